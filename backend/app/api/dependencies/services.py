@@ -0,0 +1,65 @@
+"""Access to the application-scoped service instances."""
+
+from __future__ import annotations
+
+import threading
+
+from fastapi import Depends, Request
+
+from app.services.certificate_authority import CertificateAuthorityService
+from app.services.container import ServiceContainer
+from app.services.pdf_signing import PDFSigningService
+from app.services.pdf_verification import PDFVerificationService
+from app.services.signing_jobs import SigningJobService
+from app.services.storage import EncryptedStorageService
+from app.services.timestamp_authority import configure_local_timestamp_authority
+
+_build_lock = threading.Lock()
+
+
+def get_services(request: Request) -> ServiceContainer:
+    """Return the services built by the application lifespan.
+
+    Clients that drive the ASGI app without running its lifespan get the
+    container built on first use instead.
+    """
+
+    state = request.app.state
+    services: ServiceContainer | None = getattr(state, "services", None)
+    if services is None:
+        with _build_lock:
+            services = getattr(state, "services", None)
+            if services is None:
+                services = state.services = ServiceContainer.build()
+                configure_local_timestamp_authority(services.certificate_authority)
+    return services
+
+
+def get_storage_service(
+    services: ServiceContainer = Depends(get_services),
+) -> EncryptedStorageService:
+    return services.storage
+
+
+def get_ca_service(
+    services: ServiceContainer = Depends(get_services),
+) -> CertificateAuthorityService:
+    return services.certificate_authority
+
+
+def get_signing_service(
+    services: ServiceContainer = Depends(get_services),
+) -> PDFSigningService:
+    return services.signing
+
+
+def get_verification_service(
+    services: ServiceContainer = Depends(get_services),
+) -> PDFVerificationService:
+    return services.verification
+
+
+def get_signing_job_service(
+    services: ServiceContainer = Depends(get_services),
+) -> SigningJobService:
+    return services.signing_jobs
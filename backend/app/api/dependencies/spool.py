@@ -0,0 +1,17 @@
+"""Request-scoped spooling of uploaded documents."""
+
+from __future__ import annotations
+
+from typing import AsyncIterator
+
+from app.services.spool import UploadSpool
+
+
+async def get_upload_spool() -> AsyncIterator[UploadSpool]:
+    """Provide a spool whose files are removed once the request completes."""
+
+    spool = UploadSpool()
+    try:
+        yield spool
+    finally:
+        spool.close()
@@ -8,11 +8,14 @@ from datetime import datetime, timezone
 from uuid import UUID
 
 from cryptography.hazmat.primitives import hashes
-from fastapi import APIRouter, Depends, status
-from fastapi.responses import PlainTextResponse
+from fastapi import APIRouter, Depends, Header, status
+from fastapi.responses import PlainTextResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies.auth import get_current_user, require_roles
+from app.api.dependencies.services import get_ca_service
+from app.api.http_cache import etag_matches, http_date
+from app.core.config import settings
 from app.core.errors import (
     AlreadyExistsError,
     InvalidFileError,
@@ -22,6 +25,7 @@ from app.core.errors import (
 from app.core.file_validators import CertificateValidator
 from app.crud import certificate as certificate_crud
 from app.db.session import get_db
+from app.models.ca_artifact import CAArtifact, CAArtifactType
 from app.models.certificate import Certificate, CertificateStatus
 from app.models.user import User, UserRole
 from app.schemas.ca import (
@@ -38,6 +42,14 @@ from app.schemas.ca import (
     RootCACreateRequest,
     RootCAResponse,
     RootCertificateExportResponse,
+    TSACertificateIssueRequest,
+    TSACertificateResponse,
+)
+from app.services.ca_distribution import (
+    CADistributionError,
+    CADistributionNotFoundError,
+    DistributionDocument,
+    get_ca_distribution_cache,
 )
 from app.services.certificate_authority import (
     CertificateAuthorityError,
@@ -45,12 +57,13 @@ from app.services.certificate_authority import (
     CertificateImportError,
     CertificateIssuanceError,
     CertificateRevocationError,
+    CRLResult,
     RootCAAlreadyExistsError,
     RootCANotFoundError,
 )
+from app.services.timestamp_authority import reset_local_timestamp_authority
 
 router = APIRouter(prefix="/ca", tags=["certificate-authority"])
-ca_service = CertificateAuthorityService()
 
 
 @router.post(
@@ -60,6 +73,7 @@ async def generate_root_ca(
     payload: RootCACreateRequest,
     current_user: User = Depends(require_roles(UserRole.ADMIN)),
     session: AsyncSession = Depends(get_db),
+    ca_service: CertificateAuthorityService = Depends(get_ca_service),
 ) -> RootCAResponse:
     """Generate the primary root certificate authority."""
 
@@ -95,16 +109,56 @@ async def generate_root_ca(
 
 @router.get("/root/certificate", response_model=RootCertificateExportResponse)
 async def export_root_certificate(
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
     session: AsyncSession = Depends(get_db),
-) -> RootCertificateExportResponse:
+) -> Response:
     """Return the PEM encoded root certificate."""
 
-    try:
-        certificate_pem = await ca_service.export_root_certificate(session=session)
-    except RootCANotFoundError as exc:
-        raise NotFoundError("Root certificate") from exc
+    document = await _load_distribution_document(
+        session=session, artifact_type=CAArtifactType.ROOT_CERTIFICATE
+    )
+    headers = _distribution_headers(document, "json")
+    if if_none_match is not None and etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    payload = RootCertificateExportResponse(
+        certificate_pem=document.pem.decode("ascii")
+    )
+    return Response(
+        content=payload.model_dump_json(),
+        media_type="application/json",
+        headers=headers,
+    )
 
-    return RootCertificateExportResponse(certificate_pem=certificate_pem)
+
+@router.get("/root/certificate.pem", response_class=Response)
+async def download_root_certificate_pem(
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    session: AsyncSession = Depends(get_db),
+) -> Response:
+    """Download the root certificate in PEM."""
+
+    return await _distribution_response(
+        session=session,
+        artifact_type=CAArtifactType.ROOT_CERTIFICATE,
+        representation="pem",
+        if_none_match=if_none_match,
+    )
+
+
+@router.get("/root/certificate.der", response_class=Response)
+async def download_root_certificate_der(
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    session: AsyncSession = Depends(get_db),
+) -> Response:
+    """Download the root certificate in DER."""
+
+    return await _distribution_response(
+        session=session,
+        artifact_type=CAArtifactType.ROOT_CERTIFICATE,
+        representation="der",
+        if_none_match=if_none_match,
+    )
 
 
 @router.post("/certificates/issue", response_model=CertificateIssueResponse)
@@ -112,6 +166,7 @@ async def issue_certificate(
     payload: CertificateIssueRequest,
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_db),
+    ca_service: CertificateAuthorityService = Depends(get_ca_service),
 ) -> CertificateIssueResponse:
     """Issue a certificate for the authenticated user."""
 
@@ -152,6 +207,7 @@ async def import_certificate(
     payload: CertificateImportRequest,
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_db),
+    ca_service: CertificateAuthorityService = Depends(get_ca_service),
 ) -> CertificateImportResponse:
     """Import an externally issued PKCS#12 bundle."""
 
@@ -228,6 +284,7 @@ async def revoke_certificate(
     certificate_id: UUID,
     current_user: User = Depends(require_roles(UserRole.ADMIN)),
     session: AsyncSession = Depends(get_db),
+    ca_service: CertificateAuthorityService = Depends(get_ca_service),
 ) -> CertificateRevokeResponse:
     """Revoke a certificate by identifier."""
 
@@ -258,6 +315,7 @@ async def revoke_certificate(
 async def generate_crl(
     current_user: User = Depends(require_roles(UserRole.ADMIN)),
     session: AsyncSession = Depends(get_db),
+    ca_service: CertificateAuthorityService = Depends(get_ca_service),
 ) -> CRLGenerateResponse:
     """Generate a new certificate revocation list."""
 
@@ -268,34 +326,152 @@ async def generate_crl(
     except CertificateAuthorityError as exc:
         raise OperationFailedError("Failed to generate CRL", str(exc)) from exc
 
-    return CRLGenerateResponse(
+    return _crl_generate_response(result)
+
+
+@router.post("/crl/delta", response_model=CRLGenerateResponse)
+async def generate_delta_crl(
+    current_user: User = Depends(require_roles(UserRole.ADMIN)),
+    session: AsyncSession = Depends(get_db),
+    ca_service: CertificateAuthorityService = Depends(get_ca_service),
+) -> CRLGenerateResponse:
+    """Generate a delta CRL with the revocations since the newest base CRL."""
+
+    try:
+        result = await ca_service.generate_delta_crl(
+            session=session, actor_id=current_user.id
+        )
+    except CertificateAuthorityError as exc:
+        raise OperationFailedError("Failed to generate delta CRL", str(exc)) from exc
+
+    return _crl_generate_response(result)
+
+
+@router.post(
+    "/tsa", response_model=TSACertificateResponse, status_code=status.HTTP_201_CREATED
+)
+async def issue_tsa_certificate(
+    payload: TSACertificateIssueRequest,
+    current_user: User = Depends(require_roles(UserRole.ADMIN)),
+    session: AsyncSession = Depends(get_db),
+    ca_service: CertificateAuthorityService = Depends(get_ca_service),
+) -> TSACertificateResponse:
+    """Issue the certificate used by the built-in timestamp authority."""
+
+    try:
+        result = await ca_service.issue_tsa_certificate(
+            session=session,
+            common_name=payload.common_name,
+            organization=payload.organization,
+            algorithm=payload.algorithm,
+            validity_days=payload.validity_days,
+            actor_id=current_user.id,
+        )
+    except RootCANotFoundError as exc:
+        raise NotFoundError("Root CA") from exc
+    except CertificateAuthorityError as exc:
+        raise OperationFailedError(
+            "Failed to issue timestamping certificate", str(exc)
+        ) from exc
+
+    # New timestamps are signed with the freshly issued key from now on.
+    reset_local_timestamp_authority()
+
+    return TSACertificateResponse(
         artifact_id=result.artifact.id,
-        name=result.artifact.name,
-        created_at=result.artifact.created_at,
-        crl_pem=result.crl_pem,
-        revoked_serials=list(result.revoked_serials),
+        algorithm=result.algorithm,
+        serial_number=f"{result.certificate.serial_number:x}".upper(),
+        subject=result.certificate.subject.rfc4514_string(),
+        fingerprint_sha256=result.certificate.fingerprint(hashes.SHA256())
+        .hex()
+        .upper(),
+        issued_at=_ensure_utc(result.certificate.not_valid_before),
+        expires_at=_ensure_utc(result.certificate.not_valid_after),
+        certificate_pem=result.certificate_pem,
     )
 
 
 @router.get("/crl", response_model=CRLListResponse)
-async def list_crls(session: AsyncSession = Depends(get_db)) -> CRLListResponse:
+async def list_crls(
+    session: AsyncSession = Depends(get_db),
+    ca_service: CertificateAuthorityService = Depends(get_ca_service),
+) -> CRLListResponse:
     """Return a list of published certificate revocation lists."""
 
     artifacts = await ca_service.list_crls(session=session)
-    entries = [
-        CRLMetadata(
-            artifact_id=artifact.id,
-            name=artifact.name,
-            created_at=artifact.created_at,
-        )
-        for artifact in artifacts
-    ]
-    return CRLListResponse(crls=entries)
+    delta_artifacts = await ca_service.list_crls(session=session, delta=True)
+    return CRLListResponse(
+        crls=[_crl_metadata(artifact) for artifact in artifacts],
+        delta_crls=[_crl_metadata(artifact) for artifact in delta_artifacts],
+    )
+
+
+@router.get("/crl/latest", response_class=Response)
+@router.get("/crl/latest.pem", response_class=Response)
+async def download_latest_crl(
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    session: AsyncSession = Depends(get_db),
+) -> Response:
+    """Download the newest base CRL in PEM."""
+
+    return await _distribution_response(
+        session=session,
+        artifact_type=CAArtifactType.CRL,
+        representation="pem",
+        if_none_match=if_none_match,
+    )
+
+
+@router.get("/crl/latest.der", response_class=Response)
+async def download_latest_crl_der(
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    session: AsyncSession = Depends(get_db),
+) -> Response:
+    """Download the newest base CRL in DER."""
+
+    return await _distribution_response(
+        session=session,
+        artifact_type=CAArtifactType.CRL,
+        representation="der",
+        if_none_match=if_none_match,
+    )
+
+
+@router.get("/crl/delta/latest", response_class=Response)
+async def download_latest_delta_crl(
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    session: AsyncSession = Depends(get_db),
+) -> Response:
+    """Download the newest delta CRL in PEM."""
+
+    return await _distribution_response(
+        session=session,
+        artifact_type=CAArtifactType.DELTA_CRL,
+        representation="pem",
+        if_none_match=if_none_match,
+    )
+
+
+@router.get("/crl/delta/latest.der", response_class=Response)
+async def download_latest_delta_crl_der(
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    session: AsyncSession = Depends(get_db),
+) -> Response:
+    """Download the newest delta CRL in DER."""
+
+    return await _distribution_response(
+        session=session,
+        artifact_type=CAArtifactType.DELTA_CRL,
+        representation="der",
+        if_none_match=if_none_match,
+    )
 
 
 @router.get("/crl/{artifact_id}", response_class=PlainTextResponse)
 async def download_crl(
-    artifact_id: UUID, session: AsyncSession = Depends(get_db)
+    artifact_id: UUID,
+    session: AsyncSession = Depends(get_db),
+    ca_service: CertificateAuthorityService = Depends(get_ca_service),
 ) -> PlainTextResponse:
     """Download the specified certificate revocation list."""
 
@@ -309,6 +485,28 @@ async def download_crl(
     return PlainTextResponse(content=crl_pem, media_type="application/pkix-crl")
 
 
+def _crl_metadata(artifact: CAArtifact) -> CRLMetadata:
+    return CRLMetadata(
+        artifact_id=artifact.id,
+        name=artifact.name,
+        created_at=artifact.created_at,
+        crl_number=artifact.crl_number,
+        base_crl_number=artifact.base_crl_number,
+    )
+
+
+def _crl_generate_response(result: CRLResult) -> CRLGenerateResponse:
+    return CRLGenerateResponse(
+        artifact_id=result.artifact.id,
+        name=result.artifact.name,
+        created_at=result.artifact.created_at,
+        crl_number=result.artifact.crl_number,
+        base_crl_number=result.artifact.base_crl_number,
+        crl_pem=result.crl_pem,
+        revoked_serials=list(result.revoked_serials),
+    )
+
+
 def _ensure_utc(dt: datetime) -> datetime:
     if dt.tzinfo is None:
         return dt.replace(tzinfo=timezone.utc)
@@ -324,3 +522,72 @@ async def _load_certificate_or_404(
     if certificate is None:
         raise NotFoundError("Certificate", str(certificate_id))
     return certificate
+
+
+_MEDIA_TYPES = {
+    (CAArtifactType.ROOT_CERTIFICATE, "pem"): "application/x-pem-file",
+    (CAArtifactType.ROOT_CERTIFICATE, "der"): "application/pkix-cert",
+    # PEM CRLs keep the media type ``GET /ca/crl/{artifact_id}`` has always used.
+    (CAArtifactType.CRL, "pem"): "application/pkix-crl",
+    (CAArtifactType.CRL, "der"): "application/pkix-crl",
+    (CAArtifactType.DELTA_CRL, "pem"): "application/pkix-crl",
+    (CAArtifactType.DELTA_CRL, "der"): "application/pkix-crl",
+}
+
+
+async def _load_distribution_document(
+    *, session: AsyncSession, artifact_type: CAArtifactType
+) -> DistributionDocument:
+    try:
+        return await get_ca_distribution_cache().get(
+            session=session, artifact_type=artifact_type
+        )
+    except CADistributionNotFoundError as exc:
+        resource = (
+            "Root certificate"
+            if artifact_type is CAArtifactType.ROOT_CERTIFICATE
+            else "CRL"
+        )
+        raise NotFoundError(resource) from exc
+    except CADistributionError as exc:
+        raise OperationFailedError("Failed to load CA document", str(exc)) from exc
+
+
+def _distribution_headers(
+    document: DistributionDocument, representation: str
+) -> dict[str, str]:
+    """Validators plus a freshness lifetime ending at the CRL's next update."""
+
+    if document.next_update is None:
+        max_age = settings.ca_root_certificate_max_age_seconds
+    else:
+        remaining = document.next_update - datetime.now(timezone.utc)
+        max_age = max(int(remaining.total_seconds()), 0)
+    return {
+        "ETag": document.etag(representation),
+        "Last-Modified": http_date(document.last_modified),
+        "Cache-Control": f"public, max-age={max_age}",
+    }
+
+
+async def _distribution_response(
+    *,
+    session: AsyncSession,
+    artifact_type: CAArtifactType,
+    representation: str,
+    if_none_match: str | None,
+) -> Response:
+    """Serve a cached root certificate or CRL, honouring ``If-None-Match``."""
+
+    document = await _load_distribution_document(
+        session=session, artifact_type=artifact_type
+    )
+    headers = _distribution_headers(document, representation)
+    if if_none_match is not None and etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(
+        content=document.pem if representation == "pem" else document.der,
+        media_type=_MEDIA_TYPES[artifact_type, representation],
+        headers=headers,
+    )
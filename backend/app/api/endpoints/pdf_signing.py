@@ -2,36 +2,77 @@
 
 from __future__ import annotations
 
-import io
+import base64
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Iterator
 from urllib.parse import quote
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, Request, UploadFile, status
-from fastapi.responses import StreamingResponse
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    Header,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
 
 from app.api.dependencies.auth import get_current_user
+from app.api.dependencies.services import (
+    get_signing_job_service,
+    get_signing_service,
+    get_verification_service,
+)
+from app.api.dependencies.spool import get_upload_spool
+from app.api.http_cache import etag_matches
 from app.core.config import settings
-from app.core.errors import InvalidFileError, NotFoundError, OperationFailedError
+from app.core.errors import (
+    InvalidFileError,
+    InvalidStateError,
+    NotFoundError,
+    OperationFailedError,
+    ServiceUnavailableError,
+    ValidationError,
+)
 from app.core.file_validators import PDFValidator
 from app.crud import audit_log as audit_log_crud
-from app.db.session import get_db
+from app.crud import signing_job as signing_job_crud
+from app.db.session import get_db, get_session_factory
+from app.models.signing_job import (
+    SigningJob,
+    SigningJobItem,
+    SigningJobItemStatus,
+    SigningJobStatus,
+)
 from app.models.user import User
 from app.schemas.pdf_signing import (
+    DigestAlgorithm,
+    PDFBatchArchiveManifest,
+    PDFBatchArchiveManifestItem,
     PDFBatchSignResponse,
     PDFBatchSignResultItem,
+    PDFDigestSignRequest,
+    PDFDigestSignResponse,
     PDFSignResponse,
     PDFVerificationResponse,
     SignatureCoordinates,
     SignatureMetadata,
     SignatureVerificationResult,
     SignatureVisibility,
+    SigningJobItemResponse,
+    SigningJobResponse,
 )
 from app.services.pdf_signing import (
     CertificateInvalidError,
     CertificateNotFoundError,
+    DigestSigningError,
     PDFSigningService,
     PDFValidationError,
     SealNotFoundError,
@@ -40,13 +81,33 @@ from app.services.pdf_signing import SignatureCoordinates as ServiceCoordinates
 from app.services.pdf_signing import SignatureError
 from app.services.pdf_signing import SignatureMetadata as ServiceMetadata
 from app.services.pdf_signing import SignatureVisibility as ServiceVisibility
-from app.services.pdf_signing import SigningResult
+from app.services.pdf_signing import SigningResult, SigningUnavailableError
 from app.services.pdf_verification import (
     PDFVerificationError,
     PDFVerificationInputError,
     PDFVerificationRootCAError,
     PDFVerificationService,
 )
+from app.services.signing_idempotency import (
+    IdempotencyConflictError,
+    get_signed_result_store,
+    request_fingerprint,
+)
+from app.services.signing_jobs import (
+    SigningJobLimitError,
+    SigningJobNotFoundError,
+    SigningJobService,
+)
+from app.services.signing_metrics import StageTimings
+from app.services.spool import (
+    SpooledFile,
+    SpoolLimitError,
+    UploadSpool,
+    iter_file_range,
+    iter_source_chunks,
+)
+from app.services.storage import StorageError
+from app.services.zip_stream import StreamingZipWriter
 
 router = APIRouter(prefix="/pdf", tags=["pdf-signing"])
 
@@ -116,6 +177,150 @@ async def _record_audit_event(
     )
 
 
+@dataclass(slots=True)
+class _BatchSignInputs:
+    """Validated form inputs shared by the batch signing endpoints."""
+
+    pdfs: list[tuple[str, SpooledFile]]
+    certificate_id: UUID
+    seal_id: UUID | None
+    visibility: SignatureVisibility
+    coordinates: SignatureCoordinates | None
+    metadata: SignatureMetadata | None
+
+
+async def _parse_batch_request(
+    *,
+    spool: UploadSpool,
+    pdf_files: list[UploadFile],
+    certificate_id: str,
+    seal_id: str | None,
+    visibility: str,
+    page: int | None,
+    x: float | None,
+    y: float | None,
+    width: float | None,
+    height: float | None,
+    reason: str | None,
+    location: str | None,
+    contact_info: str | None,
+    max_count: int | None = None,
+    timings: StageTimings | None = None,
+) -> _BatchSignInputs:
+    """Validate batch form fields and read the uploaded PDFs."""
+
+    limit = settings.pdf_batch_max_count if max_count is None else max_count
+    if len(pdf_files) > limit:
+        raise InvalidFileError(f"Batch size exceeds maximum of {limit}")
+
+    try:
+        cert_uuid = UUID(certificate_id)
+    except ValueError as exc:
+        raise InvalidFileError("Invalid certificate_id format") from exc
+
+    seal_uuid: UUID | None = None
+    if seal_id:
+        try:
+            seal_uuid = UUID(seal_id)
+        except ValueError as exc:
+            raise InvalidFileError("Invalid seal_id format") from exc
+
+    try:
+        sig_visibility = SignatureVisibility(visibility)
+    except ValueError as exc:
+        raise InvalidFileError(f"Invalid visibility value: {visibility}") from exc
+
+    coordinates: SignatureCoordinates | None = None
+    if sig_visibility == SignatureVisibility.VISIBLE:
+        if page is None or x is None or y is None or width is None or height is None:
+            raise InvalidFileError("Visible signatures require coordinates")
+        coordinates = SignatureCoordinates(
+            page=page, x=x, y=y, width=width, height=height
+        )
+
+    metadata: SignatureMetadata | None = None
+    if reason or location or contact_info:
+        metadata = SignatureMetadata(
+            reason=reason, location=location, contact_info=contact_info
+        )
+
+    pdfs: list[tuple[str, SpooledFile]] = []
+    for pdf_file in pdf_files:
+        if pdf_file.content_type not in settings.pdf_allowed_content_types:
+            raise InvalidFileError(
+                f"Invalid content type for {pdf_file.filename}: {pdf_file.content_type}"
+            )
+
+        filename = pdf_file.filename or "unknown.pdf"
+        pdf_source = await _spool_pdf_upload(
+            spool,
+            pdf_file,
+            filename=filename,
+            read_error=f"Failed to read {pdf_file.filename}",
+            invalid_prefix=f"Invalid PDF file {filename}",
+            timings=timings,
+        )
+        pdfs.append((filename, pdf_source))
+
+    return _BatchSignInputs(
+        pdfs=pdfs,
+        certificate_id=cert_uuid,
+        seal_id=seal_uuid,
+        visibility=sig_visibility,
+        coordinates=coordinates,
+        metadata=metadata,
+    )
+
+
+async def _spool_pdf_upload(
+    spool: UploadSpool,
+    pdf_file: UploadFile,
+    *,
+    filename: str,
+    read_error: str,
+    invalid_prefix: str,
+    timings: StageTimings | None = None,
+) -> SpooledFile:
+    """Spool an uploaded PDF to disk and run the checks that need no parsing."""
+
+    timings = timings or StageTimings()
+    try:
+        with timings.stage("upload"):
+            pdf_source = await spool.add(pdf_file.file)
+    except SpoolLimitError as exc:
+        raise InvalidFileError(f"{invalid_prefix}: {exc}") from exc
+    except Exception as exc:
+        raise InvalidFileError(read_error, str(exc)) from exc
+
+    with timings.stage("validate"):
+        is_valid_pdf, pdf_error = PDFValidator.precheck(pdf_source, filename)
+    if not is_valid_pdf:
+        raise InvalidFileError(f"{invalid_prefix}: {pdf_error or 'Validation failed'}")
+    return pdf_source
+
+
+def _remove_spooled_files(
+    spooled_files: list[SpooledFile], output_spool: UploadSpool | None = None
+) -> None:
+    """Delete spool files once a streamed response has finished."""
+
+    for spooled in spooled_files:
+        spooled.unlink()
+    if output_spool is not None:
+        output_spool.close()
+
+
+def _signed_filename(original_filename: str) -> str:
+    """Derive a header-safe ``<name>-signed.pdf`` filename."""
+
+    base_name = Path(original_filename).stem or "document"
+    sanitized_base = (
+        base_name.replace("\\", "_").replace("/", "_").replace('"', "").strip()
+        or "document"
+    )
+    return f"{sanitized_base}-signed.pdf"
+
+
 @router.post("/sign")
 async def sign_pdf(
     request: Request,
@@ -141,23 +346,35 @@ async def sign_pdf(
     contact_info: str | None = Form(default=None, description="Contact information"),
     use_tsa: bool = Form(default=False, description="Include RFC3161 timestamp"),
     embed_ltv: bool = Form(default=False, description="Embed LTV validation material"),
+    persist: bool = Form(
+        default=False, description="Keep the signed PDF for /pdf/documents/{id}"
+    ),
+    idempotency_key: str | None = Header(
+        default=None,
+        alias="Idempotency-Key",
+        max_length=255,
+        description="Client key under which retries replay the first result",
+    ),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_db),
+    service: PDFSigningService = Depends(get_signing_service),
+    spool: UploadSpool = Depends(get_upload_spool),
 ) -> StreamingResponse:
     """Sign a single PDF document with a user's certificate."""
 
+    timings = StageTimings()
     if pdf_file.content_type not in settings.pdf_allowed_content_types:
         raise InvalidFileError(f"Invalid content type: {pdf_file.content_type}")
 
-    try:
-        pdf_data = await pdf_file.read()
-    except Exception as exc:
-        raise InvalidFileError("Failed to read PDF file", str(exc)) from exc
-
     original_filename = pdf_file.filename or "document.pdf"
-    is_valid_pdf, pdf_error = PDFValidator.validate(pdf_data, original_filename)
-    if not is_valid_pdf:
-        raise InvalidFileError(f"Invalid PDF file: {pdf_error or 'Validation failed'}")
+    pdf_source = await _spool_pdf_upload(
+        spool,
+        pdf_file,
+        filename=original_filename,
+        read_error="Failed to read PDF file",
+        invalid_prefix="Invalid PDF file",
+        timings=timings,
+    )
 
     try:
         cert_uuid = UUID(certificate_id)
@@ -192,57 +409,105 @@ async def sign_pdf(
             reason=reason, location=location, contact_info=contact_info
         )
 
-    base_name = Path(original_filename).stem or "document"
-    sanitized_base = (
-        base_name.replace("\\", "_").replace("/", "_").replace('"', "").strip()
-        or "document"
-    )
-    signed_filename = f"{sanitized_base}-signed.pdf"
+    signed_filename = _signed_filename(original_filename)
 
-    service = PDFSigningService()
+    service_visibility = _convert_visibility(sig_visibility)
+    service_coordinates = _convert_coordinates(coordinates)
+    service_metadata = _convert_metadata(metadata)
 
-    try:
+    async def sign() -> SigningResult:
         result = await service.sign_pdf(
             session=session,
-            pdf_data=pdf_data,
+            pdf_data=pdf_source,
             certificate_id=cert_uuid,
             user_id=current_user.id,
             seal_id=seal_uuid,
-            visibility=_convert_visibility(sig_visibility),
-            coordinates=_convert_coordinates(coordinates),
-            metadata=_convert_metadata(metadata),
+            visibility=service_visibility,
+            coordinates=service_coordinates,
+            metadata=service_metadata,
             use_tsa=use_tsa,
             embed_ltv=embed_ltv,
+            output_spool=spool,
+            timings=timings,
         )
+        with timings.stage("audit"):
+            await _record_audit_event(
+                session=session,
+                request=request,
+                actor_id=current_user.id,
+                event_type="pdf.signature.applied",
+                resource="pdf",
+                meta={
+                    "document_id": result.document_id,
+                    "certificate_id": str(result.certificate_id),
+                    "seal_id": str(result.seal_id) if result.seal_id else None,
+                    "visibility": result.visibility.value,
+                    "tsa_used": result.tsa_used,
+                    "ltv_embedded": result.ltv_embedded,
+                    "signed_at": result.signed_at.isoformat(),
+                    "file_size": result.file_size,
+                    "original_filename": original_filename,
+                    "signed_filename": signed_filename,
+                },
+            )
+        return result
+
+    async def fingerprint() -> str:
+        with timings.stage("idempotency"):
+            return await request_fingerprint(
+                pdf_source,
+                certificate_id=cert_uuid,
+                seal_id=seal_uuid,
+                visibility=service_visibility,
+                coordinates=service_coordinates,
+                metadata=service_metadata,
+                use_tsa=use_tsa,
+                embed_ltv=embed_ltv,
+            )
+
+    store = get_signed_result_store()
+    replayed = False
+    try:
+        if settings.pdf_idempotency_enabled:
+            # Replays still require the certificate and seal to be usable.
+            await service.check_signing_material(
+                session=session,
+                certificate_id=cert_uuid,
+                user_id=current_user.id,
+                seal_id=seal_uuid,
+            )
+            result, replayed = await store.sign_once(
+                session=session,
+                owner_id=current_user.id,
+                idempotency_key=idempotency_key,
+                fingerprint=await fingerprint(),
+                sign=sign,
+                persist=persist,
+                filename=signed_filename,
+            )
+        else:
+            result = await sign()
+            if persist:
+                await store.persist(
+                    session=session,
+                    owner_id=current_user.id,
+                    fingerprint=await fingerprint(),
+                    result=result,
+                    filename=signed_filename,
+                )
+    except IdempotencyConflictError as exc:
+        raise ValidationError(str(exc)) from exc
     except PDFValidationError as exc:
         raise InvalidFileError(str(exc)) from exc
     except CertificateNotFoundError as exc:
         raise NotFoundError("Certificate") from exc
     except (CertificateInvalidError, SealNotFoundError) as exc:
         raise OperationFailedError("PDF signing operation failed", str(exc)) from exc
+    except SigningUnavailableError as exc:
+        raise ServiceUnavailableError("PDF signing is at capacity", str(exc)) from exc
     except SignatureError as exc:
         raise OperationFailedError("Signature creation failed", str(exc)) from exc
 
-    await _record_audit_event(
-        session=session,
-        request=request,
-        actor_id=current_user.id,
-        event_type="pdf.signature.applied",
-        resource="pdf",
-        meta={
-            "document_id": result.document_id,
-            "certificate_id": str(result.certificate_id),
-            "seal_id": str(result.seal_id) if result.seal_id else None,
-            "visibility": result.visibility.value,
-            "tsa_used": result.tsa_used,
-            "ltv_embedded": result.ltv_embedded,
-            "signed_at": result.signed_at.isoformat(),
-            "file_size": result.file_size,
-            "original_filename": original_filename,
-            "signed_filename": signed_filename,
-        },
-    )
-
     quoted_filename = quote(signed_filename)
     content_disposition = f'attachment; filename="{signed_filename}"'
     if quoted_filename != signed_filename:
@@ -258,17 +523,194 @@ async def sign_pdf(
         "X-LTV-Embedded": str(result.ltv_embedded).lower(),
         "X-Original-Filename": original_filename,
         "X-Signed-Filename": signed_filename,
+        "Content-Length": str(result.file_size),
+        "Server-Timing": timings.server_timing(),
     }
     if result.seal_id is not None:
         headers["X-Seal-Id"] = str(result.seal_id)
+    if replayed:
+        headers["Idempotent-Replayed"] = "true"
+
+    # The signed output lives in the spool; hand it to the response for cleanup.
+    spooled_files = spool.detach()
+    return StreamingResponse(
+        iter_source_chunks(result.signed_output),
+        media_type="application/pdf",
+        headers=headers,
+        background=BackgroundTask(_remove_spooled_files, spooled_files),
+    )
+
+
+class _UnsatisfiableRange(Exception):
+    """Raised when a ``Range`` header selects no byte of the document."""
+
+
+def _parse_byte_range(value: str, size: int) -> tuple[int, int] | None:
+    """Return the inclusive byte span requested by a single-range header.
+
+    Headers this endpoint does not serve as ranges (other units, several
+    ranges, malformed syntax) yield ``None`` and the full document is sent.
+    """
+
+    unit, _, spec = value.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, dash, last = spec.strip().partition("-")
+    if not dash or not (first.isdigit() or last.isdigit()):
+        return None
+    if first and last and not (first.isdigit() and last.isdigit()):
+        return None
+
+    if not first:
+        suffix = int(last)
+        if suffix == 0:
+            raise _UnsatisfiableRange
+        return max(size - suffix, 0), size - 1
+
+    start = int(first)
+    end = int(last) if last else size - 1
+    if last and end < start:
+        return None
+    if start >= size:
+        raise _UnsatisfiableRange
+    return start, min(end, size - 1)
+
+
+@router.get("/documents/{document_id}")
+async def download_signed_document(
+    document_id: str,
+    byte_range: str | None = Header(default=None, alias="Range"),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    if_range: str | None = Header(default=None, alias="If-Range"),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+) -> Response:
+    """Download a stored signed document, resuming with ``Range`` if asked."""
+
+    store = get_signed_result_store()
+    document = await store.get_document(
+        session=session, owner_id=current_user.id, document_id=document_id
+    )
+    if document is None:
+        raise NotFoundError("Signed document", document_id)
+
+    # The checksum of the stored plaintext identifies the exact bytes served.
+    etag = f'"{document.file.checksum}"'
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "private, no-cache",
+        "X-Document-ID": document.document_id,
+    }
+    if if_none_match is not None and etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    size = document.file_size
+    span: tuple[int, int] | None = None
+    if byte_range is not None and (if_range is None or if_range == etag):
+        try:
+            span = _parse_byte_range(byte_range, size)
+        except _UnsatisfiableRange:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{size}"},
+            )
+
+    try:
+        spooled = await store.open_document(session=session, document=document)
+    except StorageError as exc:
+        raise OperationFailedError("Failed to load signed document", str(exc)) from exc
+    # Open now so the response keeps reading even if the spool file is evicted.
+    handle = open(spooled.path, "rb")
+
+    signed_filename = document.file.filename
+    quoted_filename = quote(signed_filename)
+    content_disposition = f'attachment; filename="{signed_filename}"'
+    if quoted_filename != signed_filename:
+        content_disposition += f"; filename*=UTF-8''{quoted_filename}"
+    headers["Content-Disposition"] = content_disposition
+
+    status_code = status.HTTP_200_OK
+    start, end = span if span is not None else (0, size - 1)
+    if span is not None:
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        iter_file_range(handle, start, end - start + 1),
+        status_code=status_code,
+        media_type="application/pdf",
+        headers=headers,
+    )
+
+
+@router.post("/sign/digest", response_model=PDFDigestSignResponse)
+async def sign_pdf_digest(
+    request: Request,
+    payload: PDFDigestSignRequest,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+    service: PDFSigningService = Depends(get_signing_service),
+) -> PDFDigestSignResponse:
+    """Sign a client-computed PDF digest and return the CMS to embed.
 
-    pdf_stream = io.BytesIO(result.signed_pdf)
-    return StreamingResponse(pdf_stream, media_type="application/pdf", headers=headers)
+    The client prepares the signature placeholder and hashes the byte range
+    locally, so only the digest and the resulting CMS cross the network.
+    """
+
+    try:
+        result = await service.sign_digest(
+            session=session,
+            certificate_id=payload.certificate_id,
+            user_id=current_user.id,
+            digest_algorithm=payload.digest_algorithm.value,
+            document_digest=payload.document_digest,
+            signed_attributes=payload.signed_attributes,
+            use_pades=payload.use_pades,
+            use_tsa=payload.use_tsa,
+        )
+    except DigestSigningError as exc:
+        raise ValidationError("Invalid digest signing request", str(exc)) from exc
+    except CertificateNotFoundError as exc:
+        raise NotFoundError("Certificate") from exc
+    except CertificateInvalidError as exc:
+        raise OperationFailedError("PDF signing operation failed", str(exc)) from exc
+    except SigningUnavailableError as exc:
+        raise ServiceUnavailableError("PDF signing is at capacity", str(exc)) from exc
+    except SignatureError as exc:
+        raise OperationFailedError("Signature creation failed", str(exc)) from exc
+
+    await _record_audit_event(
+        session=session,
+        request=request,
+        actor_id=current_user.id,
+        event_type="pdf.signature.digest_signed",
+        resource="pdf",
+        meta={
+            "signature_id": result.signature_id,
+            "certificate_id": str(result.certificate_id),
+            "digest_algorithm": result.digest_algorithm,
+            "signed_attributes": payload.signed_attributes is not None,
+            "tsa_used": result.tsa_used,
+            "signed_at": result.signed_at.isoformat(),
+        },
+    )
+
+    return PDFDigestSignResponse(
+        signature_id=result.signature_id,
+        signed_at=result.signed_at,
+        certificate_id=result.certificate_id,
+        digest_algorithm=DigestAlgorithm(result.digest_algorithm),
+        cms=base64.b64encode(result.cms).decode("ascii"),
+        cms_size=len(result.cms),
+        tsa_used=result.tsa_used,
+    )
 
 
 @router.post("/sign/batch", response_model=PDFBatchSignResponse)
 async def batch_sign_pdfs(
     request: Request,
+    response: Response,
     pdf_files: list[UploadFile] = File(..., description="PDF files to sign"),
     certificate_id: str = Form(..., description="Certificate UUID"),
     seal_id: str | None = Form(default=None, description="Seal UUID (optional)"),
@@ -287,70 +729,32 @@ async def batch_sign_pdfs(
     embed_ltv: bool = Form(default=False, description="Embed LTV"),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_db),
+    service: PDFSigningService = Depends(get_signing_service),
+    spool: UploadSpool = Depends(get_upload_spool),
 ) -> PDFBatchSignResponse:
     """Sign multiple PDF documents in batch with the same certificate and settings."""
 
-    if len(pdf_files) > settings.pdf_batch_max_count:
-        raise InvalidFileError(
-            f"Batch size exceeds maximum of {settings.pdf_batch_max_count}"
-        )
-
-    try:
-        cert_uuid = UUID(certificate_id)
-    except ValueError as exc:
-        raise InvalidFileError("Invalid certificate_id format") from exc
-
-    seal_uuid: UUID | None = None
-    if seal_id:
-        try:
-            seal_uuid = UUID(seal_id)
-        except ValueError as exc:
-            raise InvalidFileError("Invalid seal_id format") from exc
-
-    try:
-        sig_visibility = SignatureVisibility(visibility)
-    except ValueError as exc:
-        raise InvalidFileError(f"Invalid visibility value: {visibility}") from exc
-
-    coordinates: SignatureCoordinates | None = None
-    if sig_visibility == SignatureVisibility.VISIBLE:
-        if page is None or x is None or y is None or width is None or height is None:
-            raise InvalidFileError("Visible signatures require coordinates")
-        coordinates = SignatureCoordinates(
-            page=page, x=x, y=y, width=width, height=height
-        )
-
-    metadata: SignatureMetadata | None = None
-    if reason or location or contact_info:
-        metadata = SignatureMetadata(
-            reason=reason, location=location, contact_info=contact_info
-        )
-
-    pdfs: list[tuple[str, bytes]] = []
-    for pdf_file in pdf_files:
-        if pdf_file.content_type not in settings.pdf_allowed_content_types:
-            raise InvalidFileError(
-                f"Invalid content type for {pdf_file.filename}: {pdf_file.content_type}"
-            )
-
-        filename = pdf_file.filename or "unknown.pdf"
-
-        try:
-            pdf_data = await pdf_file.read()
-        except Exception as exc:
-            raise InvalidFileError(
-                f"Failed to read {pdf_file.filename}", str(exc)
-            ) from exc
-
-        is_valid_pdf, pdf_error = PDFValidator.validate(pdf_data, filename)
-        if not is_valid_pdf:
-            raise InvalidFileError(
-                f"Invalid PDF file {filename}: {pdf_error or 'Validation failed'}"
-            )
-
-        pdfs.append((filename, pdf_data))
-
-    service = PDFSigningService()
+    timings = StageTimings()
+    batch = await _parse_batch_request(
+        spool=spool,
+        pdf_files=pdf_files,
+        certificate_id=certificate_id,
+        seal_id=seal_id,
+        visibility=visibility,
+        page=page,
+        x=x,
+        y=y,
+        width=width,
+        height=height,
+        reason=reason,
+        location=location,
+        contact_info=contact_info,
+        timings=timings,
+    )
+    pdfs = batch.pdfs
+    cert_uuid = batch.certificate_id
+    seal_uuid = batch.seal_id
+    sig_visibility = batch.visibility
 
     try:
         results = await service.batch_sign_pdfs(
@@ -360,10 +764,12 @@ async def batch_sign_pdfs(
             user_id=current_user.id,
             seal_id=seal_uuid,
             visibility=_convert_visibility(sig_visibility),
-            coordinates=_convert_coordinates(coordinates),
-            metadata=_convert_metadata(metadata),
+            coordinates=_convert_coordinates(batch.coordinates),
+            metadata=_convert_metadata(batch.metadata),
             use_tsa=use_tsa,
             embed_ltv=embed_ltv,
+            output_spool=spool,
+            timings=timings,
         )
     except PDFValidationError as exc:
         raise InvalidFileError(str(exc)) from exc
@@ -415,36 +821,194 @@ async def batch_sign_pdfs(
         ltv_embedded=embed_ltv,
     )
 
-    await _record_audit_event(
-        session=session,
-        request=request,
-        actor_id=current_user.id,
-        event_type="pdf.signature.batch_applied",
-        resource="pdf",
-        meta={
-            "total": len(pdfs),
-            "successful": successful,
-            "failed": failed,
-            "certificate_id": str(cert_uuid),
-            "seal_id": str(seal_uuid) if seal_uuid else None,
-            "visibility": sig_visibility.value,
-            "tsa_used": use_tsa,
-            "ltv_embedded": embed_ltv,
-            "document_ids": [
-                item.document_id for item in result_items if item.document_id
-            ],
-        },
-    )
+    with timings.stage("audit"):
+        await _record_audit_event(
+            session=session,
+            request=request,
+            actor_id=current_user.id,
+            event_type="pdf.signature.batch_applied",
+            resource="pdf",
+            meta={
+                "total": len(pdfs),
+                "successful": successful,
+                "failed": failed,
+                "certificate_id": str(cert_uuid),
+                "seal_id": str(seal_uuid) if seal_uuid else None,
+                "visibility": sig_visibility.value,
+                "tsa_used": use_tsa,
+                "ltv_embedded": embed_ltv,
+                "document_ids": [
+                    item.document_id for item in result_items if item.document_id
+                ],
+            },
+        )
 
+    response.headers["Server-Timing"] = timings.server_timing()
     return response_payload
 
 
+@router.post("/sign/batch/archive")
+async def batch_sign_pdfs_archive(
+    request: Request,
+    pdf_files: list[UploadFile] = File(..., description="PDF files to sign"),
+    certificate_id: str = Form(..., description="Certificate UUID"),
+    seal_id: str | None = Form(default=None, description="Seal UUID (optional)"),
+    visibility: str = Form(default="invisible", description="Signature visibility"),
+    page: int | None = Form(
+        default=None, description="Page number for visible signature"
+    ),
+    x: float | None = Form(default=None, description="X coordinate"),
+    y: float | None = Form(default=None, description="Y coordinate"),
+    width: float | None = Form(default=None, description="Width"),
+    height: float | None = Form(default=None, description="Height"),
+    reason: str | None = Form(default=None, description="Reason for signing"),
+    location: str | None = Form(default=None, description="Location"),
+    contact_info: str | None = Form(default=None, description="Contact info"),
+    use_tsa: bool = Form(default=False, description="Use TSA"),
+    embed_ltv: bool = Form(default=False, description="Embed LTV"),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+    service: PDFSigningService = Depends(get_signing_service),
+    spool: UploadSpool = Depends(get_upload_spool),
+) -> StreamingResponse:
+    """Sign a batch and stream the signed PDFs back as a ZIP archive.
+
+    Each signed document is written to the archive as soon as it finishes;
+    ``manifest.json`` is appended last with per-file status.
+    """
+
+    batch = await _parse_batch_request(
+        spool=spool,
+        pdf_files=pdf_files,
+        certificate_id=certificate_id,
+        seal_id=seal_id,
+        visibility=visibility,
+        page=page,
+        x=x,
+        y=y,
+        width=width,
+        height=height,
+        reason=reason,
+        location=location,
+        contact_info=contact_info,
+    )
+
+    # Signed output is produced while the body streams, after the request
+    # spool has been closed, so it gets a spool owned by the response.
+    output_spool = UploadSpool()
+
+    try:
+        results = await service.iter_batch_sign_pdfs(
+            session=session,
+            pdfs=batch.pdfs,
+            certificate_id=batch.certificate_id,
+            user_id=current_user.id,
+            seal_id=batch.seal_id,
+            visibility=_convert_visibility(batch.visibility),
+            coordinates=_convert_coordinates(batch.coordinates),
+            metadata=_convert_metadata(batch.metadata),
+            use_tsa=use_tsa,
+            embed_ltv=embed_ltv,
+            output_spool=output_spool,
+        )
+    except PDFValidationError as exc:
+        raise InvalidFileError(str(exc)) from exc
+    except CertificateNotFoundError as exc:
+        raise NotFoundError("Certificate") from exc
+    except (CertificateInvalidError, SealNotFoundError) as exc:
+        raise OperationFailedError("PDF signing operation failed", str(exc)) from exc
+
+    filenames = [filename for filename, _ in batch.pdfs]
+    actor_id = current_user.id
+    # Spooled uploads must outlive the request scope while the body streams.
+    spooled_files = spool.detach()
+
+    async def archive_stream() -> AsyncIterator[bytes]:
+        archive = StreamingZipWriter()
+        items: list[PDFBatchArchiveManifestItem | None] = [None] * len(filenames)
+
+        async for index, result in results:
+            filename = filenames[index]
+            if isinstance(result, SigningResult):
+                archive_name = archive.unique_name(_signed_filename(filename))
+                for chunk in archive.add_source(
+                    archive_name, result.signed_output, modified_at=result.signed_at
+                ):
+                    yield chunk
+                # Drop each signed file as soon as it has been archived.
+                if isinstance(result.signed_output, SpooledFile):
+                    result.signed_output.unlink()
+                items[index] = PDFBatchArchiveManifestItem(
+                    filename=filename,
+                    success=True,
+                    document_id=result.document_id,
+                    signed_at=result.signed_at,
+                    file_size=result.file_size,
+                    archive_name=archive_name,
+                )
+            else:
+                items[index] = PDFBatchArchiveManifestItem(
+                    filename=filename, success=False, error=str(result)
+                )
+
+        manifest_items = [item for item in items if item is not None]
+        successful = sum(1 for item in manifest_items if item.success)
+        manifest = PDFBatchArchiveManifest(
+            total=len(filenames),
+            successful=successful,
+            failed=len(manifest_items) - successful,
+            results=manifest_items,
+            certificate_id=batch.certificate_id,
+            seal_id=batch.seal_id,
+            visibility=batch.visibility,
+            tsa_used=use_tsa,
+            ltv_embedded=embed_ltv,
+        )
+        yield archive.add(
+            "manifest.json", manifest.model_dump_json(indent=2).encode("utf-8")
+        )
+        yield archive.finish()
+
+        # The request-scoped session is released before the body is streamed.
+        async with get_session_factory()() as audit_session:
+            await _record_audit_event(
+                session=audit_session,
+                request=request,
+                actor_id=actor_id,
+                event_type="pdf.signature.batch_applied",
+                resource="pdf",
+                meta={
+                    "total": manifest.total,
+                    "successful": manifest.successful,
+                    "failed": manifest.failed,
+                    "certificate_id": str(batch.certificate_id),
+                    "seal_id": str(batch.seal_id) if batch.seal_id else None,
+                    "visibility": batch.visibility.value,
+                    "tsa_used": use_tsa,
+                    "ltv_embedded": embed_ltv,
+                    "document_ids": [
+                        item.document_id for item in manifest_items if item.document_id
+                    ],
+                    "delivery": "archive",
+                },
+            )
+
+    return StreamingResponse(
+        archive_stream(),
+        media_type="application/zip",
+        headers={"Content-Disposition": 'attachment; filename="signed-documents.zip"'},
+        background=BackgroundTask(_remove_spooled_files, spooled_files, output_spool),
+    )
+
+
 @router.post("/verify", response_model=PDFVerificationResponse)
 async def verify_pdf(
     request: Request,
     pdf_file: UploadFile = File(..., description="Signed PDF to verify"),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_db),
+    verification_service: PDFVerificationService = Depends(get_verification_service),
+    spool: UploadSpool = Depends(get_upload_spool),
 ) -> PDFVerificationResponse:
     """Validate signatures embedded in a PDF document."""
 
@@ -452,15 +1016,15 @@ async def verify_pdf(
         raise InvalidFileError(f"Invalid content type: {pdf_file.content_type}")
 
     try:
-        pdf_data = await pdf_file.read()
+        pdf_source = await spool.add(pdf_file.file)
+    except SpoolLimitError as exc:
+        raise InvalidFileError(f"Invalid PDF file: {exc}") from exc
     except Exception as exc:  # pragma: no cover - defensive branch
         raise InvalidFileError("Failed to read PDF file", str(exc)) from exc
 
-    verification_service = PDFVerificationService()
-
     try:
         report = await verification_service.verify_pdf(
-            session=session, pdf_data=pdf_data
+            session=session, pdf_data=pdf_source
         )
     except PDFVerificationInputError as exc:
         raise InvalidFileError(str(exc)) from exc
@@ -512,3 +1076,299 @@ async def verify_pdf(
     )
 
     return response_payload
+
+
+def _job_response(
+    job: SigningJob, items: list[SigningJobItem] | None = None
+) -> SigningJobResponse:
+    """Build the API representation of a signing job."""
+
+    return SigningJobResponse(
+        id=job.id,
+        status=SigningJobStatus(job.status),
+        total=job.total_items,
+        successful=job.succeeded_items,
+        failed=job.failed_items,
+        pending=job.total_items - job.succeeded_items - job.failed_items,
+        certificate_id=job.certificate_id,
+        seal_id=job.seal_id,
+        visibility=SignatureVisibility(job.visibility),
+        tsa_used=job.use_tsa,
+        ltv_embedded=job.embed_ltv,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        items=[
+            SigningJobItemResponse(
+                id=item.id,
+                position=item.position,
+                filename=item.filename,
+                status=SigningJobItemStatus(item.status),
+                document_id=item.document_id,
+                file_size=item.file_size,
+                signed_at=item.signed_at,
+                error=item.error,
+            )
+            for item in items or []
+        ],
+    )
+
+
+@router.post(
+    "/jobs",
+    response_model=SigningJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_signing_job(
+    request: Request,
+    pdf_files: list[UploadFile] = File(..., description="PDF files to sign"),
+    certificate_id: str = Form(..., description="Certificate UUID"),
+    seal_id: str | None = Form(default=None, description="Seal UUID (optional)"),
+    visibility: str = Form(default="invisible", description="Signature visibility"),
+    page: int | None = Form(
+        default=None, description="Page number for visible signature"
+    ),
+    x: float | None = Form(default=None, description="X coordinate"),
+    y: float | None = Form(default=None, description="Y coordinate"),
+    width: float | None = Form(default=None, description="Width"),
+    height: float | None = Form(default=None, description="Height"),
+    reason: str | None = Form(default=None, description="Reason for signing"),
+    location: str | None = Form(default=None, description="Location"),
+    contact_info: str | None = Form(default=None, description="Contact info"),
+    use_tsa: bool = Form(default=False, description="Use TSA"),
+    embed_ltv: bool = Form(default=False, description="Embed LTV"),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+    job_service: SigningJobService = Depends(get_signing_job_service),
+    spool: UploadSpool = Depends(get_upload_spool),
+) -> SigningJobResponse:
+    """Queue documents for background signing and return the job for polling."""
+
+    batch = await _parse_batch_request(
+        spool=spool,
+        pdf_files=pdf_files,
+        certificate_id=certificate_id,
+        seal_id=seal_id,
+        visibility=visibility,
+        page=page,
+        x=x,
+        y=y,
+        width=width,
+        height=height,
+        reason=reason,
+        location=location,
+        contact_info=contact_info,
+        max_count=settings.pdf_job_max_documents,
+    )
+
+    try:
+        job = await job_service.submit_job(
+            session=session,
+            owner_id=current_user.id,
+            documents=batch.pdfs,
+            certificate_id=batch.certificate_id,
+            seal_id=batch.seal_id,
+            visibility=_convert_visibility(batch.visibility),
+            coordinates=_convert_coordinates(batch.coordinates),
+            metadata=_convert_metadata(batch.metadata),
+            use_tsa=use_tsa,
+            embed_ltv=embed_ltv,
+        )
+    except SigningJobLimitError as exc:
+        raise InvalidFileError(str(exc)) from exc
+    except CertificateNotFoundError as exc:
+        raise NotFoundError("Certificate") from exc
+    except (CertificateInvalidError, SealNotFoundError) as exc:
+        raise OperationFailedError("PDF signing operation failed", str(exc)) from exc
+    # The uploads now live in the job directory and belong to the job.
+    spool.detach()
+
+    await _record_audit_event(
+        session=session,
+        request=request,
+        actor_id=current_user.id,
+        event_type="pdf.signature.job_submitted",
+        resource="pdf",
+        meta={
+            "job_id": str(job.id),
+            "total": job.total_items,
+            "certificate_id": str(job.certificate_id),
+            "seal_id": str(job.seal_id) if job.seal_id else None,
+            "visibility": job.visibility,
+            "tsa_used": job.use_tsa,
+            "ltv_embedded": job.embed_ltv,
+        },
+    )
+
+    return _job_response(job)
+
+
+@router.get("/jobs/{job_id}", response_model=SigningJobResponse)
+async def get_signing_job(
+    job_id: UUID,
+    offset: int = Query(default=0, ge=0, description="Number of documents to skip"),
+    limit: int = Query(
+        default=100, ge=0, le=1000, description="Maximum number of documents"
+    ),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+    job_service: SigningJobService = Depends(get_signing_job_service),
+) -> SigningJobResponse:
+    """Return job progress and a page of per-document results."""
+
+    try:
+        job = await job_service.get_job(
+            session=session, job_id=job_id, owner_id=current_user.id
+        )
+    except SigningJobNotFoundError as exc:
+        raise NotFoundError("Signing job", str(job_id)) from exc
+
+    items = await signing_job_crud.list_job_items(
+        session=session, job_id=job.id, offset=offset, limit=limit
+    )
+    return _job_response(job, items)
+
+
+@router.get("/jobs/{job_id}/items/{item_id}/download")
+async def download_signing_job_item(
+    job_id: UUID,
+    item_id: UUID,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+    job_service: SigningJobService = Depends(get_signing_job_service),
+) -> StreamingResponse:
+    """Stream one signed document of a job."""
+
+    try:
+        item = await job_service.get_item(
+            session=session, job_id=job_id, item_id=item_id, owner_id=current_user.id
+        )
+    except SigningJobNotFoundError as exc:
+        raise NotFoundError("Signing job item", str(item_id)) from exc
+
+    if (
+        item.status != SigningJobItemStatus.SUCCEEDED.value
+        or item.output_path is None
+        or item.file_size is None
+    ):
+        raise InvalidStateError(
+            "Signed document is not available", f"Item status: {item.status}"
+        )
+
+    signed_filename = _signed_filename(item.filename)
+    quoted_filename = quote(signed_filename)
+    content_disposition = f'attachment; filename="{signed_filename}"'
+    if quoted_filename != signed_filename:
+        content_disposition += f"; filename*=UTF-8''{quoted_filename}"
+
+    headers = {
+        "Content-Disposition": content_disposition,
+        "Content-Length": str(item.file_size),
+    }
+    if item.document_id:
+        headers["X-Document-ID"] = item.document_id
+
+    return StreamingResponse(
+        iter_source_chunks(SpooledFile(path=item.output_path, size=item.file_size)),
+        media_type="application/pdf",
+        headers=headers,
+    )
+
+
+@router.get("/jobs/{job_id}/archive")
+async def download_signing_job_archive(
+    job_id: UUID,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+    job_service: SigningJobService = Depends(get_signing_job_service),
+) -> StreamingResponse:
+    """Stream every document signed so far as a ZIP archive with a manifest."""
+
+    try:
+        job = await job_service.get_job(
+            session=session, job_id=job_id, owner_id=current_user.id
+        )
+    except SigningJobNotFoundError as exc:
+        raise NotFoundError("Signing job", str(job_id)) from exc
+
+    items = await signing_job_crud.list_job_items(session=session, job_id=job.id)
+
+    def archive_stream() -> Iterator[bytes]:
+        archive = StreamingZipWriter()
+        manifest_items: list[PDFBatchArchiveManifestItem] = []
+        for item in items:
+            archive_name: str | None = None
+            if (
+                item.status == SigningJobItemStatus.SUCCEEDED.value
+                and item.output_path is not None
+                and item.file_size is not None
+            ):
+                archive_name = archive.unique_name(_signed_filename(item.filename))
+                yield from archive.add_source(
+                    archive_name,
+                    SpooledFile(path=item.output_path, size=item.file_size),
+                    modified_at=item.signed_at,
+                )
+            manifest_items.append(
+                PDFBatchArchiveManifestItem(
+                    filename=item.filename,
+                    success=archive_name is not None,
+                    document_id=item.document_id,
+                    signed_at=item.signed_at,
+                    file_size=item.file_size,
+                    error=item.error,
+                    archive_name=archive_name,
+                )
+            )
+
+        manifest = PDFBatchArchiveManifest(
+            total=job.total_items,
+            successful=job.succeeded_items,
+            failed=job.failed_items,
+            results=manifest_items,
+            certificate_id=job.certificate_id,
+            seal_id=job.seal_id,
+            visibility=SignatureVisibility(job.visibility),
+            tsa_used=job.use_tsa,
+            ltv_embedded=job.embed_ltv,
+        )
+        yield archive.add(
+            "manifest.json", manifest.model_dump_json(indent=2).encode("utf-8")
+        )
+        yield archive.finish()
+
+    return StreamingResponse(
+        archive_stream(),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="signing-job-{job.id}.zip"'
+        },
+    )
+
+
+@router.delete("/jobs/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_signing_job(
+    request: Request,
+    job_id: UUID,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+    job_service: SigningJobService = Depends(get_signing_job_service),
+) -> Response:
+    """Cancel outstanding work for a job and delete its documents."""
+
+    try:
+        await job_service.delete_job(
+            session=session, job_id=job_id, owner_id=current_user.id
+        )
+    except SigningJobNotFoundError as exc:
+        raise NotFoundError("Signing job", str(job_id)) from exc
+
+    await _record_audit_event(
+        session=session,
+        request=request,
+        actor_id=current_user.id,
+        event_type="pdf.signature.job_deleted",
+        resource="pdf",
+        meta={"job_id": str(job_id)},
+    )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
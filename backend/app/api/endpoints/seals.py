@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, File, Form, Query, UploadFile, status
@@ -9,6 +10,7 @@ from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies.auth import get_current_user
+from app.api.dependencies.services import get_storage_service
 from app.core.config import settings
 from app.core.errors import (
     ForbiddenError,
@@ -22,6 +24,11 @@ from app.crud import seal as seal_crud
 from app.db.session import get_db
 from app.models.user import User
 from app.schemas.seal import SealCreate, SealListResponse, SealResponse
+from app.services.seal_appearance import (
+    SealAppearanceError,
+    get_seal_appearance_cache,
+    render_seal_appearance,
+)
 from app.services.storage import (
     EncryptedStorageService,
     StorageNotFoundError,
@@ -40,6 +47,7 @@ async def upload_seal(
     *,
     session: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    storage_service: EncryptedStorageService = Depends(get_storage_service),
     name: str = Form(..., min_length=1, max_length=120),
     description: str | None = Form(default=None),
     file: UploadFile = File(...),
@@ -70,7 +78,6 @@ async def upload_seal(
         )
 
     # Store the seal image in encrypted storage
-    storage_service = EncryptedStorageService()
     try:
         file_metadata, secret = await storage_service.store_seal_image(
             session=session,
@@ -99,6 +106,15 @@ async def upload_seal(
             "Failed to create seal. Name might already exist for this user.", str(exc)
         ) from exc
 
+    # Render the signature appearance now so the first visible signature
+    # with this seal does not pay for decoding the image.
+    try:
+        appearance = await asyncio.to_thread(render_seal_appearance, content)
+    except SealAppearanceError:
+        pass
+    else:
+        get_seal_appearance_cache().put(seal.id, secret.id, appearance)
+
     # Create audit log for seal creation
     await audit_log_crud.create_audit_log(
         session=session,
@@ -171,6 +187,7 @@ async def download_seal_image(
     *,
     session: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    storage_service: EncryptedStorageService = Depends(get_storage_service),
     seal_id: UUID,
 ) -> StreamingResponse:
     """
@@ -193,7 +210,6 @@ async def download_seal_image(
         raise NotFoundError("Seal image")
 
     # Retrieve the encrypted image
-    storage_service = EncryptedStorageService()
     try:
         image_data = await storage_service.load_seal_image(
             session=session, secret_id=seal.image_secret.id
@@ -238,6 +254,7 @@ async def delete_seal(
 
     # Delete the seal
     await seal_crud.delete_seal(session=session, seal=seal, commit=True)
+    get_seal_appearance_cache().invalidate(seal_id)
 
     # Create audit log for seal deletion
     await audit_log_crud.create_audit_log(
@@ -0,0 +1,91 @@
+"""RFC 3161 timestamping endpoint served by the built-in timestamp authority."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
+
+from app.core.config import settings
+from app.core.errors import (
+    FileTooLargeError,
+    InvalidFileError,
+    NotFoundError,
+    ServiceUnavailableError,
+)
+from app.services.timestamp_authority import (
+    TimestampAuthorityError,
+    get_local_timestamp_authority,
+)
+
+router = APIRouter(prefix="/tsa", tags=["timestamp-authority"])
+
+QUERY_CONTENT_TYPE = "application/timestamp-query"
+REPLY_CONTENT_TYPE = "application/timestamp-reply"
+# Timestamp queries carry a digest, a nonce and a few OIDs; real ones are tiny.
+MAX_QUERY_BYTES = 64 * 1024
+
+
+@router.post(
+    "",
+    response_class=Response,
+    responses={200: {"content": {REPLY_CONTENT_TYPE: {}}}},
+)
+async def timestamp(request: Request) -> Response:
+    """Answer a DER encoded RFC 3161 timestamp query.
+
+    Rejected queries are still answered with HTTP 200 and a
+    ``TimeStampResp`` carrying the failure status, as RFC 3161 requires.
+    """
+
+    if not settings.tsa_local_enabled:
+        raise NotFoundError("Timestamp authority")
+
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type != QUERY_CONTENT_TYPE:
+        raise InvalidFileError(
+            "Unsupported content type", f"Expected {QUERY_CONTENT_TYPE}"
+        )
+
+    body = await _read_query(request)
+
+    try:
+        authority = await get_local_timestamp_authority()
+    except TimestampAuthorityError as exc:
+        raise ServiceUnavailableError(
+            "Timestamp authority is not ready", str(exc)
+        ) from exc
+
+    reply = await authority.respond_der(body)
+    return Response(content=reply, media_type=REPLY_CONTENT_TYPE)
+
+
+def _query_too_large() -> FileTooLargeError:
+    return FileTooLargeError(
+        "Timestamp query too large", f"Maximum size is {MAX_QUERY_BYTES} bytes"
+    )
+
+
+async def _read_query(request: Request) -> bytes:
+    """Read the query body, refusing anything over ``MAX_QUERY_BYTES``.
+
+    The endpoint is unauthenticated, so an oversized declared length is
+    rejected up front and the stream is never buffered past the limit.
+    """
+
+    declared = request.headers.get("content-length")
+    if declared is not None:
+        try:
+            declared_size = int(declared)
+        except ValueError as exc:
+            raise InvalidFileError(
+                "Invalid Content-Length", "Expected a byte count"
+            ) from exc
+        if declared_size > MAX_QUERY_BYTES:
+            raise _query_too_large()
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body.extend(chunk)
+        if len(body) > MAX_QUERY_BYTES:
+            raise _query_too_large()
+    return bytes(body)
@@ -0,0 +1,21 @@
+"""Helpers for answering conditional ``GET`` requests."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from email.utils import format_datetime
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """Apply the weak comparison ``If-None-Match`` calls for."""
+
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return "*" in candidates or any(
+        candidate.removeprefix("W/") == etag for candidate in candidates
+    )
+
+
+def http_date(value: datetime) -> str:
+    """Format a UTC datetime for ``Last-Modified`` and similar headers."""
+
+    return format_datetime(value, usegmt=True)
@@ -1,12 +1,24 @@
 import logging
+from dataclasses import asdict
 from datetime import datetime, timezone
+from typing import Any
 
 from fastapi import APIRouter, HTTPException
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.api.endpoints import audit, auth, ca, pdf_signing, seals, users
+from app.api.endpoints import audit, auth, ca, pdf_signing, seals, tsa, users
 from app.core.config import settings
 from app.db.session import get_engine
+from app.services.ca_distribution import get_ca_distribution_cache
+from app.services.key_pool import get_leaf_key_pool
+from app.services.ltv_material import get_ltv_material_cache
+from app.services.root_material import get_root_material_cache
+from app.services.seal_appearance import get_seal_appearance_cache
+from app.services.signer_cache import get_signer_cache
+from app.services.signing_executor import get_signing_executor
+from app.services.signing_idempotency import get_signed_result_store
+from app.services.signing_metrics import get_signing_metrics
+from app.services.tsa_client import get_tsa_client
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +30,7 @@ api_router.include_router(audit.router)
 api_router.include_router(ca.router)
 api_router.include_router(pdf_signing.router)
 api_router.include_router(seals.router)
+api_router.include_router(tsa.router)
 api_router.include_router(users.router, prefix="/users")
 router.include_router(api_router)
 
@@ -61,3 +74,40 @@ async def health_check_db() -> dict[str, str]:
     except Exception as e:
         logger.error(f"Unexpected database health check error: {e}")
         raise HTTPException(status_code=503, detail="Database health check failed")
+
+
+@router.get("/health/signing", tags=["health"])
+async def health_check_signing() -> dict[str, Any]:
+    """Report signing pool load, cache and replay hit rates, stage and TSA latency."""
+
+    stats = get_signing_executor().stats()
+    return {
+        "status": "ok",
+        "service": settings.app_name,
+        "signing": {**asdict(stats), "mode": stats.mode.value},
+        "signer_cache": asdict(get_signer_cache().stats()),
+        "seal_appearance_cache": asdict(get_seal_appearance_cache().stats()),
+        "ltv_material": asdict(get_ltv_material_cache().stats()),
+        "signing_stages": {
+            stage: asdict(stats)
+            for stage, stats in get_signing_metrics().stats().items()
+        },
+        "idempotency": asdict(get_signed_result_store().stats()),
+        "tsa": asdict(get_tsa_client().stats()),
+    }
+
+
+@router.get("/health/ca", tags=["health"])
+async def health_check_ca() -> dict[str, Any]:
+    """Report leaf key pool depth and CA material cache counters."""
+
+    return {
+        "status": "ok",
+        "service": settings.app_name,
+        "key_pool": {
+            algorithm: asdict(stats)
+            for algorithm, stats in get_leaf_key_pool().stats().items()
+        },
+        "root_material": asdict(get_root_material_cache().stats()),
+        "distribution": asdict(get_ca_distribution_cache().stats()),
+    }
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import base64
+import os
 from enum import Enum
 from functools import lru_cache
 from pathlib import Path
@@ -26,6 +27,14 @@ class StorageEncryptionAlgorithm(str, Enum):
     AES_GCM = "aes-gcm"
 
 
+class SigningExecutionMode(str, Enum):
+    """Where the CPU-bound pyHanko signing work is executed."""
+
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
@@ -89,15 +98,104 @@ class Settings(BaseSettings):
         alias="SEAL_IMAGE_ALLOWED_CONTENT_TYPES",
     )
 
+    ca_key_pool_algorithms: list[str] = Field(
+        default_factory=lambda: ["rsa-2048"], alias="CA_KEY_POOL_ALGORITHMS"
+    )
+    ca_key_pool_low_watermark: int = Field(default=4, alias="CA_KEY_POOL_LOW_WATERMARK")
+    ca_key_pool_high_watermark: int = Field(
+        default=16, alias="CA_KEY_POOL_HIGH_WATERMARK"
+    )
+    ca_key_pool_workers: int = Field(default=1, alias="CA_KEY_POOL_WORKERS")
+    ca_distribution_cache_ttl_seconds: int = Field(
+        default=60, alias="CA_DISTRIBUTION_CACHE_TTL_SECONDS"
+    )
+    ca_root_certificate_max_age_seconds: int = Field(
+        default=3600, alias="CA_ROOT_CERTIFICATE_MAX_AGE_SECONDS"
+    )
+
     pdf_max_bytes: int = Field(default=50 * 1024 * 1024, alias="PDF_MAX_BYTES")
     pdf_allowed_content_types: list[str] = Field(
         default_factory=lambda: ["application/pdf"],
         alias="PDF_ALLOWED_CONTENT_TYPES",
     )
     pdf_batch_max_count: int = Field(default=10, alias="PDF_BATCH_MAX_COUNT")
+    pdf_batch_concurrency: int = Field(default=4, alias="PDF_BATCH_CONCURRENCY")
+    pdf_spool_dir: Path | None = Field(default=None, alias="PDF_SPOOL_DIR")
+    pdf_signing_execution_mode: SigningExecutionMode = Field(
+        default=SigningExecutionMode.THREAD,
+        alias="PDF_SIGNING_EXECUTION_MODE",
+    )
+    pdf_signing_pool_size: int = Field(
+        default_factory=lambda: os.cpu_count() or 1,
+        alias="PDF_SIGNING_POOL_SIZE",
+    )
+    pdf_signing_pool_max_queue: int = Field(
+        default=32, alias="PDF_SIGNING_POOL_MAX_QUEUE"
+    )
+    pdf_signing_pool_max_tasks_per_child: int = Field(
+        default=200, alias="PDF_SIGNING_POOL_MAX_TASKS_PER_CHILD"
+    )
+    pdf_signer_cache_size: int = Field(default=128, alias="PDF_SIGNER_CACHE_SIZE")
+    pdf_signer_cache_ttl_seconds: int = Field(
+        default=300, alias="PDF_SIGNER_CACHE_TTL_SECONDS"
+    )
+    pdf_seal_appearance_cache_size: int = Field(
+        default=64, alias="PDF_SEAL_APPEARANCE_CACHE_SIZE"
+    )
+    pdf_ltv_cache_ttl_seconds: int = Field(
+        default=300, alias="PDF_LTV_CACHE_TTL_SECONDS"
+    )
+    pdf_idempotency_enabled: bool = Field(
+        default=False, alias="PDF_IDEMPOTENCY_ENABLED"
+    )
+    pdf_idempotency_ttl_seconds: int = Field(
+        default=900, alias="PDF_IDEMPOTENCY_TTL_SECONDS"
+    )
+    pdf_idempotency_max_entries: int = Field(
+        default=1000, alias="PDF_IDEMPOTENCY_MAX_ENTRIES"
+    )
+    pdf_idempotency_max_document_bytes: int = Field(
+        default=10 * 1024 * 1024, alias="PDF_IDEMPOTENCY_MAX_DOCUMENT_BYTES"
+    )
+    pdf_document_retention_seconds: int = Field(
+        default=86400, alias="PDF_DOCUMENT_RETENTION_SECONDS"
+    )
+    pdf_download_cache_entries: int = Field(
+        default=16, alias="PDF_DOWNLOAD_CACHE_ENTRIES"
+    )
+    pdf_job_dir: Path | None = Field(default=None, alias="PDF_JOB_DIR")
+    pdf_job_max_documents: int = Field(default=1000, alias="PDF_JOB_MAX_DOCUMENTS")
+    pdf_job_workers: int = Field(default=2, alias="PDF_JOB_WORKERS")
+    pdf_job_poll_interval_seconds: float = Field(
+        default=2.0, alias="PDF_JOB_POLL_INTERVAL_SECONDS"
+    )
+    pdf_job_claim_timeout_seconds: int = Field(
+        default=900, alias="PDF_JOB_CLAIM_TIMEOUT_SECONDS"
+    )
+    pdf_job_max_attempts: int = Field(default=3, alias="PDF_JOB_MAX_ATTEMPTS")
+    pdf_job_retention_hours: int = Field(default=24, alias="PDF_JOB_RETENTION_HOURS")
     tsa_url: str | None = Field(default=None, alias="TSA_URL")
+    tsa_urls: list[str] = Field(default_factory=list, alias="TSA_URLS")
     tsa_username: str | None = Field(default=None, alias="TSA_USERNAME")
     tsa_password: SecretStr | None = Field(default=None, alias="TSA_PASSWORD")
+    tsa_timeout_seconds: float = Field(default=10.0, alias="TSA_TIMEOUT_SECONDS")
+    tsa_max_connections: int = Field(default=10, alias="TSA_MAX_CONNECTIONS")
+    tsa_signature_reserve_bytes: int = Field(
+        default=16384, alias="TSA_SIGNATURE_RESERVE_BYTES"
+    )
+    tsa_hedge_percentile: float = Field(default=0.95, alias="TSA_HEDGE_PERCENTILE")
+    tsa_hedge_default_delay_ms: int = Field(
+        default=1000, alias="TSA_HEDGE_DEFAULT_DELAY_MS"
+    )
+    tsa_breaker_error_rate: float = Field(default=0.5, alias="TSA_BREAKER_ERROR_RATE")
+    tsa_breaker_cooldown_seconds: float = Field(
+        default=30.0, alias="TSA_BREAKER_COOLDOWN_SECONDS"
+    )
+    tsa_local_enabled: bool = Field(default=False, alias="TSA_LOCAL_ENABLED")
+    tsa_local_policy_oid: str = Field(
+        default="2.25.103459978499409053173109096185925042356",
+        alias="TSA_LOCAL_POLICY_OID",
+    )
 
     _master_key_bytes: bytes = PrivateAttr(default=b"")
     _raw_master_key: str = PrivateAttr(default="")
@@ -129,8 +227,29 @@ class Settings(BaseSettings):
     @field_validator(
         "private_key_max_bytes",
         "seal_image_max_bytes",
+        "ca_key_pool_high_watermark",
+        "ca_key_pool_workers",
+        "ca_distribution_cache_ttl_seconds",
+        "ca_root_certificate_max_age_seconds",
         "pdf_max_bytes",
         "pdf_batch_max_count",
+        "pdf_batch_concurrency",
+        "pdf_signing_pool_size",
+        "pdf_signing_pool_max_tasks_per_child",
+        "pdf_signer_cache_ttl_seconds",
+        "pdf_ltv_cache_ttl_seconds",
+        "pdf_idempotency_ttl_seconds",
+        "pdf_idempotency_max_entries",
+        "pdf_idempotency_max_document_bytes",
+        "pdf_document_retention_seconds",
+        "pdf_download_cache_entries",
+        "pdf_job_max_documents",
+        "pdf_job_claim_timeout_seconds",
+        "pdf_job_max_attempts",
+        "pdf_job_retention_hours",
+        "tsa_max_connections",
+        "tsa_signature_reserve_bytes",
+        "tsa_hedge_default_delay_ms",
     )
     @classmethod
     def _validate_positive_int(cls, value: int) -> int:
@@ -138,6 +257,23 @@ class Settings(BaseSettings):
             raise ValueError("Sizes must be positive integers")
         return value
 
+    @field_validator("tsa_urls", mode="before")
+    @classmethod
+    def _assemble_tsa_urls(cls, value: Any) -> list[str]:
+        return cls._normalize_sequence(value)
+
+    @field_validator("ca_key_pool_algorithms", mode="before")
+    @classmethod
+    def _assemble_key_pool_algorithms(cls, value: Any) -> list[str]:
+        return [item.lower() for item in cls._normalize_sequence(value)]
+
+    @field_validator("tsa_hedge_percentile", "tsa_breaker_error_rate")
+    @classmethod
+    def _validate_fraction(cls, value: float) -> float:
+        if not 0 < value <= 1:
+            raise ValueError("Fractions must be greater than 0 and at most 1")
+        return value
+
     @field_validator("pdf_allowed_content_types", mode="before")
     @classmethod
     def _assemble_pdf_content_types(cls, value: Any) -> list[str]:
@@ -33,6 +33,7 @@ class ErrorCode(str, Enum):
 
     # Server errors
     INTERNAL_ERROR = "INTERNAL_ERROR"
+    SERVICE_UNAVAILABLE = "SERVICE_UNAVAILABLE"
 
 
 class APIException(Exception):
@@ -226,3 +227,15 @@ class InternalServerError(APIException):
             detail=detail,
             status_code=500,
         )
+
+
+class ServiceUnavailableError(APIException):
+    """Raised when the server is temporarily unable to accept the request."""
+
+    def __init__(self, message: str, detail: Optional[str] = None) -> None:
+        super().__init__(
+            code=ErrorCode.SERVICE_UNAVAILABLE,
+            message=message,
+            detail=detail,
+            status_code=503,
+        )
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import mmap
 from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, BinaryIO, cast
 
 import magic
 
 from app.core.config import settings
 
+if TYPE_CHECKING:
+    from app.services.spool import PDFSource
+
+# libmagic only inspects the leading bytes; avoid handing it whole documents.
+_MIME_SNIFF_BYTES = 64 * 1024
+
 _MAGIC_DETECTOR: Any = None
 _MAGIC_DETECTOR_FAILED = False
 
@@ -63,44 +70,65 @@ class PDFValidator(FileValidator):
     MAX_FILE_SIZE = settings.pdf_max_bytes
 
     @classmethod
-    def validate(cls, file_content: bytes, filename: str) -> tuple[bool, str | None]:
-        if len(file_content) == 0:
-            return False, "PDF file is empty"
+    def validate(
+        cls, file_content: bytes | mmap.mmap, filename: str
+    ) -> tuple[bool, str | None]:
+        error = cls._check_envelope(
+            len(file_content), file_content[:_MIME_SNIFF_BYTES], filename
+        )
+        if error is not None:
+            return False, error
 
-        if len(file_content) > cls.MAX_FILE_SIZE:
+        from app.services.pdf_ingest import PDFIngestError, read_document
+
+        if isinstance(file_content, mmap.mmap):
+            file_content.seek(0)
+            stream: BinaryIO = cast(BinaryIO, file_content)
+        else:
+            stream = BytesIO(file_content)
+        try:
+            read_document(stream)
+        except PDFIngestError as exc:
+            return False, str(exc)
+
+        return True, None
+
+    @classmethod
+    def precheck(cls, source: PDFSource, filename: str) -> tuple[bool, str | None]:
+        """Check size, name, MIME type and header without parsing the document.
+
+        Uploads bound for signing are parsed once by the signer, which also
+        rejects structurally broken files, so only the cheap checks run here.
+        """
+
+        from app.services.spool import source_head, source_size
+
+        error = cls._check_envelope(
+            source_size(source), source_head(source, _MIME_SNIFF_BYTES), filename
+        )
+        return error is None, error
+
+    @classmethod
+    def _check_envelope(cls, size: int, head: bytes, filename: str) -> str | None:
+        if size == 0:
+            return "PDF file is empty"
+
+        if size > cls.MAX_FILE_SIZE:
             max_mb = cls.MAX_FILE_SIZE / (1024 * 1024)
-            return False, f"File size exceeds {max_mb:.0f}MB limit"
+            return f"File size exceeds {max_mb:.0f}MB limit"
 
         if not filename.lower().endswith(".pdf"):
-            return False, "File must be a PDF (*.pdf)"
+            return "File must be a PDF (*.pdf)"
 
-        mime = _detect_mime(file_content)
+        mime = _detect_mime(head)
         if mime is None or mime not in cls.ALLOWED_MIME_TYPES:
             expected = ", ".join(sorted(cls.ALLOWED_MIME_TYPES)) or "application/pdf"
-            return (
-                False,
-                f"Invalid MIME type: {mime or 'unknown'}. Expected: {expected}",
-            )
+            return f"Invalid MIME type: {mime or 'unknown'}. Expected: {expected}"
 
-        if not file_content.startswith(b"%PDF"):
-            return False, "Invalid PDF file: missing PDF header"
+        if head[:4] != b"%PDF":
+            return "Invalid PDF file: missing PDF header"
 
-        try:
-            from pypdf import PdfReader
-            from pypdf.errors import PdfReadError
-        except ImportError as exc:  # pragma: no cover - defensive branch
-            return False, f"PDF validation dependency missing: {exc}"
-
-        try:
-            reader = PdfReader(BytesIO(file_content))
-            if len(reader.pages) == 0:
-                return False, "PDF file appears to be empty"
-        except PdfReadError as exc:
-            return False, f"PDF file is corrupted or invalid: {exc}"
-        except Exception as exc:  # pragma: no cover - defensive branch
-            return False, f"PDF file is corrupted or invalid: {exc}"
-
-        return True, None
+        return None
 
 
 class SealImageValidator(FileValidator):
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import Select, select
+from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -21,7 +22,8 @@ async def get_latest_artifact_by_type(
     statement: Select[tuple[CAArtifact]] = (
         select(CAArtifact)
         .where(CAArtifact.artifact_type == artifact_type.value)
-        .order_by(CAArtifact.created_at.desc())
+        # CRLs published within the same second are told apart by number.
+        .order_by(CAArtifact.created_at.desc(), CAArtifact.crl_number.desc())
         .limit(1)
         .options(
             selectinload(CAArtifact.file),
@@ -32,6 +34,35 @@ async def get_latest_artifact_by_type(
     return result.scalar_one_or_none()
 
 
+async def get_latest_artifact_id_by_type(
+    *,
+    session: AsyncSession,
+    artifact_type: CAArtifactType,
+) -> UUID | None:
+    """Return only the identifier of the newest artifact for the supplied type."""
+
+    statement = (
+        select(CAArtifact.id)
+        .where(CAArtifact.artifact_type == artifact_type.value)
+        .order_by(CAArtifact.created_at.desc())
+        .limit(1)
+    )
+    result = await session.execute(statement)
+    return result.scalar_one_or_none()
+
+
+async def get_highest_crl_number(*, session: AsyncSession) -> int | None:
+    """Return the highest CRL number issued across base and delta CRLs."""
+
+    statement = select(func.max(CAArtifact.crl_number)).where(
+        CAArtifact.artifact_type.in_(
+            [CAArtifactType.CRL.value, CAArtifactType.DELTA_CRL.value]
+        )
+    )
+    result = await session.execute(statement)
+    return result.scalar_one_or_none()
+
+
 async def create_artifact(
     *,
     session: AsyncSession,
@@ -40,6 +71,9 @@ async def create_artifact(
     description: str | None = None,
     file_id: UUID | None = None,
     secret_id: UUID | None = None,
+    crl_number: int | None = None,
+    base_crl_number: int | None = None,
+    this_update: datetime | None = None,
     commit: bool = True,
 ) -> CAArtifact:
     """Persist a new certificate authority artifact."""
@@ -50,6 +84,9 @@ async def create_artifact(
         description=description,
         file_id=file_id,
         secret_id=secret_id,
+        crl_number=crl_number,
+        base_crl_number=base_crl_number,
+        this_update=this_update,
     )
     session.add(artifact)
     await session.flush()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import AsyncIterator
 from uuid import UUID
 
 from sqlalchemy import select
@@ -98,6 +99,31 @@ async def list_revoked_certificates(*, session: AsyncSession) -> list[Certificat
     return list(result.scalars().all())
 
 
+async def iter_revoked_serials(
+    *,
+    session: AsyncSession,
+    revoked_since: datetime | None = None,
+    batch_size: int = 5000,
+) -> AsyncIterator[list[tuple[str, datetime]]]:
+    """Yield ``(serial_number, updated_at)`` rows of revoked certificates in batches.
+
+    Only the two columns a CRL entry needs are read, and rows are streamed,
+    so stored certificates are never loaded for revocation lists.
+    """
+
+    statement = select(Certificate.serial_number, Certificate.updated_at).where(
+        Certificate.status == CertificateStatus.REVOKED.value
+    )
+    if revoked_since is not None:
+        statement = statement.where(Certificate.updated_at >= revoked_since)
+    result = await session.stream(statement.execution_options(yield_per=batch_size))
+    try:
+        async for rows in result.partitions():
+            yield [(serial_number, updated_at) for serial_number, updated_at in rows]
+    finally:
+        await result.close()
+
+
 async def mark_certificate_revoked(
     *,
     session: AsyncSession,
@@ -0,0 +1,121 @@
+"""CRUD helpers for stored signed documents."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Sequence
+from uuid import UUID
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.signed_document import SignedDocument
+from app.models.storage import EncryptedSecret, FileMetadata
+
+
+async def get_by_idempotency_key(
+    *,
+    session: AsyncSession,
+    owner_id: int,
+    idempotency_key: str,
+) -> SignedDocument | None:
+    """Return the document stored for ``idempotency_key`` by ``owner_id``."""
+
+    statement = select(SignedDocument).where(
+        SignedDocument.owner_id == owner_id,
+        SignedDocument.idempotency_key == idempotency_key,
+    )
+    result = await session.execute(statement)
+    return result.scalar_one_or_none()
+
+
+async def get_by_document_id(
+    *,
+    session: AsyncSession,
+    owner_id: int,
+    document_id: str,
+) -> SignedDocument | None:
+    """Return ``owner_id``'s stored document together with its file metadata."""
+
+    statement = (
+        select(SignedDocument)
+        .options(selectinload(SignedDocument.file))
+        .where(
+            SignedDocument.owner_id == owner_id,
+            SignedDocument.document_id == document_id,
+        )
+    )
+    result = await session.execute(statement)
+    return result.scalar_one_or_none()
+
+
+async def create_signed_document(
+    *,
+    session: AsyncSession,
+    document: SignedDocument,
+    commit: bool = True,
+) -> SignedDocument:
+    """Persist a stored signed document record."""
+
+    session.add(document)
+    await session.flush()
+    if commit:
+        await session.commit()
+        await session.refresh(document)
+    return document
+
+
+async def delete_signed_documents(
+    *,
+    session: AsyncSession,
+    document_ids: Sequence[UUID],
+    commit: bool = True,
+) -> None:
+    """Delete stored documents together with their encrypted payloads."""
+
+    if not document_ids:
+        return
+    file_ids = select(SignedDocument.file_id).where(SignedDocument.id.in_(document_ids))
+    file_id_list = list((await session.execute(file_ids)).scalars())
+    await session.execute(
+        delete(SignedDocument).where(SignedDocument.id.in_(document_ids))
+    )
+    await session.execute(
+        delete(EncryptedSecret).where(EncryptedSecret.file_id.in_(file_id_list))
+    )
+    await session.execute(delete(FileMetadata).where(FileMetadata.id.in_(file_id_list)))
+    if commit:
+        await session.commit()
+
+
+async def purge_signed_documents(
+    *,
+    session: AsyncSession,
+    now: datetime,
+    max_entries: int,
+) -> int:
+    """Delete expired documents and the oldest cached ones beyond ``max_entries``.
+
+    Persisted documents only leave the store once they expire.
+    """
+
+    expired = select(SignedDocument.id).where(SignedDocument.expires_at <= now)
+    doomed = list((await session.execute(expired)).scalars())
+
+    cached = (SignedDocument.expires_at > now, SignedDocument.persisted.is_(False))
+    remaining = await session.scalar(
+        select(func.count()).select_from(SignedDocument).where(*cached)
+    )
+    overflow = (remaining or 0) - max_entries
+    if overflow > 0:
+        oldest = (
+            select(SignedDocument.id)
+            .where(*cached)
+            .order_by(SignedDocument.signed_at)
+            .limit(overflow)
+        )
+        doomed.extend((await session.execute(oldest)).scalars())
+
+    await delete_signed_documents(session=session, document_ids=doomed)
+    return len(doomed)
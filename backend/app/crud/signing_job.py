@@ -0,0 +1,380 @@
+"""CRUD helpers for asynchronous signing jobs and their work queue."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Sequence, cast
+from uuid import UUID
+
+from sqlalchemy import CursorResult, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.signing_job import (
+    SigningJob,
+    SigningJobItem,
+    SigningJobItemStatus,
+    SigningJobStatus,
+)
+
+_ACTIVE_JOB_STATUSES = (SigningJobStatus.QUEUED.value, SigningJobStatus.RUNNING.value)
+
+
+async def create_job(
+    *,
+    session: AsyncSession,
+    job_id: UUID,
+    owner_id: int,
+    certificate_id: UUID,
+    seal_id: UUID | None,
+    visibility: str,
+    coordinates: dict[str, Any] | None,
+    signature_meta: dict[str, Any] | None,
+    use_tsa: bool,
+    embed_ltv: bool,
+    documents: Sequence[tuple[str, str, int]],
+    commit: bool = True,
+) -> SigningJob:
+    """Persist a job and one queued item per ``(filename, path, size)`` document."""
+
+    queued_at = datetime.now(timezone.utc)
+    job = SigningJob(
+        id=job_id,
+        owner_id=owner_id,
+        certificate_id=certificate_id,
+        seal_id=seal_id,
+        status=SigningJobStatus.QUEUED.value,
+        visibility=visibility,
+        coordinates=coordinates,
+        signature_meta=signature_meta,
+        use_tsa=use_tsa,
+        embed_ltv=embed_ltv,
+        total_items=len(documents),
+        succeeded_items=0,
+        failed_items=0,
+    )
+    session.add(job)
+    session.add_all(
+        SigningJobItem(
+            job_id=job_id,
+            position=position,
+            filename=filename,
+            status=SigningJobItemStatus.QUEUED.value,
+            input_path=path,
+            input_size=size,
+            attempts=0,
+            queued_at=queued_at,
+        )
+        for position, (filename, path, size) in enumerate(documents)
+    )
+    await session.flush()
+    if commit:
+        await session.commit()
+        await session.refresh(job)
+    return job
+
+
+async def get_job_by_id(*, session: AsyncSession, job_id: UUID) -> SigningJob | None:
+    """Return a signing job by its identifier."""
+
+    statement = select(SigningJob).where(SigningJob.id == job_id)
+    result = await session.execute(statement)
+    return result.scalar_one_or_none()
+
+
+async def list_job_items(
+    *,
+    session: AsyncSession,
+    job_id: UUID,
+    offset: int = 0,
+    limit: int | None = None,
+) -> list[SigningJobItem]:
+    """Return the items of a job in submission order."""
+
+    statement = (
+        select(SigningJobItem)
+        .where(SigningJobItem.job_id == job_id)
+        .order_by(SigningJobItem.position)
+        .offset(offset)
+    )
+    if limit is not None:
+        statement = statement.limit(limit)
+    result = await session.execute(statement)
+    return list(result.scalars().all())
+
+
+async def get_job_item(
+    *, session: AsyncSession, job_id: UUID, item_id: UUID
+) -> SigningJobItem | None:
+    """Return a single item belonging to ``job_id``."""
+
+    statement = select(SigningJobItem).where(
+        SigningJobItem.id == item_id, SigningJobItem.job_id == job_id
+    )
+    result = await session.execute(statement)
+    return result.scalar_one_or_none()
+
+
+async def claim_next_item(
+    *, session: AsyncSession, max_retries: int = 3
+) -> SigningJobItem | None:
+    """Atomically move the oldest queued item to ``running`` and return it.
+
+    The claim is a compare-and-set on the item status, so several workers
+    (or several application processes) can poll the same queue safely.
+    """
+
+    for _ in range(max_retries):
+        candidate = await session.execute(
+            select(SigningJobItem.id)
+            .join(SigningJob, SigningJob.id == SigningJobItem.job_id)
+            .where(
+                SigningJobItem.status == SigningJobItemStatus.QUEUED.value,
+                SigningJob.status.in_(_ACTIVE_JOB_STATUSES),
+            )
+            .order_by(SigningJobItem.queued_at, SigningJobItem.position)
+            .limit(1)
+        )
+        item_id = candidate.scalar_one_or_none()
+        if item_id is None:
+            return None
+
+        now = datetime.now(timezone.utc)
+        claimed = cast(
+            CursorResult[Any],
+            await session.execute(
+                update(SigningJobItem)
+                .where(
+                    SigningJobItem.id == item_id,
+                    SigningJobItem.status == SigningJobItemStatus.QUEUED.value,
+                )
+                .values(
+                    status=SigningJobItemStatus.RUNNING.value,
+                    claimed_at=now,
+                    attempts=SigningJobItem.attempts + 1,
+                )
+            ),
+        )
+        if claimed.rowcount != 1:
+            await session.rollback()
+            continue
+
+        item = await session.get(SigningJobItem, item_id, populate_existing=True)
+        assert item is not None  # Claimed above within this transaction
+        await session.execute(
+            update(SigningJob)
+            .where(
+                SigningJob.id == item.job_id,
+                SigningJob.status == SigningJobStatus.QUEUED.value,
+            )
+            .values(status=SigningJobStatus.RUNNING.value, started_at=now)
+        )
+        await session.commit()
+        return item
+
+    return None
+
+
+async def requeue_item(*, session: AsyncSession, item_id: UUID) -> None:
+    """Put a claimed item back at the end of the queue.
+
+    The item was handed back without being signed (the pool was busy or the
+    worker shut down), so the claim does not count as an attempt.
+    """
+
+    await session.execute(
+        update(SigningJobItem)
+        .where(
+            SigningJobItem.id == item_id,
+            SigningJobItem.status == SigningJobItemStatus.RUNNING.value,
+        )
+        .values(
+            status=SigningJobItemStatus.QUEUED.value,
+            claimed_at=None,
+            queued_at=datetime.now(timezone.utc),
+            attempts=SigningJobItem.attempts - 1,
+        )
+    )
+    await session.commit()
+
+
+async def complete_item(
+    *,
+    session: AsyncSession,
+    item: SigningJobItem,
+    output_path: str,
+    document_id: str,
+    file_size: int,
+    signed_at: datetime,
+) -> bool:
+    """Record a signed item and bump its job's counters.
+
+    Returns ``False`` when the item no longer exists or was not running,
+    for example because the job was deleted meanwhile.
+    """
+
+    return await _finish_item(
+        session=session,
+        item=item,
+        values={
+            "status": SigningJobItemStatus.SUCCEEDED.value,
+            "output_path": output_path,
+            "document_id": document_id,
+            "file_size": file_size,
+            "signed_at": signed_at,
+            "error": None,
+        },
+        counter=SigningJob.succeeded_items,
+    )
+
+
+async def fail_item(*, session: AsyncSession, item: SigningJobItem, error: str) -> bool:
+    """Record a failed item and bump its job's failure counter."""
+
+    return await _finish_item(
+        session=session,
+        item=item,
+        values={"status": SigningJobItemStatus.FAILED.value, "error": error},
+        counter=SigningJob.failed_items,
+    )
+
+
+async def _finish_item(
+    *,
+    session: AsyncSession,
+    item: SigningJobItem,
+    values: dict[str, Any],
+    counter: Any,
+) -> bool:
+    finished = cast(
+        CursorResult[Any],
+        await session.execute(
+            update(SigningJobItem)
+            .where(
+                SigningJobItem.id == item.id,
+                SigningJobItem.status == SigningJobItemStatus.RUNNING.value,
+            )
+            .values(**values)
+        ),
+    )
+    if finished.rowcount != 1:
+        await session.rollback()
+        return False
+
+    await session.execute(
+        update(SigningJob)
+        .where(SigningJob.id == item.job_id)
+        .values({counter.key: counter + 1})
+    )
+    now = datetime.now(timezone.utc)
+    done = (
+        SigningJob.succeeded_items + SigningJob.failed_items >= SigningJob.total_items
+    )
+    await session.execute(
+        update(SigningJob)
+        .where(
+            SigningJob.id == item.job_id,
+            SigningJob.status.in_(_ACTIVE_JOB_STATUSES),
+            done,
+            SigningJob.succeeded_items > 0,
+        )
+        .values(status=SigningJobStatus.COMPLETED.value, finished_at=now)
+    )
+    await session.execute(
+        update(SigningJob)
+        .where(
+            SigningJob.id == item.job_id,
+            SigningJob.status.in_(_ACTIVE_JOB_STATUSES),
+            done,
+        )
+        .values(status=SigningJobStatus.FAILED.value, finished_at=now)
+    )
+    await session.commit()
+    return True
+
+
+async def fail_exhausted_items(
+    *, session: AsyncSession, claimed_before: datetime, max_attempts: int
+) -> list[str]:
+    """Fail stale running items that have used up ``max_attempts`` claims.
+
+    A document that crashes or hangs its worker would otherwise be requeued
+    by :func:`release_stale_items` forever. Returns the input paths of the
+    items that were failed, so their spooled documents can be removed.
+    """
+
+    result = await session.execute(
+        select(SigningJobItem).where(
+            SigningJobItem.status == SigningJobItemStatus.RUNNING.value,
+            SigningJobItem.claimed_at < claimed_before,
+            SigningJobItem.attempts >= max_attempts,
+        )
+    )
+    failed: list[str] = []
+    for item in result.scalars().all():
+        input_path = item.input_path
+        if await fail_item(
+            session=session,
+            item=item,
+            error=f"Signing did not finish after {item.attempts} attempt(s)",
+        ):
+            failed.append(input_path)
+    return failed
+
+
+async def release_stale_items(
+    *, session: AsyncSession, claimed_before: datetime, max_attempts: int
+) -> int:
+    """Requeue running items whose worker stopped reporting back.
+
+    Items that have already been claimed ``max_attempts`` times are left for
+    :func:`fail_exhausted_items`.
+    """
+
+    result = cast(
+        CursorResult[Any],
+        await session.execute(
+            update(SigningJobItem)
+            .where(
+                SigningJobItem.status == SigningJobItemStatus.RUNNING.value,
+                SigningJobItem.claimed_at < claimed_before,
+                SigningJobItem.attempts < max_attempts,
+            )
+            .values(status=SigningJobItemStatus.QUEUED.value, claimed_at=None)
+        ),
+    )
+    await session.commit()
+    return result.rowcount or 0
+
+
+async def list_expired_jobs(
+    *, session: AsyncSession, finished_before: datetime, limit: int = 100
+) -> list[SigningJob]:
+    """Return finished jobs older than the retention cutoff, with their items."""
+
+    statement = (
+        select(SigningJob)
+        .where(
+            SigningJob.status.not_in(_ACTIVE_JOB_STATUSES),
+            SigningJob.finished_at < finished_before,
+        )
+        .order_by(SigningJob.finished_at)
+        .limit(limit)
+        .options(selectinload(SigningJob.items))
+    )
+    result = await session.execute(statement)
+    return list(result.scalars().all())
+
+
+async def delete_job(
+    *,
+    session: AsyncSession,
+    job_id: UUID,
+    commit: bool = True,
+) -> None:
+    """Delete a job together with its items."""
+
+    await session.execute(delete(SigningJobItem).where(SigningJobItem.job_id == job_id))
+    await session.execute(delete(SigningJob).where(SigningJob.id == job_id))
+    if commit:
+        await session.commit()
@@ -8,5 +8,7 @@ from app.models.ca_artifact import CAArtifact  # noqa: F401
 from app.models.certificate import Certificate  # noqa: F401
 from app.models.role import Role  # noqa: F401
 from app.models.seal import Seal  # noqa: F401
+from app.models.signed_document import SignedDocument  # noqa: F401
+from app.models.signing_job import SigningJob, SigningJobItem  # noqa: F401
 from app.models.storage import EncryptedSecret, FileMetadata  # noqa: F401
 from app.models.user import TokenBlocklist, User  # noqa: F401
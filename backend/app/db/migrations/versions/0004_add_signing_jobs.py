@@ -0,0 +1,97 @@
+"""Add tables backing the asynchronous signing job queue."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0004_add_signing_jobs"
+down_revision = "0003_add_username_to_users"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "signing_jobs",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("owner_id", sa.Integer(), nullable=True),
+        sa.Column("certificate_id", sa.Uuid(), nullable=False),
+        sa.Column("seal_id", sa.Uuid(), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("visibility", sa.String(length=20), nullable=False),
+        sa.Column("coordinates", sa.JSON(), nullable=True),
+        sa.Column("signature_meta", sa.JSON(), nullable=True),
+        sa.Column("use_tsa", sa.Boolean(), nullable=False),
+        sa.Column("embed_ltv", sa.Boolean(), nullable=False),
+        sa.Column("total_items", sa.Integer(), nullable=False),
+        sa.Column("succeeded_items", sa.Integer(), nullable=False),
+        sa.Column("failed_items", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["owner_id"], ["users.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_signing_jobs_owner_id", "signing_jobs", ["owner_id"], unique=False
+    )
+
+    op.create_table(
+        "signing_job_items",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("job_id", sa.Uuid(), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("filename", sa.String(length=255), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("input_path", sa.String(length=1024), nullable=False),
+        sa.Column("input_size", sa.BigInteger(), nullable=False),
+        sa.Column("output_path", sa.String(length=1024), nullable=True),
+        sa.Column("document_id", sa.String(length=32), nullable=True),
+        sa.Column("file_size", sa.BigInteger(), nullable=True),
+        sa.Column("signed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column(
+            "queued_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column("claimed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["job_id"], ["signing_jobs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_signing_job_items_status_queued_at",
+        "signing_job_items",
+        ["status", "queued_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_signing_job_items_job_position",
+        "signing_job_items",
+        ["job_id", "position"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_signing_job_items_job_position", table_name="signing_job_items")
+    op.drop_index(
+        "ix_signing_job_items_status_queued_at", table_name="signing_job_items"
+    )
+    op.drop_table("signing_job_items")
+    op.drop_index("ix_signing_jobs_owner_id", table_name="signing_jobs")
+    op.drop_table("signing_jobs")
@@ -0,0 +1,28 @@
+"""Mark signed documents kept for download beyond the replay window."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0006_persist_signed_documents"
+down_revision = "0005_add_signed_documents"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("signed_documents") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "persisted",
+                sa.Boolean(),
+                nullable=False,
+                server_default=sa.false(),
+            )
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("signed_documents") as batch_op:
+        batch_op.drop_column("persisted")
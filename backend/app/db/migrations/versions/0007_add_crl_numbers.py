@@ -0,0 +1,32 @@
+"""Record CRL numbers so delta CRLs can reference their base CRL."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0007_add_crl_numbers"
+down_revision = "0006_persist_signed_documents"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("ca_artifacts") as batch_op:
+        batch_op.add_column(sa.Column("crl_number", sa.BigInteger(), nullable=True))
+        batch_op.add_column(
+            sa.Column("base_crl_number", sa.BigInteger(), nullable=True)
+        )
+        batch_op.add_column(
+            sa.Column("this_update", sa.DateTime(timezone=True), nullable=True)
+        )
+        # CRL numbers must increase monotonically (RFC 5280 section 5.2.3).
+        batch_op.create_unique_constraint("uq_ca_artifacts_crl_number", ["crl_number"])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("ca_artifacts") as batch_op:
+        batch_op.drop_constraint("uq_ca_artifacts_crl_number", type_="unique")
+        batch_op.drop_column("this_update")
+        batch_op.drop_column("base_crl_number")
+        batch_op.drop_column("crl_number")
@@ -1,6 +1,8 @@
 import json
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from typing import AsyncIterator
 from uuid import uuid4
 
 from fastapi import FastAPI, Request
@@ -12,15 +14,54 @@ from app.api.routes import router
 from app.core.config import settings
 from app.core.errors import APIException
 from app.db.init_db import bootstrap_admin, init_db
+from app.db.session import get_session_factory
 from app.schemas.error import ErrorResponse
+from app.services.container import ServiceContainer
+from app.services.key_pool import shutdown_leaf_key_pool
+from app.services.signing_executor import shutdown_signing_executor
+from app.services.signing_idempotency import get_signed_result_store
+from app.services.signing_jobs import (
+    get_signing_job_worker,
+    shutdown_signing_job_worker,
+)
+from app.services.timestamp_authority import configure_local_timestamp_authority
+from app.services.tsa_client import shutdown_tsa_client
 
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    """Build shared services and load CA material before serving requests."""
+
+    await init_db()
+    await bootstrap_admin()
+
+    services = ServiceContainer.build()
+    async with get_session_factory()() as session:
+        await services.warm_up(session=session)
+    application.state.services = services
+    configure_local_timestamp_authority(services.certificate_authority)
+    services.key_pool.start()
+
+    if settings.pdf_job_workers > 0:
+        get_signing_job_worker(signing_service=services.signing).start()
+    try:
+        yield
+    finally:
+        await shutdown_signing_job_worker()
+        shutdown_signing_executor()
+        shutdown_leaf_key_pool()
+        await shutdown_tsa_client()
+        get_signed_result_store().clear_downloads()
+        configure_local_timestamp_authority(None)
+        application.state.services = None
+
+
 def create_application() -> FastAPI:
     """Create and configure the FastAPI application instance."""
 
-    application = FastAPI(title=settings.app_name)
+    application = FastAPI(title=settings.app_name, lifespan=lifespan)
 
     cors_origins = settings.backend_cors_origins or ["*"]
 
@@ -89,11 +130,6 @@ def create_application() -> FastAPI:
             content=json.loads(error_response.model_dump_json()),
         )
 
-    @application.on_event("startup")
-    async def _on_startup() -> None:
-        await init_db()
-        await bootstrap_admin()
-
     return application
 
 
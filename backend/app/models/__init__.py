@@ -5,5 +5,12 @@ from app.models.ca_artifact import CAArtifact, CAArtifactType
 from app.models.certificate import Certificate, CertificateStatus
 from app.models.role import Role, RoleSlug
 from app.models.seal import Seal
+from app.models.signed_document import SignedDocument
+from app.models.signing_job import (
+    SigningJob,
+    SigningJobItem,
+    SigningJobItemStatus,
+    SigningJobStatus,
+)
 from app.models.storage import EncryptedSecret, FileMetadata
 from app.models.user import TokenBlocklist, User, UserRole
@@ -5,7 +5,15 @@ from enum import Enum
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, UniqueConstraint, Uuid
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    String,
+    Text,
+    UniqueConstraint,
+    Uuid,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -21,14 +29,19 @@ class CAArtifactType(str, Enum):
     ROOT_CERTIFICATE = "root-certificate"
     INTERMEDIATE_CERTIFICATE = "intermediate-certificate"
     CRL = "certificate-revocation-list"
+    DELTA_CRL = "delta-certificate-revocation-list"
     OCSP_RESPONSE = "ocsp-response"
+    TSA_CERTIFICATE = "tsa-certificate"
 
 
 class CAArtifact(Base):
     """Artifacts produced by the certificate authority (e.g. CRL, OCSP)."""
 
     __tablename__ = "ca_artifacts"
-    __table_args__ = (UniqueConstraint("name", name="uq_ca_artifacts_name"),)
+    __table_args__ = (
+        UniqueConstraint("name", name="uq_ca_artifacts_name"),
+        UniqueConstraint("crl_number", name="uq_ca_artifacts_crl_number"),
+    )
 
     id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4)
     name: Mapped[str] = mapped_column(String(150), nullable=False)
@@ -44,6 +57,13 @@ class CAArtifact(Base):
         ForeignKey("encrypted_secrets.id", ondelete="SET NULL"),
         nullable=True,
     )
+    # Base and delta CRLs share one number sequence; a delta CRL also records
+    # the number of the base CRL it extends.
+    crl_number: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    base_crl_number: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    this_update: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
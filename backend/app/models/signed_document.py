@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    Uuid,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+
+from app.db.base_class import Base
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    from app.models.storage import FileMetadata
+    from app.models.user import User
+
+
+class SignedDocument(Base):
+    """A signed PDF kept encrypted so repeated requests need not sign again."""
+
+    __tablename__ = "signed_documents"
+    __table_args__ = (
+        UniqueConstraint(
+            "owner_id", "idempotency_key", name="uq_signed_documents_owner_key"
+        ),
+        Index("ix_signed_documents_expires_at", "expires_at"),
+    )
+
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4)
+    document_id: Mapped[str] = mapped_column(String(32), unique=True, nullable=False)
+    owner_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="SET NULL")
+    )
+    idempotency_key: Mapped[str] = mapped_column(String(320), nullable=False)
+    request_fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    file_id: Mapped[UUID] = mapped_column(
+        Uuid, ForeignKey("file_metadata.id", ondelete="CASCADE"), nullable=False
+    )
+    certificate_id: Mapped[UUID] = mapped_column(Uuid, nullable=False)
+    seal_id: Mapped[UUID | None] = mapped_column(Uuid, nullable=True)
+    visibility: Mapped[str] = mapped_column(String(20), nullable=False)
+    tsa_used: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    ltv_embedded: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    file_size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    persisted: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    signed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    owner: Mapped[Optional["User"]] = relationship("User")
+    file: Mapped["FileMetadata"] = relationship("FileMetadata")
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    Uuid,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+
+from app.db.base_class import Base
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    from app.models.user import User
+
+
+class SigningJobStatus(str, Enum):
+    """Lifecycle states for an asynchronous signing job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class SigningJobItemStatus(str, Enum):
+    """Lifecycle states for a single document inside a signing job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class SigningJob(Base):
+    """A batch of documents queued for signing with shared settings."""
+
+    __tablename__ = "signing_jobs"
+
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4)
+    owner_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="SET NULL"), index=True
+    )
+    certificate_id: Mapped[UUID] = mapped_column(Uuid, nullable=False)
+    seal_id: Mapped[UUID | None] = mapped_column(Uuid, nullable=True)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=SigningJobStatus.QUEUED.value
+    )
+    visibility: Mapped[str] = mapped_column(String(20), nullable=False)
+    coordinates: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    signature_meta: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    use_tsa: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    embed_ltv: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    total_items: Mapped[int] = mapped_column(Integer, nullable=False)
+    succeeded_items: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed_items: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+    started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    owner: Mapped[Optional["User"]] = relationship("User")
+    items: Mapped[list["SigningJobItem"]] = relationship(
+        "SigningJobItem",
+        back_populates="job",
+        cascade="all, delete-orphan",
+        order_by="SigningJobItem.position",
+    )
+
+
+class SigningJobItem(Base):
+    """A single document queued for signing; doubles as the work queue entry."""
+
+    __tablename__ = "signing_job_items"
+    __table_args__ = (
+        Index("ix_signing_job_items_status_queued_at", "status", "queued_at"),
+        Index("ix_signing_job_items_job_position", "job_id", "position"),
+    )
+
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4)
+    job_id: Mapped[UUID] = mapped_column(
+        Uuid, ForeignKey("signing_jobs.id", ondelete="CASCADE"), nullable=False
+    )
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    filename: Mapped[str] = mapped_column(String(255), nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=SigningJobItemStatus.QUEUED.value
+    )
+    input_path: Mapped[str] = mapped_column(String(1024), nullable=False)
+    input_size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    output_path: Mapped[str | None] = mapped_column(String(1024), nullable=True)
+    document_id: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    file_size: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    signed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    queued_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    claimed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    job: Mapped[SigningJob] = relationship("SigningJob", back_populates="items")
@@ -3,9 +3,14 @@
 from app.schemas.audit import AuditLogEntry, AuditLogListResponse
 from app.schemas.error import ErrorResponse
 from app.schemas.pdf_signing import (
+    DigestAlgorithm,
+    PDFBatchArchiveManifest,
+    PDFBatchArchiveManifestItem,
     PDFBatchSignRequest,
     PDFBatchSignResponse,
     PDFBatchSignResultItem,
+    PDFDigestSignRequest,
+    PDFDigestSignResponse,
     PDFSignRequest,
     PDFSignResponse,
     PDFVerificationResponse,
@@ -13,4 +18,6 @@ from app.schemas.pdf_signing import (
     SignatureMetadata,
     SignatureVerificationResult,
     SignatureVisibility,
+    SigningJobItemResponse,
+    SigningJobResponse,
 )
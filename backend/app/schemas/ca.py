@@ -115,6 +115,8 @@ class CRLGenerateResponse(BaseModel):
     artifact_id: UUID
     name: str
     created_at: datetime
+    crl_number: int | None = None
+    base_crl_number: int | None = None
     crl_pem: str
     revoked_serials: list[str]
 
@@ -125,9 +127,36 @@ class CRLMetadata(BaseModel):
     artifact_id: UUID
     name: str
     created_at: datetime
+    crl_number: int | None = None
+    base_crl_number: int | None = None
 
 
 class CRLListResponse(BaseModel):
     """Response containing CRL metadata entries."""
 
     crls: list[CRLMetadata]
+    delta_crls: list[CRLMetadata] = Field(default_factory=list)
+
+
+class TSACertificateIssueRequest(BaseModel):
+    """Request payload for issuing the built-in TSA's certificate."""
+
+    common_name: str = Field(min_length=3, max_length=255)
+    organization: str | None = Field(default=None, max_length=255)
+    algorithm: LeafKeyAlgorithm = Field(default=LeafKeyAlgorithm.RSA_2048)
+    validity_days: int = Field(default=1825, ge=1, le=3650)
+
+
+class TSACertificateResponse(BaseModel):
+    """Response describing an issued timestamping certificate."""
+
+    model_config = ConfigDict(use_enum_values=True)
+
+    artifact_id: UUID
+    algorithm: LeafKeyAlgorithm
+    serial_number: str
+    subject: str
+    fingerprint_sha256: str
+    issued_at: datetime
+    expires_at: datetime
+    certificate_pem: str
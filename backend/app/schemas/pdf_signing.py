@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
 from datetime import datetime
 from enum import Enum
+from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from app.models.signing_job import SigningJobItemStatus, SigningJobStatus
 
 
 class SignatureVisibility(str, Enum):
@@ -72,6 +77,62 @@ class PDFSignResponse(BaseModel):
     file_size: int = Field(description="Size of signed PDF in bytes")
 
 
+class DigestAlgorithm(str, Enum):
+    """Hash algorithms accepted for client-computed digests."""
+
+    SHA256 = "sha256"
+    SHA384 = "sha384"
+    SHA512 = "sha512"
+
+
+class PDFDigestSignRequest(BaseModel):
+    """Request payload for signing a client-computed PDF byte-range digest."""
+
+    certificate_id: UUID = Field(description="Certificate to use for signing")
+    digest_algorithm: DigestAlgorithm = Field(default=DigestAlgorithm.SHA256)
+    document_digest: bytes | None = Field(
+        default=None, description="Base64 digest of the signed byte range"
+    )
+    signed_attributes: bytes | None = Field(
+        default=None,
+        description="Base64 DER-encoded CMS signed attributes built by the client",
+    )
+    use_pades: bool = Field(default=False, description="Build PAdES signed attributes")
+    use_tsa: bool = Field(
+        default=False, description="Attach a signature timestamp from the TSA"
+    )
+
+    @field_validator("document_digest", "signed_attributes", mode="before")
+    @classmethod
+    def _decode_base64(cls, value: Any) -> Any:
+        if value is None or isinstance(value, bytes):
+            return value
+        try:
+            return base64.b64decode(value, validate=True)
+        except (binascii.Error, TypeError, ValueError) as exc:
+            raise ValueError("Value must be valid base64") from exc
+
+    @model_validator(mode="after")
+    def _require_one_input(self) -> PDFDigestSignRequest:
+        if (self.document_digest is None) == (self.signed_attributes is None):
+            raise ValueError(
+                "Provide exactly one of document_digest or signed_attributes"
+            )
+        return self
+
+
+class PDFDigestSignResponse(BaseModel):
+    """CMS signature to embed into the client's prepared PDF."""
+
+    signature_id: str = Field(description="Unique identifier for the signature")
+    signed_at: datetime = Field(description="Timestamp of signing operation")
+    certificate_id: UUID = Field(description="Certificate used for signing")
+    digest_algorithm: DigestAlgorithm
+    cms: str = Field(description="Base64 DER-encoded CMS SignedData")
+    cms_size: int = Field(description="Size of the DER-encoded CMS in bytes")
+    tsa_used: bool = Field(description="Whether a signature timestamp was attached")
+
+
 class PDFBatchSignRequest(BaseModel):
     """Request payload for batch signing multiple PDF documents."""
 
@@ -118,6 +179,64 @@ class PDFBatchSignResponse(BaseModel):
     ltv_embedded: bool
 
 
+class PDFBatchArchiveManifestItem(PDFBatchSignResultItem):
+    """Manifest entry for a document in a streamed batch archive."""
+
+    archive_name: str | None = Field(
+        default=None, description="Name of the signed PDF inside the archive"
+    )
+
+
+class PDFBatchArchiveManifest(BaseModel):
+    """Manifest stored as ``manifest.json`` inside a batch signing archive."""
+
+    total: int = Field(description="Total documents submitted")
+    successful: int = Field(description="Number of successfully signed documents")
+    failed: int = Field(description="Number of failed documents")
+    results: list[PDFBatchArchiveManifestItem]
+    certificate_id: UUID
+    seal_id: UUID | None = None
+    visibility: SignatureVisibility
+    tsa_used: bool
+    ltv_embedded: bool
+
+
+class SigningJobItemResponse(BaseModel):
+    """Status of a single document inside an asynchronous signing job."""
+
+    id: UUID
+    position: int = Field(description="Zero-based position in the submission")
+    filename: str
+    status: SigningJobItemStatus
+    document_id: str | None = None
+    file_size: int | None = None
+    signed_at: datetime | None = None
+    error: str | None = None
+
+
+class SigningJobResponse(BaseModel):
+    """Status of an asynchronous signing job and a page of its documents."""
+
+    id: UUID
+    status: SigningJobStatus
+    total: int = Field(description="Total documents submitted")
+    successful: int = Field(description="Number of successfully signed documents")
+    failed: int = Field(description="Number of failed documents")
+    pending: int = Field(description="Documents still queued or being signed")
+    certificate_id: UUID
+    seal_id: UUID | None = None
+    visibility: SignatureVisibility
+    tsa_used: bool
+    ltv_embedded: bool
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    items: list[SigningJobItemResponse] = Field(
+        default_factory=list,
+        description="Documents in submission order, paginated by offset/limit",
+    )
+
+
 class SignatureVerificationResult(BaseModel):
     """Verification outcome for a single embedded signature."""
 
@@ -1,13 +1,23 @@
 """Domain services and helpers for application logic."""
 
+from app.services.container import ServiceContainer
+from app.services.ltv_material import (
+    LTVMaterial,
+    LTVMaterialCache,
+    LTVMaterialCacheStats,
+    LTVMaterialError,
+    get_ltv_material_cache,
+)
 from app.services.pdf_signing import (
     CertificateInvalidError,
     CertificateNotFoundError,
+    DigestSigningError,
     PDFSigningError,
     PDFSigningService,
     PDFValidationError,
     SealNotFoundError,
     SignatureError,
+    SigningUnavailableError,
 )
 from app.services.pdf_verification import (
     PDFVerificationError,
@@ -18,6 +28,50 @@ from app.services.pdf_verification import (
     SignatureVerificationDetails,
 )
 from app.services.rate_limiter import RateLimiter
+from app.services.seal_appearance import (
+    SealAppearance,
+    SealAppearanceCache,
+    SealAppearanceCacheStats,
+    SealAppearanceError,
+    get_seal_appearance_cache,
+    render_seal_appearance,
+)
+from app.services.signature_timestamps import (
+    SignatureTimestampError,
+    timestamp_signature,
+)
+from app.services.signer_cache import SignerCache, SignerCacheStats, get_signer_cache
+from app.services.signing_executor import (
+    SignatureOptions,
+    SigningExecutor,
+    SigningExecutorError,
+    SigningExecutorStats,
+    SigningQueueFullError,
+    get_signing_executor,
+    shutdown_signing_executor,
+)
+from app.services.signing_idempotency import (
+    IdempotencyConflictError,
+    SignedResultStore,
+    SignedResultStoreStats,
+    get_signed_result_store,
+    request_fingerprint,
+)
+from app.services.signing_jobs import (
+    SigningJobError,
+    SigningJobLimitError,
+    SigningJobNotFoundError,
+    SigningJobService,
+    SigningJobWorker,
+    get_signing_job_worker,
+    shutdown_signing_job_worker,
+)
+from app.services.signing_metrics import (
+    SigningMetrics,
+    StageHistogramStats,
+    StageTimings,
+    get_signing_metrics,
+)
 from app.services.storage import (
     EncryptedStorageService,
     StorageCorruptionError,
@@ -25,9 +79,24 @@ from app.services.storage import (
     StorageNotFoundError,
     StorageValidationError,
 )
+from app.services.timestamp_authority import (
+    LocalTimestampAuthority,
+    TimestampAuthorityError,
+    TimeStampResponse,
+    configure_local_timestamp_authority,
+    get_local_timestamp_authority,
+    reset_local_timestamp_authority,
+)
 from app.services.tsa_client import (
+    CircuitState,
+    PooledTimeStamper,
     TSAClient,
+    TSAClientStats,
     TSAConnectionError,
+    TSAEndpointStats,
     TSAError,
     TSAResponseError,
+    get_tsa_client,
+    shutdown_tsa_client,
 )
+from app.services.zip_stream import StreamingZipWriter
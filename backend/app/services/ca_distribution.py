@@ -0,0 +1,237 @@
+"""Cache of the CA documents relying parties poll: the root and newest CRLs.
+
+The root certificate and the newest base and delta CRLs are read, decrypted
+and re-encoded once, then served from memory in both PEM and DER until a
+new root or CRL is generated. CRLs published by another process are picked
+up once ``ttl_seconds`` have passed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from time import monotonic
+from typing import Callable
+from uuid import UUID
+
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud import ca_artifact as ca_artifact_crud
+from app.models.ca_artifact import CAArtifactType
+from app.services.storage import EncryptedStorageService, StorageError
+
+DISTRIBUTED_TYPES = (
+    CAArtifactType.ROOT_CERTIFICATE,
+    CAArtifactType.CRL,
+    CAArtifactType.DELTA_CRL,
+)
+
+
+class CADistributionError(Exception):
+    """Raised when a distributed CA document cannot be loaded."""
+
+
+class CADistributionNotFoundError(CADistributionError):
+    """Raised when no artifact of the requested type has been generated."""
+
+
+@dataclass(slots=True, frozen=True)
+class DistributionDocument:
+    """PEM and DER encodings of one root certificate or CRL artifact."""
+
+    artifact_id: UUID
+    pem: bytes
+    der: bytes
+    sha256: str
+    last_modified: datetime
+    next_update: datetime | None = None
+
+    @property
+    def size(self) -> int:
+        return len(self.pem) + len(self.der)
+
+    def etag(self, representation: str) -> str:
+        """Strong validator for one representation of this document."""
+
+        return f'"{self.sha256}-{representation}"'
+
+
+@dataclass(slots=True)
+class CADistributionCacheStats:
+    """Point-in-time counters for the CA distribution cache."""
+
+    cached: list[str]
+    size_bytes: int
+    ttl_seconds: int
+    hits: int
+    misses: int
+    invalidations: int
+
+
+@dataclass(slots=True)
+class _Entry:
+    document: DistributionDocument
+    deadline: float
+
+
+def _decode(
+    artifact_type: CAArtifactType, artifact_id: UUID, payload: bytes
+) -> DistributionDocument:
+    """Parse a stored root certificate or CRL and encode it both ways."""
+
+    is_pem = payload.lstrip().startswith(b"-----BEGIN")
+    document: x509.Certificate | x509.CertificateRevocationList
+    next_update: datetime | None = None
+    if artifact_type is CAArtifactType.ROOT_CERTIFICATE:
+        if is_pem:
+            document = x509.load_pem_x509_certificate(payload)
+        else:
+            document = x509.load_der_x509_certificate(payload)
+        last_modified = document.not_valid_before_utc
+    else:
+        if is_pem:
+            document = x509.load_pem_x509_crl(payload)
+        else:
+            document = x509.load_der_x509_crl(payload)
+        last_modified = document.last_update_utc
+        next_update = document.next_update_utc
+
+    der = document.public_bytes(serialization.Encoding.DER)
+    return DistributionDocument(
+        artifact_id=artifact_id,
+        pem=document.public_bytes(serialization.Encoding.PEM),
+        der=der,
+        sha256=hashlib.sha256(der).hexdigest(),
+        last_modified=last_modified,
+        next_update=next_update,
+    )
+
+
+class CADistributionCache:
+    """Holds the newest root certificate and CRLs, keyed by artifact type.
+
+    A hit needs neither the database nor the storage key, so conditional
+    requests from relying parties are answered from memory.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: int,
+        storage_service: EncryptedStorageService | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("CA distribution cache TTL must be positive")
+
+        self._ttl_seconds = ttl_seconds
+        self._storage = storage_service or EncryptedStorageService()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[CAArtifactType, _Entry] = {}
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    async def get(
+        self, *, session: AsyncSession, artifact_type: CAArtifactType
+    ) -> DistributionDocument:
+        """Return the newest document of ``artifact_type``, loading it on a miss."""
+
+        if artifact_type not in DISTRIBUTED_TYPES:
+            raise ValueError(f"{artifact_type.value} artifacts are not distributed")
+
+        with self._lock:
+            entry = self._entries.get(artifact_type)
+            if entry is not None and entry.deadline > self._clock():
+                self._hits += 1
+                return entry.document
+            self._misses += 1
+            generation = self._generation
+
+        document = await self._load(session=session, artifact_type=artifact_type)
+        with self._lock:
+            # A document loaded while an invalidation ran may already be stale.
+            if generation == self._generation:
+                self._entries[artifact_type] = _Entry(
+                    document=document, deadline=self._clock() + self._ttl_seconds
+                )
+        return document
+
+    def invalidate(self, artifact_type: CAArtifactType | None = None) -> None:
+        """Drop one cached document, or all of them when no type is given."""
+
+        with self._lock:
+            self._generation += 1
+            if artifact_type is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+            else:
+                dropped = int(self._entries.pop(artifact_type, None) is not None)
+            self._invalidations += dropped
+
+    def stats(self) -> CADistributionCacheStats:
+        with self._lock:
+            entries = list(self._entries.items())
+            return CADistributionCacheStats(
+                cached=[artifact_type.value for artifact_type, _ in entries],
+                size_bytes=sum(entry.document.size for _, entry in entries),
+                ttl_seconds=self._ttl_seconds,
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+            )
+
+    async def _load(
+        self, *, session: AsyncSession, artifact_type: CAArtifactType
+    ) -> DistributionDocument:
+        artifact = await ca_artifact_crud.get_latest_artifact_by_type(
+            session=session, artifact_type=artifact_type
+        )
+        if artifact is None or artifact.file_id is None:
+            raise CADistributionNotFoundError(
+                f"No {artifact_type.value} artifact has been generated"
+            )
+        try:
+            payload = await self._storage.load_file_bytes(session, artifact.file_id)
+        except StorageError as exc:
+            raise CADistributionError(
+                f"Unable to load CA artifact {artifact.name}: {exc}"
+            ) from exc
+
+        # Large CRLs take a while to decode; keep that off the event loop.
+        try:
+            return await asyncio.to_thread(_decode, artifact_type, artifact.id, payload)
+        except ValueError as exc:
+            raise CADistributionError(
+                f"CA artifact {artifact.name} is not a valid document: {exc}"
+            ) from exc
+
+
+_cache_lock = threading.Lock()
+_ca_distribution_cache: CADistributionCache | None = None
+
+
+def get_ca_distribution_cache(
+    storage_service: EncryptedStorageService | None = None,
+) -> CADistributionCache:
+    """Return the process-wide CA distribution cache built from settings.
+
+    ``storage_service`` is only used when the cache is first created.
+    """
+
+    global _ca_distribution_cache
+    with _cache_lock:
+        if _ca_distribution_cache is None:
+            _ca_distribution_cache = CADistributionCache(
+                ttl_seconds=settings.ca_distribution_cache_ttl_seconds,
+                storage_service=storage_service,
+            )
+        return _ca_distribution_cache
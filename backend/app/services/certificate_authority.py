@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Sequence
+from typing import TYPE_CHECKING, Any, Sequence
 from uuid import UUID, uuid4
 
 from cryptography import x509
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
 from cryptography.hazmat.primitives.serialization import pkcs12
-from cryptography.x509.oid import ExtendedKeyUsageOID, NameOID
+from cryptography.x509.oid import ExtendedKeyUsageOID, ExtensionOID, NameOID
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud import audit_log as audit_log_crud
@@ -20,10 +23,27 @@ from app.crud import ca_artifact as ca_artifact_crud
 from app.crud import certificate as certificate_crud
 from app.models.ca_artifact import CAArtifact, CAArtifactType
 from app.models.certificate import Certificate, CertificateStatus
+from app.services.ca_distribution import get_ca_distribution_cache
+from app.services.ltv_material import get_ltv_material_cache
+from app.services.root_material import RootMaterialCache, get_root_material_cache
+from app.services.signer_cache import get_signer_cache
 from app.services.storage import EncryptedStorageService, StorageError
 
-RootPrivateKey = rsa.RSAPrivateKey | ec.EllipticCurvePrivateKey
-LeafPrivateKey = rsa.RSAPrivateKey | ec.EllipticCurvePrivateKey
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    from app.services.key_pool import LeafKeyPool
+
+RootPrivateKey = (
+    rsa.RSAPrivateKey | ec.EllipticCurvePrivateKey | ed25519.Ed25519PrivateKey
+)
+LeafPrivateKey = (
+    rsa.RSAPrivateKey | ec.EllipticCurvePrivateKey | ed25519.Ed25519PrivateKey
+)
+
+# Revoked certificates are read and turned into CRL entries in batches of this
+# size, so building a large CRL never holds the event loop for long.
+_CRL_BATCH_SIZE = 5000
+# Concurrent generations that collide on a CRL number re-sign this many times.
+_CRL_NUMBER_ATTEMPTS = 3
 
 
 class CertificateAuthorityError(Exception):
@@ -54,11 +74,17 @@ class CRLGenerationError(CertificateAuthorityError):
     """Raised when a certificate revocation list cannot be generated."""
 
 
+class TSACertificateNotFoundError(CertificateAuthorityError):
+    """Raised when timestamping material is requested but not issued yet."""
+
+
 class RootKeyAlgorithm(str, Enum):
     """Supported private key algorithms for the root certificate authority."""
 
     RSA_4096 = "rsa-4096"
     EC_P256 = "ec-p256"
+    EC_P384 = "ec-p384"
+    ED25519 = "ed25519"
 
 
 class LeafKeyAlgorithm(str, Enum):
@@ -66,6 +92,8 @@ class LeafKeyAlgorithm(str, Enum):
 
     RSA_2048 = "rsa-2048"
     EC_P256 = "ec-p256"
+    EC_P384 = "ec-p384"
+    ED25519 = "ed25519"
 
 
 @dataclass(slots=True)
@@ -105,6 +133,16 @@ class CRLResult:
     revoked_serials: Sequence[str]
 
 
+@dataclass(slots=True)
+class TSACertificateResult:
+    """Material returned after issuing a timestamping certificate."""
+
+    artifact: CAArtifact
+    certificate: x509.Certificate
+    certificate_pem: str
+    algorithm: LeafKeyAlgorithm
+
+
 @dataclass(slots=True)
 class RootMaterial:
     """Loaded root CA material used for signing operations."""
@@ -114,11 +152,28 @@ class RootMaterial:
     private_key: RootPrivateKey
 
 
+@dataclass(slots=True)
+class TSAMaterial:
+    """Loaded timestamping key pair together with its issuing root."""
+
+    artifact: CAArtifact
+    certificate: x509.Certificate
+    private_key: LeafPrivateKey
+    root_certificate: x509.Certificate
+
+
 class CertificateAuthorityService:
     """High level operations for managing the private certificate authority."""
 
-    def __init__(self, storage_service: EncryptedStorageService | None = None) -> None:
+    def __init__(
+        self,
+        storage_service: EncryptedStorageService | None = None,
+        key_pool: LeafKeyPool | None = None,
+        root_material_cache: RootMaterialCache | None = None,
+    ) -> None:
         self._storage = storage_service or EncryptedStorageService()
+        self._key_pool = key_pool
+        self._root_material = root_material_cache or get_root_material_cache()
 
     async def generate_root_ca(
         self,
@@ -191,7 +246,9 @@ class CertificateAuthorityService:
             ),
             critical=False,
         )
-        certificate = builder.sign(private_key=private_key, algorithm=hashes.SHA256())
+        certificate = builder.sign(
+            private_key=private_key, algorithm=self._signature_hash(private_key)
+        )
 
         certificate_pem = certificate.public_bytes(serialization.Encoding.PEM).decode(
             "utf-8"
@@ -242,6 +299,10 @@ class CertificateAuthorityService:
         )
         await session.commit()
         await session.refresh(artifact)
+        self._root_material.invalidate()
+        get_ltv_material_cache().invalidate()
+        # CRLs signed by the previous root must not be served alongside it.
+        get_ca_distribution_cache().invalidate()
 
         return RootCAResult(
             artifact=artifact,
@@ -276,7 +337,11 @@ class CertificateAuthorityService:
             raise CertificateIssuanceError("Certificate validity must be positive")
 
         root_material = await self._load_root_material(session=session)
-        leaf_private_key = self._generate_leaf_private_key(algorithm)
+        leaf_private_key = None
+        if self._key_pool is not None:
+            leaf_private_key = self._key_pool.take(algorithm)
+        if leaf_private_key is None:
+            leaf_private_key = self._generate_leaf_private_key(algorithm)
         now = datetime.now(timezone.utc)
         serial_number = x509.random_serial_number()
 
@@ -314,9 +379,11 @@ class CertificateAuthorityService:
                 x509.KeyUsage(
                     digital_signature=True,
                     content_commitment=False,
-                    key_encipherment=algorithm is LeafKeyAlgorithm.RSA_2048,
+                    key_encipherment=isinstance(leaf_private_key, rsa.RSAPrivateKey),
                     data_encipherment=False,
-                    key_agreement=algorithm is LeafKeyAlgorithm.EC_P256,
+                    key_agreement=isinstance(
+                        leaf_private_key, ec.EllipticCurvePrivateKey
+                    ),
                     key_cert_sign=False,
                     crl_sign=False,
                     encipher_only=False,
@@ -336,7 +403,8 @@ class CertificateAuthorityService:
         )
 
         certificate = builder.sign(
-            private_key=root_material.private_key, algorithm=hashes.SHA256()
+            private_key=root_material.private_key,
+            algorithm=self._signature_hash(root_material.private_key),
         )
         certificate_pem = certificate.public_bytes(serialization.Encoding.PEM).decode(
             "utf-8"
@@ -418,6 +486,141 @@ class CertificateAuthorityService:
             passphrase=p12_passphrase,
         )
 
+    async def issue_tsa_certificate(
+        self,
+        *,
+        session: AsyncSession,
+        common_name: str,
+        organization: str | None,
+        algorithm: LeafKeyAlgorithm,
+        actor_id: int | None,
+        validity_days: int = 1825,
+    ) -> TSACertificateResult:
+        """Issue a timestamping certificate for the built-in RFC 3161 responder.
+
+        The newest timestamping certificate is the one used for new tokens;
+        earlier ones stay stored so existing tokens keep validating.
+        """
+
+        if validity_days <= 0:
+            raise CertificateIssuanceError("Certificate validity must be positive")
+
+        root_material = await self._load_root_material(session=session)
+        private_key = self._generate_leaf_private_key(algorithm)
+        now = datetime.now(timezone.utc)
+        serial_number = x509.random_serial_number()
+        # A timestamping certificate must not outlive the root that vouches for it.
+        not_valid_after = min(
+            now + timedelta(days=validity_days),
+            self._ensure_utc(root_material.certificate.not_valid_after),
+        )
+
+        subject_attributes = [x509.NameAttribute(NameOID.COMMON_NAME, common_name)]
+        if organization:
+            subject_attributes.append(
+                x509.NameAttribute(NameOID.ORGANIZATION_NAME, organization)
+            )
+
+        certificate = (
+            x509.CertificateBuilder()
+            .subject_name(x509.Name(subject_attributes))
+            .issuer_name(root_material.certificate.subject)
+            .public_key(private_key.public_key())
+            .serial_number(serial_number)
+            .not_valid_before(now - timedelta(minutes=1))
+            .not_valid_after(not_valid_after)
+            .add_extension(
+                x509.BasicConstraints(ca=False, path_length=None), critical=True
+            )
+            .add_extension(
+                x509.SubjectKeyIdentifier.from_public_key(private_key.public_key()),
+                critical=False,
+            )
+            .add_extension(
+                x509.AuthorityKeyIdentifier.from_issuer_public_key(
+                    root_material.private_key.public_key()
+                ),
+                critical=False,
+            )
+            .add_extension(
+                x509.KeyUsage(
+                    digital_signature=True,
+                    content_commitment=True,
+                    key_encipherment=False,
+                    data_encipherment=False,
+                    key_agreement=False,
+                    key_cert_sign=False,
+                    crl_sign=False,
+                    encipher_only=False,
+                    decipher_only=False,
+                ),
+                critical=True,
+            )
+            # RFC 3161 section 2.3: the sole, critical extended key usage.
+            .add_extension(
+                x509.ExtendedKeyUsage([ExtendedKeyUsageOID.TIME_STAMPING]),
+                critical=True,
+            )
+            .sign(
+                private_key=root_material.private_key,
+                algorithm=self._signature_hash(root_material.private_key),
+            )
+        )
+
+        certificate_pem = certificate.public_bytes(serialization.Encoding.PEM).decode(
+            "utf-8"
+        )
+        private_key_pem = private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        ).decode("utf-8")
+
+        cert_file, _ = await self._storage.store_certificate_pem(
+            session=session,
+            pem=certificate_pem,
+            owner_id=actor_id,
+            filename=f"tsa-{uuid4().hex}.pem",
+        )
+        _, private_key_secret = await self._storage.store_private_key(
+            session=session,
+            pem=private_key_pem,
+            owner_id=actor_id,
+            filename=f"tsa-key-{uuid4().hex}.pem",
+        )
+
+        serial_hex = f"{serial_number:x}".upper()
+        artifact = await ca_artifact_crud.create_artifact(
+            session=session,
+            name=f"tsa-{serial_hex}",
+            artifact_type=CAArtifactType.TSA_CERTIFICATE,
+            description=f"Timestamping certificate issued with {algorithm.value}",
+            file_id=cert_file.id,
+            secret_id=private_key_secret.id,
+            commit=False,
+        )
+
+        await audit_log_crud.create_audit_log(
+            session=session,
+            actor_id=actor_id,
+            event_type="ca.tsa.issued",
+            resource="tsa-certificate",
+            meta={
+                "artifact_id": str(artifact.id),
+                "algorithm": algorithm.value,
+                "serial_number": serial_hex,
+            },
+        )
+        await session.commit()
+        await session.refresh(artifact)
+
+        return TSACertificateResult(
+            artifact=artifact,
+            certificate=certificate,
+            certificate_pem=certificate_pem,
+            algorithm=algorithm,
+        )
+
     async def import_certificate_from_p12(
         self,
         *,
@@ -551,6 +754,7 @@ class CertificateAuthorityService:
         )
         await session.commit()
         await session.refresh(certificate)
+        get_signer_cache().invalidate(certificate.id)
         return certificate
 
     async def generate_crl(
@@ -560,89 +764,69 @@ class CertificateAuthorityService:
         actor_id: int | None,
         next_update_days: int = 7,
     ) -> CRLResult:
-        """Generate a certificate revocation list signed by the root CA."""
+        """Generate a base certificate revocation list signed by the root CA.
+
+        Base and delta CRLs draw their CRL numbers from one sequence.
+        """
 
         if next_update_days <= 0:
             raise CRLGenerationError("CRL next update interval must be positive")
 
         root_material = await self._load_root_material(session=session)
-        revoked_certificates = await certificate_crud.list_revoked_certificates(
-            session=session
-        )
-        now = datetime.now(timezone.utc)
-
-        builder = (
-            x509.CertificateRevocationListBuilder()
-            .issuer_name(root_material.certificate.subject)
-            .last_update(now)
-            .next_update(now + timedelta(days=next_update_days))
+        # CRL times are encoded with whole-second precision.
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        return await self._publish_crl(
+            session=session,
+            actor_id=actor_id,
+            root_material=root_material,
+            revoked_since=None,
+            this_update=now,
+            next_update=now + timedelta(days=next_update_days),
         )
 
-        revoked_serials: list[str] = []
-        for revoked in revoked_certificates:
-            try:
-                serial_int = int(revoked.serial_number, 16)
-            except ValueError as exc:
-                raise CRLGenerationError(
-                    "Stored certificate serial number is invalid"
-                ) from exc
-            revocation_source = revoked.updated_at or now
-            revocation_date = self._ensure_utc(revocation_source)
-            revoked_entry = (
-                x509.RevokedCertificateBuilder()
-                .serial_number(serial_int)
-                .revocation_date(revocation_date)
-                .build()
-            )
-            builder = builder.add_revoked_certificate(revoked_entry)
-            revoked_serials.append(revoked.serial_number)
-
-        crl = builder.sign(
-            private_key=root_material.private_key, algorithm=hashes.SHA256()
-        )
-        crl_pem = crl.public_bytes(serialization.Encoding.PEM).decode("utf-8")
+    async def generate_delta_crl(
+        self,
+        *,
+        session: AsyncSession,
+        actor_id: int | None,
+        next_update_hours: int = 24,
+    ) -> CRLResult:
+        """Generate a delta CRL listing revocations since the newest base CRL."""
 
-        filename = f"crl-{now.strftime('%Y%m%d%H%M%S')}.pem"
-        crl_file, _ = await self._storage.store_encrypted_asset(
-            session=session,
-            data=crl_pem.encode("utf-8"),
-            content_type="application/pkix-crl",
-            owner_id=actor_id,
-            filename=filename,
-        )
+        if next_update_hours <= 0:
+            raise CRLGenerationError("Delta CRL next update interval must be positive")
 
-        artifact = await ca_artifact_crud.create_artifact(
-            session=session,
-            name=f"crl-{uuid4().hex}",
-            artifact_type=CAArtifactType.CRL,
-            description="Certificate revocation list",
-            file_id=crl_file.id,
-            commit=False,
+        base = await ca_artifact_crud.get_latest_artifact_by_type(
+            session=session, artifact_type=CAArtifactType.CRL
         )
+        if base is None or base.crl_number is None or base.this_update is None:
+            raise CRLGenerationError(
+                "A numbered base CRL must be generated before a delta CRL"
+            )
 
-        await audit_log_crud.create_audit_log(
+        root_material = await self._load_root_material(session=session)
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        return await self._publish_crl(
             session=session,
             actor_id=actor_id,
-            event_type="ca.crl.generated",
-            resource="crl",
-            meta={
-                "artifact_id": str(artifact.id),
-                "revoked_serials": revoked_serials,
-            },
+            root_material=root_material,
+            # Revocation times may be stored with whole-second precision, so
+            # the delta overlaps its base by a second: an entry can repeat
+            # but never go missing.
+            revoked_since=self._ensure_utc(base.this_update) - timedelta(seconds=1),
+            this_update=now,
+            next_update=now + timedelta(hours=next_update_hours),
+            base_crl_number=base.crl_number,
         )
-        await session.commit()
-        await session.refresh(artifact)
 
-        return CRLResult(
-            artifact=artifact, crl_pem=crl_pem, revoked_serials=revoked_serials
-        )
-
-    async def list_crls(self, *, session: AsyncSession) -> Sequence[CAArtifact]:
-        """Return CRL artifacts ordered from newest to oldest."""
+    async def list_crls(
+        self, *, session: AsyncSession, delta: bool = False
+    ) -> Sequence[CAArtifact]:
+        """Return base or delta CRL artifacts ordered from newest to oldest."""
 
         return await ca_artifact_crud.list_artifacts(
             session=session,
-            artifact_type=CAArtifactType.CRL,
+            artifact_type=CAArtifactType.DELTA_CRL if delta else CAArtifactType.CRL,
         )
 
     async def load_crl_pem(self, *, session: AsyncSession, artifact_id: UUID) -> str:
@@ -669,18 +853,195 @@ class CertificateAuthorityService:
             session=session, file_id=certificate.certificate_file_id
         )
 
-    async def _load_root_material(self, *, session: AsyncSession) -> RootMaterial:
+    async def load_tsa_material(self, *, session: AsyncSession) -> TSAMaterial:
+        """Load the newest timestamping key pair and the root that issued it."""
+
         artifact = await ca_artifact_crud.get_latest_artifact_by_type(
             session=session,
-            artifact_type=CAArtifactType.ROOT_CERTIFICATE,
+            artifact_type=CAArtifactType.TSA_CERTIFICATE,
         )
         if artifact is None:
+            raise TSACertificateNotFoundError(
+                "Timestamping certificate has not been issued"
+            )
+
+        root_material = await self._load_root_material(session=session)
+        certificate, private_key = await self._load_key_pair(
+            session=session, artifact=artifact, label="timestamping"
+        )
+        return TSAMaterial(
+            artifact=artifact,
+            certificate=certificate,
+            private_key=private_key,
+            root_certificate=root_material.certificate,
+        )
+
+    async def _load_root_material(self, *, session: AsyncSession) -> RootMaterial:
+        artifact_id = await ca_artifact_crud.get_latest_artifact_id_by_type(
+            session=session,
+            artifact_type=CAArtifactType.ROOT_CERTIFICATE,
+        )
+        if artifact_id is None:
             raise RootCANotFoundError(
                 "Root certificate authority has not been generated"
             )
+
+        async def load(artifact_id: UUID) -> RootMaterial:
+            artifact = await ca_artifact_crud.get_artifact_by_id(
+                session=session, artifact_id=artifact_id
+            )
+            if artifact is None:
+                raise RootCANotFoundError(
+                    "Root certificate authority has not been generated"
+                )
+            certificate, private_key = await self._load_key_pair(
+                session=session, artifact=artifact, label="root CA"
+            )
+            # The material outlives this session, so detach the artifact
+            # from it.
+            session.expunge(artifact)
+            return RootMaterial(
+                artifact=artifact,
+                certificate=certificate,
+                private_key=private_key,
+            )
+
+        return await self._root_material.get(artifact_id, load)
+
+    async def _next_crl_number(self, *, session: AsyncSession) -> int:
+        highest = await ca_artifact_crud.get_highest_crl_number(session=session)
+        return (highest or 0) + 1
+
+    async def _publish_crl(
+        self,
+        *,
+        session: AsyncSession,
+        actor_id: int | None,
+        root_material: RootMaterial,
+        revoked_since: datetime | None,
+        this_update: datetime,
+        next_update: datetime,
+        base_crl_number: int | None = None,
+    ) -> CRLResult:
+        """Sign and store a CRL under the next free number in the sequence.
+
+        The unique ``crl_number`` column arbitrates between concurrent
+        generations: the loser re-signs under the following number.
+        """
+
+        entries: list[x509.RevokedCertificate] = []
+        revoked_serials: list[str] = []
+        async for rows in certificate_crud.iter_revoked_serials(
+            session=session, revoked_since=revoked_since, batch_size=_CRL_BATCH_SIZE
+        ):
+            entries.extend(
+                await asyncio.to_thread(self._revoked_entries, rows, this_update)
+            )
+            revoked_serials.extend(serial_number for serial_number, _ in rows)
+
+        delta = base_crl_number is not None
+        artifact_type = CAArtifactType.DELTA_CRL if delta else CAArtifactType.CRL
+        prefix = "delta-crl" if delta else "crl"
+        filename = f"{prefix}-{this_update.strftime('%Y%m%d%H%M%S')}.pem"
+        description = (
+            f"Delta certificate revocation list for base CRL {base_crl_number}"
+            if delta
+            else "Certificate revocation list"
+        )
+        for attempt in range(1, _CRL_NUMBER_ATTEMPTS + 1):
+            crl_number = await self._next_crl_number(session=session)
+            # Handing every entry to the constructor at once avoids
+            # add_revoked_certificate copying the list once per entry.
+            builder = x509.CertificateRevocationListBuilder(
+                issuer_name=root_material.certificate.subject,
+                last_update=this_update,
+                next_update=next_update,
+                extensions=self._crl_extensions(crl_number, base_crl_number),
+                revoked_certificates=entries,
+            )
+            crl_pem, crl_digest = await asyncio.to_thread(
+                self._sign_crl, builder, root_material.private_key
+            )
+
+            crl_file, _ = await self._storage.store_encrypted_asset(
+                session=session,
+                data=crl_pem.encode("utf-8"),
+                content_type="application/pkix-crl",
+                owner_id=actor_id,
+                filename=filename,
+            )
+            crl_file_id = crl_file.id
+            try:
+                artifact = await ca_artifact_crud.create_artifact(
+                    session=session,
+                    name=f"{prefix}-{uuid4().hex}",
+                    artifact_type=artifact_type,
+                    description=description,
+                    file_id=crl_file_id,
+                    crl_number=crl_number,
+                    base_crl_number=base_crl_number,
+                    this_update=this_update,
+                    commit=False,
+                )
+            except IntegrityError:
+                # Another generation published this number first.
+                await session.rollback()
+                await self._storage.delete_file(session, crl_file_id)
+                if attempt == _CRL_NUMBER_ATTEMPTS:
+                    raise CRLGenerationError(
+                        "Could not allocate a CRL number; try again"
+                    ) from None
+                continue
+            break
+
+        meta: dict[str, Any] = {
+            "artifact_id": str(artifact.id),
+            "crl_number": crl_number,
+            "revoked_count": len(revoked_serials),
+            "crl_sha256": crl_digest,
+        }
+        if delta:
+            meta["base_crl_number"] = base_crl_number
+        await audit_log_crud.create_audit_log(
+            session=session,
+            actor_id=actor_id,
+            event_type="ca.crl.delta.generated" if delta else "ca.crl.generated",
+            resource="crl",
+            meta=meta,
+        )
+        await session.commit()
+        await session.refresh(artifact)
+        get_ca_distribution_cache().invalidate(artifact_type)
+        if not delta:
+            get_ltv_material_cache().invalidate()
+
+        return CRLResult(
+            artifact=artifact, crl_pem=crl_pem, revoked_serials=revoked_serials
+        )
+
+    @staticmethod
+    def _crl_extensions(
+        crl_number: int, base_crl_number: int | None
+    ) -> list[x509.Extension[x509.ExtensionType]]:
+        extensions: list[x509.Extension[x509.ExtensionType]] = [
+            x509.Extension(ExtensionOID.CRL_NUMBER, False, x509.CRLNumber(crl_number))
+        ]
+        if base_crl_number is not None:
+            extensions.append(
+                x509.Extension(
+                    ExtensionOID.DELTA_CRL_INDICATOR,
+                    True,
+                    x509.DeltaCRLIndicator(base_crl_number),
+                )
+            )
+        return extensions
+
+    async def _load_key_pair(
+        self, *, session: AsyncSession, artifact: CAArtifact, label: str
+    ) -> tuple[x509.Certificate, RootPrivateKey]:
         if artifact.file_id is None or artifact.secret_id is None:
             raise CertificateAuthorityError(
-                "Root CA artifact is missing stored material"
+                f"{label[0].upper()}{label[1:]} artifact is missing stored material"
             )
 
         try:
@@ -691,7 +1052,7 @@ class CertificateAuthorityService:
                 session=session, secret_id=artifact.secret_id
             )
         except StorageError as exc:
-            raise CertificateAuthorityError("Unable to load root CA material") from exc
+            raise CertificateAuthorityError(f"Unable to load {label} material") from exc
 
         try:
             certificate = x509.load_pem_x509_certificate(
@@ -699,7 +1060,7 @@ class CertificateAuthorityService:
             )
         except ValueError as exc:
             raise CertificateAuthorityError(
-                "Stored root certificate is invalid"
+                f"Stored {label} certificate is invalid"
             ) from exc
 
         try:
@@ -708,19 +1069,51 @@ class CertificateAuthorityService:
             )
         except ValueError as exc:
             raise CertificateAuthorityError(
-                "Stored root private key is invalid"
+                f"Stored {label} private key is invalid"
             ) from exc
 
-        if not isinstance(private_key, (rsa.RSAPrivateKey, ec.EllipticCurvePrivateKey)):
+        if not isinstance(
+            private_key,
+            (rsa.RSAPrivateKey, ec.EllipticCurvePrivateKey, ed25519.Ed25519PrivateKey),
+        ):
             raise TypeError(
-                f"Unsupported root private key type: {type(private_key).__name__}"
+                f"Unsupported {label} private key type: {type(private_key).__name__}"
             )
 
-        return RootMaterial(
-            artifact=artifact,
-            certificate=certificate,
-            private_key=private_key,
+        return certificate, private_key
+
+    @classmethod
+    def _revoked_entries(
+        cls, rows: Sequence[tuple[str, datetime | None]], default_date: datetime
+    ) -> list[x509.RevokedCertificate]:
+        entries: list[x509.RevokedCertificate] = []
+        for serial_number, revoked_at in rows:
+            try:
+                serial_int = int(serial_number, 16)
+            except ValueError as exc:
+                raise CRLGenerationError(
+                    "Stored certificate serial number is invalid"
+                ) from exc
+            entries.append(
+                x509.RevokedCertificateBuilder()
+                .serial_number(serial_int)
+                .revocation_date(cls._ensure_utc(revoked_at or default_date))
+                .build()
+            )
+        return entries
+
+    @classmethod
+    def _sign_crl(
+        cls,
+        builder: x509.CertificateRevocationListBuilder,
+        private_key: RootPrivateKey,
+    ) -> tuple[str, str]:
+        crl = builder.sign(
+            private_key=private_key, algorithm=cls._signature_hash(private_key)
         )
+        crl_der = crl.public_bytes(serialization.Encoding.DER)
+        crl_pem = crl.public_bytes(serialization.Encoding.PEM).decode("utf-8")
+        return crl_pem, hashlib.sha256(crl_der).hexdigest()
 
     @staticmethod
     def _ensure_utc(dt: datetime) -> datetime:
@@ -734,6 +1127,10 @@ class CertificateAuthorityService:
             return rsa.generate_private_key(public_exponent=65537, key_size=4096)
         if algorithm is RootKeyAlgorithm.EC_P256:
             return ec.generate_private_key(ec.SECP256R1())
+        if algorithm is RootKeyAlgorithm.EC_P384:
+            return ec.generate_private_key(ec.SECP384R1())
+        if algorithm is RootKeyAlgorithm.ED25519:
+            return ed25519.Ed25519PrivateKey.generate()
         raise CertificateAuthorityError(f"Unsupported root key algorithm: {algorithm}")
 
     @staticmethod
@@ -742,8 +1139,31 @@ class CertificateAuthorityService:
             return rsa.generate_private_key(public_exponent=65537, key_size=2048)
         if algorithm is LeafKeyAlgorithm.EC_P256:
             return ec.generate_private_key(ec.SECP256R1())
+        if algorithm is LeafKeyAlgorithm.EC_P384:
+            return ec.generate_private_key(ec.SECP384R1())
+        if algorithm is LeafKeyAlgorithm.ED25519:
+            return ed25519.Ed25519PrivateKey.generate()
         raise CertificateAuthorityError(f"Unsupported leaf key algorithm: {algorithm}")
 
+    @staticmethod
+    def _signature_hash(
+        private_key: RootPrivateKey,
+    ) -> hashes.SHA256 | hashes.SHA384 | None:
+        """Pick the digest for certificates and CRLs signed by ``private_key``.
+
+        Ed25519 hashes internally and takes no separate digest; P-384 keys are
+        paired with SHA-384 so the digest matches the curve's strength.
+        """
+
+        if isinstance(private_key, ed25519.Ed25519PrivateKey):
+            return None
+        if (
+            isinstance(private_key, ec.EllipticCurvePrivateKey)
+            and private_key.curve.key_size >= 384
+        ):
+            return hashes.SHA384()
+        return hashes.SHA256()
+
     @staticmethod
     def _resolve_common_name(certificate: x509.Certificate) -> str:
         attributes = certificate.subject.get_attributes_for_oid(NameOID.COMMON_NAME)
@@ -0,0 +1,90 @@
+"""Application-scoped service instances shared by all requests."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from time import perf_counter
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.ca_distribution import CADistributionCache, get_ca_distribution_cache
+from app.services.certificate_authority import CertificateAuthorityService
+from app.services.key_pool import LeafKeyPool, get_leaf_key_pool
+from app.services.ltv_material import (
+    LTVMaterialCache,
+    LTVMaterialError,
+    get_ltv_material_cache,
+)
+from app.services.pdf_signing import PDFSigningService
+from app.services.pdf_verification import (
+    PDFVerificationRootCAError,
+    PDFVerificationService,
+)
+from app.services.signing_idempotency import SignedResultStore, get_signed_result_store
+from app.services.signing_jobs import SigningJobService
+from app.services.storage import EncryptedStorageService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ServiceContainer:
+    """Services built once per application instead of once per request.
+
+    Every service and process-wide cache shares one ``EncryptedStorageService``,
+    so the master key is read and the cipher objects are built a single time.
+    The caches are only bound to it when the container creates them first,
+    which the application lifespan guarantees.
+    """
+
+    storage: EncryptedStorageService
+    key_pool: LeafKeyPool
+    ltv_material: LTVMaterialCache
+    ca_distribution: CADistributionCache
+    signed_results: SignedResultStore
+    certificate_authority: CertificateAuthorityService
+    signing: PDFSigningService
+    verification: PDFVerificationService
+    signing_jobs: SigningJobService
+
+    @classmethod
+    def build(cls) -> ServiceContainer:
+        storage = EncryptedStorageService()
+        key_pool = get_leaf_key_pool()
+        ltv_material = get_ltv_material_cache(storage_service=storage)
+        certificate_authority = CertificateAuthorityService(
+            storage_service=storage, key_pool=key_pool
+        )
+        signing = PDFSigningService(
+            storage_service=storage, ltv_material_cache=ltv_material
+        )
+        return cls(
+            storage=storage,
+            key_pool=key_pool,
+            ltv_material=ltv_material,
+            ca_distribution=get_ca_distribution_cache(storage_service=storage),
+            signed_results=get_signed_result_store(storage_service=storage),
+            certificate_authority=certificate_authority,
+            signing=signing,
+            verification=PDFVerificationService(ca_service=certificate_authority),
+            signing_jobs=SigningJobService(signing_service=signing),
+        )
+
+    async def warm_up(self, *, session: AsyncSession) -> None:
+        """Load the root CA, trust roots and LTV material ahead of traffic.
+
+        A fresh installation without a root CA is not an error; the material
+        is then loaded by the first request after the root is generated.
+        """
+
+        started = perf_counter()
+        try:
+            await self.verification.warm_up(session=session)
+            await self.ltv_material.get(session=session)
+        except (PDFVerificationRootCAError, LTVMaterialError) as exc:
+            logger.info("Skipping CA warm-up: %s", exc)
+            return
+        logger.info(
+            "Warmed up CA material in %.1f ms", (perf_counter() - started) * 1000
+        )
@@ -0,0 +1,232 @@
+"""In-memory pool of pre-generated leaf private keys."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing import get_context
+from typing import Sequence
+
+from cryptography.hazmat.primitives import serialization
+
+from app.core.config import settings
+from app.services.certificate_authority import (
+    CertificateAuthorityService,
+    LeafKeyAlgorithm,
+    LeafPrivateKey,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class KeyPoolStats:
+    """Point-in-time view of one algorithm's pre-generated keys."""
+
+    depth: int
+    pending: int
+    low_watermark: int
+    high_watermark: int
+    hits: int
+    misses: int
+    generated: int
+    failures: int
+
+
+@dataclass(slots=True)
+class _AlgorithmPool:
+    keys: deque[LeafPrivateKey]
+    pending: int = 0
+    hits: int = 0
+    misses: int = 0
+    generated: int = 0
+    failures: int = 0
+
+
+def _generate_key_der(algorithm: str) -> bytes:
+    """Generate a key in a worker and return it as PKCS#8 DER.
+
+    The key travels back over the pool's result pipe, which is private to
+    this process and its workers, and is never written to disk.
+    """
+
+    private_key = CertificateAuthorityService._generate_leaf_private_key(
+        LeafKeyAlgorithm(algorithm)
+    )
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+
+class LeafKeyPool:
+    """Keeps spare leaf keys per algorithm so issuance skips key generation.
+
+    Worker processes refill an algorithm's pool to ``high_watermark`` once
+    its ready and pending keys fall to ``low_watermark``. Keys live only in
+    this process's memory and each is handed out once. Until :meth:`start`
+    is called, and whenever a pool runs dry, :meth:`take` returns ``None``
+    and the caller generates the key inline.
+    """
+
+    def __init__(
+        self,
+        *,
+        algorithms: Sequence[LeafKeyAlgorithm],
+        low_watermark: int,
+        high_watermark: int,
+        workers: int,
+    ) -> None:
+        if low_watermark < 0:
+            raise ValueError("Key pool low watermark cannot be negative")
+        if high_watermark < max(low_watermark, 1):
+            raise ValueError("Key pool high watermark must cover the low watermark")
+        if workers <= 0:
+            raise ValueError("Key pool worker count must be positive")
+
+        self._low_watermark = low_watermark
+        self._high_watermark = high_watermark
+        self._workers = workers
+        self._pools = {
+            algorithm: _AlgorithmPool(keys=deque()) for algorithm in algorithms
+        }
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the worker processes and fill every pool."""
+
+        if not self._pools:
+            return
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=get_context("spawn"),
+                )
+        for algorithm in self._pools:
+            self._refill(algorithm)
+
+    def take(self, algorithm: LeafKeyAlgorithm) -> LeafPrivateKey | None:
+        """Hand out a pre-generated key, or ``None`` if none is ready."""
+
+        pool = self._pools.get(algorithm)
+        if pool is None:
+            return None
+        with self._lock:
+            if pool.keys:
+                key: LeafPrivateKey | None = pool.keys.popleft()
+                pool.hits += 1
+            else:
+                key = None
+                pool.misses += 1
+        self._refill(algorithm)
+        return key
+
+    def stats(self) -> dict[str, KeyPoolStats]:
+        """Return depth and hit/miss counters per pooled algorithm."""
+
+        with self._lock:
+            return {
+                algorithm.value: KeyPoolStats(
+                    depth=len(pool.keys),
+                    pending=pool.pending,
+                    low_watermark=self._low_watermark,
+                    high_watermark=self._high_watermark,
+                    hits=pool.hits,
+                    misses=pool.misses,
+                    generated=pool.generated,
+                    failures=pool.failures,
+                )
+                for algorithm, pool in self._pools.items()
+            }
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop the workers and drop every pooled key."""
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+            for pool in self._pools.values():
+                pool.keys.clear()
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _refill(self, algorithm: LeafKeyAlgorithm) -> None:
+        pool = self._pools[algorithm]
+        with self._lock:
+            executor = self._executor
+            available = len(pool.keys) + pool.pending
+            if executor is None or available > self._low_watermark:
+                return
+            missing = self._high_watermark - available
+            pool.pending += missing
+        for _ in range(missing):
+            try:
+                future = executor.submit(_generate_key_der, algorithm.value)
+            except RuntimeError:  # Shut down concurrently
+                with self._lock:
+                    pool.pending -= 1
+                continue
+            future.add_done_callback(partial(self._on_generated, algorithm))
+
+    def _on_generated(self, algorithm: LeafKeyAlgorithm, future: Future[bytes]) -> None:
+        pool = self._pools[algorithm]
+        key = None if future.cancelled() else self._load(algorithm, future)
+        with self._lock:
+            pool.pending -= 1
+            if key is None:
+                if not future.cancelled():
+                    pool.failures += 1
+            elif self._executor is not None:
+                pool.keys.append(key)
+                pool.generated += 1
+
+    def _load(
+        self, algorithm: LeafKeyAlgorithm, future: Future[bytes]
+    ) -> LeafPrivateKey | None:
+        try:
+            # Our own worker generated the key, so the slow RSA consistency
+            # check adds nothing.
+            private_key = serialization.load_der_private_key(
+                future.result(), password=None, unsafe_skip_rsa_key_validation=True
+            )
+        except Exception:
+            logger.exception("Failed to pre-generate a %s key", algorithm.value)
+            return None
+        return private_key  # type: ignore[return-value]
+
+
+_pool_lock = threading.Lock()
+_leaf_key_pool: LeafKeyPool | None = None
+
+
+def get_leaf_key_pool() -> LeafKeyPool:
+    """Return the process-wide leaf key pool built from settings."""
+
+    global _leaf_key_pool
+    with _pool_lock:
+        if _leaf_key_pool is None:
+            _leaf_key_pool = LeafKeyPool(
+                algorithms=[
+                    LeafKeyAlgorithm(value) for value in settings.ca_key_pool_algorithms
+                ],
+                low_watermark=settings.ca_key_pool_low_watermark,
+                high_watermark=settings.ca_key_pool_high_watermark,
+                workers=settings.ca_key_pool_workers,
+            )
+        return _leaf_key_pool
+
+
+def shutdown_leaf_key_pool() -> None:
+    """Stop the process-wide key pool and discard its keys, if one was built."""
+
+    global _leaf_key_pool
+    with _pool_lock:
+        pool, _leaf_key_pool = _leaf_key_pool, None
+    if pool is not None:
+        pool.shutdown()
@@ -0,0 +1,207 @@
+"""Long-term validation material built from the managed CA's own artifacts.
+
+Every signing certificate chains to the managed root, whose certificate and
+CRLs are already stored as CA artifacts. Embedding those directly means
+``embed_ltv`` never fetches revocation data over the network, and the
+payload only changes when the root or its newest CRL does.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from time import monotonic
+from typing import Callable
+from uuid import UUID
+
+from asn1crypto import crl as asn1_crl  # type: ignore[import-untyped]
+from asn1crypto import pem
+from asn1crypto import x509 as asn1_x509
+from pyhanko_certvalidator.context import ValidationContext
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud import ca_artifact as ca_artifact_crud
+from app.models.ca_artifact import CAArtifact, CAArtifactType
+from app.services.storage import EncryptedStorageService, StorageError
+
+
+class LTVMaterialError(Exception):
+    """Raised when validation material cannot be assembled from CA artifacts."""
+
+
+@dataclass(slots=True, frozen=True)
+class LTVMaterial:
+    """DER encoded chain and revocation data for one root epoch.
+
+    An epoch is a root certificate together with its newest CRL. The value
+    is plain bytes, so it can be shipped to process pool workers.
+    """
+
+    root_artifact_id: UUID
+    crl_artifact_id: UUID
+    root_certificate: bytes
+    crls: tuple[bytes, ...]
+
+    @property
+    def size(self) -> int:
+        """Encoded size of everything that ends up in the signed document."""
+
+        return len(self.root_certificate) + sum(len(crl) for crl in self.crls)
+
+    def certificates(self) -> list[asn1_x509.Certificate]:
+        return [asn1_x509.Certificate.load(self.root_certificate)]
+
+    def certificate_lists(self) -> list[asn1_crl.CertificateList]:
+        return [asn1_crl.CertificateList.load(crl) for crl in self.crls]
+
+    def validation_context(self) -> ValidationContext:
+        """Offline validation context trusting the root and its CRLs."""
+
+        return ValidationContext(
+            trust_roots=self.certificates(),
+            crls=self.certificate_lists(),
+            allow_fetching=False,
+            revocation_mode="soft-fail",
+        )
+
+
+@dataclass(slots=True)
+class LTVMaterialCacheStats:
+    """Point-in-time counters for the LTV material cache."""
+
+    root_artifact_id: UUID | None
+    crl_artifact_id: UUID | None
+    size_bytes: int
+    ttl_seconds: int
+    hits: int
+    misses: int
+    invalidations: int
+
+
+def _to_der(payload: bytes) -> bytes:
+    if pem.detect(payload):
+        _, _, payload = pem.unarmor(payload)
+    return payload
+
+
+class LTVMaterialCache:
+    """Holds the LTV payload for the current root epoch.
+
+    The payload is built from stored artifacts on first use and reused until
+    a new CRL or root is generated. CRLs published by another process are
+    picked up once ``ttl_seconds`` have passed.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: int,
+        storage_service: EncryptedStorageService | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("LTV material cache TTL must be positive")
+
+        self._ttl_seconds = ttl_seconds
+        self._storage = storage_service or EncryptedStorageService()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._material: LTVMaterial | None = None
+        self._deadline = 0.0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    async def get(self, *, session: AsyncSession) -> LTVMaterial:
+        """Return the LTV payload, building it from CA artifacts on a miss."""
+
+        with self._lock:
+            material = self._material
+            if material is not None and self._deadline > self._clock():
+                self._hits += 1
+                return material
+            self._misses += 1
+
+        material = await self._build(session=session)
+        with self._lock:
+            self._material = material
+            self._deadline = self._clock() + self._ttl_seconds
+        return material
+
+    def invalidate(self) -> None:
+        """Drop the cached payload, e.g. after a new CRL has been generated."""
+
+        with self._lock:
+            if self._material is not None:
+                self._invalidations += 1
+            self._material = None
+
+    def stats(self) -> LTVMaterialCacheStats:
+        with self._lock:
+            material = self._material
+            return LTVMaterialCacheStats(
+                root_artifact_id=material.root_artifact_id if material else None,
+                crl_artifact_id=material.crl_artifact_id if material else None,
+                size_bytes=material.size if material else 0,
+                ttl_seconds=self._ttl_seconds,
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+            )
+
+    async def _build(self, *, session: AsyncSession) -> LTVMaterial:
+        root = await ca_artifact_crud.get_latest_artifact_by_type(
+            session=session, artifact_type=CAArtifactType.ROOT_CERTIFICATE
+        )
+        if root is None:
+            raise LTVMaterialError("Root certificate authority has not been generated")
+        crl = await ca_artifact_crud.get_latest_artifact_by_type(
+            session=session, artifact_type=CAArtifactType.CRL
+        )
+        # Validation runs soft-fail, so without a CRL the signature would be
+        # reported as LTV-enabled while carrying no revocation data at all.
+        if crl is None:
+            raise LTVMaterialError(
+                "No CRL has been generated; generate one before embedding LTV"
+            )
+
+        return LTVMaterial(
+            root_artifact_id=root.id,
+            crl_artifact_id=crl.id,
+            root_certificate=await self._load_der(session=session, artifact=root),
+            crls=(await self._load_der(session=session, artifact=crl),),
+        )
+
+    async def _load_der(self, *, session: AsyncSession, artifact: CAArtifact) -> bytes:
+        if artifact.file_id is None:
+            raise LTVMaterialError(f"CA artifact {artifact.name} has no stored file")
+        try:
+            payload = await self._storage.load_file_bytes(session, artifact.file_id)
+        except StorageError as exc:
+            raise LTVMaterialError(
+                f"Unable to load CA artifact {artifact.name}: {exc}"
+            ) from exc
+        return _to_der(payload)
+
+
+_cache_lock = threading.Lock()
+_ltv_material_cache: LTVMaterialCache | None = None
+
+
+def get_ltv_material_cache(
+    storage_service: EncryptedStorageService | None = None,
+) -> LTVMaterialCache:
+    """Return the process-wide LTV material cache built from settings.
+
+    ``storage_service`` is only used when the cache is first created.
+    """
+
+    global _ltv_material_cache
+    with _cache_lock:
+        if _ltv_material_cache is None:
+            _ltv_material_cache = LTVMaterialCache(
+                ttl_seconds=settings.pdf_ltv_cache_ttl_seconds,
+                storage_service=storage_service,
+            )
+        return _ltv_material_cache
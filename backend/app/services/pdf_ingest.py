@@ -0,0 +1,91 @@
+"""Single-parse ingestion of PDF documents shared by validation and signing."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import BinaryIO
+
+from pyhanko.pdf_utils.reader import PdfFileReader
+from pyhanko.sign.fields import enumerate_sig_fields
+
+
+class PDFIngestError(Exception):
+    """Raised when a document cannot be parsed or fails structural checks."""
+
+
+@dataclass(slots=True, frozen=True)
+class PDFDocumentInfo:
+    """Structural facts gathered from a single parse of a PDF document."""
+
+    page_count: int
+    signature_fields: tuple[str, ...]
+    filled_signature_fields: tuple[str, ...]
+    revisions: int
+    startxref: int
+    xref_stream: bool
+    encrypted: bool
+
+    def check_page_index(self, page_index: int) -> None:
+        """Reject a zero-based page index that falls outside the document."""
+
+        if not 0 <= page_index < self.page_count:
+            raise PDFIngestError(
+                f"Page {page_index + 1} is out of range; "
+                f"document has {self.page_count} page(s)"
+            )
+
+    def signature_field_name(self, base: str, *, new_field: bool) -> str:
+        """Return a field name that will not collide with existing signatures.
+
+        An empty field called ``base`` is reused for invisible signatures;
+        visible signatures always need a name that is not taken yet.
+        """
+
+        taken = (
+            set(self.signature_fields)
+            if new_field
+            else set(self.filled_signature_fields)
+        )
+        if base not in taken:
+            return base
+        suffix = 2
+        while f"{base}{suffix}" in self.signature_fields:
+            suffix += 1
+        return f"{base}{suffix}"
+
+
+def read_document(pdf_stream: BinaryIO) -> tuple[PdfFileReader, PDFDocumentInfo]:
+    """Parse ``pdf_stream`` once with pyHanko and describe its structure.
+
+    The returned reader can be handed to ``IncrementalPdfFileWriter`` as
+    ``prev`` so that signing does not parse the document a second time.
+    """
+
+    try:
+        reader = PdfFileReader(pdf_stream)
+        page_count = int(reader.root["/Pages"]["/Count"])
+        fields = list(enumerate_sig_fields(reader))
+    except Exception as exc:
+        raise PDFIngestError(f"PDF file is corrupted or invalid: {exc}") from exc
+
+    if page_count <= 0:
+        raise PDFIngestError("PDF file appears to be empty")
+    if reader.encrypted:
+        raise PDFIngestError("Encrypted PDF documents are not supported")
+    # Incremental signing appends a revision that points back at this offset.
+    startxref = reader.last_startxref
+    if startxref is None:
+        raise PDFIngestError("PDF file is corrupted or invalid: missing startxref")
+
+    info = PDFDocumentInfo(
+        page_count=page_count,
+        signature_fields=tuple(name for name, _value, _ref in fields),
+        filled_signature_fields=tuple(
+            name for name, value, _ref in fields if value is not None
+        ),
+        revisions=reader.xrefs.total_revisions,
+        startxref=startxref,
+        xref_stream=reader.has_xref_stream,
+        encrypted=reader.encrypted,
+    )
+    return reader, info
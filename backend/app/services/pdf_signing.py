@@ -2,22 +2,23 @@
 
 from __future__ import annotations
 
-import io
-from dataclasses import dataclass
+import asyncio
+import logging
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import BinaryIO
+from typing import AsyncIterator, Awaitable, BinaryIO, Callable, Sequence
 from uuid import UUID, uuid4
 
-from asn1crypto import keys as asn1_keys  # type: ignore[import-untyped]
+from asn1crypto import cms as asn1_cms  # type: ignore[import-untyped]
+from asn1crypto import keys as asn1_keys
 from asn1crypto import x509 as asn1_x509
 from cryptography import x509
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.serialization import pkcs12
-from pyhanko.pdf_utils.incremental_writer import IncrementalPdfFileWriter
-from pyhanko.sign import fields, signers
-from pyhanko.sign.fields import SigSeedSubFilter
+from pyhanko.sign import signers
+from pyhanko.sign.timestamps import TimeStamper
 from pyhanko_certvalidator.registry import SimpleCertificateStore
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -26,8 +27,50 @@ from app.crud import certificate as certificate_crud
 from app.crud import seal as seal_crud
 from app.models.certificate import Certificate, CertificateStatus
 from app.models.seal import Seal
+from app.services.ltv_material import (
+    LTVMaterial,
+    LTVMaterialCache,
+    LTVMaterialError,
+    get_ltv_material_cache,
+)
+from app.services.pdf_ingest import PDFIngestError
+from app.services.seal_appearance import (
+    SealAppearance,
+    SealAppearanceCache,
+    SealAppearanceError,
+    get_seal_appearance_cache,
+    render_seal_appearance,
+)
+from app.services.signature_timestamps import (
+    SignatureTimestampError,
+    timestamp_signature,
+)
+from app.services.signer_cache import SignerCache, get_signer_cache
+from app.services.signing_executor import (
+    SignatureOptions,
+    SigningExecutor,
+    SigningQueueFullError,
+    get_signing_executor,
+)
+from app.services.signing_metrics import StageTimings
+from app.services.spool import (
+    PDFSource,
+    SpooledFile,
+    UploadSpool,
+    source_head,
+    source_size,
+)
 from app.services.storage import EncryptedStorageService, StorageError
-from app.services.tsa_client import TSAClient
+from app.services.tsa_client import (
+    TSAClient,
+    TSAConnectionError,
+    TSAError,
+    get_tsa_client,
+)
+
+logger = logging.getLogger(__name__)
+
+_DIGEST_SIZES = {"sha256": 32, "sha384": 48, "sha512": 64}
 
 
 class PDFSigningError(Exception):
@@ -54,6 +97,14 @@ class SignatureError(PDFSigningError):
     """Raised when signature operation fails."""
 
 
+class SigningUnavailableError(PDFSigningError):
+    """Raised when the signing pool or timestamp authority cannot take more work."""
+
+
+class DigestSigningError(PDFSigningError):
+    """Raised when a digest or signed attribute set cannot be signed."""
+
+
 class SignatureVisibility(str, Enum):
     """Visibility mode for PDF signatures."""
 
@@ -81,12 +132,24 @@ class SignatureMetadata:
     contact_info: str | None = None
 
 
+@dataclass(slots=True)
+class DigestSigningResult:
+    """CMS signature produced for a client-computed document digest."""
+
+    signature_id: str
+    cms: bytes
+    certificate_id: UUID
+    digest_algorithm: str
+    signed_at: datetime
+    tsa_used: bool = False
+
+
 @dataclass(slots=True)
 class SigningResult:
     """Result of a PDF signing operation."""
 
     document_id: str
-    signed_pdf: bytes
+    signed_output: PDFSource
     signed_at: datetime
     certificate_id: UUID
     seal_id: UUID | None
@@ -95,6 +158,15 @@ class SigningResult:
     ltv_embedded: bool
     file_size: int
 
+    @property
+    def signed_pdf(self) -> bytes:
+        """Signed document bytes, read from disk when the output was spooled."""
+
+        if isinstance(self.signed_output, SpooledFile):
+            with open(self.signed_output.path, "rb") as handle:
+                return handle.read()
+        return self.signed_output
+
 
 class PDFSigningService:
     """High-level service for signing PDF documents with pyHanko."""
@@ -103,19 +175,36 @@ class PDFSigningService:
         self,
         storage_service: EncryptedStorageService | None = None,
         tsa_client: TSAClient | None = None,
+        executor: SigningExecutor | None = None,
+        signer_cache: SignerCache | None = None,
+        seal_appearance_cache: SealAppearanceCache | None = None,
+        ltv_material_cache: LTVMaterialCache | None = None,
     ) -> None:
         self._storage = storage_service or EncryptedStorageService()
-        self._tsa = tsa_client or TSAClient()
+        self._tsa_client = tsa_client
+        self._signing_executor = executor
+        self._signer_cache = signer_cache or get_signer_cache()
+        self._seal_appearances = seal_appearance_cache or get_seal_appearance_cache()
+        self._ltv_material = ltv_material_cache or get_ltv_material_cache()
         self._pdf_max_bytes = settings.pdf_max_bytes
         self._allowed_content_types = {
             ct.lower() for ct in settings.pdf_allowed_content_types
         }
 
+    @property
+    def _tsa(self) -> TSAClient:
+        # Application-scoped instances outlive a shutdown of the shared client.
+        return self._tsa_client or get_tsa_client()
+
+    @property
+    def _executor(self) -> SigningExecutor:
+        return self._signing_executor or get_signing_executor()
+
     async def sign_pdf(
         self,
         *,
         session: AsyncSession,
-        pdf_data: bytes,
+        pdf_data: PDFSource,
         certificate_id: UUID,
         user_id: int,
         seal_id: UUID | None = None,
@@ -124,39 +213,54 @@ class PDFSigningService:
         metadata: SignatureMetadata | None = None,
         use_tsa: bool = False,
         embed_ltv: bool = False,
+        output_spool: UploadSpool | None = None,
+        timings: StageTimings | None = None,
     ) -> SigningResult:
-        """Sign a single PDF document."""
+        """Sign a single PDF document.
 
-        self._validate_pdf(pdf_data)
+        When ``output_spool`` is given the signed document is written to a
+        spool file owned by it instead of being held in memory. Stage
+        durations are added to ``timings`` when given.
+        """
 
-        certificate = await self._load_certificate(
-            session=session,
-            certificate_id=certificate_id,
-            user_id=user_id,
-        )
+        timings = timings or StageTimings()
+        with timings.stage("validate"):
+            self._validate_pdf(pdf_data)
 
-        seal_image: bytes | None = None
-        if seal_id:
-            seal_image = await self._load_seal_image(
+        with timings.stage("certificate"):
+            certificate = await self._load_certificate(
+                session=session,
+                certificate_id=certificate_id,
+                user_id=user_id,
+            )
+
+        with timings.stage("seal"):
+            seal_appearance = await self._prepare_seal(
                 session=session,
                 seal_id=seal_id,
                 user_id=user_id,
+                visibility=visibility,
             )
 
-        signer = await self._create_signer(
-            session=session,
-            certificate=certificate,
-            use_tsa=use_tsa,
-        )
+        with timings.stage("key"):
+            signer = await self._create_signer(session=session, certificate=certificate)
+        timestamper = self._tsa.get_timestamper() if use_tsa else None
+        with timings.stage("ltv"):
+            ltv_material = await self._load_ltv_material(
+                session=session, enabled=embed_ltv
+            )
 
-        signed_pdf = await self._apply_signature(
+        signed_output = await self._apply_signature(
             pdf_data=pdf_data,
             signer=signer,
             visibility=visibility,
             coordinates=coordinates,
-            seal_image=seal_image,
+            seal_appearance=seal_appearance,
             metadata=metadata,
-            embed_ltv=embed_ltv,
+            ltv_material=ltv_material,
+            timestamper=timestamper,
+            output_spool=output_spool,
+            timings=timings,
         )
 
         document_id = uuid4().hex
@@ -164,21 +268,21 @@ class PDFSigningService:
 
         return SigningResult(
             document_id=document_id,
-            signed_pdf=signed_pdf,
+            signed_output=signed_output,
             signed_at=signed_at,
             certificate_id=certificate_id,
             seal_id=seal_id,
             visibility=visibility,
-            tsa_used=use_tsa and self._tsa.is_configured(),
+            tsa_used=timestamper is not None,
             ltv_embedded=embed_ltv,
-            file_size=len(signed_pdf),
+            file_size=source_size(signed_output),
         )
 
     async def batch_sign_pdfs(
         self,
         *,
         session: AsyncSession,
-        pdfs: list[tuple[str, bytes]],
+        pdfs: Sequence[tuple[str, PDFSource]],
         certificate_id: UUID,
         user_id: int,
         seal_id: UUID | None = None,
@@ -187,12 +291,124 @@ class PDFSigningService:
         metadata: SignatureMetadata | None = None,
         use_tsa: bool = False,
         embed_ltv: bool = False,
+        output_spool: UploadSpool | None = None,
+        timings: StageTimings | None = None,
     ) -> list[SigningResult | Exception]:
         """Sign multiple PDF documents in batch."""
 
-        if len(pdfs) > settings.pdf_batch_max_count:
-            raise PDFValidationError(
-                f"Batch size {len(pdfs)} exceeds maximum of {settings.pdf_batch_max_count}"
+        sign_item = await self._prepare_batch(
+            session=session,
+            batch_size=len(pdfs),
+            certificate_id=certificate_id,
+            user_id=user_id,
+            seal_id=seal_id,
+            visibility=visibility,
+            coordinates=coordinates,
+            metadata=metadata,
+            use_tsa=use_tsa,
+            embed_ltv=embed_ltv,
+            output_spool=output_spool,
+            timings=timings,
+        )
+
+        return list(
+            await asyncio.gather(*(sign_item(pdf_data) for _, pdf_data in pdfs))
+        )
+
+    async def iter_batch_sign_pdfs(
+        self,
+        *,
+        session: AsyncSession,
+        pdfs: Sequence[tuple[str, PDFSource]],
+        certificate_id: UUID,
+        user_id: int,
+        seal_id: UUID | None = None,
+        visibility: SignatureVisibility = SignatureVisibility.INVISIBLE,
+        coordinates: SignatureCoordinates | None = None,
+        metadata: SignatureMetadata | None = None,
+        use_tsa: bool = False,
+        embed_ltv: bool = False,
+        output_spool: UploadSpool | None = None,
+    ) -> AsyncIterator[tuple[int, SigningResult | Exception]]:
+        """Sign a batch and return an iterator of ``(index, result)`` pairs.
+
+        Certificate, seal and batch-size checks run before this coroutine
+        returns; the iterator then yields items in completion order.
+        """
+
+        sign_item = await self._prepare_batch(
+            session=session,
+            batch_size=len(pdfs),
+            certificate_id=certificate_id,
+            user_id=user_id,
+            seal_id=seal_id,
+            visibility=visibility,
+            coordinates=coordinates,
+            metadata=metadata,
+            use_tsa=use_tsa,
+            embed_ltv=embed_ltv,
+            output_spool=output_spool,
+        )
+
+        async def indexed(
+            index: int, pdf_data: PDFSource
+        ) -> tuple[int, SigningResult | Exception]:
+            return index, await sign_item(pdf_data)
+
+        async def iterate() -> AsyncIterator[tuple[int, SigningResult | Exception]]:
+            tasks = [
+                asyncio.ensure_future(indexed(index, pdf_data))
+                for index, (_, pdf_data) in enumerate(pdfs)
+            ]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        return iterate()
+
+    async def sign_digest(
+        self,
+        *,
+        session: AsyncSession,
+        certificate_id: UUID,
+        user_id: int,
+        digest_algorithm: str = "sha256",
+        document_digest: bytes | None = None,
+        signed_attributes: bytes | None = None,
+        use_pades: bool = False,
+        use_tsa: bool = False,
+    ) -> DigestSigningResult:
+        """Sign a digest computed by the client and return the CMS blob.
+
+        This is the server half of interrupted signing: the client reserves
+        the signature placeholder, hashes the PDF byte range itself and
+        embeds the returned CMS, so the document never leaves the client.
+        Pass either ``document_digest``, for which the signed attributes are
+        built here, or a DER-encoded ``signed_attributes`` set the client has
+        assembled around its digest.
+        """
+
+        expected_size = _DIGEST_SIZES.get(digest_algorithm)
+        if expected_size is None:
+            raise DigestSigningError(
+                f"Unsupported digest algorithm: {digest_algorithm}"
+            )
+        if (document_digest is None) == (signed_attributes is None):
+            raise DigestSigningError(
+                "Provide exactly one of document_digest or signed_attributes"
+            )
+
+        attributes: asn1_cms.CMSAttributes | None = None
+        if signed_attributes is not None:
+            attributes = self._parse_signed_attributes(
+                signed_attributes, expected_size=expected_size
+            )
+        elif len(document_digest or b"") != expected_size:
+            raise DigestSigningError(
+                f"Digest must be {expected_size} bytes for {digest_algorithm}"
             )
 
         certificate = await self._load_certificate(
@@ -200,70 +416,183 @@ class PDFSigningService:
             certificate_id=certificate_id,
             user_id=user_id,
         )
+        signer = await self._create_signer(session=session, certificate=certificate)
+        signing_cert = signer.signing_cert
+        if signing_cert is None:
+            raise DigestSigningError("Signer has no signing certificate")
+        if (
+            signing_cert.public_key.algorithm == "ed25519"
+            and digest_algorithm != "sha512"
+        ):
+            raise DigestSigningError("Ed25519 certificates require sha512 digests")
+        timestamper = self._tsa.get_timestamper() if use_tsa else None
+
+        try:
+            if attributes is not None:
+                content_info = await signer.async_sign_prescribed_attributes(
+                    digest_algorithm, signed_attrs=attributes, timestamper=timestamper
+                )
+            else:
+                assert document_digest is not None
+                content_info = await signer.async_sign(
+                    document_digest,
+                    digest_algorithm,
+                    use_pades=use_pades,
+                    timestamper=timestamper,
+                )
+        except TSAConnectionError as exc:
+            raise SigningUnavailableError(
+                f"Timestamp authority unavailable: {exc}"
+            ) from exc
+        except Exception as exc:
+            raise SignatureError(f"Failed to sign digest: {exc}") from exc
+
+        return DigestSigningResult(
+            signature_id=uuid4().hex,
+            cms=content_info.dump(),
+            certificate_id=certificate_id,
+            digest_algorithm=digest_algorithm,
+            signed_at=datetime.now(timezone.utc),
+            tsa_used=timestamper is not None,
+        )
+
+    @staticmethod
+    def _parse_signed_attributes(
+        signed_attributes: bytes, *, expected_size: int
+    ) -> asn1_cms.CMSAttributes:
+        """Parse a client-built signed attribute set and check its digest."""
 
-        seal_image: bytes | None = None
+        try:
+            attributes = asn1_cms.CMSAttributes.load(signed_attributes)
+            types = {attr["type"].native: attr for attr in attributes}
+        except Exception as exc:
+            raise DigestSigningError(f"Invalid signed attributes: {exc}") from exc
+
+        if "content_type" not in types:
+            raise DigestSigningError("Signed attributes must include content_type")
+        message_digest = types.get("message_digest")
+        if message_digest is None:
+            raise DigestSigningError("Signed attributes must include message_digest")
+        if len(message_digest["values"][0].native) != expected_size:
+            raise DigestSigningError(f"message_digest must be {expected_size} bytes")
+        return attributes
+
+    async def check_signing_material(
+        self,
+        *,
+        session: AsyncSession,
+        certificate_id: UUID,
+        user_id: int,
+        seal_id: UUID | None = None,
+    ) -> None:
+        """Fail early if the certificate or seal cannot be used by ``user_id``."""
+
+        await self._load_certificate(
+            session=session,
+            certificate_id=certificate_id,
+            user_id=user_id,
+        )
         if seal_id:
-            seal_image = await self._load_seal_image(
+            await self._load_seal(session=session, seal_id=seal_id, user_id=user_id)
+
+    async def _prepare_batch(
+        self,
+        *,
+        session: AsyncSession,
+        batch_size: int,
+        certificate_id: UUID,
+        user_id: int,
+        seal_id: UUID | None,
+        visibility: SignatureVisibility,
+        coordinates: SignatureCoordinates | None,
+        metadata: SignatureMetadata | None,
+        use_tsa: bool,
+        embed_ltv: bool,
+        output_spool: UploadSpool | None,
+        timings: StageTimings | None = None,
+    ) -> Callable[[PDFSource], Awaitable[SigningResult | Exception]]:
+        """Load shared batch material and return a bounded per-item signer."""
+
+        timings = timings or StageTimings()
+
+        if batch_size > settings.pdf_batch_max_count:
+            raise PDFValidationError(
+                f"Batch size {batch_size} exceeds maximum of {settings.pdf_batch_max_count}"
+            )
+
+        with timings.stage("certificate"):
+            certificate = await self._load_certificate(
                 session=session,
-                seal_id=seal_id,
+                certificate_id=certificate_id,
                 user_id=user_id,
             )
 
-        signer = await self._create_signer(
-            session=session,
-            certificate=certificate,
-            use_tsa=use_tsa,
-        )
+        with timings.stage("seal"):
+            seal_appearance = await self._prepare_seal(
+                session=session,
+                seal_id=seal_id,
+                user_id=user_id,
+                visibility=visibility,
+            )
 
-        results: list[SigningResult | Exception] = []
+        with timings.stage("key"):
+            signer = await self._create_signer(session=session, certificate=certificate)
+        timestamper = self._tsa.get_timestamper() if use_tsa else None
+        with timings.stage("ltv"):
+            ltv_material = await self._load_ltv_material(
+                session=session, enabled=embed_ltv
+            )
 
-        for filename, pdf_data in pdfs:
-            try:
-                self._validate_pdf(pdf_data)
-
-                signed_pdf = await self._apply_signature(
-                    pdf_data=pdf_data,
-                    signer=signer,
-                    visibility=visibility,
-                    coordinates=coordinates,
-                    seal_image=seal_image,
-                    metadata=metadata,
-                    embed_ltv=embed_ltv,
-                )
+        semaphore = asyncio.Semaphore(settings.pdf_batch_concurrency)
 
-                document_id = uuid4().hex
-                signed_at = datetime.now(timezone.utc)
+        async def sign_item(pdf_data: PDFSource) -> SigningResult | Exception:
+            async with semaphore:
+                try:
+                    with timings.stage("validate"):
+                        self._validate_pdf(pdf_data)
 
-                results.append(
-                    SigningResult(
-                        document_id=document_id,
-                        signed_pdf=signed_pdf,
-                        signed_at=signed_at,
-                        certificate_id=certificate_id,
-                        seal_id=seal_id,
+                    signed_output = await self._apply_signature(
+                        pdf_data=pdf_data,
+                        signer=signer,
                         visibility=visibility,
-                        tsa_used=use_tsa and self._tsa.is_configured(),
-                        ltv_embedded=embed_ltv,
-                        file_size=len(signed_pdf),
+                        coordinates=coordinates,
+                        seal_appearance=seal_appearance,
+                        metadata=metadata,
+                        ltv_material=ltv_material,
+                        timestamper=timestamper,
+                        output_spool=output_spool,
+                        timings=timings,
                     )
-                )
-            except Exception as exc:
-                results.append(exc)
+                except Exception as exc:
+                    return exc
+
+            return SigningResult(
+                document_id=uuid4().hex,
+                signed_output=signed_output,
+                signed_at=datetime.now(timezone.utc),
+                certificate_id=certificate_id,
+                seal_id=seal_id,
+                visibility=visibility,
+                tsa_used=timestamper is not None,
+                ltv_embedded=embed_ltv,
+                file_size=source_size(signed_output),
+            )
 
-        return results
+        return sign_item
 
-    def _validate_pdf(self, pdf_data: bytes) -> None:
+    def _validate_pdf(self, pdf_data: PDFSource) -> None:
         """Validate PDF content and size."""
 
-        if len(pdf_data) == 0:
+        size = source_size(pdf_data)
+        if size == 0:
             raise PDFValidationError("PDF data is empty")
 
-        if len(pdf_data) > self._pdf_max_bytes:
+        if size > self._pdf_max_bytes:
             raise PDFValidationError(
-                f"PDF size {len(pdf_data)} bytes exceeds maximum of {self._pdf_max_bytes} bytes"
+                f"PDF size {size} bytes exceeds maximum of {self._pdf_max_bytes} bytes"
             )
 
-        if not pdf_data.startswith(b"%PDF-"):
+        if not source_head(pdf_data, 5).startswith(b"%PDF-"):
             raise PDFValidationError("Invalid PDF header")
 
     async def _load_certificate(
@@ -287,24 +616,28 @@ class PDFSigningService:
             raise CertificateInvalidError("Certificate does not belong to user")
 
         if certificate.status != CertificateStatus.ACTIVE.value:
+            self._signer_cache.invalidate(certificate.id)
             raise CertificateInvalidError(
                 f"Certificate is not active (status: {certificate.status})"
             )
 
-        now = datetime.now(timezone.utc)
-        if certificate.expires_at < now:
+        expires_at = certificate.expires_at
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        if expires_at < datetime.now(timezone.utc):
+            self._signer_cache.invalidate(certificate.id)
             raise CertificateInvalidError("Certificate has expired")
 
         return certificate
 
-    async def _load_seal_image(
+    async def _load_seal(
         self,
         *,
         session: AsyncSession,
         seal_id: UUID,
         user_id: int,
-    ) -> bytes:
-        """Load a seal image from storage."""
+    ) -> Seal:
+        """Load a seal owned by ``user_id`` that has image data."""
 
         seal = await seal_crud.get_seal_by_id(session=session, seal_id=seal_id)
 
@@ -317,6 +650,22 @@ class PDFSigningService:
         if seal.image_secret_id is None:
             raise SealNotFoundError("Seal has no image data")
 
+        return seal
+
+    async def _load_seal_image(
+        self,
+        *,
+        session: AsyncSession,
+        seal_id: UUID,
+        user_id: int,
+    ) -> bytes:
+        """Load a seal image from storage."""
+
+        seal = await self._load_seal(session=session, seal_id=seal_id, user_id=user_id)
+        return await self._read_seal_image(session=session, seal=seal)
+
+    async def _read_seal_image(self, *, session: AsyncSession, seal: Seal) -> bytes:
+        assert seal.image_secret_id is not None  # Checked by _load_seal
         try:
             return await self._storage.load_seal_image(
                 session=session,
@@ -325,15 +674,78 @@ class PDFSigningService:
         except StorageError as exc:
             raise SealNotFoundError(f"Failed to load seal image: {exc}") from exc
 
+    async def _prepare_seal(
+        self,
+        *,
+        session: AsyncSession,
+        seal_id: UUID | None,
+        user_id: int,
+        visibility: SignatureVisibility,
+    ) -> SealAppearance | None:
+        """Check the seal and return its appearance for visible signatures.
+
+        Invisible signatures only need the ownership check, so the image is
+        neither decrypted nor rendered for them.
+        """
+
+        if seal_id is None:
+            return None
+
+        seal = await self._load_seal(session=session, seal_id=seal_id, user_id=user_id)
+        if visibility != SignatureVisibility.VISIBLE:
+            return None
+        return await self.load_seal_appearance(session=session, seal=seal)
+
+    async def load_seal_appearance(
+        self, *, session: AsyncSession, seal: Seal
+    ) -> SealAppearance | None:
+        """Return the rendered appearance of ``seal``, rendering it on a miss.
+
+        Appearances are cached by seal id and image secret id, so the image
+        is decrypted and decoded once per seal version. Seals that cannot be
+        rendered (for example SVG without ``cairosvg``) yield ``None`` and the
+        signature falls back to the default appearance.
+        """
+
+        assert seal.image_secret_id is not None  # Checked by _load_seal
+        cached = self._seal_appearances.get(seal.id, seal.image_secret_id)
+        if cached is not None:
+            return cached
+
+        image = await self._read_seal_image(session=session, seal=seal)
+        try:
+            appearance = await asyncio.to_thread(render_seal_appearance, image)
+        except SealAppearanceError as exc:
+            logger.warning("Seal %s has no rendered appearance: %s", seal.id, exc)
+            return None
+
+        self._seal_appearances.put(seal.id, seal.image_secret_id, appearance)
+        return appearance
+
+    async def _load_ltv_material(
+        self, *, session: AsyncSession, enabled: bool
+    ) -> LTVMaterial | None:
+        """Return the managed CA's chain and CRLs when LTV embedding is requested."""
+
+        if not enabled:
+            return None
+        try:
+            return await self._ltv_material.get(session=session)
+        except LTVMaterialError as exc:
+            raise SignatureError(f"Failed to collect LTV material: {exc}") from exc
+
     async def _create_signer(
         self,
         *,
         session: AsyncSession,
         certificate: Certificate,
-        use_tsa: bool,
     ) -> signers.SimpleSigner:
         """Create a pyHanko signer from certificate and key material."""
 
+        cached = self._signer_cache.get(certificate.id)
+        if cached is not None:
+            return cached
+
         if certificate.private_key_secret_id is None:
             raise CertificateInvalidError("Certificate has no associated private key")
 
@@ -374,72 +786,96 @@ class PDFSigningService:
 
         cert_registry = SimpleCertificateStore()
 
-        return signers.SimpleSigner(
+        signer = signers.SimpleSigner(
             signing_cert=asn1_cert,
             signing_key=asn1_key,
             cert_registry=cert_registry,
             signature_mechanism=None,
         )
+        self._signer_cache.put(certificate.id, signer, not_after=certificate.expires_at)
+        return signer
 
     async def _apply_signature(
         self,
         *,
-        pdf_data: bytes,
+        pdf_data: PDFSource,
         signer: signers.SimpleSigner,
         visibility: SignatureVisibility,
         coordinates: SignatureCoordinates | None,
-        seal_image: bytes | None,
+        seal_appearance: SealAppearance | None,
         metadata: SignatureMetadata | None,
-        embed_ltv: bool,
-    ) -> bytes:
-        """Apply signature to PDF document."""
-
-        try:
-            input_stream = io.BytesIO(pdf_data)
-            writer = IncrementalPdfFileWriter(input_stream)
-
-            sig_meta = signers.PdfSignatureMetadata(
-                field_name="Signature",
-                md_algorithm="sha256",
-                subfilter=SigSeedSubFilter.ADOBE_PKCS7_DETACHED,
-                reason=metadata.reason if metadata else None,
-                location=metadata.location if metadata else None,
-                contact_info=metadata.contact_info if metadata else None,
-                embed_validation_info=embed_ltv,
-            )
-
-            output = io.BytesIO()
-
-            if visibility == SignatureVisibility.VISIBLE and coordinates:
-                sig_field = fields.SigFieldSpec(
-                    sig_field_name="Signature",
-                    on_page=coordinates.page - 1,
-                    box=(
-                        int(coordinates.x),
-                        int(coordinates.y),
-                        int(coordinates.x + coordinates.width),
-                        int(coordinates.y + coordinates.height),
-                    ),
+        ltv_material: LTVMaterial | None,
+        timestamper: TimeStamper | None = None,
+        output_spool: UploadSpool | None = None,
+        timings: StageTimings | None = None,
+    ) -> PDFSource:
+        """Apply signature to PDF document.
+
+        With a ``timestamper`` the worker reserves room for the token, which
+        is requested on the event loop once the signature value exists.
+        """
+
+        options = SignatureOptions(
+            field_name="Signature",
+            reason=metadata.reason if metadata else None,
+            location=metadata.location if metadata else None,
+            contact_info=metadata.contact_info if metadata else None,
+            ltv_material=ltv_material,
+            bytes_reserved=(
+                2
+                * (
+                    settings.tsa_signature_reserve_bytes
+                    + (ltv_material.size if ltv_material else 0)
                 )
+                if timestamper
+                else None
+            ),
+        )
+        if visibility == SignatureVisibility.VISIBLE and coordinates:
+            options = replace(
+                options,
+                page_index=coordinates.page - 1,
+                box=(
+                    int(coordinates.x),
+                    int(coordinates.y),
+                    int(coordinates.x + coordinates.width),
+                    int(coordinates.y + coordinates.height),
+                ),
+                seal_appearance=seal_appearance,
+            )
 
-                fields.append_signature_field(writer, sig_field)
-
-                signers.sign_pdf(
-                    writer,
-                    signature_meta=sig_meta,
-                    signer=signer,
-                    existing_fields_only=True,
-                    output=output,
-                )
-            else:
-                signers.sign_pdf(
-                    writer,
-                    signature_meta=sig_meta,
-                    signer=signer,
-                    output=output,
+        timings = timings or StageTimings()
+        try:
+            with timings.stage("sign"):
+                signed_output = await self._executor.run(
+                    pdf_data, signer, options, spool_output=output_spool is not None
                 )
-
-            return output.getvalue()
-
+        except SigningQueueFullError as exc:
+            raise SigningUnavailableError(str(exc)) from exc
+        except PDFIngestError as exc:
+            raise PDFValidationError(str(exc)) from exc
         except Exception as exc:
             raise SignatureError(f"Failed to sign PDF: {exc}") from exc
+
+        if timestamper is not None:
+            try:
+                with timings.stage("tsa"):
+                    signed_output = await timestamp_signature(
+                        signed_output, timestamper
+                    )
+            except BaseException as exc:
+                if isinstance(signed_output, SpooledFile):
+                    signed_output.unlink()
+                if isinstance(exc, TSAConnectionError):
+                    raise SigningUnavailableError(
+                        f"Timestamp authority unavailable: {exc}"
+                    ) from exc
+                if isinstance(exc, (TSAError, SignatureTimestampError)):
+                    raise SignatureError(
+                        f"Failed to timestamp signature: {exc}"
+                    ) from exc
+                raise
+
+        if output_spool is not None and isinstance(signed_output, SpooledFile):
+            output_spool.adopt(signed_output)
+        return signed_output
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-import io
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Sequence
+from uuid import UUID
 
 from asn1crypto import x509 as asn1_x509  # type: ignore[import-untyped]
 from cryptography import x509
 from cryptography.hazmat.primitives import serialization
 from pyhanko.pdf_utils.reader import PdfFileReader
-from pyhanko.sign.validation import validate_pdf_signature
+from pyhanko.sign.validation import async_validate_pdf_signature
 from pyhanko.sign.validation.errors import SignatureValidationError
 from pyhanko.sign.validation.pdf_embedded import EmbeddedPdfSignature
 from pyhanko.sign.validation.status import (
@@ -22,11 +23,14 @@ from pyhanko.sign.validation.status import (
 from pyhanko_certvalidator.context import ValidationContext
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.crud import ca_artifact as ca_artifact_crud
+from app.models.ca_artifact import CAArtifactType
 from app.services.certificate_authority import (
     CertificateAuthorityError,
     CertificateAuthorityService,
     RootCANotFoundError,
 )
+from app.services.spool import PDFSource, open_source, source_head, source_size
 
 
 class PDFVerificationError(Exception):
@@ -75,44 +79,52 @@ class PDFVerificationService:
 
     def __init__(self, ca_service: CertificateAuthorityService | None = None) -> None:
         self._ca_service = ca_service or CertificateAuthorityService()
+        self._trust_roots_lock = threading.Lock()
+        self._trust_roots: tuple[UUID, Sequence[asn1_x509.Certificate]] | None = None
+
+    async def warm_up(self, *, session: AsyncSession) -> None:
+        """Load and parse the trust roots before the first verification."""
+
+        await self._load_trust_roots(session=session)
 
     async def verify_pdf(
-        self, *, session: AsyncSession, pdf_data: bytes
+        self, *, session: AsyncSession, pdf_data: PDFSource
     ) -> PDFVerificationReport:
         """Validate signatures embedded in the supplied PDF payload."""
 
-        if not pdf_data:
+        if source_size(pdf_data) == 0:
             raise PDFVerificationInputError("PDF data is empty")
-        if not pdf_data.startswith(b"%PDF-"):
+        if not source_head(pdf_data, 5).startswith(b"%PDF-"):
             raise PDFVerificationInputError("Invalid PDF header")
 
-        try:
-            reader = PdfFileReader(io.BytesIO(pdf_data))
-        except Exception as exc:  # pragma: no cover - defensive branch
-            raise PDFVerificationInputError(
-                f"Unable to parse PDF document: {exc}"
-            ) from exc
-
-        signatures = list(reader.embedded_signatures)
-        if not signatures:
-            raise PDFVerificationInputError("PDF does not contain any signatures")
-
-        trust_roots = await self._load_trust_roots(session=session)
-
-        reports: list[SignatureVerificationDetails] = []
-        valid_count = 0
-        trusted_count = 0
-
-        for embedded_signature in signatures:
-            details = await self._process_signature(
-                embedded_signature=embedded_signature,
-                trust_roots=trust_roots,
-            )
-            reports.append(details)
-            if details.valid:
-                valid_count += 1
-            if details.trusted:
-                trusted_count += 1
+        with open_source(pdf_data) as pdf_stream:
+            try:
+                reader = PdfFileReader(pdf_stream)
+            except Exception as exc:  # pragma: no cover - defensive branch
+                raise PDFVerificationInputError(
+                    f"Unable to parse PDF document: {exc}"
+                ) from exc
+
+            signatures = list(reader.embedded_signatures)
+            if not signatures:
+                raise PDFVerificationInputError("PDF does not contain any signatures")
+
+            trust_roots = await self._load_trust_roots(session=session)
+
+            reports: list[SignatureVerificationDetails] = []
+            valid_count = 0
+            trusted_count = 0
+
+            for embedded_signature in signatures:
+                details = await self._process_signature(
+                    embedded_signature=embedded_signature,
+                    trust_roots=trust_roots,
+                )
+                reports.append(details)
+                if details.valid:
+                    valid_count += 1
+                if details.trusted:
+                    trusted_count += 1
 
         return PDFVerificationReport(
             total_signatures=len(reports),
@@ -124,7 +136,22 @@ class PDFVerificationService:
     async def _load_trust_roots(
         self, *, session: AsyncSession
     ) -> Sequence[asn1_x509.Certificate]:
-        """Return ASN.1 certificates that should be trusted for chain validation."""
+        """Return ASN.1 certificates that should be trusted for chain validation.
+
+        The parsed roots are kept until a newer root artifact is generated.
+        """
+
+        artifact_id = await ca_artifact_crud.get_latest_artifact_id_by_type(
+            session=session, artifact_type=CAArtifactType.ROOT_CERTIFICATE
+        )
+        if artifact_id is None:
+            raise PDFVerificationRootCAError(
+                "Root certificate authority has not been generated"
+            )
+        with self._trust_roots_lock:
+            cached = self._trust_roots
+        if cached is not None and cached[0] == artifact_id:
+            return cached[1]
 
         try:
             root_pem = await self._ca_service.export_root_certificate(session=session)
@@ -147,7 +174,10 @@ class PDFVerificationService:
                 "Stored root certificate is invalid"
             ) from exc
 
-        return (root_asn1,)
+        trust_roots = (root_asn1,)
+        with self._trust_roots_lock:
+            self._trust_roots = (artifact_id, trust_roots)
+        return trust_roots
 
     async def _process_signature(
         self,
@@ -160,7 +190,7 @@ class PDFVerificationService:
         context = ValidationContext(trust_roots=trust_roots, allow_fetching=False)
 
         try:
-            status = validate_pdf_signature(
+            status = await async_validate_pdf_signature(
                 embedded_signature,
                 signer_validation_context=context,
                 ts_validation_context=context,
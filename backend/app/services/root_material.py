@@ -0,0 +1,145 @@
+"""Process-wide cache of the decrypted root CA key pair."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Awaitable, Callable
+from uuid import UUID
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    from app.services.certificate_authority import RootMaterial
+
+
+@dataclass(slots=True)
+class RootMaterialCacheStats:
+    """Point-in-time counters for the root material cache."""
+
+    root_artifact_id: UUID | None
+    hits: int
+    misses: int
+    coalesced: int
+    invalidations: int
+
+
+@dataclass(slots=True)
+class _PendingLoad:
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future[RootMaterial]
+
+
+class RootMaterialCache:
+    """Keeps the root certificate and private key for the newest root artifact.
+
+    Callers look up the newest root artifact id, which is a single indexed
+    query, and only load and decrypt the stored material when that id
+    differs from the cached one. Concurrent misses for the same artifact
+    share one load.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._material: RootMaterial | None = None
+        self._artifact_id: UUID | None = None
+        self._pending: dict[UUID, _PendingLoad] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._invalidations = 0
+
+    async def get(
+        self,
+        artifact_id: UUID,
+        load: Callable[[UUID], Awaitable[RootMaterial]],
+    ) -> RootMaterial:
+        """Return the material for ``artifact_id``, calling ``load`` on a miss."""
+
+        loop = asyncio.get_running_loop()
+        counted = False
+        while True:
+            with self._lock:
+                if self._material is not None and self._artifact_id == artifact_id:
+                    self._hits += 1
+                    return self._material
+                if not counted:
+                    self._misses += 1
+                    counted = True
+                pending = self._pending.get(artifact_id)
+                if pending is None or pending.loop is not loop:
+                    pending = _PendingLoad(loop=loop, future=loop.create_future())
+                    self._pending[artifact_id] = pending
+                    owner = True
+                else:
+                    self._coalesced += 1
+                    owner = False
+
+            if owner:
+                return await self._load(artifact_id, pending, load)
+            try:
+                return await asyncio.shield(pending.future)
+            except asyncio.CancelledError:
+                # Retry only when the loading caller was cancelled, not us.
+                if not pending.future.cancelled():
+                    raise
+
+    def invalidate(self) -> None:
+        """Drop the cached material, e.g. after a new root has been generated."""
+
+        with self._lock:
+            if self._material is not None:
+                self._invalidations += 1
+            self._material = None
+            self._artifact_id = None
+
+    def stats(self) -> RootMaterialCacheStats:
+        with self._lock:
+            return RootMaterialCacheStats(
+                root_artifact_id=self._artifact_id,
+                hits=self._hits,
+                misses=self._misses,
+                coalesced=self._coalesced,
+                invalidations=self._invalidations,
+            )
+
+    async def _load(
+        self,
+        artifact_id: UUID,
+        pending: _PendingLoad,
+        load: Callable[[UUID], Awaitable[RootMaterial]],
+    ) -> RootMaterial:
+        try:
+            material = await load(artifact_id)
+        except BaseException as exc:
+            with self._lock:
+                if self._pending.get(artifact_id) is pending:
+                    del self._pending[artifact_id]
+            if isinstance(exc, asyncio.CancelledError):
+                pending.future.cancel()
+            else:
+                pending.future.set_exception(exc)
+                # Waiters re-raise the error; nobody else needs to retrieve it.
+                pending.future.exception()
+            raise
+
+        with self._lock:
+            if self._pending.get(artifact_id) is pending:
+                del self._pending[artifact_id]
+            self._material = material
+            self._artifact_id = artifact_id
+        pending.future.set_result(material)
+        return material
+
+
+_cache_lock = threading.Lock()
+_root_material_cache: RootMaterialCache | None = None
+
+
+def get_root_material_cache() -> RootMaterialCache:
+    """Return the process-wide root material cache."""
+
+    global _root_material_cache
+    with _cache_lock:
+        if _root_material_cache is None:
+            _root_material_cache = RootMaterialCache()
+        return _root_material_cache
@@ -0,0 +1,227 @@
+"""Pre-rendered seal appearances for visible signatures."""
+
+from __future__ import annotations
+
+import binascii
+import io
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from uuid import UUID
+
+from PIL import Image
+from pyhanko import stamp
+from pyhanko.pdf_utils import content, generic, layout
+from pyhanko.pdf_utils.images import PdfImage
+from pyhanko.pdf_utils.reader import PdfFileReader
+from pyhanko.pdf_utils.writer import BasePdfFileWriter, PageObject, PdfFileWriter
+
+from app.core.config import settings
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+class SealAppearanceError(Exception):
+    """Raised when a seal image cannot be rendered into an appearance."""
+
+
+@dataclass(slots=True, frozen=True)
+class SealAppearance:
+    """A seal rendered once into a single-page PDF.
+
+    Signing imports the page as a form XObject, which copies the already
+    compressed image stream instead of decoding the image again. The value
+    is plain bytes, so it can be shipped to process pool workers.
+    """
+
+    pdf: bytes
+    width: int
+    height: int
+
+
+@dataclass(slots=True)
+class SealAppearanceCacheStats:
+    """Point-in-time counters for the seal appearance cache."""
+
+    size: int
+    max_entries: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+
+def _decode_image(image: bytes) -> Image.Image:
+    data = image
+    if not image.startswith(_PNG_SIGNATURE):
+        if b"<svg" not in image[:4096].lower():
+            raise SealAppearanceError("Unsupported seal image format")
+        try:
+            import cairosvg  # type: ignore[import-not-found]
+        except ImportError as exc:
+            raise SealAppearanceError(
+                "Rendering SVG seals requires the optional cairosvg package"
+            ) from exc
+        try:
+            data = cairosvg.svg2png(bytestring=image)
+        except Exception as exc:
+            raise SealAppearanceError(f"Invalid SVG seal image: {exc}") from exc
+
+    try:
+        decoded = Image.open(io.BytesIO(data))
+        decoded.load()
+    except Exception as exc:
+        raise SealAppearanceError(f"Invalid seal image: {exc}") from exc
+    return decoded
+
+
+def render_seal_appearance(image: bytes) -> SealAppearance:
+    """Decode a PNG or SVG seal image and render it into a one-page PDF."""
+
+    decoded = _decode_image(image)
+    width, height = decoded.size
+
+    writer = PdfFileWriter()
+    pdf_image = PdfImage(decoded, writer=writer)
+    page = PageObject(
+        contents=writer.add_object(
+            generic.StreamObject(stream_data=pdf_image.render())
+        ),
+        media_box=generic.ArrayObject(
+            generic.NumberObject(value) for value in (0, 0, width, height)
+        ),
+        resources=pdf_image.resources.as_pdf_object(),
+    )
+    writer.insert_page(page)
+
+    output = io.BytesIO()
+    writer.write(output)
+    return SealAppearance(pdf=output.getvalue(), width=width, height=height)
+
+
+class _SealContent(content.PdfContent):
+    """Draw a pre-rendered seal page as a form XObject."""
+
+    def __init__(self, appearance: SealAppearance) -> None:
+        super().__init__(
+            box=layout.BoxConstraints(width=appearance.width, height=appearance.height)
+        )
+        self._appearance = appearance
+
+    def render(self) -> bytes:
+        writer: BasePdfFileWriter = self._ensure_writer
+        reader = PdfFileReader(io.BytesIO(self._appearance.pdf))
+        xobject = writer.import_page_as_xobject(reader, page_ix=0)
+        resource_name = b"/Seal" + binascii.hexlify(uuid.uuid4().bytes)
+        self.resources.xobject[resource_name.decode("ascii")] = xobject
+        return resource_name + b" Do"
+
+
+def seal_stamp_style(appearance: SealAppearance) -> stamp.StaticStampStyle:
+    """Return a stamp style that fills the signature box with the seal."""
+
+    return stamp.StaticStampStyle(
+        background=_SealContent(appearance),
+        background_opacity=1.0,
+        border_width=0,
+        background_layout=layout.SimpleBoxLayoutRule(
+            x_align=layout.AxisAlignment.ALIGN_MID,
+            y_align=layout.AxisAlignment.ALIGN_MID,
+            margins=layout.Margins.uniform(0),
+            inner_content_scaling=layout.InnerScaling.STRETCH_TO_FIT,
+        ),
+    )
+
+
+class SealAppearanceCache:
+    """Bounded LRU cache of rendered seal appearances.
+
+    Entries are keyed by seal id and image version, so replacing a seal's
+    image never serves a stale appearance. A ``max_entries`` of zero
+    disables caching.
+    """
+
+    def __init__(self, *, max_entries: int) -> None:
+        if max_entries < 0:
+            raise ValueError("Seal appearance cache size cannot be negative")
+
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[UUID, UUID], SealAppearance] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, seal_id: UUID, version: UUID) -> SealAppearance | None:
+        """Return the cached appearance for this seal image version."""
+
+        with self._lock:
+            appearance = self._entries.get((seal_id, version))
+            if appearance is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end((seal_id, version))
+            self._hits += 1
+            return appearance
+
+    def put(self, seal_id: UUID, version: UUID, appearance: SealAppearance) -> None:
+        """Cache ``appearance``, evicting the least recently used entries."""
+
+        if self._max_entries == 0:
+            return
+
+        with self._lock:
+            self._entries[(seal_id, version)] = appearance
+            self._entries.move_to_end((seal_id, version))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, seal_id: UUID) -> bool:
+        """Drop every version cached for ``seal_id``; return whether any existed."""
+
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == seal_id]
+            for key in keys:
+                del self._entries[key]
+            if not keys:
+                return False
+            self._invalidations += 1
+            return True
+
+    def clear(self) -> None:
+        """Remove every cached appearance."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> SealAppearanceCacheStats:
+        """Return cache occupancy and hit/miss counters."""
+
+        with self._lock:
+            return SealAppearanceCacheStats(
+                size=len(self._entries),
+                max_entries=self._max_entries,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+            )
+
+
+_cache_lock = threading.Lock()
+_seal_appearance_cache: SealAppearanceCache | None = None
+
+
+def get_seal_appearance_cache() -> SealAppearanceCache:
+    """Return the process-wide seal appearance cache built from settings."""
+
+    global _seal_appearance_cache
+    with _cache_lock:
+        if _seal_appearance_cache is None:
+            _seal_appearance_cache = SealAppearanceCache(
+                max_entries=settings.pdf_seal_appearance_cache_size
+            )
+        return _seal_appearance_cache
@@ -0,0 +1,98 @@
+"""Attach RFC 3161 signature timestamps to freshly signed PDFs.
+
+Signing workers produce the CMS container without a timestamp, leaving
+spare room in the ``/Contents`` placeholder. The timestamp token is then
+fetched on the event loop and written into that placeholder, so network
+round trips never occupy a signing worker. Only unsigned attributes change
+and ``/Contents`` is excluded from the signed byte range, so the document
+digest and signature stay valid.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import binascii
+import hashlib
+import mmap
+import re
+
+from asn1crypto import cms  # type: ignore[import-untyped]
+from pyhanko.sign.general import simple_cms_attribute
+from pyhanko.sign.timestamps import TimeStamper
+from pyhanko.sign.timestamps.common_utils import TimestampRequestError
+
+from app.services.spool import PDFSource, SpooledFile
+
+_BYTE_RANGE = re.compile(rb"/ByteRange\s*\[\s*(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s*\]")
+
+
+class SignatureTimestampError(Exception):
+    """Raised when a timestamp token cannot be attached to a signature."""
+
+
+def _locate_contents(data: bytes | mmap.mmap) -> tuple[int, int]:
+    """Return offset and length of the newest signature's hex ``/Contents``."""
+
+    index = data.rfind(b"/ByteRange")
+    match = _BYTE_RANGE.match(data, index) if index >= 0 else None
+    if match is None:
+        raise SignatureTimestampError("Signed document has no signature byte range")
+    _, first_length, second_start, _ = (int(value) for value in match.groups())
+    # Skip the ``<`` and ``>`` delimiting the hex string.
+    return first_length + 1, second_start - first_length - 2
+
+
+def _read_contents(source: PDFSource) -> tuple[int, bytes]:
+    if isinstance(source, SpooledFile):
+        with source.map() as data:
+            start, length = _locate_contents(data)
+            return start, data[start : start + length]
+    start, length = _locate_contents(source)
+    return start, source[start : start + length]
+
+
+def _write_contents(source: PDFSource, start: int, contents: bytes) -> PDFSource:
+    if isinstance(source, SpooledFile):
+        with open(source.path, "r+b") as handle:
+            handle.seek(start)
+            handle.write(contents)
+        return source
+    patched = bytearray(source)
+    patched[start : start + len(contents)] = contents
+    return bytes(patched)
+
+
+async def timestamp_signature(source: PDFSource, timestamper: TimeStamper) -> PDFSource:
+    """Add a signature timestamp token to the newest signature in ``source``.
+
+    Spooled documents are patched in place; in-memory documents are
+    returned as a patched copy.
+    """
+
+    start, contents = await asyncio.to_thread(_read_contents, source)
+    try:
+        content_info = cms.ContentInfo.load(binascii.unhexlify(contents))
+        signer_info = content_info["content"]["signer_infos"][0]
+        md_algorithm = signer_info["digest_algorithm"]["algorithm"].native
+        signature = signer_info["signature"].native
+    except Exception as exc:
+        raise SignatureTimestampError(f"Invalid signature container: {exc}") from exc
+
+    try:
+        token = await timestamper.async_timestamp(
+            hashlib.new(md_algorithm, signature).digest(), md_algorithm
+        )
+    except TimestampRequestError as exc:
+        raise SignatureTimestampError(f"Timestamp request rejected: {exc}") from exc
+
+    signer_info["unsigned_attrs"] = cms.CMSAttributes(
+        [simple_cms_attribute("signature_time_stamp_token", token)]
+    )
+    encoded = binascii.hexlify(content_info.dump())
+    if len(encoded) > len(contents):
+        raise SignatureTimestampError(
+            "Timestamp token does not fit in the space reserved for the signature"
+        )
+    return await asyncio.to_thread(
+        _write_contents, source, start, encoded.ljust(len(contents), b"0")
+    )
@@ -0,0 +1,158 @@
+"""In-memory LRU cache of prepared pyHanko signers."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from time import monotonic
+from typing import Callable
+from uuid import UUID
+
+from pyhanko.sign import signers
+
+from app.core.config import settings
+
+
+@dataclass(slots=True)
+class SignerCacheStats:
+    """Point-in-time counters for the signer cache."""
+
+    size: int
+    max_entries: int
+    ttl_seconds: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+
+@dataclass(slots=True)
+class _SignerCacheEntry:
+    signer: signers.SimpleSigner
+    deadline: float
+
+
+class SignerCache:
+    """Bounded, TTL-limited cache of ``SimpleSigner`` objects by certificate id.
+
+    Entries never outlive the certificate's ``expires_at`` and are dropped
+    explicitly when a certificate is revoked. A ``max_entries`` of zero
+    disables caching.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: int,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if max_entries < 0:
+            raise ValueError("Signer cache size cannot be negative")
+        if ttl_seconds <= 0:
+            raise ValueError("Signer cache TTL must be positive")
+
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[UUID, _SignerCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, certificate_id: UUID) -> signers.SimpleSigner | None:
+        """Return the cached signer for ``certificate_id`` if still fresh."""
+
+        with self._lock:
+            entry = self._entries.get(certificate_id)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.deadline <= self._clock():
+                del self._entries[certificate_id]
+                self._evictions += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(certificate_id)
+            self._hits += 1
+            return entry.signer
+
+    def put(
+        self,
+        certificate_id: UUID,
+        signer: signers.SimpleSigner,
+        *,
+        not_after: datetime | None = None,
+    ) -> None:
+        """Cache ``signer`` until the TTL or the certificate expiry, if sooner."""
+
+        if self._max_entries == 0:
+            return
+
+        lifetime = float(self._ttl_seconds)
+        if not_after is not None:
+            if not_after.tzinfo is None:
+                not_after = not_after.replace(tzinfo=timezone.utc)
+            remaining = (not_after - datetime.now(timezone.utc)).total_seconds()
+            lifetime = min(lifetime, remaining)
+        if lifetime <= 0:
+            return
+
+        with self._lock:
+            self._entries[certificate_id] = _SignerCacheEntry(
+                signer=signer, deadline=self._clock() + lifetime
+            )
+            self._entries.move_to_end(certificate_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, certificate_id: UUID) -> bool:
+        """Drop the entry for ``certificate_id``; return whether one existed."""
+
+        with self._lock:
+            if self._entries.pop(certificate_id, None) is None:
+                return False
+            self._invalidations += 1
+            return True
+
+    def clear(self) -> None:
+        """Remove every cached signer."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> SignerCacheStats:
+        """Return cache occupancy and hit/miss counters."""
+
+        with self._lock:
+            return SignerCacheStats(
+                size=len(self._entries),
+                max_entries=self._max_entries,
+                ttl_seconds=self._ttl_seconds,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+            )
+
+
+_cache_lock = threading.Lock()
+_signer_cache: SignerCache | None = None
+
+
+def get_signer_cache() -> SignerCache:
+    """Return the process-wide signer cache built from settings."""
+
+    global _signer_cache
+    with _cache_lock:
+        if _signer_cache is None:
+            _signer_cache = SignerCache(
+                max_entries=settings.pdf_signer_cache_size,
+                ttl_seconds=settings.pdf_signer_cache_ttl_seconds,
+            )
+        return _signer_cache
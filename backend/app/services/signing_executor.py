@@ -0,0 +1,463 @@
+"""Execution backends that run pyHanko signing off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+from typing import BinaryIO
+
+from asn1crypto import keys as asn1_keys  # type: ignore[import-untyped]
+from asn1crypto import x509 as asn1_x509
+from pyhanko.pdf_utils.incremental_writer import IncrementalPdfFileWriter
+from pyhanko.sign import fields, signers
+from pyhanko.sign.fields import SigSeedSubFilter
+from pyhanko.sign.signers.pdf_cms import select_suitable_signing_md
+from pyhanko.sign.validation import DocumentSecurityStore
+from pyhanko_certvalidator.registry import SimpleCertificateStore
+
+from app.core.config import SigningExecutionMode, settings
+from app.services.ltv_material import LTVMaterial
+from app.services.pdf_ingest import read_document
+from app.services.seal_appearance import SealAppearance, seal_stamp_style
+from app.services.spool import PDFSource, SpooledFile, create_spool_file, open_source
+
+
+class SigningExecutorError(Exception):
+    """Base error raised by signing executors."""
+
+
+class SigningQueueFullError(SigningExecutorError):
+    """Raised when the signing pool has no free worker or queue slot."""
+
+
+@dataclass(slots=True, frozen=True)
+class SignatureOptions:
+    """Picklable description of the signature to apply to a document."""
+
+    field_name: str = "Signature"
+    page_index: int | None = None
+    box: tuple[int, int, int, int] | None = None
+    reason: str | None = None
+    location: str | None = None
+    contact_info: str | None = None
+    ltv_material: LTVMaterial | None = None
+    seal_appearance: SealAppearance | None = None
+    bytes_reserved: int | None = None
+
+
+@dataclass(slots=True)
+class SigningExecutorStats:
+    """Point-in-time view of a signing executor's capacity and load."""
+
+    mode: SigningExecutionMode
+    pool_size: int
+    max_queue: int
+    max_tasks_per_child: int | None
+    in_flight: int
+    running: int
+    queued: int
+    completed: int
+    failed: int
+    rejected: int
+
+
+def _prepare_signature(
+    pdf_stream: BinaryIO, signer: signers.Signer, options: SignatureOptions
+) -> tuple[IncrementalPdfFileWriter, signers.PdfSigner, bool]:
+    """Open the document for incremental update and describe the signature.
+
+    The document is parsed exactly once; the same reader drives the page
+    bounds check, the choice of signature field and the incremental writer.
+    """
+
+    signing_cert = signer.signing_cert
+    if signing_cert is None:
+        raise SigningExecutorError("Signer has no signing certificate")
+
+    reader, info = read_document(pdf_stream)
+    page_index, box = options.page_index, options.box
+    visible = box is not None and page_index is not None
+    if page_index is not None:
+        info.check_page_index(page_index)
+    field_name = info.signature_field_name(options.field_name, new_field=visible)
+
+    writer = IncrementalPdfFileWriter(pdf_stream, prev=reader)
+
+    ltv = options.ltv_material
+    sig_meta = signers.PdfSignatureMetadata(
+        field_name=field_name,
+        # SHA-256 for RSA-2048 and P-256, SHA-384 for P-384, and the SHA-512
+        # that Ed25519 mandates (RFC 8419).
+        md_algorithm=select_suitable_signing_md(signing_cert.public_key),
+        subfilter=SigSeedSubFilter.ADOBE_PKCS7_DETACHED,
+        reason=options.reason,
+        location=options.location,
+        contact_info=options.contact_info,
+        embed_validation_info=ltv is not None,
+        validation_context=ltv.validation_context() if ltv is not None else None,
+        signer_key_usage={"digital_signature"},
+    )
+    if ltv is not None:
+        # The CMS carries the CRLs as an Adobe revocation attribute; the DSS
+        # written in the same revision also serves PAdES-aware validators.
+        # VRI entries are skipped because they key on the final /Contents.
+        DocumentSecurityStore.supply_dss_in_writer(
+            writer,
+            None,
+            certs=[signing_cert, *ltv.certificates()],
+            crls=ltv.certificate_lists(),
+        )
+
+    existing_fields_only = False
+    stamp_style = None
+    if box is not None and page_index is not None:
+        sig_field = fields.SigFieldSpec(
+            sig_field_name=field_name,
+            on_page=page_index,
+            box=box,
+        )
+        fields.append_signature_field(writer, sig_field)
+        existing_fields_only = True
+        if options.seal_appearance is not None:
+            stamp_style = seal_stamp_style(options.seal_appearance)
+
+    pdf_signer = signers.PdfSigner(sig_meta, signer, stamp_style=stamp_style)
+    return writer, pdf_signer, existing_fields_only
+
+
+def _open_output(spool_output: bool) -> BinaryIO:
+    if spool_output:
+        return create_spool_file(
+            directory=settings.pdf_spool_dir, prefix="ca-pdf-signed-"
+        )
+    return io.BytesIO()
+
+
+def _finish_output(output: BinaryIO) -> PDFSource:
+    if isinstance(output, io.BytesIO):
+        return output.getvalue()
+    size = output.seek(0, io.SEEK_END)
+    output.close()
+    return SpooledFile(path=output.name, size=size)
+
+
+def _discard_output(output: BinaryIO) -> None:
+    output.close()
+    if not isinstance(output, io.BytesIO):
+        SpooledFile(path=output.name, size=0).unlink()
+
+
+def apply_signature(
+    pdf_data: PDFSource,
+    signer: signers.Signer,
+    options: SignatureOptions,
+    *,
+    spool_output: bool = False,
+) -> PDFSource:
+    """Sign a PDF document synchronously.
+
+    The signed document is returned as bytes, or written to a spool file
+    when ``spool_output`` is set.
+    """
+
+    output = _open_output(spool_output)
+    try:
+        with open_source(pdf_data) as pdf_stream:
+            writer, pdf_signer, existing_fields_only = _prepare_signature(
+                pdf_stream, signer, options
+            )
+            pdf_signer.sign_pdf(
+                writer,
+                existing_fields_only=existing_fields_only,
+                bytes_reserved=options.bytes_reserved,
+                output=output,
+            )
+    except BaseException:
+        _discard_output(output)
+        raise
+    return _finish_output(output)
+
+
+async def async_apply_signature(
+    pdf_data: PDFSource,
+    signer: signers.Signer,
+    options: SignatureOptions,
+    *,
+    spool_output: bool = False,
+) -> PDFSource:
+    """Sign a PDF document on the running event loop."""
+
+    output = _open_output(spool_output)
+    try:
+        with open_source(pdf_data) as pdf_stream:
+            writer, pdf_signer, existing_fields_only = _prepare_signature(
+                pdf_stream, signer, options
+            )
+            await pdf_signer.async_sign_pdf(
+                writer,
+                existing_fields_only=existing_fields_only,
+                bytes_reserved=options.bytes_reserved,
+                output=output,
+            )
+    except BaseException:
+        _discard_output(output)
+        raise
+    return _finish_output(output)
+
+
+@dataclass(slots=True, frozen=True)
+class _WorkerTask:
+    """Payload shipped to a process pool worker for a single signature."""
+
+    pdf_data: PDFSource
+    certificate_der: bytes
+    private_key_der: bytes
+    options: SignatureOptions
+    spool_output: bool
+
+
+_WORKER_SIGNER_CACHE_SIZE = 8
+_worker_signers: OrderedDict[bytes, signers.SimpleSigner] = OrderedDict()
+
+
+def _worker_signer(task: _WorkerTask) -> signers.SimpleSigner:
+    """Rebuild (or reuse) the pyHanko signer inside a worker process.
+
+    Key material travels to spawned workers over the executor's pipes, which
+    are private to this process and its children; wrapping it under a key
+    sent down the same pipes would add nothing.
+    """
+
+    cache_key = hashlib.sha256(task.certificate_der).digest()
+    cached = _worker_signers.get(cache_key)
+    if cached is not None:
+        _worker_signers.move_to_end(cache_key)
+        return cached
+
+    signer = signers.SimpleSigner(
+        signing_cert=asn1_x509.Certificate.load(task.certificate_der),
+        signing_key=asn1_keys.PrivateKeyInfo.load(task.private_key_der),
+        cert_registry=SimpleCertificateStore(),
+        signature_mechanism=None,
+    )
+    _worker_signers[cache_key] = signer
+    while len(_worker_signers) > _WORKER_SIGNER_CACHE_SIZE:
+        _worker_signers.popitem(last=False)
+    return signer
+
+
+def _run_worker_task(task: _WorkerTask) -> PDFSource:
+    """Entry point executed inside a process pool worker."""
+
+    return apply_signature(
+        task.pdf_data,
+        _worker_signer(task),
+        task.options,
+        spool_output=task.spool_output,
+    )
+
+
+def _discard_abandoned_output(future: Future[PDFSource]) -> None:
+    if future.cancelled() or future.exception() is not None:
+        return
+    result = future.result()
+    if isinstance(result, SpooledFile):
+        result.unlink()
+
+
+class SigningExecutor:
+    """Bounded executor that keeps pyHanko signing off the event loop."""
+
+    def __init__(
+        self,
+        *,
+        mode: SigningExecutionMode,
+        pool_size: int,
+        max_queue: int,
+        max_tasks_per_child: int | None = None,
+    ) -> None:
+        if pool_size <= 0:
+            raise ValueError("Signing pool size must be positive")
+        if max_queue < 0:
+            raise ValueError("Signing queue size cannot be negative")
+
+        self._mode = mode
+        self._pool_size = pool_size
+        self._max_queue = max_queue
+        self._max_tasks_per_child = (
+            max_tasks_per_child if mode is SigningExecutionMode.PROCESS else None
+        )
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+
+    @property
+    def mode(self) -> SigningExecutionMode:
+        return self._mode
+
+    async def run(
+        self,
+        pdf_data: PDFSource,
+        signer: signers.SimpleSigner,
+        options: SignatureOptions,
+        *,
+        spool_output: bool = False,
+    ) -> PDFSource:
+        """Sign a document using the configured execution backend."""
+
+        self._acquire_slot()
+
+        if self._mode is SigningExecutionMode.INLINE:
+            try:
+                result = await async_apply_signature(
+                    pdf_data, signer, options, spool_output=spool_output
+                )
+            except BaseException:
+                self._release_slot(failed=True)
+                raise
+            self._release_slot(failed=False)
+            return result
+
+        try:
+            if self._mode is SigningExecutionMode.THREAD:
+                future = self._get_executor().submit(
+                    apply_signature,
+                    pdf_data,
+                    signer,
+                    options,
+                    spool_output=spool_output,
+                )
+            else:
+                task = self._build_worker_task(
+                    pdf_data, signer, options, spool_output=spool_output
+                )
+                future = self._get_executor().submit(_run_worker_task, task)
+        except BaseException:
+            self._release_slot(failed=True)
+            raise
+
+        future.add_done_callback(self._on_future_done)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # A worker that is already running keeps going; drop its output.
+            future.add_done_callback(_discard_abandoned_output)
+            raise
+
+    def stats(self) -> SigningExecutorStats:
+        """Return the executor's configuration and current load."""
+
+        with self._lock:
+            in_flight = self._in_flight
+            return SigningExecutorStats(
+                mode=self._mode,
+                pool_size=self._pool_size,
+                max_queue=self._max_queue,
+                max_tasks_per_child=self._max_tasks_per_child,
+                in_flight=in_flight,
+                running=min(in_flight, self._pool_size),
+                queued=max(0, in_flight - self._pool_size),
+                completed=self._completed,
+                failed=self._failed,
+                rejected=self._rejected,
+            )
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop worker threads or processes owned by this executor."""
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _acquire_slot(self) -> None:
+        with self._lock:
+            if self._in_flight >= self._pool_size + self._max_queue:
+                self._rejected += 1
+                raise SigningQueueFullError(
+                    "Signing capacity exhausted; retry the request later"
+                )
+            self._in_flight += 1
+
+    def _release_slot(self, *, failed: bool) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+
+    def _on_future_done(self, future: Future[PDFSource]) -> None:
+        self._release_slot(failed=future.cancelled() or future.exception() is not None)
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self._mode is SigningExecutionMode.PROCESS:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self._pool_size,
+                        mp_context=get_context("spawn"),
+                        max_tasks_per_child=self._max_tasks_per_child,
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._pool_size,
+                        thread_name_prefix="pdf-signing",
+                    )
+            return self._executor
+
+    def _build_worker_task(
+        self,
+        pdf_data: PDFSource,
+        signer: signers.SimpleSigner,
+        options: SignatureOptions,
+        *,
+        spool_output: bool,
+    ) -> _WorkerTask:
+        if signer.signing_cert is None:
+            raise SigningExecutorError("Signer has no signing certificate")
+        return _WorkerTask(
+            pdf_data=pdf_data,
+            certificate_der=signer.signing_cert.dump(),
+            private_key_der=signer.signing_key.dump(),
+            options=options,
+            spool_output=spool_output,
+        )
+
+
+_executor_lock = threading.Lock()
+_signing_executor: SigningExecutor | None = None
+
+
+def get_signing_executor() -> SigningExecutor:
+    """Return the process-wide signing executor built from settings."""
+
+    global _signing_executor
+    with _executor_lock:
+        if _signing_executor is None:
+            _signing_executor = SigningExecutor(
+                mode=settings.pdf_signing_execution_mode,
+                pool_size=settings.pdf_signing_pool_size,
+                max_queue=settings.pdf_signing_pool_max_queue,
+                max_tasks_per_child=settings.pdf_signing_pool_max_tasks_per_child,
+            )
+        return _signing_executor
+
+
+def shutdown_signing_executor() -> None:
+    """Tear down the process-wide signing executor, if one was created."""
+
+    global _signing_executor
+    with _executor_lock:
+        executor, _signing_executor = _signing_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
@@ -0,0 +1,495 @@
+"""Idempotent signing backed by a bounded, encrypted store of signed outputs.
+
+Clients that retry after a timeout upload the same document again. Each
+``/pdf/sign`` request is keyed either by the client's ``Idempotency-Key``
+or by a SHA-256 fingerprint of the document and every signing option, and
+a request whose key was answered within the TTL is replayed from the
+store instead of being signed, and audited, a second time.
+
+Documents signed with ``persist`` are kept for the longer retention period
+and are not evicted by the entry limit, so interrupted downloads can be
+resumed from ``GET /pdf/documents/{document_id}``. A downloaded document is
+decrypted once into a spool file, so repeated and ranged requests read from
+disk instead of decrypting the whole payload again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Awaitable, Callable
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud import signed_document as signed_document_crud
+from app.models.signed_document import SignedDocument
+from app.services.pdf_signing import (
+    SignatureCoordinates,
+    SignatureMetadata,
+    SignatureVisibility,
+    SigningResult,
+)
+from app.services.spool import PDFSource, SpooledFile, iter_source_chunks, spool_stream
+from app.services.storage import EncryptedStorageService, StorageError
+
+_CLIENT_KEY_PREFIX = "key:"
+_FINGERPRINT_KEY_PREFIX = "sha256:"
+_DOCUMENT_KEY_PREFIX = "document:"
+
+
+class IdempotencyConflictError(Exception):
+    """Raised when an idempotency key is reused for a different request."""
+
+
+@dataclass(slots=True)
+class SignedResultStoreStats:
+    """Point-in-time counters for idempotent signing."""
+
+    ttl_seconds: int
+    retention_seconds: int
+    max_entries: int
+    max_document_bytes: int
+    replays: int
+    misses: int
+    stored: int
+    persisted: int
+    skipped: int
+    conflicts: int
+    evictions: int
+    cached_downloads: int
+    download_hits: int
+    download_misses: int
+
+
+def _hash_source(source: PDFSource) -> str:
+    digest = hashlib.sha256()
+    for chunk in iter_source_chunks(source):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+async def request_fingerprint(
+    pdf_data: PDFSource,
+    *,
+    certificate_id: UUID,
+    seal_id: UUID | None,
+    visibility: SignatureVisibility,
+    coordinates: SignatureCoordinates | None,
+    metadata: SignatureMetadata | None,
+    use_tsa: bool,
+    embed_ltv: bool,
+) -> str:
+    """Return a SHA-256 over the document and everything that shapes its signature."""
+
+    document_digest = await asyncio.to_thread(_hash_source, pdf_data)
+    options = {
+        "document": document_digest,
+        "certificate_id": str(certificate_id),
+        "seal_id": str(seal_id) if seal_id else None,
+        "visibility": visibility.value,
+        "coordinates": (
+            [
+                coordinates.page,
+                coordinates.x,
+                coordinates.y,
+                coordinates.width,
+                coordinates.height,
+            ]
+            if coordinates
+            else None
+        ),
+        "metadata": (
+            [metadata.reason, metadata.location, metadata.contact_info]
+            if metadata
+            else None
+        ),
+        "use_tsa": use_tsa,
+        "embed_ltv": embed_ltv,
+    }
+    canonical = json.dumps(options, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _read_output(source: PDFSource) -> bytes:
+    if isinstance(source, SpooledFile):
+        with open(source.path, "rb") as handle:
+            return handle.read()
+    return source
+
+
+def _spool_payload(payload: bytes) -> SpooledFile:
+    return spool_stream(
+        io.BytesIO(payload),
+        max_bytes=len(payload),
+        directory=settings.pdf_spool_dir,
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class SignedResultStore:
+    """Answers repeated signing requests from encrypted stored outputs.
+
+    Concurrent requests with the same key are serialized in-process, so a
+    retry that arrives while the original is still signing waits for it and
+    is then replayed. Signed documents larger than ``max_document_bytes``
+    are not stored, and the store keeps at most ``max_entries`` documents
+    besides those persisted on request. The ``max_downloads`` most recently
+    downloaded documents stay decrypted in spool files.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: int,
+        max_entries: int,
+        max_document_bytes: int,
+        retention_seconds: int | None = None,
+        max_downloads: int = 16,
+        storage_service: EncryptedStorageService | None = None,
+    ) -> None:
+        retention_seconds = retention_seconds or ttl_seconds
+        if min(ttl_seconds, max_entries, max_document_bytes, retention_seconds) <= 0:
+            raise ValueError("Idempotency store limits must be positive")
+        if max_downloads <= 0:
+            raise ValueError("Download cache size must be positive")
+
+        self._ttl = timedelta(seconds=ttl_seconds)
+        # Persisted documents never expire before an idempotent replay would.
+        self._retention = max(self._ttl, timedelta(seconds=retention_seconds))
+        self._max_entries = max_entries
+        self._max_document_bytes = max_document_bytes
+        self._max_downloads = max_downloads
+        self._storage = storage_service or EncryptedStorageService()
+        self._lock = threading.Lock()
+        self._inflight: dict[tuple[int, str], tuple[asyncio.Lock, int]] = {}
+        self._downloads: OrderedDict[UUID, SpooledFile] = OrderedDict()
+        self._replays = 0
+        self._misses = 0
+        self._stored = 0
+        self._persisted = 0
+        self._skipped = 0
+        self._conflicts = 0
+        self._evictions = 0
+        self._download_hits = 0
+        self._download_misses = 0
+
+    async def sign_once(
+        self,
+        *,
+        session: AsyncSession,
+        owner_id: int,
+        idempotency_key: str | None,
+        fingerprint: str,
+        sign: Callable[[], Awaitable[SigningResult]],
+        persist: bool = False,
+        filename: str | None = None,
+    ) -> tuple[SigningResult, bool]:
+        """Return the stored result for this request or sign and store it.
+
+        The second element is ``True`` when the result was replayed.
+        """
+
+        key = (
+            _CLIENT_KEY_PREFIX + idempotency_key
+            if idempotency_key
+            else _FINGERPRINT_KEY_PREFIX + fingerprint
+        )
+        async with self._claim(owner_id, key):
+            replayed = await self._lookup(
+                session=session,
+                owner_id=owner_id,
+                key=key,
+                fingerprint=fingerprint,
+                persist=persist,
+            )
+            if replayed is not None:
+                return replayed, True
+
+            result = await sign()
+            await self._store(
+                session=session,
+                owner_id=owner_id,
+                key=key,
+                fingerprint=fingerprint,
+                result=result,
+                persist=persist,
+                filename=filename,
+            )
+            return result, False
+
+    async def persist(
+        self,
+        *,
+        session: AsyncSession,
+        owner_id: int,
+        fingerprint: str,
+        result: SigningResult,
+        filename: str | None = None,
+    ) -> None:
+        """Keep an already signed result for download without enabling replay."""
+
+        await self._store(
+            session=session,
+            owner_id=owner_id,
+            key=_DOCUMENT_KEY_PREFIX + result.document_id,
+            fingerprint=fingerprint,
+            result=result,
+            persist=True,
+            filename=filename,
+        )
+
+    async def get_document(
+        self,
+        *,
+        session: AsyncSession,
+        owner_id: int,
+        document_id: str,
+    ) -> SignedDocument | None:
+        """Return the unexpired stored document, with its file metadata loaded."""
+
+        document = await signed_document_crud.get_by_document_id(
+            session=session, owner_id=owner_id, document_id=document_id
+        )
+        if document is None or _as_utc(document.expires_at) <= datetime.now(
+            timezone.utc
+        ):
+            return None
+        return document
+
+    async def open_document(
+        self, *, session: AsyncSession, document: SignedDocument
+    ) -> SpooledFile:
+        """Return the signed PDF held for ``document`` decrypted to a spool file.
+
+        The stored payload is only decrypted when it is not already spooled,
+        so resuming a download does not pay for the whole document again.
+        """
+
+        with self._lock:
+            spooled = self._downloads.get(document.file_id)
+            if spooled is not None and os.path.exists(spooled.path):
+                self._downloads.move_to_end(document.file_id)
+                self._download_hits += 1
+                return spooled
+            self._download_misses += 1
+
+        payload = await self._storage.load_file_bytes(session, document.file_id)
+        spooled = await asyncio.to_thread(_spool_payload, payload)
+        with self._lock:
+            dropped = [self._downloads.pop(document.file_id, None)]
+            self._downloads[document.file_id] = spooled
+            while len(self._downloads) > self._max_downloads:
+                dropped.append(self._downloads.popitem(last=False)[1])
+        # Responses still streaming a dropped file keep their open handle.
+        for stale in dropped:
+            if stale is not None:
+                stale.unlink()
+        return spooled
+
+    def clear_downloads(self) -> None:
+        """Remove every spooled download."""
+
+        with self._lock:
+            dropped = list(self._downloads.values())
+            self._downloads.clear()
+        for spooled in dropped:
+            spooled.unlink()
+
+    def stats(self) -> SignedResultStoreStats:
+        with self._lock:
+            return SignedResultStoreStats(
+                ttl_seconds=int(self._ttl.total_seconds()),
+                retention_seconds=int(self._retention.total_seconds()),
+                max_entries=self._max_entries,
+                max_document_bytes=self._max_document_bytes,
+                replays=self._replays,
+                misses=self._misses,
+                stored=self._stored,
+                persisted=self._persisted,
+                skipped=self._skipped,
+                conflicts=self._conflicts,
+                evictions=self._evictions,
+                cached_downloads=len(self._downloads),
+                download_hits=self._download_hits,
+                download_misses=self._download_misses,
+            )
+
+    @asynccontextmanager
+    async def _claim(self, owner_id: int, key: str) -> AsyncIterator[None]:
+        scope = (owner_id, key)
+        with self._lock:
+            lock, waiters = self._inflight.get(scope, (asyncio.Lock(), 0))
+            self._inflight[scope] = (lock, waiters + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            with self._lock:
+                lock, waiters = self._inflight[scope]
+                if waiters == 1:
+                    del self._inflight[scope]
+                else:
+                    self._inflight[scope] = (lock, waiters - 1)
+
+    async def _lookup(
+        self,
+        *,
+        session: AsyncSession,
+        owner_id: int,
+        key: str,
+        fingerprint: str,
+        persist: bool,
+    ) -> SigningResult | None:
+        document = await signed_document_crud.get_by_idempotency_key(
+            session=session, owner_id=owner_id, idempotency_key=key
+        )
+        if document is not None and _as_utc(document.expires_at) <= datetime.now(
+            timezone.utc
+        ):
+            await signed_document_crud.delete_signed_documents(
+                session=session, document_ids=[document.id]
+            )
+            document = None
+
+        if document is None:
+            with self._lock:
+                self._misses += 1
+            return None
+
+        if document.request_fingerprint != fingerprint:
+            with self._lock:
+                self._conflicts += 1
+            raise IdempotencyConflictError(
+                "Idempotency-Key was already used for a different request"
+            )
+
+        try:
+            payload = await self._storage.load_file_bytes(session, document.file_id)
+        except StorageError:
+            # An unreadable entry is dropped and the request signed afresh.
+            await signed_document_crud.delete_signed_documents(
+                session=session, document_ids=[document.id]
+            )
+            with self._lock:
+                self._misses += 1
+            return None
+
+        if persist and not document.persisted:
+            document.persisted = True
+            document.expires_at = datetime.now(timezone.utc) + self._retention
+            await session.commit()
+            with self._lock:
+                self._persisted += 1
+
+        with self._lock:
+            self._replays += 1
+        return SigningResult(
+            document_id=document.document_id,
+            signed_output=payload,
+            signed_at=_as_utc(document.signed_at),
+            certificate_id=document.certificate_id,
+            seal_id=document.seal_id,
+            visibility=SignatureVisibility(document.visibility),
+            tsa_used=document.tsa_used,
+            ltv_embedded=document.ltv_embedded,
+            file_size=document.file_size,
+        )
+
+    async def _store(
+        self,
+        *,
+        session: AsyncSession,
+        owner_id: int,
+        key: str,
+        fingerprint: str,
+        result: SigningResult,
+        persist: bool,
+        filename: str | None,
+    ) -> None:
+        if not persist and result.file_size > self._max_document_bytes:
+            with self._lock:
+                self._skipped += 1
+            return
+
+        payload = await asyncio.to_thread(_read_output, result.signed_output)
+        file_metadata, _ = await self._storage.store_encrypted_asset(
+            session,
+            data=payload,
+            content_type="application/pdf",
+            owner_id=owner_id,
+            filename=filename or f"{result.document_id}.pdf",
+        )
+        now = datetime.now(timezone.utc)
+        try:
+            await signed_document_crud.create_signed_document(
+                session=session,
+                document=SignedDocument(
+                    document_id=result.document_id,
+                    owner_id=owner_id,
+                    idempotency_key=key,
+                    request_fingerprint=fingerprint,
+                    file_id=file_metadata.id,
+                    certificate_id=result.certificate_id,
+                    seal_id=result.seal_id,
+                    visibility=result.visibility.value,
+                    tsa_used=result.tsa_used,
+                    ltv_embedded=result.ltv_embedded,
+                    file_size=result.file_size,
+                    signed_at=result.signed_at,
+                    expires_at=now + (self._retention if persist else self._ttl),
+                    persisted=persist,
+                ),
+            )
+        except IntegrityError:
+            # Another worker stored this key first; its entry wins.
+            await session.rollback()
+            await self._storage.delete_file(session, file_metadata.id)
+            return
+
+        evicted = await signed_document_crud.purge_signed_documents(
+            session=session, now=now, max_entries=self._max_entries
+        )
+        with self._lock:
+            self._stored += 1
+            self._persisted += int(persist)
+            self._evictions += evicted
+
+
+_store_lock = threading.Lock()
+_signed_result_store: SignedResultStore | None = None
+
+
+def get_signed_result_store(
+    storage_service: EncryptedStorageService | None = None,
+) -> SignedResultStore:
+    """Return the process-wide idempotency store built from settings.
+
+    ``storage_service`` is only used when the store is first created.
+    """
+
+    global _signed_result_store
+    with _store_lock:
+        if _signed_result_store is None:
+            _signed_result_store = SignedResultStore(
+                ttl_seconds=settings.pdf_idempotency_ttl_seconds,
+                max_entries=settings.pdf_idempotency_max_entries,
+                max_document_bytes=settings.pdf_idempotency_max_document_bytes,
+                retention_seconds=settings.pdf_document_retention_seconds,
+                max_downloads=settings.pdf_download_cache_entries,
+                storage_service=storage_service,
+            )
+        return _signed_result_store
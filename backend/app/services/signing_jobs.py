@@ -0,0 +1,426 @@
+"""Asynchronous signing jobs processed by local workers from a database queue."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import shutil
+import tempfile
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import UUID, uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud import audit_log as audit_log_crud
+from app.crud import signing_job as signing_job_crud
+from app.db.session import get_session_factory
+from app.models.signing_job import SigningJob, SigningJobItem
+from app.services.pdf_signing import (
+    PDFSigningError,
+    PDFSigningService,
+    SignatureCoordinates,
+    SignatureMetadata,
+    SignatureVisibility,
+    SigningUnavailableError,
+)
+from app.services.spool import SpooledFile, UploadSpool
+
+logger = logging.getLogger(__name__)
+
+
+class SigningJobError(Exception):
+    """Base error raised by the signing job subsystem."""
+
+
+class SigningJobNotFoundError(SigningJobError):
+    """Raised when a job does not exist or belongs to another user."""
+
+
+class SigningJobLimitError(SigningJobError):
+    """Raised when a submission is empty or exceeds the document limit."""
+
+
+def job_directory(job_id: UUID) -> Path:
+    """Return the directory holding a job's uploaded and signed documents."""
+
+    base = settings.pdf_job_dir or Path(tempfile.gettempdir()) / "ca-pdf-jobs"
+    return base / str(job_id)
+
+
+def _move_documents(
+    documents: list[tuple[str, SpooledFile]], directory: Path
+) -> list[tuple[str, str, int]]:
+    directory.mkdir(parents=True, exist_ok=True)
+    moved: list[tuple[str, str, int]] = []
+    for position, (filename, spooled) in enumerate(documents):
+        target = directory / f"{position:05d}.pdf"
+        shutil.move(spooled.path, target)
+        moved.append((filename, str(target), spooled.size))
+    return moved
+
+
+def _remove_file(path: str | None) -> None:
+    if path is not None:
+        SpooledFile(path=path, size=0).unlink()
+
+
+class SigningJobService:
+    """Submit, inspect and remove asynchronous signing jobs."""
+
+    def __init__(self, signing_service: PDFSigningService | None = None) -> None:
+        self._signing = signing_service or PDFSigningService()
+
+    async def submit_job(
+        self,
+        *,
+        session: AsyncSession,
+        owner_id: int,
+        documents: list[tuple[str, SpooledFile]],
+        certificate_id: UUID,
+        seal_id: UUID | None = None,
+        visibility: SignatureVisibility = SignatureVisibility.INVISIBLE,
+        coordinates: SignatureCoordinates | None = None,
+        metadata: SignatureMetadata | None = None,
+        use_tsa: bool = False,
+        embed_ltv: bool = False,
+    ) -> SigningJob:
+        """Queue documents for signing and return the persisted job.
+
+        The spooled documents are moved into the job directory, so the
+        caller's spool no longer owns them once this returns.
+        """
+
+        if not documents:
+            raise SigningJobLimitError("A signing job needs at least one document")
+        if len(documents) > settings.pdf_job_max_documents:
+            raise SigningJobLimitError(
+                f"Job size {len(documents)} exceeds maximum of "
+                f"{settings.pdf_job_max_documents}"
+            )
+
+        await self._signing.check_signing_material(
+            session=session,
+            certificate_id=certificate_id,
+            user_id=owner_id,
+            seal_id=seal_id,
+        )
+
+        job_id = uuid4()
+        directory = job_directory(job_id)
+        try:
+            moved = await asyncio.to_thread(_move_documents, documents, directory)
+            job = await signing_job_crud.create_job(
+                session=session,
+                job_id=job_id,
+                owner_id=owner_id,
+                certificate_id=certificate_id,
+                seal_id=seal_id,
+                visibility=visibility.value,
+                coordinates=asdict(coordinates) if coordinates else None,
+                signature_meta=asdict(metadata) if metadata else None,
+                use_tsa=use_tsa,
+                embed_ltv=embed_ltv,
+                documents=moved,
+            )
+        except BaseException:
+            await asyncio.to_thread(shutil.rmtree, directory, True)
+            raise
+
+        get_signing_job_worker().notify()
+        return job
+
+    async def get_job(
+        self, *, session: AsyncSession, job_id: UUID, owner_id: int
+    ) -> SigningJob:
+        """Return a job owned by ``owner_id``."""
+
+        job = await signing_job_crud.get_job_by_id(session=session, job_id=job_id)
+        if job is None or job.owner_id != owner_id:
+            raise SigningJobNotFoundError(f"Signing job {job_id} not found")
+        return job
+
+    async def get_item(
+        self, *, session: AsyncSession, job_id: UUID, item_id: UUID, owner_id: int
+    ) -> SigningJobItem:
+        """Return a document of a job owned by ``owner_id``."""
+
+        await self.get_job(session=session, job_id=job_id, owner_id=owner_id)
+        item = await signing_job_crud.get_job_item(
+            session=session, job_id=job_id, item_id=item_id
+        )
+        if item is None:
+            raise SigningJobNotFoundError(f"Signing job item {item_id} not found")
+        return item
+
+    async def delete_job(
+        self, *, session: AsyncSession, job_id: UUID, owner_id: int
+    ) -> None:
+        """Drop a job, its queued documents and any signed output."""
+
+        await self.get_job(session=session, job_id=job_id, owner_id=owner_id)
+        await signing_job_crud.delete_job(session=session, job_id=job_id)
+        await asyncio.to_thread(shutil.rmtree, job_directory(job_id), True)
+
+
+class SigningJobWorker:
+    """Local workers that drain the signing job queue.
+
+    Each worker claims one document at a time, so the signing pool sees at
+    most ``concurrency`` job documents regardless of how many are queued.
+    """
+
+    _MAINTENANCE_INTERVAL = timedelta(minutes=1)
+
+    def __init__(
+        self,
+        *,
+        concurrency: int,
+        poll_interval: float,
+        claim_timeout: timedelta,
+        retention: timedelta,
+        max_attempts: int = 3,
+        signing_service: PDFSigningService | None = None,
+    ) -> None:
+        self._concurrency = concurrency
+        self._poll_interval = poll_interval
+        self._claim_timeout = claim_timeout
+        self._max_attempts = max_attempts
+        self._retention = retention
+        self._signing = signing_service or PDFSigningService()
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+        self._last_maintenance: datetime | None = None
+
+    def start(self) -> None:
+        """Spawn the worker tasks on the running event loop."""
+
+        if self._tasks:
+            return
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._run(), name=f"signing-job-worker-{index}")
+            for index in range(self._concurrency)
+        ]
+
+    async def stop(self) -> None:
+        """Cancel the worker tasks; claimed items are requeued after a timeout."""
+
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def notify(self) -> None:
+        """Wake idle workers because new items were queued."""
+
+        self._wakeup.set()
+
+    async def run_once(self) -> bool:
+        """Claim and process a single queued item; ``False`` if none was ready."""
+
+        async with get_session_factory()() as session:
+            item = await signing_job_crud.claim_next_item(session=session)
+            if item is None:
+                return False
+            try:
+                await self._process(session=session, item=item)
+            except asyncio.CancelledError:
+                await self._requeue(item.id)
+                raise
+        return True
+
+    async def run_maintenance(self) -> None:
+        """Requeue abandoned items and delete jobs past their retention."""
+
+        now = datetime.now(timezone.utc)
+        claimed_before = now - self._claim_timeout
+        async with get_session_factory()() as session:
+            exhausted = await signing_job_crud.fail_exhausted_items(
+                session=session,
+                claimed_before=claimed_before,
+                max_attempts=self._max_attempts,
+            )
+            if exhausted:
+                logger.warning(
+                    "Failed %d signing job item(s) after %d attempts",
+                    len(exhausted),
+                    self._max_attempts,
+                )
+            for input_path in exhausted:
+                _remove_file(input_path)
+            released = await signing_job_crud.release_stale_items(
+                session=session,
+                claimed_before=claimed_before,
+                max_attempts=self._max_attempts,
+            )
+            if released:
+                logger.warning("Requeued %d abandoned signing job item(s)", released)
+                self.notify()
+
+            expired = await signing_job_crud.list_expired_jobs(
+                session=session, finished_before=now - self._retention
+            )
+            for job in expired:
+                await signing_job_crud.delete_job(session=session, job_id=job.id)
+                await asyncio.to_thread(shutil.rmtree, job_directory(job.id), True)
+        self._last_maintenance = now
+
+    async def _requeue(self, item_id: UUID) -> None:
+        async with get_session_factory()() as session:
+            await signing_job_crud.requeue_item(session=session, item_id=item_id)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if self._maintenance_due():
+                    await self.run_maintenance()
+                if await self.run_once():
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Signing job worker iteration failed")
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _maintenance_due(self) -> bool:
+        if self._last_maintenance is None:
+            return True
+        elapsed = datetime.now(timezone.utc) - self._last_maintenance
+        return elapsed >= self._MAINTENANCE_INTERVAL
+
+    async def _process(self, *, session: AsyncSession, item: SigningJobItem) -> None:
+        job = await signing_job_crud.get_job_by_id(session=session, job_id=item.job_id)
+        if job is None:
+            return
+        if job.owner_id is None:
+            await signing_job_crud.fail_item(
+                session=session, item=item, error="Job owner no longer exists"
+            )
+            _remove_file(item.input_path)
+            return
+
+        output_spool = UploadSpool()
+        try:
+            result = await self._signing.sign_pdf(
+                session=session,
+                pdf_data=SpooledFile(path=item.input_path, size=item.input_size),
+                certificate_id=job.certificate_id,
+                user_id=job.owner_id,
+                seal_id=job.seal_id,
+                visibility=SignatureVisibility(job.visibility),
+                coordinates=(
+                    SignatureCoordinates(**job.coordinates) if job.coordinates else None
+                ),
+                metadata=(
+                    SignatureMetadata(**job.signature_meta)
+                    if job.signature_meta
+                    else None
+                ),
+                use_tsa=job.use_tsa,
+                embed_ltv=job.embed_ltv,
+                output_spool=output_spool,
+            )
+        except SigningUnavailableError:
+            # The signing pool is saturated by interactive requests; retry later.
+            await signing_job_crud.requeue_item(session=session, item_id=item.id)
+            output_spool.close()
+            await asyncio.sleep(self._poll_interval)
+            return
+        except Exception as exc:
+            if not isinstance(exc, PDFSigningError):
+                logger.exception("Unexpected error signing job item %s", item.id)
+            await signing_job_crud.fail_item(session=session, item=item, error=str(exc))
+            output_spool.close()
+            _remove_file(item.input_path)
+            return
+
+        output_path = str(Path(item.input_path).with_suffix(".signed.pdf"))
+        try:
+            if isinstance(result.signed_output, SpooledFile):
+                await asyncio.to_thread(
+                    shutil.move, result.signed_output.path, output_path
+                )
+            else:
+                await asyncio.to_thread(
+                    Path(output_path).write_bytes, result.signed_output
+                )
+            recorded = await signing_job_crud.complete_item(
+                session=session,
+                item=item,
+                output_path=output_path,
+                document_id=result.document_id,
+                file_size=result.file_size,
+                signed_at=result.signed_at,
+            )
+        except BaseException:
+            _remove_file(output_path)
+            raise
+        finally:
+            output_spool.close()
+
+        _remove_file(item.input_path)
+        if not recorded:
+            _remove_file(output_path)
+            return
+
+        await audit_log_crud.create_audit_log(
+            session=session,
+            actor_id=job.owner_id,
+            event_type="pdf.signature.job_applied",
+            resource="pdf",
+            meta={
+                "job_id": str(job.id),
+                "item_id": str(item.id),
+                "document_id": result.document_id,
+                "certificate_id": str(result.certificate_id),
+                "seal_id": str(result.seal_id) if result.seal_id else None,
+                "visibility": result.visibility.value,
+                "tsa_used": result.tsa_used,
+                "ltv_embedded": result.ltv_embedded,
+                "signed_at": result.signed_at.isoformat(),
+                "file_size": result.file_size,
+                "original_filename": item.filename,
+            },
+            commit=True,
+        )
+
+
+_signing_job_worker: SigningJobWorker | None = None
+
+
+def get_signing_job_worker(
+    signing_service: PDFSigningService | None = None,
+) -> SigningJobWorker:
+    """Return the process-wide signing job worker built from settings.
+
+    ``signing_service`` is only used when the worker is first created.
+    """
+
+    global _signing_job_worker
+    if _signing_job_worker is None:
+        _signing_job_worker = SigningJobWorker(
+            concurrency=settings.pdf_job_workers,
+            poll_interval=settings.pdf_job_poll_interval_seconds,
+            claim_timeout=timedelta(seconds=settings.pdf_job_claim_timeout_seconds),
+            retention=timedelta(hours=settings.pdf_job_retention_hours),
+            max_attempts=settings.pdf_job_max_attempts,
+            signing_service=signing_service,
+        )
+    return _signing_job_worker
+
+
+async def shutdown_signing_job_worker() -> None:
+    """Stop the process-wide signing job worker, if one was created."""
+
+    global _signing_job_worker
+    worker, _signing_job_worker = _signing_job_worker, None
+    if worker is not None:
+        await worker.stop()
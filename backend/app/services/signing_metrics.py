@@ -0,0 +1,150 @@
+"""Per-stage latency of the signing pipeline.
+
+A request collects its stage durations in a :class:`StageTimings`, which
+the endpoints report in a ``Server-Timing`` header. Every duration is also
+fed into process-wide histograms, so slow stages show up under real load
+in ``/health/signing`` rather than only in individual responses.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+# Upper bounds of the histogram buckets in milliseconds; slower samples land
+# in the implicit "+Inf" bucket.
+_BUCKET_BOUNDS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+@dataclass(slots=True)
+class StageHistogramStats:
+    """Point-in-time latency distribution of one signing stage.
+
+    ``buckets`` is cumulative: each bound maps to the number of samples that
+    took at most that many milliseconds.
+    """
+
+    count: int
+    total_ms: float
+    max_ms: float
+    buckets: dict[str, int]
+
+
+class _StageHistogram:
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.bucket_counts = [0] * (len(_BUCKET_BOUNDS_MS) + 1)
+
+    def observe(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        for index, bound in enumerate(_BUCKET_BOUNDS_MS):
+            if elapsed_ms <= bound:
+                self.bucket_counts[index] += 1
+                return
+        self.bucket_counts[-1] += 1
+
+    def stats(self) -> StageHistogramStats:
+        buckets: dict[str, int] = {}
+        running = 0
+        for bound, count in zip(
+            (*(str(bound) for bound in _BUCKET_BOUNDS_MS), "+Inf"),
+            self.bucket_counts,
+        ):
+            running += count
+            buckets[bound] = running
+        return StageHistogramStats(
+            count=self.count,
+            total_ms=round(self.total_ms, 2),
+            max_ms=round(self.max_ms, 2),
+            buckets=buckets,
+        )
+
+
+class SigningMetrics:
+    """Process-wide latency histograms keyed by signing stage."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: dict[str, _StageHistogram] = {}
+
+    def observe(self, stage: str, elapsed_ms: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = _StageHistogram()
+            histogram.observe(elapsed_ms)
+
+    def stats(self) -> dict[str, StageHistogramStats]:
+        with self._lock:
+            return {
+                stage: histogram.stats()
+                for stage, histogram in self._histograms.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+class StageTimings:
+    """Stage durations collected while serving a single request.
+
+    Stages that run more than once, such as per-document stages of a batch,
+    are summed. Batch items are signed concurrently, so summed stages can
+    exceed the request's total wall time.
+    """
+
+    def __init__(self, metrics: SigningMetrics | None = None) -> None:
+        self._metrics = metrics or get_signing_metrics()
+        self._started = time.perf_counter()
+        self._durations_ms: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as ``name``, including when it fails."""
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - started) * 1000)
+
+    def record(self, name: str, elapsed_ms: float) -> None:
+        self._durations_ms[name] = self._durations_ms.get(name, 0.0) + elapsed_ms
+        self._metrics.observe(name, elapsed_ms)
+
+    @property
+    def durations_ms(self) -> dict[str, float]:
+        return dict(self._durations_ms)
+
+    def server_timing(self) -> str:
+        """Render the stages and the elapsed total as a ``Server-Timing`` value."""
+
+        entries = [
+            f"{name};dur={elapsed_ms:.2f}"
+            for name, elapsed_ms in self._durations_ms.items()
+        ]
+        total_ms = (time.perf_counter() - self._started) * 1000
+        entries.append(f"total;dur={total_ms:.2f}")
+        return ", ".join(entries)
+
+
+_metrics_lock = threading.Lock()
+_signing_metrics: SigningMetrics | None = None
+
+
+def get_signing_metrics() -> SigningMetrics:
+    """Return the process-wide signing stage histograms."""
+
+    global _signing_metrics
+    with _metrics_lock:
+        if _signing_metrics is None:
+            _signing_metrics = SigningMetrics()
+        return _signing_metrics
@@ -0,0 +1,206 @@
+"""Disk-backed spooling of uploaded PDF documents."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator, TypeAlias, cast
+
+from app.core.config import settings
+
+SPOOL_CHUNK_SIZE = 1024 * 1024
+STREAM_CHUNK_SIZE = 256 * 1024
+
+
+class SpoolError(Exception):
+    """Base error raised while spooling documents."""
+
+
+class SpoolLimitError(SpoolError):
+    """Raised when a document exceeds the configured spool size limit."""
+
+
+@dataclass(slots=True, frozen=True)
+class SpooledFile:
+    """Picklable handle to a document spooled to local disk."""
+
+    path: str
+    size: int
+
+    def head(self, length: int) -> bytes:
+        """Return up to ``length`` bytes from the start of the file."""
+
+        with open(self.path, "rb") as handle:
+            return handle.read(length)
+
+    @contextmanager
+    def map(self) -> Iterator[mmap.mmap]:
+        """Memory-map the file read-only for the duration of the context."""
+
+        with open(self.path, "rb") as handle:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                yield view
+
+    def unlink(self) -> None:
+        """Remove the spooled file, ignoring files that are already gone."""
+
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+PDFSource: TypeAlias = bytes | SpooledFile
+
+
+def source_size(source: PDFSource) -> int:
+    """Return the size in bytes of an in-memory or spooled document."""
+
+    if isinstance(source, SpooledFile):
+        return source.size
+    return len(source)
+
+
+def source_head(source: PDFSource, length: int) -> bytes:
+    """Return the first ``length`` bytes of a document."""
+
+    if isinstance(source, SpooledFile):
+        return source.head(length)
+    return source[:length]
+
+
+@contextmanager
+def open_source(source: PDFSource) -> Iterator[BinaryIO]:
+    """Open a document as a seekable binary stream without copying it.
+
+    Spooled files are read straight from disk, so pyHanko only pulls the
+    byte ranges it needs through the page cache instead of a heap copy.
+    """
+
+    if isinstance(source, SpooledFile):
+        with open(source.path, "rb") as handle:
+            yield handle
+        return
+    yield io.BytesIO(source)
+
+
+def create_spool_file(
+    *, directory: Path | None = None, prefix: str = "ca-pdf-", suffix: str = ".pdf"
+) -> BinaryIO:
+    """Create a named, readable and writable spool file that outlives its handle."""
+
+    return cast(
+        BinaryIO,
+        tempfile.NamedTemporaryFile(
+            mode="w+b",
+            prefix=prefix,
+            suffix=suffix,
+            dir=directory,
+            delete=False,
+        ),
+    )
+
+
+def iter_source_chunks(
+    source: PDFSource, chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Yield a document in fixed-size chunks, reading spooled files lazily."""
+
+    if isinstance(source, SpooledFile):
+        with open(source.path, "rb") as handle:
+            while chunk := handle.read(chunk_size):
+                yield chunk
+        return
+    view = memoryview(source)
+    for offset in range(0, len(view), chunk_size):
+        yield bytes(view[offset : offset + chunk_size])
+
+
+def iter_file_range(
+    handle: BinaryIO, start: int, length: int, chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Yield ``length`` bytes from ``start`` in fixed-size chunks, then close."""
+
+    try:
+        handle.seek(start)
+        while length > 0 and (chunk := handle.read(min(chunk_size, length))):
+            length -= len(chunk)
+            yield chunk
+    finally:
+        handle.close()
+
+
+def spool_stream(
+    stream: BinaryIO,
+    *,
+    max_bytes: int,
+    directory: Path | None = None,
+    suffix: str = ".pdf",
+) -> SpooledFile:
+    """Copy ``stream`` to a temporary file in fixed-size chunks."""
+
+    handle = create_spool_file(directory=directory, suffix=suffix)
+    size = 0
+    try:
+        with handle:
+            while chunk := stream.read(SPOOL_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    max_mb = max_bytes / (1024 * 1024)
+                    raise SpoolLimitError(f"File size exceeds {max_mb:.0f}MB limit")
+                handle.write(chunk)
+    except BaseException:
+        os.unlink(handle.name)
+        raise
+    return SpooledFile(path=handle.name, size=size)
+
+
+async def spool_upload(stream: BinaryIO, *, max_bytes: int) -> SpooledFile:
+    """Spool an upload stream to ``PDF_SPOOL_DIR`` without blocking the loop."""
+
+    stream.seek(0)
+    return await asyncio.to_thread(
+        spool_stream,
+        stream,
+        max_bytes=max_bytes,
+        directory=settings.pdf_spool_dir,
+    )
+
+
+class UploadSpool:
+    """Spooled files owned by a single request, removed when it finishes."""
+
+    def __init__(self, *, max_bytes: int | None = None) -> None:
+        self._max_bytes = max_bytes if max_bytes is not None else settings.pdf_max_bytes
+        self._files: list[SpooledFile] = []
+
+    async def add(self, stream: BinaryIO) -> SpooledFile:
+        """Spool ``stream`` and track the resulting file for cleanup."""
+
+        spooled = await spool_upload(stream, max_bytes=self._max_bytes)
+        self._files.append(spooled)
+        return spooled
+
+    def adopt(self, spooled: SpooledFile) -> SpooledFile:
+        """Take ownership of a file spooled elsewhere, such as signed output."""
+
+        self._files.append(spooled)
+        return spooled
+
+    def detach(self) -> list[SpooledFile]:
+        """Hand ownership of all tracked files to the caller."""
+
+        files, self._files = self._files, []
+        return files
+
+    def close(self) -> None:
+        """Remove every file still owned by this spool."""
+
+        for spooled in self.detach():
+            spooled.unlink()
@@ -7,6 +7,7 @@ from uuid import UUID, uuid4
 
 from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import StorageEncryptionAlgorithm, settings
@@ -167,10 +168,13 @@ class EncryptedStorageService:
         file_metadata = await session.get(FileMetadata, file_id)
         if file_metadata is None:
             raise StorageNotFoundError(f"File metadata {file_id} was not found")
-        secret = file_metadata.encrypted_payload
+        result = await session.execute(
+            select(EncryptedSecret).where(EncryptedSecret.file_id == file_metadata.id)
+        )
+        secret = result.scalar_one_or_none()
         if secret is None:
             raise StorageCorruptionError("Stored file is missing encrypted payload")
-        return await self.retrieve_secret(session, secret.id)
+        return self._decrypt_secret(secret)
 
     async def load_certificate_pem(self, session: AsyncSession, file_id: UUID) -> str:
         payload = await self.load_file_bytes(session, file_id)
@@ -0,0 +1,228 @@
+"""Built-in RFC 3161 timestamp authority backed by the managed CA.
+
+Tokens are signed with a timestamping certificate issued from the root CA,
+so signatures can carry trusted timestamps without an external TSA. The
+same responder answers in-process requests from the TSA client, which then
+skips HTTP entirely, and DER requests posted to the ``/tsa`` endpoint.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+from uuid import UUID
+
+from asn1crypto import cms  # type: ignore[import-untyped]
+from asn1crypto import keys as asn1_keys
+from asn1crypto import tsp
+from asn1crypto import x509 as asn1_x509
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+from pyhanko.sign import signers
+from pyhanko.sign.signers.pdf_cms import select_suitable_signing_md
+from pyhanko_certvalidator.registry import SimpleCertificateStore
+
+from app.core.config import settings
+from app.db.session import get_session_factory
+from app.services.certificate_authority import (
+    CertificateAuthorityError,
+    CertificateAuthorityService,
+    TSAMaterial,
+)
+
+# Message imprint lengths accepted per hash algorithm; weaker hashes are refused.
+_IMPRINT_LENGTHS = {"sha256": 32, "sha384": 48, "sha512": 64}
+
+
+class TimestampAuthorityError(Exception):
+    """Raised when the built-in timestamp authority cannot issue tokens."""
+
+
+class TimeStampResponse(tsp.TimeStampResp):
+    """``TimeStampResp`` whose token is optional, as RFC 3161 defines it.
+
+    asn1crypto declares the token mandatory, which makes rejections
+    impossible to encode or parse.
+    """
+
+    _fields = [
+        ("status", tsp.PKIStatusInfo),
+        ("time_stamp_token", cms.ContentInfo, {"optional": True}),
+    ]
+
+
+def _rejection(failure: str, reason: str) -> TimeStampResponse:
+    return TimeStampResponse(
+        {
+            "status": tsp.PKIStatusInfo(
+                {
+                    "status": "rejection",
+                    "status_string": [reason],
+                    "fail_info": tsp.PKIFailureInfo({failure}),
+                }
+            )
+        }
+    )
+
+
+def _to_asn1_certificate(certificate: x509.Certificate) -> asn1_x509.Certificate:
+    return asn1_x509.Certificate.load(
+        certificate.public_bytes(serialization.Encoding.DER)
+    )
+
+
+class LocalTimestampAuthority:
+    """Answers RFC 3161 timestamp requests with a CA-issued TSA key."""
+
+    def __init__(
+        self,
+        *,
+        certificate: asn1_x509.Certificate,
+        private_key: asn1_keys.PrivateKeyInfo,
+        chain: list[asn1_x509.Certificate] | None = None,
+        policy: str | None = None,
+        artifact_id: UUID | None = None,
+    ) -> None:
+        self.certificate = certificate
+        self.policy = policy or settings.tsa_local_policy_oid
+        self.artifact_id = artifact_id
+        self._md_algorithm = select_suitable_signing_md(certificate.public_key)
+        self._signer = signers.SimpleSigner(
+            signing_cert=certificate,
+            signing_key=private_key,
+            cert_registry=SimpleCertificateStore.from_certs(chain or []),
+        )
+
+    @classmethod
+    def from_material(cls, material: TSAMaterial) -> LocalTimestampAuthority:
+        """Build a responder from key material loaded by the CA service."""
+
+        return cls(
+            certificate=_to_asn1_certificate(material.certificate),
+            private_key=asn1_keys.PrivateKeyInfo.load(
+                material.private_key.private_bytes(
+                    encoding=serialization.Encoding.DER,
+                    format=serialization.PrivateFormat.PKCS8,
+                    encryption_algorithm=serialization.NoEncryption(),
+                )
+            ),
+            chain=[_to_asn1_certificate(material.root_certificate)],
+            artifact_id=material.artifact.id,
+        )
+
+    async def respond(self, request: tsp.TimeStampReq) -> TimeStampResponse:
+        """Grant a timestamp token for ``request`` or explain the rejection."""
+
+        try:
+            parsed = request.native
+        except Exception:
+            return _rejection("bad_data_format", "Malformed timestamp request")
+
+        algorithm = parsed["message_imprint"]["hash_algorithm"]["algorithm"]
+        if algorithm not in _IMPRINT_LENGTHS:
+            return _rejection("bad_alg", f"Unsupported hash algorithm: {algorithm}")
+        if (
+            len(parsed["message_imprint"]["hashed_message"])
+            != _IMPRINT_LENGTHS[algorithm]
+        ):
+            return _rejection("bad_data_format", "Message imprint length mismatch")
+        if parsed["req_policy"] not in (None, self.policy):
+            return _rejection("unaccepted_policy", "Requested policy is not supported")
+        if parsed["extensions"]:
+            return _rejection("unaccepted_extension", "Extensions are not supported")
+
+        tst_info = {
+            "version": "v1",
+            "policy": self.policy,
+            "message_imprint": request["message_imprint"],
+            "serial_number": x509.random_serial_number(),
+            "gen_time": datetime.now(timezone.utc),
+            "accuracy": {"seconds": 1},
+            "tsa": asn1_x509.GeneralName(
+                name="directory_name", value=self.certificate.subject
+            ),
+        }
+        if parsed["nonce"] is not None:
+            tst_info["nonce"] = parsed["nonce"]
+
+        token = await self._signer.async_sign_general_data(
+            cms.EncapsulatedContentInfo(
+                {
+                    "content_type": "tst_info",
+                    "content": cms.ParsableOctetString(tsp.TSTInfo(tst_info).dump()),
+                }
+            ),
+            self._md_algorithm,
+            detached=False,
+            use_cades=True,
+        )
+        if not parsed["cert_req"]:
+            # RFC 3161 section 2.4.1: omit certificates unless requested.
+            token["content"]["certificates"] = None
+        return TimeStampResponse(
+            {"status": {"status": "granted"}, "time_stamp_token": token}
+        )
+
+    async def respond_der(self, body: bytes) -> bytes:
+        """Answer a DER encoded ``TimeStampReq`` with a DER ``TimeStampResp``."""
+
+        try:
+            request = tsp.TimeStampReq.load(body)
+        except Exception:
+            response = _rejection("bad_data_format", "Malformed timestamp request")
+        else:
+            response = await self.respond(request)
+        encoded: bytes = response.dump()
+        return encoded
+
+
+_authority_lock = threading.Lock()
+_authority: LocalTimestampAuthority | None = None
+_ca_service: CertificateAuthorityService | None = None
+
+
+def configure_local_timestamp_authority(
+    ca_service: CertificateAuthorityService | None,
+) -> None:
+    """Load the responder's key through the application's CA service."""
+
+    global _authority, _ca_service
+    with _authority_lock:
+        _ca_service = ca_service
+        _authority = None
+
+
+async def get_local_timestamp_authority() -> LocalTimestampAuthority:
+    """Return the process-wide responder, loading its key on first use.
+
+    The key is loaded through the CA service handed over by the application;
+    callers outside the application get one CA service built on first use.
+    """
+
+    global _authority, _ca_service
+    authority = _authority
+    if authority is not None:
+        return authority
+
+    with _authority_lock:
+        if _ca_service is None:
+            _ca_service = CertificateAuthorityService()
+        ca_service = _ca_service
+    async with get_session_factory()() as session:
+        try:
+            material = await ca_service.load_tsa_material(session=session)
+        except CertificateAuthorityError as exc:
+            raise TimestampAuthorityError(str(exc)) from exc
+
+    authority = LocalTimestampAuthority.from_material(material)
+    with _authority_lock:
+        _authority = authority
+    return authority
+
+
+def reset_local_timestamp_authority() -> None:
+    """Forget the cached responder so the newest certificate is loaded next."""
+
+    global _authority
+    with _authority_lock:
+        _authority = None
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
-from typing import Protocol
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
 
-import requests
-from pyhanko.sign.timestamps import HTTPTimeStamper
+import httpx
+from asn1crypto import tsp  # type: ignore[import-untyped]
+from pyhanko.sign.timestamps import TimeStamper
 
 from app.core.config import settings
+from app.services.timestamp_authority import (
+    TimestampAuthorityError,
+    get_local_timestamp_authority,
+)
+
+_LATENCY_WINDOW = 256
+_OUTCOME_WINDOW = 20
+_MIN_SAMPLES = 5
+_MIN_HEDGE_DELAY_SECONDS = 0.02
 
 
 class TSAError(Exception):
@@ -22,77 +37,448 @@ class TSAResponseError(TSAError):
     """Raised when TSA returns an invalid response."""
 
 
-class TimeStamperProtocol(Protocol):
-    """Protocol for time stamping operations."""
+class CircuitState(str, Enum):
+    """Circuit breaker state of a TSA endpoint."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(slots=True)
+class TSAEndpointStats:
+    """Point-in-time health of a single TSA endpoint."""
+
+    url: str
+    state: CircuitState
+    requests: int
+    failures: int
+    error_rate: float
+    latency_p50_ms: float | None
+    latency_p95_ms: float | None
+    hedge_delay_ms: float
+
+
+@dataclass(slots=True)
+class TSAClientStats:
+    """Point-in-time request counters and latency for a TSA client.
+
+    Client-level latencies are end to end, including hedged and failed-over
+    attempts; per-endpoint figures cover individual attempts.
+    """
+
+    max_connections: int
+    local: bool
+    requests: int
+    failures: int
+    hedged: int
+    latency_p50_ms: float | None
+    latency_p95_ms: float | None
+    latency_max_ms: float | None
+    endpoints: list[TSAEndpointStats] = field(default_factory=list)
+
+
+def _percentile(latencies: deque[float], fraction: float) -> float | None:
+    if not latencies:
+        return None
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _round(value: float | None) -> float | None:
+    return round(value, 2) if value is not None else None
+
+
+class _Endpoint:
+    """Rolling latency, error rate and circuit breaker for one TSA URL."""
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.requests = 0
+        self.failures = 0
+        self._latencies: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._outcomes: deque[bool] = deque(maxlen=_OUTCOME_WINDOW)
+        self._open_until: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        if self._open_until is None:
+            return CircuitState.CLOSED
+        if time.monotonic() < self._open_until:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    @property
+    def error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def available(self) -> bool:
+        """Whether a request may be sent; half-open circuits allow one trial."""
+
+        state = self.state
+        if state is CircuitState.OPEN:
+            return False
+        return not (state is CircuitState.HALF_OPEN and self._trial_in_flight)
+
+    def rank(self) -> tuple[float, float]:
+        """Sort key preferring reliable, then fast, endpoints."""
+
+        median = _percentile(self._latencies, 0.5)
+        if len(self._latencies) < _MIN_SAMPLES or median is None:
+            median = 0.0
+        return round(self.error_rate, 1), median
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait on this endpoint before hedging to the next one."""
+
+        budget = _percentile(self._latencies, settings.tsa_hedge_percentile)
+        if len(self._latencies) < _MIN_SAMPLES or budget is None:
+            return settings.tsa_hedge_default_delay_ms / 1000
+        return max(_MIN_HEDGE_DELAY_SECONDS, budget / 1000)
+
+    def begin(self) -> None:
+        self.requests += 1
+        if self.state is CircuitState.HALF_OPEN:
+            self._trial_in_flight = True
+
+    def record_success(self, elapsed_ms: float) -> None:
+        self._latencies.append(elapsed_ms)
+        self._outcomes.append(True)
+        if self._open_until is not None:
+            self._open_until = None
+            self._trial_in_flight = False
+            self._outcomes.clear()
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._outcomes.append(False)
+        if self._trial_in_flight or (
+            len(self._outcomes) >= _MIN_SAMPLES
+            and self.error_rate >= settings.tsa_breaker_error_rate
+        ):
+            self._open_until = time.monotonic() + settings.tsa_breaker_cooldown_seconds
+            self._trial_in_flight = False
+
+    def record_abandoned(self, elapsed_ms: float) -> None:
+        """Note an attempt that lost a hedge race; it was at least this slow."""
+
+        self._latencies.append(elapsed_ms)
+        self._trial_in_flight = False
+
+    def stats(self) -> TSAEndpointStats:
+        return TSAEndpointStats(
+            url=self.url,
+            state=self.state,
+            requests=self.requests,
+            failures=self.failures,
+            error_rate=round(self.error_rate, 3),
+            latency_p50_ms=_round(_percentile(self._latencies, 0.5)),
+            latency_p95_ms=_round(_percentile(self._latencies, 0.95)),
+            hedge_delay_ms=round(self.hedge_delay() * 1000, 2),
+        )
+
+
+class PooledTimeStamper(TimeStamper):
+    """pyHanko timestamper that sends requests through a shared :class:`TSAClient`."""
+
+    def __init__(self, client: TSAClient) -> None:
+        super().__init__()
+        self._client = client
 
     async def async_request_tsa_response(
-        self,
-        req: bytes,
-        timeout: int | None = None,
-    ) -> bytes:
-        """Request a timestamp token from the TSA."""
-        ...
+        self, req: tsp.TimeStampReq
+    ) -> tsp.TimeStampResp:
+        return await self._client.request(req)
 
 
 class TSAClient:
-    """Client for RFC3161 timestamp authority operations."""
+    """Client for RFC3161 timestamp authority operations.
+
+    Requests go through one ``httpx.AsyncClient`` per TSA client, so
+    concurrent signatures share a bounded pool of keep-alive connections
+    instead of opening a blocking socket per document.
+
+    With several endpoints configured, each request goes to the most
+    reliable and fastest endpoint first. If it has not answered within its
+    recent latency percentile, the same request is hedged to the next
+    endpoint and the first reply wins; failures fail over immediately.
+    Endpoints whose recent error rate crosses the breaker threshold are
+    skipped until a cooldown has passed and a trial request succeeds.
+
+    With ``local`` enabled, requests are answered in-process by the built-in
+    timestamp authority and no HTTP endpoint is contacted.
+    """
 
     def __init__(
         self,
         tsa_url: str | None = None,
         username: str | None = None,
         password: str | None = None,
+        *,
+        tsa_urls: list[str] | None = None,
+        timeout: float | None = None,
+        max_connections: int | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        local: bool | None = None,
     ) -> None:
-        self.tsa_url = tsa_url or settings.tsa_url
+        if tsa_urls is None:
+            if tsa_url:
+                tsa_urls = [tsa_url]
+            else:
+                tsa_urls = settings.tsa_urls or (
+                    [settings.tsa_url] if settings.tsa_url else []
+                )
+        self._endpoints = [_Endpoint(url) for url in dict.fromkeys(tsa_urls)]
+        self._local = settings.tsa_local_enabled if local is None else local
         self.username = username or settings.tsa_username
         self.password = password or (
             settings.tsa_password.get_secret_value() if settings.tsa_password else None
         )
+        self._timeout = timeout if timeout is not None else settings.tsa_timeout_seconds
+        self._max_connections = max_connections or settings.tsa_max_connections
+        self._transport = transport
+        self._http: httpx.AsyncClient | None = None
+        self._timestamper: PooledTimeStamper | None = None
+        self._latencies: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._requests = 0
+        self._failures = 0
+        self._hedged = 0
+
+    @property
+    def tsa_url(self) -> str | None:
+        """The first configured endpoint."""
+        return self._endpoints[0].url if self._endpoints else None
+
+    @property
+    def tsa_urls(self) -> list[str]:
+        """All configured endpoints in failover order."""
+        return [endpoint.url for endpoint in self._endpoints]
 
     def is_configured(self) -> bool:
         """Check if TSA is configured and available."""
-        return bool(self.tsa_url)
+        return self._local or bool(self._endpoints)
 
-    def get_timestamper(self) -> HTTPTimeStamper | None:
-        """Create and return a pyHanko HTTP timestamper instance."""
+    def get_timestamper(self) -> PooledTimeStamper | None:
+        """Return the pyHanko timestamper bound to this client's connection pool."""
         if not self.is_configured():
             return None
 
-        if not self.tsa_url:
-            return None
+        if self._timestamper is None:
+            self._timestamper = PooledTimeStamper(self)
+        return self._timestamper
+
+    async def request(self, req: tsp.TimeStampReq) -> tsp.TimeStampResp:
+        """Submit a timestamp request and return the first valid response."""
+        if self._local:
+            return await self._request_local(req)
+        if not self._endpoints:
+            raise TSAConnectionError("No TSA endpoint is configured")
+
+        self._requests += 1
+        candidates = sorted(
+            (endpoint for endpoint in self._endpoints if endpoint.available()),
+            key=_Endpoint.rank,
+        )
+        if not candidates:
+            self._failures += 1
+            raise TSAConnectionError("All TSA endpoints are unavailable")
 
-        auth: tuple[str, str] | None = None
-        if self.username and self.password:
-            auth = (self.username, self.password)
+        body = req.dump()
+        started = time.perf_counter()
+        attempts: set[asyncio.Task[tsp.TimeStampResp]] = set()
+        errors: list[TSAError] = []
+        hedge_delay: float | None = None
+        try:
+            while candidates or attempts:
+                if candidates and not attempts:
+                    endpoint = candidates.pop(0)
+                    attempts.add(asyncio.ensure_future(self._send(endpoint, body)))
+                    hedge_delay = endpoint.hedge_delay()
+
+                done, attempts = await asyncio.wait(
+                    attempts,
+                    timeout=hedge_delay if candidates else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    endpoint = candidates.pop(0)
+                    attempts.add(asyncio.ensure_future(self._send(endpoint, body)))
+                    hedge_delay = endpoint.hedge_delay()
+                    self._hedged += 1
+                    continue
+
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        self._latencies.append((time.perf_counter() - started) * 1000)
+                        return task.result()
+                    if not isinstance(error, TSAError):
+                        raise error
+                    errors.append(error)
+        finally:
+            for task in attempts:
+                task.cancel()
+            await asyncio.gather(*attempts, return_exceptions=True)
 
-        return HTTPTimeStamper(
-            url=self.tsa_url,
-            auth=auth,
-            timeout=30,
+        self._failures += 1
+        if all(isinstance(error, TSAConnectionError) for error in errors):
+            if len(errors) == 1:
+                raise errors[0]
+            raise TSAConnectionError(
+                "All TSA endpoints failed: " + "; ".join(map(str, errors))
+            )
+        raise next(
+            error for error in reversed(errors) if isinstance(error, TSAResponseError)
         )
 
-    def validate_tsa_connection(self) -> bool:
-        """Validate that the TSA endpoint is reachable."""
-        if not self.is_configured() or not self.tsa_url:
+    async def validate_tsa_connection(self) -> bool:
+        """Validate that at least one TSA endpoint is reachable."""
+        if not self.is_configured():
             return False
+        if self._local:
+            try:
+                await get_local_timestamp_authority()
+            except TimestampAuthorityError as exc:
+                raise TSAResponseError(str(exc)) from exc
+            return True
+
+        reachable = False
+        last_error: TSAError | None = None
+        for endpoint in self._endpoints:
+            try:
+                response = await self._get_http().head(
+                    endpoint.url, follow_redirects=True
+                )
+            except httpx.HTTPError as exc:
+                last_error = TSAConnectionError(
+                    f"Failed to reach TSA endpoint {endpoint.url}: {exc}"
+                )
+                continue
+
+            status_code = response.status_code
+            if status_code >= 500:
+                last_error = TSAResponseError(
+                    f"TSA {endpoint.url} responded with server error ({status_code})"
+                )
+            elif status_code < 400:
+                reachable = True
+
+        if not reachable and last_error is not None:
+            raise last_error
+        return reachable
+
+    def stats(self) -> TSAClientStats:
+        """Return request counters and latency percentiles over recent requests."""
+        return TSAClientStats(
+            max_connections=self._max_connections,
+            local=self._local,
+            requests=self._requests,
+            failures=self._failures,
+            hedged=self._hedged,
+            latency_p50_ms=_round(_percentile(self._latencies, 0.5)),
+            latency_p95_ms=_round(_percentile(self._latencies, 0.95)),
+            latency_max_ms=_round(max(self._latencies, default=None)),
+            endpoints=[endpoint.stats() for endpoint in self._endpoints],
+        )
+
+    async def aclose(self) -> None:
+        """Close pooled connections held by this client."""
+        http, self._http = self._http, None
+        if http is not None:
+            await http.aclose()
 
-        auth: tuple[str, str] | None = None
-        if self.username and self.password:
-            auth = (self.username, self.password)
+    async def _request_local(self, req: tsp.TimeStampReq) -> tsp.TimeStampResp:
+        self._requests += 1
+        started = time.perf_counter()
+        try:
+            authority = await get_local_timestamp_authority()
+            response = await authority.respond(req)
+        except TimestampAuthorityError as exc:
+            self._failures += 1
+            raise TSAResponseError(
+                f"Built-in timestamp authority is unavailable: {exc}"
+            ) from exc
+        self._latencies.append((time.perf_counter() - started) * 1000)
+        return response
 
+    async def _send(self, endpoint: _Endpoint, body: bytes) -> tsp.TimeStampResp:
+        endpoint.begin()
+        started = time.perf_counter()
         try:
-            response = requests.head(
-                self.tsa_url,
+            response = await self._get_http().post(
+                endpoint.url,
+                content=body,
+                headers={
+                    "Content-Type": "application/timestamp-query",
+                    "Accept": "application/timestamp-reply",
+                },
+            )
+        except asyncio.CancelledError:
+            endpoint.record_abandoned((time.perf_counter() - started) * 1000)
+            raise
+        except httpx.HTTPError as exc:
+            endpoint.record_failure()
+            raise TSAConnectionError(
+                f"Failed to reach TSA endpoint {endpoint.url}: {exc}"
+            ) from exc
+
+        if response.status_code != 200:
+            endpoint.record_failure()
+            raise TSAResponseError(
+                f"TSA {endpoint.url} responded with status {response.status_code}"
+            )
+
+        try:
+            parsed = tsp.TimeStampResp.load(response.content)
+            parsed.native  # Force a full parse so malformed replies fail here
+        except Exception as exc:
+            endpoint.record_failure()
+            raise TSAResponseError(
+                f"Invalid response from TSA {endpoint.url}: {exc}"
+            ) from exc
+
+        endpoint.record_success((time.perf_counter() - started) * 1000)
+        return parsed
+
+    def _get_http(self) -> httpx.AsyncClient:
+        if self._http is None:
+            auth: tuple[str, str] | None = None
+            if self.username and self.password:
+                auth = (self.username, self.password)
+            self._http = httpx.AsyncClient(
                 auth=auth,
-                timeout=10,
-                allow_redirects=True,
+                timeout=httpx.Timeout(self._timeout),
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+                transport=self._transport,
             )
-        except requests.RequestException as exc:
-            raise TSAConnectionError(f"Failed to reach TSA endpoint: {exc}") from exc
+        return self._http
 
-        status_code = response.status_code
-        if status_code >= 500:
-            raise TSAResponseError(f"TSA responded with server error ({status_code})")
-        if status_code >= 400:
-            return False
-        return True
+
+_client_lock = threading.Lock()
+_tsa_client: TSAClient | None = None
+
+
+def get_tsa_client() -> TSAClient:
+    """Return the process-wide TSA client built from settings."""
+
+    global _tsa_client
+    with _client_lock:
+        if _tsa_client is None:
+            _tsa_client = TSAClient()
+        return _tsa_client
+
+
+async def shutdown_tsa_client() -> None:
+    """Close the process-wide TSA client's connection pool, if one was created."""
+
+    global _tsa_client
+    with _client_lock:
+        client, _tsa_client = _tsa_client, None
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,102 @@
+"""Incremental ZIP archive writer for streaming HTTP responses."""
+
+from __future__ import annotations
+
+import io
+import zipfile
+from datetime import datetime, timezone
+from typing import Iterator
+
+from app.services.spool import PDFSource, iter_source_chunks, source_size
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, non-seekable sink that buffers bytes until drained."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class StreamingZipWriter:
+    """Build a ZIP archive member by member, returning bytes as they are ready.
+
+    The underlying sink is not seekable, so :mod:`zipfile` writes data
+    descriptors after each member and nothing but the member currently being
+    added is held in memory.
+    """
+
+    def __init__(self, *, compression: int = zipfile.ZIP_STORED) -> None:
+        self._sink = _ChunkSink()
+        self._archive = zipfile.ZipFile(
+            self._sink, mode="w", compression=compression, allowZip64=True
+        )
+        self._names: set[str] = set()
+
+    def unique_name(self, name: str) -> str:
+        """Return ``name`` or a numbered variant not yet used in the archive."""
+
+        if name not in self._names:
+            return name
+        stem, dot, suffix = name.rpartition(".")
+        if not dot:
+            stem, suffix = name, ""
+        counter = 2
+        while True:
+            candidate = f"{stem}-{counter}.{suffix}" if dot else f"{stem}-{counter}"
+            if candidate not in self._names:
+                return candidate
+            counter += 1
+
+    def add(
+        self, name: str, data: bytes, *, modified_at: datetime | None = None
+    ) -> bytes:
+        """Append a member and return the archive bytes produced for it."""
+
+        self._archive.writestr(self._member_info(name, modified_at), data)
+        self._names.add(name)
+        return self._sink.drain()
+
+    def add_source(
+        self, name: str, source: PDFSource, *, modified_at: datetime | None = None
+    ) -> Iterator[bytes]:
+        """Append a member from ``source`` and yield archive bytes chunk by chunk.
+
+        Spooled documents are read in fixed-size chunks, so the member is never
+        loaded into memory in full. The iterator must be exhausted before the
+        next member is added.
+        """
+
+        info = self._member_info(name, modified_at)
+        info.file_size = source_size(source)
+        self._names.add(name)
+        with self._archive.open(info, mode="w") as member:
+            for chunk in iter_source_chunks(source):
+                member.write(chunk)
+                if data := self._sink.drain():
+                    yield data
+        if data := self._sink.drain():
+            yield data
+
+    def _member_info(self, name: str, modified_at: datetime | None) -> zipfile.ZipInfo:
+        timestamp = (modified_at or datetime.now(timezone.utc)).timetuple()[:6]
+        info = zipfile.ZipInfo(filename=name, date_time=timestamp)
+        info.compress_type = self._archive.compression
+        return info
+
+    def finish(self) -> bytes:
+        """Write the central directory and return the remaining bytes."""
+
+        self._archive.close()
+        return self._sink.drain()
@@ -0,0 +1 @@
+"""Performance benchmarks for the backend, run outside the pytest suite."""
@@ -0,0 +1,222 @@
+"""CRL generation benchmarks over large revocation lists.
+
+Fills the certificate table with revoked rows up to each requested size and
+times ``generate_crl`` end to end: streaming serials and revocation dates,
+building the entries, signing, encrypted storage and the audit record.
+Alongside throughput the report lists the longest event loop stall seen
+while a CRL was being built, which stays small because entry building and
+signing run in worker threads.
+
+Run from ``backend/``::
+
+    python -m benchmarks.crl --output crl.json
+    python -m benchmarks.crl --sizes 10000,100000 --iterations 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Sequence
+
+from sqlalchemy import func, insert, select
+
+# Importing the signing benchmark first prepares the same isolated database
+# and storage key before any application module reads its settings.
+from benchmarks.signing import RSSSampler, _csv, environment  # isort: skip
+from app.db.init_db import init_db
+from app.db.session import get_session_factory
+from app.models.certificate import Certificate, CertificateStatus
+from app.services.certificate_authority import (
+    CertificateAuthorityService,
+    RootCANotFoundError,
+    RootKeyAlgorithm,
+)
+
+REPORT_VERSION = 1
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+# Serials of generated rows start here so they never collide with issued ones.
+_SERIAL_BASE = 0xB0000000000000
+_INSERT_BATCH = 50_000
+_LAG_SAMPLE_SECONDS = 0.005
+
+
+@dataclass(slots=True)
+class CRLResult:
+    """Measurements for one revocation count; times are per generated CRL."""
+
+    name: str
+    revoked: int
+    iterations: int
+    wall_seconds: float
+    latency_mean_ms: float
+    entries_per_second: float
+    crl_bytes: int
+    event_loop_max_stall_ms: float
+    peak_rss_mib: float
+
+
+class _LoopStallMonitor:
+    """Records the longest gap between ticks of a coroutine on the loop."""
+
+    def __init__(self) -> None:
+        self.max_stall = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> _LoopStallMonitor:
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        assert self._task is not None
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(_LAG_SAMPLE_SECONDS)
+            stall = time.perf_counter() - started - _LAG_SAMPLE_SECONDS
+            self.max_stall = max(self.max_stall, stall)
+
+
+class CRLBenchmark:
+    """Owns the root CA and the revoked rows shared by all sizes."""
+
+    def __init__(self) -> None:
+        self._ca = CertificateAuthorityService()
+
+    async def setup(self) -> None:
+        await init_db()
+        async with get_session_factory()() as session:
+            try:
+                await self._ca.export_root_certificate(session=session)
+            except RootCANotFoundError:
+                await self._ca.generate_root_ca(
+                    session=session,
+                    algorithm=RootKeyAlgorithm.EC_P256,
+                    common_name="Benchmark Root CA",
+                    organization="Benchmark",
+                    actor_id=None,
+                    validity_days=365,
+                )
+
+    async def fill(self, revoked: int) -> None:
+        """Insert revoked rows until ``revoked`` certificates are revoked."""
+
+        async with get_session_factory()() as session:
+            existing = await session.scalar(
+                select(func.count())
+                .select_from(Certificate)
+                .where(Certificate.status == CertificateStatus.REVOKED.value)
+            )
+            revoked_at = datetime.now(timezone.utc) - timedelta(days=1)
+            for start in range(existing or 0, revoked, _INSERT_BATCH):
+                stop = min(start + _INSERT_BATCH, revoked)
+                await session.execute(
+                    insert(Certificate),
+                    [
+                        {
+                            "serial_number": f"{_SERIAL_BASE + index:X}",
+                            "subject_common_name": f"Revoked {index}",
+                            "issued_at": revoked_at - timedelta(days=30),
+                            "expires_at": revoked_at + timedelta(days=335),
+                            "status": CertificateStatus.REVOKED.value,
+                            "certificate_pem": "",
+                            "updated_at": revoked_at,
+                        }
+                        for index in range(start, stop)
+                    ],
+                )
+                await session.commit()
+
+    async def run(self, revoked: int, *, iterations: int) -> CRLResult:
+        await self.fill(revoked)
+
+        crl_bytes = 0
+        with RSSSampler() as sampler:
+            async with _LoopStallMonitor() as monitor:
+                started = time.perf_counter()
+                for _ in range(iterations):
+                    async with get_session_factory()() as session:
+                        result = await self._ca.generate_crl(
+                            session=session, actor_id=None
+                        )
+                    crl_bytes = len(result.crl_pem)
+                wall = time.perf_counter() - started
+
+        return CRLResult(
+            name=f"crl/{revoked}",
+            revoked=revoked,
+            iterations=iterations,
+            wall_seconds=round(wall, 4),
+            latency_mean_ms=round(wall * 1000 / iterations, 3),
+            entries_per_second=round(revoked * iterations / wall, 1),
+            crl_bytes=crl_bytes,
+            event_loop_max_stall_ms=round(monitor.max_stall * 1000, 3),
+            peak_rss_mib=round(sampler.peak_bytes / (1024 * 1024), 1),
+        )
+
+
+async def run_benchmarks(
+    *, sizes: Sequence[int], iterations: int = 1
+) -> dict[str, Any]:
+    """Generate a CRL for each revocation count, smallest first."""
+
+    benchmark = CRLBenchmark()
+    await benchmark.setup()
+    results: list[CRLResult] = []
+    for revoked in sorted(sizes):
+        result = await benchmark.run(revoked, iterations=iterations)
+        print(
+            f"{result.name}: {result.latency_mean_ms} ms, "
+            f"{result.entries_per_second} entries/s, "
+            f"loop stall {result.event_loop_max_stall_ms} ms",
+            file=sys.stderr,
+        )
+        results.append(result)
+
+    return {
+        "benchmark": "crl",
+        "version": REPORT_VERSION,
+        "environment": environment(),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=_csv, default=[str(size) for size in DEFAULT_SIZES]
+    )
+    parser.add_argument("--iterations", type=int, default=1)
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    report = asyncio.run(
+        run_benchmarks(
+            sizes=[int(size) for size in args.sizes], iterations=args.iterations
+        )
+    )
+    payload = json.dumps(report, indent=2, sort_keys=True)
+    if args.output is None:
+        print(payload)
+    else:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
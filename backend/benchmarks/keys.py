@@ -0,0 +1,261 @@
+"""Key algorithm benchmarks for issuance and raw signing.
+
+Compares every root and leaf key algorithm the CA offers on the operations
+whose cost depends on the key: generating a key pair, issuing a leaf
+certificate end to end (key generation, certificate, PKCS#12 and encrypted
+storage) and producing the CMS signature value that a PDF signature needs.
+Whole-document signing per key is covered by ``benchmarks.signing``.
+
+Run from ``backend/``::
+
+    python -m benchmarks.keys --output keys.json
+    python -m benchmarks.keys --leaf-keys rsa-2048,ed25519 --iterations 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Sequence
+
+from asn1crypto import keys as asn1_keys  # type: ignore[import-untyped]
+from asn1crypto import x509 as asn1_x509
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.serialization import pkcs12
+from pyhanko.sign import signers
+from pyhanko.sign.signers.pdf_cms import select_suitable_signing_md
+from pyhanko_certvalidator.registry import SimpleCertificateStore
+
+# Importing the signing benchmark first prepares the same isolated database
+# and storage key before any application module reads its settings.
+from benchmarks.signing import _csv, _percentile, environment  # isort: skip
+from app.crud import user as user_crud
+from app.db.init_db import init_db
+from app.db.session import get_session_factory
+from app.services.certificate_authority import (
+    CertificateAuthorityService,
+    LeafKeyAlgorithm,
+    RootKeyAlgorithm,
+)
+
+REPORT_VERSION = 1
+OPERATIONS = ("root-keygen", "keygen", "issue", "sign")
+
+
+@dataclass(slots=True)
+class KeyResult:
+    """Measurements for one operation and algorithm; latencies are per call."""
+
+    name: str
+    operation: str
+    algorithm: str
+    iterations: int
+    wall_seconds: float
+    throughput_ops_per_second: float
+    latency_p50_ms: float
+    latency_p99_ms: float
+    latency_max_ms: float
+
+
+def _signer_from_p12(p12_bytes: bytes) -> signers.SimpleSigner:
+    private_key, certificate, _ = pkcs12.load_key_and_certificates(p12_bytes, None)
+    assert private_key is not None and certificate is not None
+    return signers.SimpleSigner(
+        signing_cert=asn1_x509.Certificate.load(
+            certificate.public_bytes(serialization.Encoding.DER)
+        ),
+        signing_key=asn1_keys.PrivateKeyInfo.load(
+            private_key.private_bytes(
+                encoding=serialization.Encoding.DER,
+                format=serialization.PrivateFormat.PKCS8,
+                encryption_algorithm=serialization.NoEncryption(),
+            )
+        ),
+        cert_registry=SimpleCertificateStore(),
+        signature_mechanism=None,
+    )
+
+
+class KeyBenchmark:
+    """Owns the root CA and signing user shared by all measurements."""
+
+    def __init__(self) -> None:
+        self._ca = CertificateAuthorityService()
+        self._user_id = 0
+
+    async def setup(self) -> None:
+        await init_db()
+        async with get_session_factory()() as session:
+            user = await user_crud.get_user_by_email(
+                session=session, email="bench@example.com"
+            )
+            if user is None:
+                user = await user_crud.create_user(
+                    session=session,
+                    email="bench@example.com",
+                    password="BenchPass123!",
+                )
+            self._user_id = user.id
+            await self._ca.generate_root_ca(
+                session=session,
+                algorithm=RootKeyAlgorithm.EC_P256,
+                common_name="Benchmark Root CA",
+                organization="Benchmark",
+                actor_id=None,
+                validity_days=365,
+            )
+
+    async def _issue(self, algorithm: LeafKeyAlgorithm) -> bytes:
+        async with get_session_factory()() as session:
+            issued = await self._ca.issue_certificate(
+                session=session,
+                owner_id=self._user_id,
+                common_name=f"Benchmark {algorithm.value}",
+                organization="Benchmark",
+                algorithm=algorithm,
+                actor_id=None,
+                validity_days=30,
+            )
+        return issued.p12_bytes
+
+    async def call_for(
+        self, operation: str, algorithm: str
+    ) -> Callable[[], Awaitable[None]]:
+        if operation == "root-keygen":
+            root = RootKeyAlgorithm(algorithm)
+
+            async def generate_root() -> None:
+                self._ca._generate_root_private_key(root)
+
+            return generate_root
+
+        leaf = LeafKeyAlgorithm(algorithm)
+        if operation == "keygen":
+
+            async def generate() -> None:
+                self._ca._generate_leaf_private_key(leaf)
+
+            return generate
+
+        if operation == "issue":
+
+            async def issue() -> None:
+                await self._issue(leaf)
+
+            return issue
+
+        signer = _signer_from_p12(await self._issue(leaf))
+        md_algorithm = select_suitable_signing_md(signer.signing_cert.public_key)
+        # The signed attributes of a CMS signature are a few hundred bytes.
+        payload = hashlib.sha512(b"signed attributes").digest() * 8
+
+        async def sign() -> None:
+            await signer.async_sign_raw(payload, md_algorithm)
+
+        return sign
+
+    async def run(
+        self, operation: str, algorithm: str, *, iterations: int, warmup: int
+    ) -> KeyResult:
+        call = await self.call_for(operation, algorithm)
+        for _ in range(warmup):
+            await call()
+
+        latencies: list[float] = []
+        started = time.perf_counter()
+        for _ in range(iterations):
+            call_started = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - call_started) * 1000)
+        wall = time.perf_counter() - started
+
+        return KeyResult(
+            name=f"{operation}/{algorithm}",
+            operation=operation,
+            algorithm=algorithm,
+            iterations=iterations,
+            wall_seconds=round(wall, 4),
+            throughput_ops_per_second=round(iterations / wall, 3),
+            latency_p50_ms=round(_percentile(latencies, 0.5), 3),
+            latency_p99_ms=round(_percentile(latencies, 0.99), 3),
+            latency_max_ms=round(max(latencies), 3),
+        )
+
+
+async def run_benchmarks(
+    *,
+    operations: Sequence[str],
+    root_keys: Sequence[RootKeyAlgorithm],
+    leaf_keys: Sequence[LeafKeyAlgorithm],
+    iterations: int,
+    warmup: int = 1,
+) -> dict[str, Any]:
+    """Measure ``operations`` for each algorithm and return the report."""
+
+    benchmark = KeyBenchmark()
+    await benchmark.setup()
+    results: list[KeyResult] = []
+    for operation in operations:
+        keys = root_keys if operation == "root-keygen" else leaf_keys
+        for key in keys:
+            result = await benchmark.run(
+                operation, key.value, iterations=iterations, warmup=warmup
+            )
+            print(
+                f"{result.name}: p50 {result.latency_p50_ms} ms, "
+                f"p99 {result.latency_p99_ms} ms, "
+                f"{result.throughput_ops_per_second} ops/s",
+                file=sys.stderr,
+            )
+            results.append(result)
+
+    return {
+        "benchmark": "key-algorithms",
+        "version": REPORT_VERSION,
+        "environment": environment(),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", type=_csv, default=list(OPERATIONS))
+    parser.add_argument(
+        "--root-keys", type=_csv, default=[key.value for key in RootKeyAlgorithm]
+    )
+    parser.add_argument(
+        "--leaf-keys", type=_csv, default=[key.value for key in LeafKeyAlgorithm]
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    report = asyncio.run(
+        run_benchmarks(
+            operations=[op for op in OPERATIONS if op in args.operations],
+            root_keys=[RootKeyAlgorithm(key) for key in args.root_keys],
+            leaf_keys=[LeafKeyAlgorithm(key) for key in args.leaf_keys],
+            iterations=args.iterations,
+            warmup=args.warmup,
+        )
+    )
+    payload = json.dumps(report, indent=2, sort_keys=True)
+    if args.output is None:
+        print(payload)
+    else:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
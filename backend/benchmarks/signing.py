@@ -0,0 +1,649 @@
+"""Reproducible PDF signing benchmarks.
+
+Sweeps generated PDFs of several sizes, every leaf key algorithm and
+visible and invisible signatures, with and without timestamps and LTV
+material. Timestamps come from the built-in TSA and LTV material from the
+local CA, so no run touches the network. Every scenario signs through
+``PDFSigningService`` directly and through the ASGI app.
+
+Run from ``backend/``::
+
+    python -m benchmarks.signing --output signing.json
+    python -m benchmarks.signing --quick
+
+The JSON report lists one entry per scenario in a stable order, so reports
+from two releases can be diffed directly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Sequence
+from uuid import UUID
+
+from cryptography.fernet import Fernet
+
+# Settings are read once at import time, so the benchmark environment has to
+# be in place before any application module is imported.
+if "DATABASE_URL" not in os.environ:
+    _workdir = Path(tempfile.mkdtemp(prefix="ca-pdf-bench-"))
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_workdir / 'bench.db'}"
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("ENCRYPTED_STORAGE_ALGORITHM", "fernet")
+os.environ.setdefault("ENCRYPTED_STORAGE_MASTER_KEY", Fernet.generate_key().decode())
+os.environ.setdefault("TSA_LOCAL_ENABLED", "true")
+os.environ.setdefault("PDF_JOB_WORKERS", "0")
+# Every iteration re-signs the same document; replays would hide the real cost.
+os.environ.setdefault("PDF_IDEMPOTENCY_ENABLED", "false")
+
+import httpx  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.security import create_access_token  # noqa: E402
+from app.crud import user as user_crud  # noqa: E402
+from app.db.init_db import init_db  # noqa: E402
+from app.db.session import get_session_factory  # noqa: E402
+from app.main import create_application  # noqa: E402
+from app.services.certificate_authority import (  # noqa: E402
+    CertificateAuthorityService,
+    LeafKeyAlgorithm,
+    RootKeyAlgorithm,
+)
+from app.services.pdf_signing import (  # noqa: E402
+    PDFSigningService,
+    SignatureCoordinates,
+    SignatureVisibility,
+    SigningResult,
+)
+from app.services.signing_executor import shutdown_signing_executor  # noqa: E402
+from app.services.timestamp_authority import (  # noqa: E402
+    reset_local_timestamp_authority,
+)
+from app.services.tsa_client import TSAClient, shutdown_tsa_client  # noqa: E402
+
+REPORT_VERSION = 1
+
+_SIZE_UNITS = {"KB": 1024, "MB": 1024 * 1024}
+DEFAULT_SIZES = ("10KB", "1MB", "10MB", "50MB")
+QUICK_SIZES = ("10KB", "1MB")
+# Bytes signed per scenario at most; large documents get fewer iterations.
+_SCENARIO_BYTE_BUDGET = 256 * 1024 * 1024
+_MIN_ITERATIONS = 3
+_IMAGE_WIDTH = 256
+_PAGE_IMAGE_BYTES = 1024 * 1024
+_VISIBLE_BOX = SignatureCoordinates(page=1, x=50, y=50, width=200, height=60)
+_RSS_SAMPLE_SECONDS = 0.01
+
+
+def parse_size(value: str) -> int:
+    """Parse ``10KB`` / ``50MB`` style sizes into bytes."""
+
+    text = value.strip().upper()
+    for unit, factor in _SIZE_UNITS.items():
+        if text.endswith(unit):
+            return int(float(text[: -len(unit)]) * factor)
+    return int(text)
+
+
+def format_size(size: int) -> str:
+    for unit, factor in sorted(_SIZE_UNITS.items(), key=lambda item: -item[1]):
+        if size >= factor and size % factor == 0:
+            return f"{size // factor}{unit}"
+    return f"{size}B"
+
+
+def generate_pdf(target_bytes: int, *, seed: int = 0) -> bytes:
+    """Build a PDF of at most ``target_bytes`` from pages of noise images.
+
+    Random grayscale images do not compress, so the file size tracks the
+    target like a scanned document would. The same seed yields the same bytes.
+    """
+
+    pdf = _build_noise_pdf(target_bytes, seed=seed)
+    if len(pdf) > target_bytes:
+        # Shave the object overhead off the image payload so limits such as
+        # PDF_MAX_BYTES can be hit exactly.
+        pdf = _build_noise_pdf(2 * target_bytes - len(pdf), seed=seed)
+    return pdf
+
+
+def _build_noise_pdf(payload: int, *, seed: int) -> bytes:
+    rng = random.Random(seed)
+    payload = max(_IMAGE_WIDTH, payload)
+    chunks: list[int] = []
+    while payload >= _IMAGE_WIDTH:
+        chunk = min(payload, _PAGE_IMAGE_BYTES)
+        chunks.append(chunk // _IMAGE_WIDTH)
+        payload -= chunk
+
+    objects: list[bytes] = []
+    page_refs: list[int] = []
+    # Objects 1 and 2 are the catalog and the page tree.
+    next_id = 3
+    for rows in chunks:
+        page_id, content_id, image_id = next_id, next_id + 1, next_id + 2
+        next_id += 3
+        page_refs.append(page_id)
+        content = b"q 612 0 0 792 0 0 cm /Im0 Do Q"
+        image = rng.randbytes(_IMAGE_WIDTH * rows)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /XObject << /Im0 %d 0 R >> >> /Contents %d 0 R >>"
+            % (image_id, content_id)
+        )
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content)
+        )
+        objects.append(
+            b"<< /Type /XObject /Subtype /Image /Width %d /Height %d "
+            b"/ColorSpace /DeviceGray /BitsPerComponent 8 /Length %d >>\n"
+            b"stream\n%s\nendstream" % (_IMAGE_WIDTH, rows, len(image), image)
+        )
+
+    kids = b" ".join(b"%d 0 R" % ref for ref in page_refs)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_refs)),
+        *objects,
+    ]
+
+    output = bytearray(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+    offsets: list[int] = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref_offset,
+    )
+    return bytes(output)
+
+
+def _read_rss(pid: str) -> int:
+    with open(f"/proc/{pid}/statm", encoding="ascii") as handle:
+        return int(handle.read().split()[1]) * resource.getpagesize()
+
+
+def _child_pids() -> list[str]:
+    pids: list[str] = []
+    for task in Path("/proc/self/task").iterdir():
+        try:
+            pids.extend((task / "children").read_text().split())
+        except OSError:
+            continue
+    return pids
+
+
+class RSSSampler:
+    """Tracks peak resident memory of this process and its pool workers.
+
+    Samples ``/proc`` while a scenario runs. Where ``/proc`` is missing the
+    process high-water mark from ``getrusage`` is reported instead, which
+    never decreases between scenarios.
+    """
+
+    def __init__(self) -> None:
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._procfs = Path("/proc/self/statm").exists()
+
+    def __enter__(self) -> RSSSampler:
+        if self._procfs:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        else:
+            # ru_maxrss is reported in KiB on Linux and in bytes on macOS.
+            scale = 1 if sys.platform == "darwin" else 1024
+            self.peak_bytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+    def _sample(self) -> None:
+        total = _read_rss("self")
+        for pid in _child_pids():
+            try:
+                total += _read_rss(pid)
+            except OSError:
+                continue
+        self.peak_bytes = max(self.peak_bytes, total)
+
+    def _run(self) -> None:
+        self._sample()
+        while not self._stop.wait(_RSS_SAMPLE_SECONDS):
+            self._sample()
+        self._sample()
+
+
+@dataclass(slots=True, frozen=True)
+class Scenario:
+    """One point of the sweep."""
+
+    interface: str
+    operation: str
+    size: int
+    key: LeafKeyAlgorithm
+    visibility: SignatureVisibility
+    tsa: bool
+    ltv: bool
+    documents: int
+    iterations: int
+
+    @property
+    def name(self) -> str:
+        features = "+".join(
+            name for name, on in (("tsa", self.tsa), ("ltv", self.ltv)) if on
+        )
+        return "/".join(
+            (
+                self.interface,
+                self.operation,
+                format_size(self.size),
+                self.key.value,
+                self.visibility.value,
+                features or "plain",
+            )
+        )
+
+
+@dataclass(slots=True)
+class ScenarioResult:
+    """Measurements for one scenario; latencies are per call."""
+
+    name: str
+    interface: str
+    operation: str
+    size_bytes: int
+    pdf_bytes: int
+    key: str
+    visibility: str
+    tsa: bool
+    ltv: bool
+    documents_per_call: int
+    iterations: int
+    wall_seconds: float
+    throughput_docs_per_second: float
+    throughput_mib_per_second: float
+    latency_p50_ms: float
+    latency_p99_ms: float
+    latency_max_ms: float
+    peak_rss_mib: float
+
+
+def _percentile(latencies: Sequence[float], fraction: float) -> float:
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def build_scenarios(
+    *,
+    sizes: Sequence[int],
+    keys: Sequence[LeafKeyAlgorithm],
+    visibilities: Sequence[SignatureVisibility],
+    features: Sequence[str],
+    interfaces: Sequence[str],
+    operations: Sequence[str],
+    iterations: int,
+    batch_size: int,
+) -> list[Scenario]:
+    """Expand the sweep into scenarios in a stable order."""
+
+    scenarios: list[Scenario] = []
+    for operation in operations:
+        for size in sizes:
+            documents = 1
+            if operation == "batch":
+                documents = max(1, min(batch_size, _SCENARIO_BYTE_BUDGET // size))
+            runs = max(
+                _MIN_ITERATIONS,
+                min(iterations, _SCENARIO_BYTE_BUDGET // (size * documents)),
+            )
+            for interface in interfaces:
+                for key in keys:
+                    for visibility in visibilities:
+                        for feature in features:
+                            scenarios.append(
+                                Scenario(
+                                    interface=interface,
+                                    operation=operation,
+                                    size=size,
+                                    key=key,
+                                    visibility=visibility,
+                                    tsa=feature == "tsa-ltv",
+                                    ltv=feature == "tsa-ltv",
+                                    documents=documents,
+                                    iterations=runs,
+                                )
+                            )
+    return scenarios
+
+
+class SigningBenchmark:
+    """Owns the CA material, users and clients shared by all scenarios."""
+
+    def __init__(self) -> None:
+        self._certificates: dict[LeafKeyAlgorithm, str] = {}
+        self._user_id = 0
+        self._token = ""
+        self._pdfs: dict[int, bytes] = {}
+        self._tsa_client = TSAClient(tsa_urls=[], local=True)
+        self._service = PDFSigningService(tsa_client=self._tsa_client)
+        self._http: httpx.AsyncClient | None = None
+
+    async def setup(self) -> None:
+        """Create the schema, a signing user, a root CA, leaf certs and a TSA."""
+
+        await init_db()
+        ca = CertificateAuthorityService()
+        async with get_session_factory()() as session:
+            user = await user_crud.get_user_by_email(
+                session=session, email="bench@example.com"
+            )
+            if user is None:
+                user = await user_crud.create_user(
+                    session=session,
+                    email="bench@example.com",
+                    password="BenchPass123!",
+                )
+            self._user_id = user.id
+
+            await ca.generate_root_ca(
+                session=session,
+                algorithm=RootKeyAlgorithm.EC_P256,
+                common_name="Benchmark Root CA",
+                organization="Benchmark",
+                actor_id=None,
+                validity_days=365,
+            )
+            for key in LeafKeyAlgorithm:
+                issued = await ca.issue_certificate(
+                    session=session,
+                    owner_id=self._user_id,
+                    common_name=f"Benchmark {key.value}",
+                    organization="Benchmark",
+                    algorithm=key,
+                    actor_id=None,
+                    validity_days=30,
+                )
+                self._certificates[key] = str(issued.certificate.id)
+            await ca.issue_tsa_certificate(
+                session=session,
+                common_name="Benchmark TSA",
+                organization="Benchmark",
+                algorithm=LeafKeyAlgorithm.EC_P256,
+                actor_id=None,
+            )
+            await ca.generate_crl(session=session, actor_id=None)
+        reset_local_timestamp_authority()
+
+        self._token = create_access_token(subject=str(self._user_id), role="user")
+        self._http = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=create_application()),
+            base_url="http://benchmark",
+            timeout=None,
+        )
+
+    async def close(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+        await self._tsa_client.aclose()
+
+    def _pdf(self, size: int) -> bytes:
+        if size not in self._pdfs:
+            self._pdfs[size] = generate_pdf(size)
+        return self._pdfs[size]
+
+    async def run(self, scenario: Scenario, *, warmup: int) -> ScenarioResult:
+        """Run ``scenario`` and summarize its latency, throughput and memory."""
+
+        pdf = self._pdf(scenario.size)
+        call = self._call_for(scenario, pdf)
+        for _ in range(warmup):
+            await call()
+
+        latencies: list[float] = []
+        with RSSSampler() as sampler:
+            started = time.perf_counter()
+            for _ in range(scenario.iterations):
+                call_started = time.perf_counter()
+                await call()
+                latencies.append((time.perf_counter() - call_started) * 1000)
+            wall = time.perf_counter() - started
+
+        documents = scenario.documents * scenario.iterations
+        return ScenarioResult(
+            name=scenario.name,
+            interface=scenario.interface,
+            operation=scenario.operation,
+            size_bytes=scenario.size,
+            pdf_bytes=len(pdf),
+            key=scenario.key.value,
+            visibility=scenario.visibility.value,
+            tsa=scenario.tsa,
+            ltv=scenario.ltv,
+            documents_per_call=scenario.documents,
+            iterations=scenario.iterations,
+            wall_seconds=round(wall, 4),
+            throughput_docs_per_second=round(documents / wall, 3),
+            throughput_mib_per_second=round(
+                documents * len(pdf) / wall / (1024 * 1024), 3
+            ),
+            latency_p50_ms=round(_percentile(latencies, 0.5), 2),
+            latency_p99_ms=round(_percentile(latencies, 0.99), 2),
+            latency_max_ms=round(max(latencies), 2),
+            peak_rss_mib=round(sampler.peak_bytes / (1024 * 1024), 1),
+        )
+
+    def _call_for(
+        self, scenario: Scenario, pdf: bytes
+    ) -> Callable[[], Awaitable[None]]:
+        if scenario.interface == "asgi":
+            return lambda: self._call_asgi(scenario, pdf)
+        return lambda: self._call_service(scenario, pdf)
+
+    async def _call_service(self, scenario: Scenario, pdf: bytes) -> None:
+        kwargs: dict[str, Any] = {
+            "certificate_id": UUID(self._certificates[scenario.key]),
+            "user_id": self._user_id,
+            "visibility": scenario.visibility,
+            "coordinates": (
+                _VISIBLE_BOX
+                if scenario.visibility == SignatureVisibility.VISIBLE
+                else None
+            ),
+            "use_tsa": scenario.tsa,
+            "embed_ltv": scenario.ltv,
+        }
+        async with get_session_factory()() as session:
+            if scenario.operation == "batch":
+                results = await self._service.batch_sign_pdfs(
+                    session=session,
+                    pdfs=[
+                        (f"doc-{index}.pdf", pdf) for index in range(scenario.documents)
+                    ],
+                    **kwargs,
+                )
+            else:
+                results = [
+                    await self._service.sign_pdf(
+                        session=session, pdf_data=pdf, **kwargs
+                    )
+                ]
+        for result in results:
+            if not isinstance(result, SigningResult):
+                raise RuntimeError(f"{scenario.name} failed: {result}")
+
+    async def _call_asgi(self, scenario: Scenario, pdf: bytes) -> None:
+        assert self._http is not None  # Created by setup()
+        data: dict[str, str] = {
+            "certificate_id": self._certificates[scenario.key],
+            "visibility": scenario.visibility.value,
+            "use_tsa": str(scenario.tsa).lower(),
+            "embed_ltv": str(scenario.ltv).lower(),
+        }
+        if scenario.visibility == SignatureVisibility.VISIBLE:
+            data.update(
+                page=str(_VISIBLE_BOX.page),
+                x=str(_VISIBLE_BOX.x),
+                y=str(_VISIBLE_BOX.y),
+                width=str(_VISIBLE_BOX.width),
+                height=str(_VISIBLE_BOX.height),
+            )
+        if scenario.operation == "batch":
+            url = "/api/v1/pdf/sign/batch"
+            files: list[tuple[str, tuple[str, bytes, str]]] = [
+                ("pdf_files", (f"doc-{index}.pdf", pdf, "application/pdf"))
+                for index in range(scenario.documents)
+            ]
+        else:
+            url = "/api/v1/pdf/sign"
+            files = [("pdf_file", ("doc.pdf", pdf, "application/pdf"))]
+
+        response = await self._http.post(
+            url,
+            headers={"Authorization": f"Bearer {self._token}"},
+            data=data,
+            files=files,
+        )
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"{scenario.name} failed: {response.status_code} {response.text}"
+            )
+        if scenario.operation == "batch" and response.json()["failed"]:
+            raise RuntimeError(f"{scenario.name} failed: {response.text}")
+
+
+def environment() -> dict[str, Any]:
+    """Describe the machine and signing configuration behind a report."""
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "executor_mode": settings.pdf_signing_execution_mode.value,
+        "pool_size": settings.pdf_signing_pool_size,
+        "batch_concurrency": settings.pdf_batch_concurrency,
+    }
+
+
+async def run_benchmarks(
+    scenarios: Sequence[Scenario], *, warmup: int = 1
+) -> dict[str, Any]:
+    """Run ``scenarios`` against a freshly provisioned CA and return the report."""
+
+    benchmark = SigningBenchmark()
+    await benchmark.setup()
+    results: list[ScenarioResult] = []
+    try:
+        for scenario in scenarios:
+            result = await benchmark.run(scenario, warmup=warmup)
+            print(
+                f"{result.name}: p50 {result.latency_p50_ms} ms, "
+                f"p99 {result.latency_p99_ms} ms, "
+                f"{result.throughput_docs_per_second} docs/s, "
+                f"peak RSS {result.peak_rss_mib} MiB",
+                file=sys.stderr,
+            )
+            results.append(result)
+    finally:
+        await benchmark.close()
+
+    return {
+        "benchmark": "pdf-signing",
+        "version": REPORT_VERSION,
+        "environment": environment(),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def _csv(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=_csv, default=list(DEFAULT_SIZES))
+    parser.add_argument(
+        "--keys", type=_csv, default=[key.value for key in LeafKeyAlgorithm]
+    )
+    parser.add_argument(
+        "--visibility",
+        type=_csv,
+        default=[visibility.value for visibility in SignatureVisibility],
+    )
+    parser.add_argument(
+        "--features",
+        type=_csv,
+        default=["plain", "tsa-ltv"],
+        help="plain and/or tsa-ltv (built-in TSA plus local LTV material)",
+    )
+    parser.add_argument("--interfaces", type=_csv, default=["service", "asgi"])
+    parser.add_argument("--operations", type=_csv, default=["sign", "batch"])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=settings.pdf_batch_max_count)
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help=f"Only {', '.join(QUICK_SIZES)} with {_MIN_ITERATIONS} iterations",
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    # pyHanko warns on every LTV signature that fetching is disabled, which is
+    # intended here since the local CA supplies all revocation data.
+    logging.getLogger("pyhanko").setLevel(logging.ERROR)
+    sizes = list(QUICK_SIZES) if args.quick else args.sizes
+    scenarios = build_scenarios(
+        sizes=[parse_size(size) for size in sizes],
+        keys=[LeafKeyAlgorithm(key) for key in args.keys],
+        visibilities=[SignatureVisibility(value) for value in args.visibility],
+        features=args.features,
+        interfaces=args.interfaces,
+        operations=args.operations,
+        iterations=_MIN_ITERATIONS if args.quick else args.iterations,
+        batch_size=min(args.batch_size, settings.pdf_batch_max_count),
+    )
+
+    async def run() -> dict[str, Any]:
+        try:
+            return await run_benchmarks(scenarios, warmup=args.warmup)
+        finally:
+            shutdown_signing_executor()
+            await shutdown_tsa_client()
+
+    report = asyncio.run(run())
+    payload = json.dumps(report, indent=2, sort_keys=True)
+    if args.output is None:
+        print(payload)
+    else:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
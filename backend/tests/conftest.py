@@ -32,6 +32,7 @@ from app.db.base import Base
 from app.db.init_db import bootstrap_admin
 from app.db.session import get_engine, refresh_session_factory
 from app.main import create_application
+from app.services.ca_distribution import get_ca_distribution_cache
 
 # Ensure settings and database connections are refreshed based on test environment
 reload_settings()
@@ -61,6 +62,8 @@ async def reset_state() -> AsyncGenerator[None, None]:
 
     await bootstrap_admin()
     await _auth_rate_limiter.reset()
+    # Cached CA documents would outlive the database they were read from.
+    get_ca_distribution_cache().invalidate()
 
     yield
 
@@ -0,0 +1,103 @@
+"""Tests for the cached root certificate and latest CRL endpoints."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import pytest
+from cryptography import x509
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud import ca_artifact as ca_artifact_crud
+from app.services.ca_distribution import get_ca_distribution_cache
+from app.services.certificate_authority import CertificateAuthorityService
+from tests.test_pdf_signing import (  # noqa: F401 - shared fixtures
+    ca_service,
+    db_session,
+    root_ca,
+)
+
+CA_URL = f"{settings.api_v1_prefix}/ca"
+
+
+async def test_latest_crl_is_served_from_cache_with_validators(
+    client: AsyncClient,
+    ca_service: CertificateAuthorityService,
+    db_session: AsyncSession,
+    root_ca: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """PEM and DER match, and a matching ``If-None-Match`` skips the database."""
+    assert (await client.get(f"{CA_URL}/crl/latest")).status_code == 404
+
+    generated = await ca_service.generate_crl(session=db_session, actor_id=None)
+    crl = x509.load_pem_x509_crl(generated.crl_pem.encode("utf-8"))
+
+    pem = await client.get(f"{CA_URL}/crl/latest")
+    der = await client.get(f"{CA_URL}/crl/latest.der")
+    assert pem.status_code == der.status_code == 200
+    assert pem.text == generated.crl_pem
+    assert (await client.get(f"{CA_URL}/crl/latest.pem")).text == pem.text
+    assert x509.load_der_x509_crl(der.content) == crl
+    assert der.headers["content-type"] == "application/pkix-crl"
+    assert pem.headers["etag"] != der.headers["etag"]
+    assert parsedate_to_datetime(der.headers["last-modified"]) == crl.last_update_utc
+    max_age = int(der.headers["cache-control"].removeprefix("public, max-age="))
+    remaining = crl.next_update_utc - datetime.now(timezone.utc)
+    assert 0 < remaining.total_seconds() - max_age < 60
+
+    async def no_database(**_: object) -> None:
+        raise AssertionError("cached CRL should not be reloaded")
+
+    monkeypatch.setattr(ca_artifact_crud, "get_latest_artifact_by_type", no_database)
+    cached = await client.get(
+        f"{CA_URL}/crl/latest.der",
+        headers={"If-None-Match": f'W/"other", {der.headers["etag"]}'},
+    )
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == der.headers["etag"]
+    monkeypatch.undo()
+
+    await ca_service.generate_crl(session=db_session, actor_id=None)
+    fresh = await client.get(
+        f"{CA_URL}/crl/latest.der", headers={"If-None-Match": der.headers["etag"]}
+    )
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != der.headers["etag"]
+    assert get_ca_distribution_cache().stats().invalidations >= 1
+
+
+async def test_root_certificate_variants_answer_conditional_requests(
+    client: AsyncClient,
+    ca_service: CertificateAuthorityService,
+    db_session: AsyncSession,
+    root_ca: None,
+) -> None:
+    """The JSON export keeps its shape and gains the same validators."""
+    root_pem = await ca_service.export_root_certificate(session=db_session)
+
+    exported = await client.get(f"{CA_URL}/root/certificate")
+    assert exported.status_code == 200
+    assert exported.json() == {"certificate_pem": root_pem}
+    assert exported.headers["cache-control"] == (
+        f"public, max-age={settings.ca_root_certificate_max_age_seconds}"
+    )
+    again = await client.get(
+        f"{CA_URL}/root/certificate",
+        headers={"If-None-Match": exported.headers["etag"]},
+    )
+    assert again.status_code == 304
+
+    der = await client.get(f"{CA_URL}/root/certificate.der")
+    pem = await client.get(f"{CA_URL}/root/certificate.pem")
+    root = x509.load_pem_x509_certificate(root_pem.encode("utf-8"))
+    assert x509.load_der_x509_certificate(der.content) == root
+    assert der.headers["content-type"] == "application/pkix-cert"
+    assert pem.text == root_pem
+    assert (
+        len({exported.headers["etag"], der.headers["etag"], pem.headers["etag"]}) == 3
+    )
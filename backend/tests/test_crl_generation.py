@@ -0,0 +1,65 @@
+"""Tests for CRL generation over many revoked certificates."""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timedelta, timezone
+
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.audit_log import AuditLog
+from app.models.certificate import Certificate, CertificateStatus
+from app.services.certificate_authority import CertificateAuthorityService
+from tests.test_pdf_signing import (  # noqa: F401 - shared fixtures
+    ca_service,
+    db_session,
+    root_ca,
+)
+
+REVOKED = 12_000
+SERIAL_BASE = 0x5E0000000000
+
+
+async def test_crl_covers_every_batch_and_audits_a_digest(
+    ca_service: CertificateAuthorityService,
+    db_session: AsyncSession,
+    root_ca: None,
+) -> None:
+    """Entries span several read batches; the audit log keeps only a summary."""
+    revoked_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    await db_session.execute(
+        insert(Certificate),
+        [
+            {
+                "serial_number": f"{SERIAL_BASE + index:X}",
+                "subject_common_name": f"Bulk {index}",
+                "issued_at": revoked_at - timedelta(days=30),
+                "expires_at": revoked_at + timedelta(days=335),
+                "status": CertificateStatus.REVOKED.value,
+                "certificate_pem": "",
+                "updated_at": revoked_at,
+            }
+            for index in range(REVOKED)
+        ],
+    )
+    await db_session.commit()
+
+    result = await ca_service.generate_crl(session=db_session, actor_id=None)
+
+    crl = x509.load_pem_x509_crl(result.crl_pem.encode("utf-8"))
+    assert len(crl) == REVOKED
+    last = crl.get_revoked_certificate_by_serial_number(SERIAL_BASE + REVOKED - 1)
+    assert last is not None and last.revocation_date_utc == revoked_at
+
+    entry = (
+        await db_session.execute(
+            select(AuditLog).where(AuditLog.event_type == "ca.crl.generated")
+        )
+    ).scalar_one()
+    assert entry.meta["revoked_count"] == REVOKED
+    assert "revoked_serials" not in entry.meta
+    crl_der = crl.public_bytes(serialization.Encoding.DER)
+    assert entry.meta["crl_sha256"] == hashlib.sha256(crl_der).hexdigest()
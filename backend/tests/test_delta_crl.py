@@ -0,0 +1,121 @@
+"""Tests for numbered base CRLs and delta CRLs."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from cryptography import x509
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import certificate as certificate_crud
+from app.models.ca_artifact import CAArtifactType
+from app.models.certificate import Certificate
+from app.services.certificate_authority import (
+    CertificateAuthorityService,
+    CRLGenerationError,
+    LeafKeyAlgorithm,
+)
+from tests.test_pdf_signing import (  # noqa: F401 - shared fixtures
+    ca_service,
+    db_session,
+    root_ca,
+)
+
+
+async def _issue_and_revoke(
+    ca_service: CertificateAuthorityService, session: AsyncSession, name: str
+) -> str:
+    issued = await ca_service.issue_certificate(
+        session=session,
+        owner_id=1,
+        common_name=name,
+        organization=None,
+        algorithm=LeafKeyAlgorithm.EC_P256,
+        actor_id=None,
+    )
+    certificate = await certificate_crud.get_certificate_by_id(
+        session=session, certificate_id=issued.certificate.id
+    )
+    await ca_service.revoke_certificate(
+        session=session, certificate=certificate, actor_id=None
+    )
+    return issued.certificate.serial_number
+
+
+def _serials(crl: x509.CertificateRevocationList) -> set[str]:
+    return {f"{entry.serial_number:x}".upper() for entry in crl}
+
+
+async def test_delta_crl_lists_revocations_since_base(
+    ca_service: CertificateAuthorityService,
+    db_session: AsyncSession,
+    root_ca: None,
+) -> None:
+    """Deltas carry the base number and only what changed after the base."""
+    with pytest.raises(CRLGenerationError, match="base CRL"):
+        await ca_service.generate_delta_crl(session=db_session, actor_id=None)
+
+    before = await _issue_and_revoke(ca_service, db_session, "Before Base")
+    await db_session.execute(
+        update(Certificate)
+        .where(Certificate.serial_number == before)
+        .values(updated_at=datetime.now(timezone.utc) - timedelta(hours=1))
+    )
+    await db_session.commit()
+    base_result = await ca_service.generate_crl(session=db_session, actor_id=None)
+    base = x509.load_pem_x509_crl(base_result.crl_pem.encode("utf-8"))
+    assert base.extensions.get_extension_for_class(x509.CRLNumber).value.crl_number == 1
+    assert _serials(base) == {before.upper()}
+
+    after = await _issue_and_revoke(ca_service, db_session, "After Base")
+    delta_result = await ca_service.generate_delta_crl(
+        session=db_session, actor_id=None
+    )
+    delta = x509.load_pem_x509_crl(delta_result.crl_pem.encode("utf-8"))
+
+    artifact = delta_result.artifact
+    assert artifact.artifact_type == CAArtifactType.DELTA_CRL.value
+    assert (artifact.crl_number, artifact.base_crl_number) == (2, 1)
+    number = delta.extensions.get_extension_for_class(x509.CRLNumber)
+    assert number.value.crl_number == 2
+    indicator = delta.extensions.get_extension_for_class(x509.DeltaCRLIndicator)
+    assert indicator.critical and indicator.value.crl_number == 1
+    assert _serials(delta) == {after.upper()}
+    root_pem = await ca_service.export_root_certificate(session=db_session)
+    root = x509.load_pem_x509_certificate(root_pem.encode("utf-8"))
+    assert delta.is_signature_valid(root.public_key())
+
+    assert [crl.id for crl in await ca_service.list_crls(session=db_session)] == [
+        base_result.artifact.id
+    ]
+    deltas = await ca_service.list_crls(session=db_session, delta=True)
+    assert [crl.id for crl in deltas] == [delta_result.artifact.id]
+
+
+async def test_colliding_crl_number_is_retried(
+    ca_service: CertificateAuthorityService,
+    db_session: AsyncSession,
+    root_ca: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A number taken by a concurrent generation is re-signed under the next."""
+    await ca_service.generate_crl(session=db_session, actor_id=None)
+
+    numbers = iter([1, 2])
+
+    async def stale_next_number(**_: object) -> int:
+        return next(numbers)
+
+    monkeypatch.setattr(ca_service, "_next_crl_number", stale_next_number)
+    result = await ca_service.generate_crl(session=db_session, actor_id=None)
+
+    crl = x509.load_pem_x509_crl(result.crl_pem.encode("utf-8"))
+    assert crl.extensions.get_extension_for_class(x509.CRLNumber).value.crl_number == 2
+    assert result.artifact.crl_number == 2
+    numbers_in_use = [
+        artifact.crl_number
+        for artifact in await ca_service.list_crls(session=db_session)
+    ]
+    assert sorted(numbers_in_use) == [1, 2]
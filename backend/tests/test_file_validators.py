@@ -105,6 +105,20 @@ class TestPDFValidator:
         assert error is not None
         assert "exceeds" in error.lower()
 
+    def test_precheck_skips_structural_parse(self) -> None:
+        pdf_bytes = b"%PDF-1.7\n" + b"0" * 1024
+
+        assert PDFValidator.precheck(pdf_bytes, "document.pdf") == (True, None)
+        is_valid, error = PDFValidator.validate(pdf_bytes, "document.pdf")
+        assert is_valid is False
+        assert error is not None and "corrupt" in error.lower()
+
+    def test_precheck_rejects_missing_header(self) -> None:
+        is_valid, error = PDFValidator.precheck(b"not-a-valid-pdf", "document.pdf")
+
+        assert is_valid is False
+        assert error is not None
+
 
 class TestSealImageValidator:
     def test_accepts_valid_png(self) -> None:
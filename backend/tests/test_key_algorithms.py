@@ -0,0 +1,152 @@
+"""End-to-end tests for the Ed25519 and P-384 key algorithms."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from cryptography.hazmat.primitives.serialization import pkcs12
+from pyhanko.pdf_utils.reader import PdfFileReader
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.certificate_authority import (
+    CertificateAuthorityService,
+    LeafKeyAlgorithm,
+    RootKeyAlgorithm,
+)
+from app.services.ltv_material import LTVMaterialCache
+from app.services.pdf_signing import DigestSigningError, PDFSigningService
+from app.services.pdf_verification import PDFVerificationService
+from app.services.timestamp_authority import LocalTimestampAuthority
+from tests.test_pdf_signing import (  # noqa: F401 - shared fixtures
+    ca_service,
+    create_minimal_pdf,
+    db_session,
+)
+from tests.test_timestamp_authority import make_request
+
+_KEY_TYPES = {
+    "ec-p384": ec.EllipticCurvePrivateKey,
+    "ed25519": ed25519.Ed25519PrivateKey,
+}
+
+
+@pytest.mark.parametrize(
+    ("root_algorithm", "leaf_algorithm", "md_algorithm"),
+    [
+        (RootKeyAlgorithm.ED25519, LeafKeyAlgorithm.ED25519, "sha512"),
+        (RootKeyAlgorithm.EC_P384, LeafKeyAlgorithm.EC_P384, "sha384"),
+        (RootKeyAlgorithm.EC_P256, LeafKeyAlgorithm.ED25519, "sha512"),
+    ],
+)
+async def test_issue_sign_and_verify(
+    ca_service: CertificateAuthorityService,
+    db_session: AsyncSession,
+    root_algorithm: RootKeyAlgorithm,
+    leaf_algorithm: LeafKeyAlgorithm,
+    md_algorithm: str,
+) -> None:
+    """Issued keys chain to the root, export to PKCS#12 and sign verifiably."""
+    root = await ca_service.generate_root_ca(
+        session=db_session,
+        algorithm=root_algorithm,
+        common_name="Test Root CA",
+        organization="Test Org",
+        actor_id=None,
+        validity_days=365,
+    )
+    await ca_service.generate_crl(session=db_session, actor_id=None)
+    issued = await ca_service.issue_certificate(
+        session=db_session,
+        owner_id=1,
+        common_name="Test User",
+        organization="Test Org",
+        algorithm=leaf_algorithm,
+        actor_id=None,
+        validity_days=365,
+    )
+
+    private_key, certificate, _ = pkcs12.load_key_and_certificates(
+        issued.p12_bytes, None
+    )
+    assert isinstance(private_key, _KEY_TYPES[leaf_algorithm.value])
+    key_usage = certificate.extensions.get_extension_for_class(x509.KeyUsage).value
+    assert key_usage.digital_signature and not key_usage.key_encipherment
+    certificate.verify_directly_issued_by(root.certificate)
+
+    service = PDFSigningService(ltv_material_cache=LTVMaterialCache(ttl_seconds=60))
+    result = await service.sign_pdf(
+        session=db_session,
+        pdf_data=create_minimal_pdf(),
+        certificate_id=issued.certificate.id,
+        user_id=1,
+        embed_ltv=True,
+    )
+    embedded = PdfFileReader(io.BytesIO(result.signed_pdf)).embedded_signatures[0]
+    assert embedded.md_algorithm == md_algorithm
+
+    report = await PDFVerificationService(ca_service=ca_service).verify_pdf(
+        session=db_session, pdf_data=result.signed_pdf
+    )
+    assert report.valid_signatures == 1
+    assert report.signatures[0].error is None
+
+
+async def test_ed25519_timestamps_and_digest_signing(
+    ca_service: CertificateAuthorityService,
+    db_session: AsyncSession,
+) -> None:
+    """Ed25519 tokens use SHA-512 and client digests must be SHA-512 too."""
+    await ca_service.generate_root_ca(
+        session=db_session,
+        algorithm=RootKeyAlgorithm.ED25519,
+        common_name="Test Root CA",
+        organization="Test Org",
+        actor_id=None,
+        validity_days=365,
+    )
+    await ca_service.issue_tsa_certificate(
+        session=db_session,
+        common_name="Test TSA",
+        organization="Test Org",
+        algorithm=LeafKeyAlgorithm.ED25519,
+        actor_id=None,
+    )
+    authority = LocalTimestampAuthority.from_material(
+        await ca_service.load_tsa_material(session=db_session)
+    )
+    response = await authority.respond(
+        make_request(hashlib.sha256(b"document").digest())
+    )
+    assert response["status"]["status"].native == "granted"
+    signer_info = response["time_stamp_token"]["content"]["signer_infos"][0]
+    assert signer_info["digest_algorithm"]["algorithm"].native == "sha512"
+
+    issued = await ca_service.issue_certificate(
+        session=db_session,
+        owner_id=1,
+        common_name="Test User",
+        organization="Test Org",
+        algorithm=LeafKeyAlgorithm.ED25519,
+        actor_id=None,
+        validity_days=365,
+    )
+    service = PDFSigningService()
+    with pytest.raises(DigestSigningError, match="sha512"):
+        await service.sign_digest(
+            session=db_session,
+            certificate_id=issued.certificate.id,
+            user_id=1,
+            document_digest=hashlib.sha256(b"document").digest(),
+        )
+    signed = await service.sign_digest(
+        session=db_session,
+        certificate_id=issued.certificate.id,
+        user_id=1,
+        digest_algorithm="sha512",
+        document_digest=hashlib.sha512(b"document").digest(),
+    )
+    assert signed.cms
@@ -0,0 +1,99 @@
+"""Tests for the pre-generated leaf key pool."""
+
+from __future__ import annotations
+
+import asyncio
+
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.certificate_authority import (
+    CertificateAuthorityService,
+    LeafKeyAlgorithm,
+)
+from app.services.key_pool import LeafKeyPool
+from tests.test_pdf_signing import (  # noqa: F401 - shared fixtures
+    ca_service,
+    db_session,
+    root_ca,
+)
+
+
+def _public_der(public_key) -> bytes:
+    return public_key.public_bytes(
+        serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+
+
+async def _wait_for_depth(pool: LeafKeyPool, algorithm: str, depth: int) -> None:
+    for _ in range(600):
+        stats = pool.stats()[algorithm]
+        if stats.depth >= depth and stats.pending == 0:
+            return
+        await asyncio.sleep(0.05)
+    raise AssertionError(f"Key pool did not reach depth {depth}: {stats}")
+
+
+def test_unstarted_pool_counts_misses() -> None:
+    """Without workers every request falls back and is counted as a miss."""
+    pool = LeafKeyPool(
+        algorithms=[LeafKeyAlgorithm.RSA_2048],
+        low_watermark=1,
+        high_watermark=2,
+        workers=1,
+    )
+
+    assert pool.take(LeafKeyAlgorithm.RSA_2048) is None
+    assert pool.take(LeafKeyAlgorithm.EC_P256) is None
+    stats = pool.stats()
+    assert list(stats) == ["rsa-2048"]
+    assert (stats["rsa-2048"].misses, stats["rsa-2048"].depth) == (1, 0)
+
+
+async def test_issuance_takes_pooled_keys_and_refills(
+    db_session: AsyncSession, root_ca: None
+) -> None:
+    """Issued certificates use pooled keys; the pool tops up at the low mark."""
+    pool = LeafKeyPool(
+        algorithms=[LeafKeyAlgorithm.EC_P256],
+        low_watermark=1,
+        high_watermark=3,
+        workers=1,
+    )
+    ca = CertificateAuthorityService(key_pool=pool)
+    pool.start()
+    try:
+        await _wait_for_depth(pool, "ec-p256", 3)
+        pooled = {_public_der(key.public_key()) for key in pool._pools["ec-p256"].keys}
+
+        for _ in range(2):
+            issued = await ca.issue_certificate(
+                session=db_session,
+                owner_id=1,
+                common_name="Pooled",
+                organization=None,
+                algorithm=LeafKeyAlgorithm.EC_P256,
+                actor_id=None,
+            )
+            certificate = x509.load_pem_x509_certificate(
+                issued.certificate_pem.encode("utf-8")
+            )
+            assert _public_der(certificate.public_key()) in pooled
+
+        await _wait_for_depth(pool, "ec-p256", 3)
+        stats = pool.stats()["ec-p256"]
+        assert (stats.hits, stats.misses, stats.generated) == (2, 0, 5)
+    finally:
+        pool.shutdown()
+
+    assert pool.stats()["ec-p256"].depth == 0
+
+
+async def test_health_reports_key_pool(client: AsyncClient) -> None:
+    """Pool depth and misses are exposed for monitoring."""
+    response = await client.get("/health/ca")
+
+    assert response.status_code == 200
+    assert set(response.json()["key_pool"]["rsa-2048"]) >= {"depth", "misses"}
@@ -0,0 +1,117 @@
+"""Tests for LTV material built from the managed CA's artifacts."""
+
+from __future__ import annotations
+
+import io
+from uuid import UUID
+
+import pytest
+from pyhanko.pdf_utils.reader import PdfFileReader
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.certificate_authority import CertificateAuthorityService
+from app.services.ltv_material import (
+    LTVMaterialCache,
+    LTVMaterialError,
+    get_ltv_material_cache,
+)
+from app.services.pdf_signing import PDFSigningService
+from app.services.pdf_verification import PDFVerificationService
+from tests.test_pdf_signing import (  # noqa: F401 - shared fixtures
+    ca_service,
+    create_minimal_pdf,
+    db_session,
+    root_ca,
+    user_certificate,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def test_material_is_cached_per_root_epoch(
+    ca_service: CertificateAuthorityService,
+    db_session: AsyncSession,
+    root_ca: None,
+) -> None:
+    """The payload is reused until a new CRL starts the next epoch."""
+    cache = get_ltv_material_cache()
+    cache.invalidate()
+
+    with pytest.raises(LTVMaterialError, match="No CRL"):
+        await cache.get(session=db_session)
+
+    await ca_service.generate_crl(session=db_session, actor_id=None)
+    first = await cache.get(session=db_session)
+    assert len(first.crls) == 1
+    assert await cache.get(session=db_session) is first
+
+    crl = await ca_service.generate_crl(session=db_session, actor_id=None)
+    second = await cache.get(session=db_session)
+
+    assert second.root_artifact_id == first.root_artifact_id
+    assert second.crl_artifact_id == crl.artifact.id != first.crl_artifact_id
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 3)
+    assert stats.size_bytes == second.size
+    cache.invalidate()
+
+
+async def test_material_expires_after_ttl(
+    ca_service: CertificateAuthorityService,
+    db_session: AsyncSession,
+    root_ca: None,
+) -> None:
+    """Other processes' CRLs are picked up once the TTL has passed."""
+    await ca_service.generate_crl(session=db_session, actor_id=None)
+    clock = FakeClock()
+    cache = LTVMaterialCache(ttl_seconds=60, clock=clock)
+
+    first = await cache.get(session=db_session)
+    clock.now = 59
+    assert await cache.get(session=db_session) is first
+    clock.now = 61
+    assert await cache.get(session=db_session) is not first
+
+
+async def test_embed_ltv_uses_local_chain_and_crl(
+    ca_service: CertificateAuthorityService,
+    db_session: AsyncSession,
+    user_certificate: tuple[str, int],
+) -> None:
+    """LTV signatures carry the root and CRL in the CMS and the DSS."""
+    cert_id, owner_id = user_certificate
+    await ca_service.generate_crl(session=db_session, actor_id=None)
+    cache = LTVMaterialCache(ttl_seconds=60)
+    service = PDFSigningService(ltv_material_cache=cache)
+
+    for _ in range(2):
+        result = await service.sign_pdf(
+            session=db_session,
+            pdf_data=create_minimal_pdf(),
+            certificate_id=UUID(cert_id),
+            user_id=owner_id,
+            embed_ltv=True,
+        )
+
+    assert result.ltv_embedded is True
+    assert (cache.stats().hits, cache.stats().misses) == (1, 1)
+
+    reader = PdfFileReader(io.BytesIO(result.signed_pdf))
+    dss = reader.root["/DSS"]
+    assert len(dss["/Certs"]) == 2
+    assert len(dss["/CRLs"]) == 1
+    signed_attrs = reader.embedded_signatures[0].signer_info["signed_attrs"]
+    assert "adobe_revocation_info_archival" in [
+        attr["type"].native for attr in signed_attrs
+    ]
+
+    report = await PDFVerificationService().verify_pdf(
+        session=db_session, pdf_data=result.signed_pdf
+    )
+    assert report.signatures[0].valid is True
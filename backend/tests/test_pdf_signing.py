@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
 import io
-from uuid import uuid4
+import json
+import zipfile
+from uuid import UUID, uuid4
 
 import pytest
+from asn1crypto import x509 as asn1_x509  # type: ignore[import-untyped]
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
 from httpx import AsyncClient
+from pyhanko.pdf_utils.incremental_writer import IncrementalPdfFileWriter
+from pyhanko.sign import signers
+from pyhanko.sign.signers.pdf_signer import PdfTBSDocument
+from pyhanko_certvalidator.registry import SimpleCertificateStore
 from pypdf import PdfReader, PdfWriter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import SigningExecutionMode
 from app.crud import certificate as certificate_crud
 from app.crud import seal as seal_crud
 from app.db.session import get_db
@@ -21,6 +33,7 @@ from app.services.certificate_authority import (
 from app.services.pdf_signing import (
     CertificateInvalidError,
     CertificateNotFoundError,
+    DigestSigningError,
     PDFSigningService,
     PDFValidationError,
     SealNotFoundError,
@@ -32,6 +45,7 @@ from app.services.pdf_verification import (
     PDFVerificationInputError,
     PDFVerificationService,
 )
+from app.services.signing_executor import SigningExecutor
 from app.services.storage import EncryptedStorageService
 
 
@@ -381,6 +395,69 @@ class TestPDFSigning:
 
         assert result.signed_pdf is not None
 
+    async def test_sign_pdf_visible_rejects_page_out_of_range(
+        self,
+        pdf_service: PDFSigningService,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """Visible signatures on a page past the end fail validation."""
+        cert_id, owner_id = user_certificate
+
+        with pytest.raises(PDFValidationError, match="out of range"):
+            await pdf_service.sign_pdf(
+                session=db_session,
+                pdf_data=create_multipage_pdf(2),
+                certificate_id=UUID(cert_id),
+                user_id=owner_id,
+                visibility=SignatureVisibility.VISIBLE,
+                coordinates=SignatureCoordinates(
+                    page=3, x=100, y=100, width=200, height=50
+                ),
+            )
+
+    async def test_sign_pdf_corrupted_body_fails_validation(
+        self,
+        pdf_service: PDFSigningService,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """Documents the signer cannot parse surface as validation errors."""
+        cert_id, owner_id = user_certificate
+
+        with pytest.raises(PDFValidationError, match="corrupted or invalid"):
+            await pdf_service.sign_pdf(
+                session=db_session,
+                pdf_data=b"%PDF-1.7\nnot really a pdf",
+                certificate_id=UUID(cert_id),
+                user_id=owner_id,
+            )
+
+    async def test_sign_already_signed_pdf_uses_new_field(
+        self,
+        pdf_service: PDFSigningService,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """Signing twice adds a second field instead of clashing with the first."""
+        cert_id, owner_id = user_certificate
+
+        first = await pdf_service.sign_pdf(
+            session=db_session,
+            pdf_data=create_minimal_pdf(),
+            certificate_id=UUID(cert_id),
+            user_id=owner_id,
+        )
+        second = await pdf_service.sign_pdf(
+            session=db_session,
+            pdf_data=first.signed_pdf,
+            certificate_id=UUID(cert_id),
+            user_id=owner_id,
+        )
+
+        fields = PdfReader(io.BytesIO(second.signed_pdf)).get_fields() or {}
+        assert {"Signature", "Signature2"} <= set(fields)
+
 
 class TestPDFVerification:
     """Tests for PDF signature verification."""
@@ -430,6 +507,110 @@ class TestPDFVerification:
             await verification_service.verify_pdf(session=db_session, pdf_data=pdf_data)
 
 
+async def prepare_remote_signature(
+    session: AsyncSession, certificate_id: str
+) -> tuple[bytes, io.BytesIO, object]:
+    """Prepare a PDF for interrupted signing the way a remote client would."""
+    certificate = await certificate_crud.get_certificate_by_id(
+        session=session, certificate_id=UUID(certificate_id)
+    )
+    assert certificate is not None
+    signing_cert = asn1_x509.Certificate.load(
+        x509.load_pem_x509_certificate(
+            certificate.certificate_pem.encode("utf-8")
+        ).public_bytes(serialization.Encoding.DER)
+    )
+    pdf_signer = signers.PdfSigner(
+        signers.PdfSignatureMetadata(field_name="Signature", md_algorithm="sha256"),
+        signer=signers.ExternalSigner(
+            signing_cert=signing_cert,
+            cert_registry=SimpleCertificateStore(),
+            signature_value=bytes(512),
+        ),
+    )
+    writer = IncrementalPdfFileWriter(io.BytesIO(create_minimal_pdf()))
+    prepared, _tbs, output = await pdf_signer.async_digest_doc_for_signing(
+        writer, bytes_reserved=16384
+    )
+    return prepared.document_digest, output, prepared
+
+
+class TestDigestSigning:
+    """Tests for two-phase signing of client-computed digests."""
+
+    async def test_sign_digest_completes_client_prepared_pdf(
+        self,
+        pdf_service: PDFSigningService,
+        verification_service: PDFVerificationService,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """The returned CMS finishes a document prepared on the client."""
+        cert_id, owner_id = user_certificate
+        digest, output, prepared = await prepare_remote_signature(db_session, cert_id)
+
+        result = await pdf_service.sign_digest(
+            session=db_session,
+            certificate_id=UUID(cert_id),
+            user_id=owner_id,
+            document_digest=digest,
+        )
+        await PdfTBSDocument.async_finish_signing(output, prepared, result.cms)
+
+        report = await verification_service.verify_pdf(
+            session=db_session, pdf_data=output.getvalue()
+        )
+        assert report.total_signatures == 1
+        assert report.signatures[0].valid is True
+
+    async def test_sign_digest_rejects_wrong_length(
+        self,
+        pdf_service: PDFSigningService,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """Digests that do not match the algorithm are rejected."""
+        cert_id, owner_id = user_certificate
+
+        with pytest.raises(DigestSigningError, match="32 bytes"):
+            await pdf_service.sign_digest(
+                session=db_session,
+                certificate_id=UUID(cert_id),
+                user_id=owner_id,
+                document_digest=b"short",
+            )
+
+    async def test_sign_digest_endpoint_returns_cms(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """The digest endpoint exchanges a base64 digest for a base64 CMS."""
+        from app.core.security import create_access_token
+
+        cert_id, owner_id = user_certificate
+        token = create_access_token(subject=str(owner_id), role="admin")
+        digest, output, prepared = await prepare_remote_signature(db_session, cert_id)
+
+        response = await client.post(
+            "/api/v1/pdf/sign/digest",
+            headers={"Authorization": f"Bearer {token}"},
+            json={
+                "certificate_id": cert_id,
+                "document_digest": base64.b64encode(digest).decode("ascii"),
+            },
+        )
+
+        assert response.status_code == 200
+        payload = response.json()
+        assert payload["digest_algorithm"] == "sha256"
+        cms = base64.b64decode(payload["cms"])
+        assert len(cms) == payload["cms_size"]
+        await PdfTBSDocument.async_finish_signing(output, prepared, cms)
+        assert PdfReader(io.BytesIO(output.getvalue())).get_fields()
+
+
 class TestBatchSigning:
     """Tests for batch PDF signing operations."""
 
@@ -505,6 +686,52 @@ class TestBatchSigning:
                 user_id=owner_id,
             )
 
+    async def test_batch_sign_is_bounded_and_ordered(
+        self,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Batch items run concurrently up to the limit and keep input order."""
+        cert_id, owner_id = user_certificate
+        monkeypatch.setattr(
+            "app.services.pdf_signing.settings.pdf_batch_concurrency", 2
+        )
+
+        class TrackingExecutor(SigningExecutor):
+            def __init__(self) -> None:
+                super().__init__(
+                    mode=SigningExecutionMode.INLINE, pool_size=8, max_queue=0
+                )
+                self.active = 0
+                self.peak = 0
+
+            async def run(self, pdf_data, signer, options, *, spool_output=False):  # type: ignore[no-untyped-def]
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                await asyncio.sleep(0.01)
+                self.active -= 1
+                return pdf_data + b"%signed"
+
+        executor = TrackingExecutor()
+        service = PDFSigningService(executor=executor)
+        pdfs = [(f"doc{i}.pdf", create_multipage_pdf(i + 1)) for i in range(5)]
+        pdfs.insert(2, ("broken.pdf", b"Not a PDF"))
+
+        results = await service.batch_sign_pdfs(
+            session=db_session,
+            pdfs=pdfs,
+            certificate_id=UUID(cert_id),
+            user_id=owner_id,
+        )
+
+        assert executor.peak == 2
+        assert isinstance(results[2], PDFValidationError)
+        for (_, pdf_data), result in zip(pdfs, results):
+            if isinstance(result, Exception):
+                continue
+            assert result.signed_pdf == pdf_data + b"%signed"
+
 
 class TestAPIEndpoints:
     """Tests for PDF signing API endpoints."""
@@ -573,6 +800,84 @@ class TestAPIEndpoints:
         assert response.headers.get("x-ltv-embedded") in {"true", "false"}
         assert response.headers.get("x-document-id")
         assert len(response.content) > len(pdf_data)
+        assert int(response.headers["content-length"]) == len(response.content)
+
+    async def test_verify_endpoint_validates_spooled_upload(
+        self,
+        client: AsyncClient,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """Test that a document signed via the API verifies as intact."""
+        from app.core.security import create_access_token
+
+        cert_id, owner_id = user_certificate
+        token = create_access_token(subject=str(owner_id), role="admin")
+        headers = {"Authorization": f"Bearer {token}"}
+        signed = await client.post(
+            "/api/v1/pdf/sign",
+            headers=headers,
+            files={
+                "pdf_file": ("test.pdf", create_multipage_pdf(3), "application/pdf")
+            },
+            data={"certificate_id": cert_id},
+        )
+        assert signed.status_code == 200
+
+        response = await client.post(
+            "/api/v1/pdf/verify",
+            headers=headers,
+            files={"pdf_file": ("signed.pdf", signed.content, "application/pdf")},
+        )
+
+        assert response.status_code == 200
+        payload = response.json()
+        assert payload["total_signatures"] == 1
+        assert payload["all_signatures_valid"] is True
+        assert payload["signatures"][0]["summary"].startswith("INTACT")
+
+    async def test_batch_sign_archive_streams_zip(
+        self,
+        client: AsyncClient,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """Test that the archive endpoint returns signed PDFs plus a manifest."""
+        from app.core.security import create_access_token
+
+        cert_id, owner_id = user_certificate
+        token = create_access_token(subject=str(owner_id), role="admin")
+        files = [
+            ("pdf_files", ("report.pdf", create_minimal_pdf(), "application/pdf")),
+            ("pdf_files", ("report.pdf", create_multipage_pdf(2), "application/pdf")),
+        ]
+
+        response = await client.post(
+            "/api/v1/pdf/sign/batch/archive",
+            headers={"Authorization": f"Bearer {token}"},
+            files=files,
+            data={"certificate_id": cert_id},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/zip"
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            names = set(archive.namelist())
+            assert names == {
+                "report-signed.pdf",
+                "report-signed-2.pdf",
+                "manifest.json",
+            }
+            manifest = json.loads(archive.read("manifest.json"))
+            assert manifest["total"] == 2
+            assert manifest["successful"] == 2
+            assert [item["filename"] for item in manifest["results"]] == [
+                "report.pdf",
+                "report.pdf",
+            ]
+            for item in manifest["results"]:
+                assert item["document_id"]
+                signed = archive.read(item["archive_name"])
+                assert len(signed) == item["file_size"]
+                assert PdfReader(io.BytesIO(signed)).get_fields()
 
     async def test_batch_sign_endpoint_unauthenticated(
         self, client: AsyncClient
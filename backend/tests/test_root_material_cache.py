@@ -0,0 +1,102 @@
+"""Tests for the in-memory root CA material cache."""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_session_factory
+from app.services.certificate_authority import CertificateAuthorityService, RootMaterial
+from app.services.root_material import RootMaterialCache
+from tests.test_pdf_signing import (  # noqa: F401 - shared fixtures
+    ca_service,
+    db_session,
+    root_ca,
+)
+
+
+async def test_root_material_is_decrypted_once(
+    db_session: AsyncSession, root_ca: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Later operations reuse the key pair until a new root artifact appears."""
+    cache = RootMaterialCache()
+    ca = CertificateAuthorityService(root_material_cache=cache)
+    loads = 0
+    load_key_pair = ca._load_key_pair
+
+    async def counting_load_key_pair(**kwargs):
+        nonlocal loads
+        loads += 1
+        return await load_key_pair(**kwargs)
+
+    monkeypatch.setattr(ca, "_load_key_pair", counting_load_key_pair)
+
+    first = await ca.export_root_certificate(session=db_session)
+    await ca.generate_crl(session=db_session, actor_id=None)
+    async with get_session_factory()() as other_session:
+        assert await ca.export_root_certificate(session=other_session) == first
+
+    stats = cache.stats()
+    assert loads == 1
+    assert (stats.hits, stats.misses) == (2, 1)
+    assert stats.root_artifact_id is not None
+
+    cache.invalidate()
+    await ca.export_root_certificate(session=db_session)
+    assert loads == 2
+    assert cache.stats().invalidations == 1
+
+
+async def test_concurrent_misses_share_one_load() -> None:
+    """Cold callers wait for the first load; a new artifact id reloads."""
+    cache = RootMaterialCache()
+    loaded: list[UUID] = []
+    release = asyncio.Event()
+
+    async def load(artifact_id: UUID) -> RootMaterial:
+        loaded.append(artifact_id)
+        await release.wait()
+        return object()  # type: ignore[return-value]
+
+    first_id = uuid4()
+    waiters = [asyncio.create_task(cache.get(first_id, load)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert loaded == [first_id]
+    assert all(result is results[0] for result in results)
+    assert cache.stats().coalesced == 4
+
+    second_id = uuid4()
+    assert await cache.get(second_id, load) is not results[0]
+    assert loaded == [first_id, second_id]
+    assert cache.stats().root_artifact_id == second_id
+
+
+async def test_failed_load_reaches_waiters_and_is_retried() -> None:
+    """A failing load is not cached; the next caller loads again."""
+    cache = RootMaterialCache()
+    attempts = 0
+
+    async def load(artifact_id: UUID) -> RootMaterial:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0)
+        if attempts == 1:
+            raise RuntimeError("storage unavailable")
+        return object()  # type: ignore[return-value]
+
+    artifact_id = uuid4()
+    results = await asyncio.gather(
+        cache.get(artifact_id, load),
+        cache.get(artifact_id, load),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    await cache.get(artifact_id, load)
+    assert attempts == 2
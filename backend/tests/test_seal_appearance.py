@@ -0,0 +1,146 @@
+"""Tests for pre-rendered seal appearances."""
+
+from __future__ import annotations
+
+import io
+from uuid import UUID, uuid4
+
+import pytest
+from PIL import Image
+from pypdf import PdfReader
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.pdf_signing import (
+    PDFSigningService,
+    SignatureCoordinates,
+    SignatureVisibility,
+)
+from app.services.seal_appearance import (
+    SealAppearance,
+    SealAppearanceCache,
+    SealAppearanceError,
+    render_seal_appearance,
+)
+from tests.test_pdf_signing import (  # noqa: F401 - shared fixtures
+    ca_service,
+    create_minimal_pdf,
+    db_session,
+    root_ca,
+    seal_image,
+    user_certificate,
+)
+
+
+def make_png(width: int = 120, height: int = 60) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGBA", (width, height), (200, 0, 0, 160)).save(output, "PNG")
+    return output.getvalue()
+
+
+def test_render_png_seal_to_single_page() -> None:
+    """A PNG seal renders into a one-page PDF with the image's dimensions."""
+    appearance = render_seal_appearance(make_png(120, 60))
+
+    assert (appearance.width, appearance.height) == (120, 60)
+    reader = PdfReader(io.BytesIO(appearance.pdf))
+    assert len(reader.pages) == 1
+    assert [float(v) for v in reader.pages[0].mediabox] == [0, 0, 120, 60]
+
+
+def test_render_rejects_unknown_format() -> None:
+    """Non-image payloads are reported instead of producing a broken stamp."""
+    with pytest.raises(SealAppearanceError):
+        render_seal_appearance(b"GIF89a not supported")
+
+
+def test_cache_is_keyed_by_seal_version() -> None:
+    """Different image versions of a seal are cached independently."""
+    cache = SealAppearanceCache(max_entries=2)
+    seal_id, old_version, new_version = uuid4(), uuid4(), uuid4()
+    appearance = SealAppearance(pdf=b"%PDF-", width=1, height=1)
+
+    cache.put(seal_id, old_version, appearance)
+    assert cache.get(seal_id, old_version) is appearance
+    assert cache.get(seal_id, new_version) is None
+
+    cache.put(seal_id, new_version, appearance)
+    cache.put(uuid4(), uuid4(), appearance)
+    assert cache.get(seal_id, old_version) is None
+    assert cache.invalidate(seal_id) is True
+    assert cache.get(seal_id, new_version) is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.invalidations) == (
+        1,
+        3,
+        1,
+        1,
+    )
+
+
+def image_subtypes(form) -> list[str]:  # type: ignore[no-untyped-def]
+    """Collect image XObjects reachable from a form XObject's resources."""
+    found: list[str] = []
+    for xobject in form.get("/Resources", {}).get("/XObject", {}).values():
+        xobject = xobject.get_object()
+        if xobject.get("/Subtype") == "/Image":
+            found.append("/Image")
+        else:
+            found.extend(image_subtypes(xobject))
+    return found
+
+
+class TestSealSigning:
+    """Tests for signing with a seal appearance."""
+
+    async def test_visible_signature_draws_cached_seal(
+        self,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+        seal_image: str,
+    ) -> None:
+        """The seal is rendered once and embedded in every visible signature."""
+        cert_id, owner_id = user_certificate
+        cache = SealAppearanceCache(max_entries=4)
+        service = PDFSigningService(seal_appearance_cache=cache)
+        coordinates = SignatureCoordinates(page=1, x=100, y=100, width=200, height=50)
+
+        for _ in range(2):
+            result = await service.sign_pdf(
+                session=db_session,
+                pdf_data=create_minimal_pdf(),
+                certificate_id=UUID(cert_id),
+                user_id=owner_id,
+                seal_id=UUID(seal_image),
+                visibility=SignatureVisibility.VISIBLE,
+                coordinates=coordinates,
+            )
+
+        stats = cache.stats()
+        assert (stats.size, stats.hits, stats.misses) == (1, 1, 1)
+
+        reader = PdfReader(io.BytesIO(result.signed_pdf))
+        widget = reader.pages[0]["/Annots"][0].get_object()
+        assert image_subtypes(widget["/AP"]["/N"].get_object()) == ["/Image"]
+
+    async def test_invisible_signature_skips_rendering(
+        self,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+        seal_image: str,
+    ) -> None:
+        """Invisible signatures check the seal without rendering it."""
+        cert_id, owner_id = user_certificate
+        cache = SealAppearanceCache(max_entries=4)
+        service = PDFSigningService(seal_appearance_cache=cache)
+
+        await service.sign_pdf(
+            session=db_session,
+            pdf_data=create_minimal_pdf(),
+            certificate_id=UUID(cert_id),
+            user_id=owner_id,
+            seal_id=UUID(seal_image),
+        )
+
+        stats = cache.stats()
+        assert (stats.size, stats.hits, stats.misses) == (0, 0, 0)
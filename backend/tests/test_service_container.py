@@ -0,0 +1,83 @@
+"""Tests for application-scoped services and lifespan warm-up."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+
+from app.api.dependencies.services import get_services
+from app.main import create_application
+from app.services import timestamp_authority
+from app.services.container import ServiceContainer
+from app.services.ltv_material import get_ltv_material_cache
+from app.services.signing_jobs import get_signing_job_worker
+from tests.test_pdf_signing import (  # noqa: F401 - shared fixtures
+    ca_service,
+    db_session,
+    root_ca,
+)
+
+
+def test_services_share_one_storage_service(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The master key is loaded once for every service in the container."""
+    monkeypatch.setattr("app.services.ltv_material._ltv_material_cache", None)
+    monkeypatch.setattr("app.services.ca_distribution._ca_distribution_cache", None)
+    monkeypatch.setattr("app.services.signing_idempotency._signed_result_store", None)
+    services = ServiceContainer.build()
+
+    assert services.certificate_authority._storage is services.storage
+    assert services.signing._storage is services.storage
+    assert services.signing._ltv_material is services.ltv_material
+    assert services.ltv_material._storage is services.storage
+    assert services.ca_distribution._storage is services.storage
+    assert services.signed_results._storage is services.storage
+    assert get_ltv_material_cache() is services.ltv_material
+    assert services.verification._ca_service is services.certificate_authority
+    assert services.signing_jobs._signing is services.signing
+
+
+async def test_lifespan_builds_and_warms_services(root_ca: None) -> None:
+    """Startup loads the trust roots and hands shared services to workers."""
+    application = create_application()
+
+    async with application.router.lifespan_context(application):
+        services = application.state.services
+        assert isinstance(services, ServiceContainer)
+        assert services.verification._trust_roots is not None
+        assert get_signing_job_worker()._signing is services.signing
+        assert timestamp_authority._ca_service is services.certificate_authority
+
+    assert application.state.services is None
+    assert timestamp_authority._ca_service is None
+
+
+def test_services_built_on_first_use_serve_the_tsa(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Without a lifespan the lazily built container still backs the TSA."""
+    monkeypatch.setattr("app.services.timestamp_authority._ca_service", None)
+    application = create_application()
+
+    services = get_services(SimpleNamespace(app=application))  # type: ignore[arg-type]
+
+    assert timestamp_authority._ca_service is services.certificate_authority
+
+
+async def test_requests_reuse_application_services(client: AsyncClient) -> None:
+    """Endpoints receive the same instances on every request."""
+    from app.core.security import create_access_token
+    from app.main import app
+
+    token = create_access_token(subject="1", role="admin")
+    seen = []
+    for _ in range(2):
+        response = await client.get(
+            "/api/v1/ca/crl", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 200
+        seen.append(app.state.services)
+
+    assert isinstance(seen[0], ServiceContainer)
+    assert seen[0] is seen[1]
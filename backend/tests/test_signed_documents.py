@@ -0,0 +1,129 @@
+"""Tests for downloading persisted signed documents."""
+
+from __future__ import annotations
+
+import hashlib
+
+import pytest
+from httpx import AsyncClient
+
+from app.api.endpoints.pdf_signing import _parse_byte_range, _UnsatisfiableRange
+from app.crud.user import create_user
+from app.db.session import get_session_factory
+from app.models.user import UserRole
+from app.services.signing_idempotency import get_signed_result_store
+from tests.test_pdf_signing import (  # noqa: F401 - shared fixtures
+    ca_service,
+    create_minimal_pdf,
+    db_session,
+    root_ca,
+    user_certificate,
+)
+
+
+def test_byte_ranges_follow_http_semantics() -> None:
+    """Open-ended, suffix and oversized ranges resolve within the document."""
+    assert _parse_byte_range("bytes=0-99", 1000) == (0, 99)
+    assert _parse_byte_range("bytes=900-", 1000) == (900, 999)
+    assert _parse_byte_range("bytes=-100", 1000) == (900, 999)
+    assert _parse_byte_range("bytes=990-2000", 1000) == (990, 999)
+    assert _parse_byte_range("bytes=0-1,5-9", 1000) is None
+    assert _parse_byte_range("items=0-1", 1000) is None
+    with pytest.raises(_UnsatisfiableRange):
+        _parse_byte_range("bytes=1000-", 1000)
+
+
+class TestSignedDocumentAPI:
+    """Tests for GET /pdf/documents/{document_id}."""
+
+    async def test_persisted_document_supports_etag_and_range(
+        self,
+        client: AsyncClient,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """A persisted document downloads whole, revalidates and resumes."""
+        from app.core.security import create_access_token
+
+        cert_id, owner_id = user_certificate
+        token = create_access_token(subject=str(owner_id), role="admin")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        signed = await client.post(
+            "/api/v1/pdf/sign",
+            headers=headers,
+            files={"pdf_file": ("test.pdf", create_minimal_pdf(), "application/pdf")},
+            data={"certificate_id": cert_id, "persist": "true"},
+        )
+        assert signed.status_code == 200
+        url = f"/api/v1/pdf/documents/{signed.headers['x-document-id']}"
+        before = get_signed_result_store().stats()
+
+        full = await client.get(url, headers=headers)
+        assert full.status_code == 200
+        assert full.content == signed.content
+        etag = full.headers["etag"]
+        assert etag == f'"{hashlib.sha256(signed.content).hexdigest()}"'
+        assert full.headers["accept-ranges"] == "bytes"
+        assert "test-signed.pdf" in full.headers["content-disposition"]
+
+        cached = await client.get(url, headers={**headers, "If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        resumed = await client.get(
+            url, headers={**headers, "Range": "bytes=100-", "If-Range": etag}
+        )
+        size = len(signed.content)
+        assert resumed.status_code == 206
+        assert resumed.headers["content-range"] == f"bytes 100-{size - 1}/{size}"
+        assert resumed.content == signed.content[100:]
+
+        stale = await client.get(
+            url, headers={**headers, "Range": "bytes=100-", "If-Range": '"other"'}
+        )
+        assert stale.status_code == 200
+        assert stale.content == signed.content
+
+        beyond = await client.get(url, headers={**headers, "Range": f"bytes={size}-"})
+        assert beyond.status_code == 416
+        assert beyond.headers["content-range"] == f"bytes */{size}"
+
+        stats = get_signed_result_store().stats()
+        assert stats.download_misses == before.download_misses + 1
+        assert stats.download_hits == before.download_hits + 2
+
+    async def test_documents_are_private_to_their_owner(
+        self,
+        client: AsyncClient,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """Other users and unknown ids get 404."""
+        from app.core.security import create_access_token
+
+        cert_id, owner_id = user_certificate
+        token = create_access_token(subject=str(owner_id), role="admin")
+        signed = await client.post(
+            "/api/v1/pdf/sign",
+            headers={"Authorization": f"Bearer {token}"},
+            files={"pdf_file": ("test.pdf", create_minimal_pdf(), "application/pdf")},
+            data={"certificate_id": cert_id, "persist": "true"},
+        )
+        assert signed.status_code == 200
+
+        async with get_session_factory()() as session:
+            stranger_user = await create_user(
+                session=session,
+                email="stranger@example.com",
+                password="StrangerPass123!",
+                role=UserRole.USER,
+            )
+        token = create_access_token(subject=str(stranger_user.id), role="user")
+        stranger = {"Authorization": f"Bearer {token}"}
+        response = await client.get(
+            f"/api/v1/pdf/documents/{signed.headers['x-document-id']}",
+            headers=stranger,
+        )
+        assert response.status_code == 404
+
+        missing = await client.get("/api/v1/pdf/documents/unknown", headers=stranger)
+        assert missing.status_code == 404
@@ -0,0 +1,137 @@
+"""Tests for the prepared signer cache."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.services.certificate_authority import (
+    CertificateAuthorityService,
+    LeafKeyAlgorithm,
+    RootKeyAlgorithm,
+)
+from app.services.pdf_signing import CertificateInvalidError, PDFSigningService
+from app.services.signer_cache import SignerCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_hits_misses_and_lru_eviction() -> None:
+    """Entries are returned until evicted by newer certificates."""
+    cache = SignerCache(max_entries=2, ttl_seconds=60)
+    first, second, third = uuid4(), uuid4(), uuid4()
+    signer_a, signer_b, signer_c = object(), object(), object()
+
+    assert cache.get(first) is None
+    cache.put(first, signer_a)  # type: ignore[arg-type]
+    cache.put(second, signer_b)  # type: ignore[arg-type]
+    assert cache.get(first) is signer_a
+    cache.put(third, signer_c)  # type: ignore[arg-type]
+
+    assert cache.get(second) is None
+    assert cache.get(first) is signer_a
+    assert cache.get(third) is signer_c
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions) == (3, 2, 1)
+    assert stats.size == 2
+
+
+def test_cache_respects_ttl_and_certificate_expiry() -> None:
+    """Entries expire after the TTL or the certificate's not-after time."""
+    clock = _Clock()
+    cache = SignerCache(max_entries=4, ttl_seconds=60, clock=clock)
+    long_lived, short_lived, expired = uuid4(), uuid4(), uuid4()
+    now = datetime.now(timezone.utc)
+
+    cache.put(long_lived, object(), not_after=now + timedelta(days=1))  # type: ignore[arg-type]
+    cache.put(short_lived, object(), not_after=now + timedelta(seconds=10))  # type: ignore[arg-type]
+    cache.put(expired, object(), not_after=now - timedelta(seconds=1))  # type: ignore[arg-type]
+    assert cache.stats().size == 2
+
+    clock.now += 30
+    assert cache.get(short_lived) is None
+    assert cache.get(long_lived) is not None
+
+    clock.now += 31
+    assert cache.get(long_lived) is None
+
+
+def test_invalidate_and_disabled_cache() -> None:
+    """Invalidation removes entries and a zero-sized cache stores nothing."""
+    cache = SignerCache(max_entries=4, ttl_seconds=60)
+    certificate_id = uuid4()
+    cache.put(certificate_id, object())  # type: ignore[arg-type]
+
+    assert cache.invalidate(certificate_id) is True
+    assert cache.invalidate(certificate_id) is False
+    assert cache.get(certificate_id) is None
+    assert cache.stats().invalidations == 1
+
+    disabled = SignerCache(max_entries=0, ttl_seconds=60)
+    disabled.put(certificate_id, object())  # type: ignore[arg-type]
+    assert disabled.get(certificate_id) is None
+
+
+@pytest.fixture
+async def db_session() -> AsyncSession:
+    async for session in get_db():
+        return session
+
+
+async def test_signing_service_reuses_signer_until_revoked(
+    db_session: AsyncSession,
+) -> None:
+    """Hot certificates skip key decryption; revocation drops the entry."""
+    ca_service = CertificateAuthorityService()
+    await ca_service.generate_root_ca(
+        session=db_session,
+        algorithm=RootKeyAlgorithm.EC_P256,
+        common_name="Cache Root CA",
+        organization="Test Org",
+        actor_id=None,
+        validity_days=365,
+    )
+    issued = await ca_service.issue_certificate(
+        session=db_session,
+        owner_id=1,
+        common_name="Cache User",
+        organization="Test Org",
+        algorithm=LeafKeyAlgorithm.EC_P256,
+        actor_id=None,
+        validity_days=365,
+    )
+    certificate_id = UUID(str(issued.certificate.id))
+    cache = SignerCache(max_entries=4, ttl_seconds=60)
+    service = PDFSigningService(signer_cache=cache)
+
+    signers = []
+    for _ in range(2):
+        certificate = await service._load_certificate(
+            session=db_session, certificate_id=certificate_id, user_id=1
+        )
+        signers.append(
+            await service._create_signer(session=db_session, certificate=certificate)
+        )
+
+    assert signers[0] is signers[1]
+    assert (cache.stats().hits, cache.stats().misses) == (1, 1)
+
+    await ca_service.revoke_certificate(
+        session=db_session, certificate=certificate, actor_id=None
+    )
+    with pytest.raises(CertificateInvalidError, match="not active"):
+        await service._load_certificate(
+            session=db_session, certificate_id=certificate_id, user_id=1
+        )
+    assert cache.stats().size == 0
+    assert cache.stats().invalidations == 1
@@ -0,0 +1,103 @@
+"""Smoke tests keeping the signing, key and CRL benchmark suites runnable."""
+
+from __future__ import annotations
+
+import io
+
+from pypdf import PdfReader
+
+from app.services.certificate_authority import LeafKeyAlgorithm, RootKeyAlgorithm
+from app.services.pdf_signing import SignatureVisibility
+from benchmarks import crl as crl_benchmarks
+from benchmarks import keys as key_benchmarks
+from benchmarks.signing import build_scenarios, generate_pdf, parse_size, run_benchmarks
+
+
+def test_generated_pdfs_stay_within_target() -> None:
+    """Documents fill the requested size without exceeding it."""
+    for size in ("10KB", "2MB"):
+        target = parse_size(size)
+        pdf = generate_pdf(target)
+
+        assert target - 4096 <= len(pdf) <= target
+        assert len(PdfReader(io.BytesIO(pdf)).pages) >= 1
+    assert generate_pdf(parse_size("10KB")) == generate_pdf(parse_size("10KB"))
+
+
+def test_large_documents_get_fewer_iterations() -> None:
+    """The per-scenario byte budget bounds runs for large documents."""
+    scenarios = build_scenarios(
+        sizes=[parse_size("10KB"), parse_size("50MB")],
+        keys=list(LeafKeyAlgorithm),
+        visibilities=list(SignatureVisibility),
+        features=["plain", "tsa-ltv"],
+        interfaces=["service", "asgi"],
+        operations=["sign", "batch"],
+        iterations=20,
+        batch_size=10,
+    )
+
+    assert len(scenarios) == 2 * 2 * len(LeafKeyAlgorithm) * 2 * 2 * 2
+    small = next(s for s in scenarios if s.size == parse_size("10KB"))
+    large_batch = next(
+        s for s in scenarios if s.size == parse_size("50MB") and s.operation == "batch"
+    )
+    assert small.iterations == 20
+    assert (large_batch.documents, large_batch.iterations) == (5, 3)
+    assert len({s.name for s in scenarios}) == len(scenarios)
+
+
+async def test_report_covers_every_scenario() -> None:
+    """A minimal sweep signs through both interfaces and reports each run."""
+    scenarios = build_scenarios(
+        sizes=[parse_size("10KB")],
+        keys=[LeafKeyAlgorithm.EC_P256],
+        visibilities=[SignatureVisibility.INVISIBLE],
+        features=["plain"],
+        interfaces=["service", "asgi"],
+        operations=["sign", "batch"],
+        iterations=1,
+        batch_size=2,
+    )
+
+    report = await run_benchmarks(scenarios, warmup=0)
+
+    assert report["version"] == 1
+    results = report["results"]
+    assert [result["name"] for result in results] == [s.name for s in scenarios]
+    for result in results:
+        assert result["throughput_docs_per_second"] > 0
+        assert result["latency_p99_ms"] >= result["latency_p50_ms"]
+        assert result["peak_rss_mib"] > 0
+
+
+async def test_key_report_covers_each_operation_and_algorithm() -> None:
+    """Root key generation sweeps root keys; the other operations leaf keys."""
+    report = await key_benchmarks.run_benchmarks(
+        operations=key_benchmarks.OPERATIONS,
+        root_keys=[RootKeyAlgorithm.ED25519],
+        leaf_keys=[LeafKeyAlgorithm.EC_P384, LeafKeyAlgorithm.ED25519],
+        iterations=1,
+        warmup=0,
+    )
+
+    assert [result["name"] for result in report["results"]] == [
+        "root-keygen/ed25519",
+        "keygen/ec-p384",
+        "keygen/ed25519",
+        "issue/ec-p384",
+        "issue/ed25519",
+        "sign/ec-p384",
+        "sign/ed25519",
+    ]
+    assert all(r["throughput_ops_per_second"] > 0 for r in report["results"])
+
+
+async def test_crl_report_grows_with_revocations() -> None:
+    """Each size tops up the revoked rows and reports one CRL run."""
+    report = await crl_benchmarks.run_benchmarks(sizes=[200, 50])
+
+    results = report["results"]
+    assert [result["name"] for result in results] == ["crl/50", "crl/200"]
+    assert results[0]["crl_bytes"] < results[1]["crl_bytes"]
+    assert all(result["entries_per_second"] > 0 for result in results)
@@ -0,0 +1,178 @@
+"""Tests for the PDF signing executor backends."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from asn1crypto import keys as asn1_keys  # type: ignore[import-untyped]
+from asn1crypto import x509 as asn1_x509
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+from httpx import AsyncClient
+from pyhanko.sign import signers
+from pyhanko_certvalidator.registry import SimpleCertificateStore
+from pypdf import PdfReader, PdfWriter
+
+from app.core.config import SigningExecutionMode
+from app.main import app
+from app.services.signing_executor import (
+    SignatureOptions,
+    SigningExecutor,
+    SigningQueueFullError,
+)
+from app.services.spool import SpooledFile
+
+
+def _minimal_pdf() -> bytes:
+    writer = PdfWriter()
+    writer.add_blank_page(width=612, height=792)
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+def _self_signed_signer() -> signers.SimpleSigner:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "Executor Test")])
+    now = datetime.now(timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(minutes=1))
+        .not_valid_after(now + timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    return signers.SimpleSigner(
+        signing_cert=asn1_x509.Certificate.load(
+            certificate.public_bytes(serialization.Encoding.DER)
+        ),
+        signing_key=asn1_keys.PrivateKeyInfo.load(
+            key.private_bytes(
+                encoding=serialization.Encoding.DER,
+                format=serialization.PrivateFormat.PKCS8,
+                encryption_algorithm=serialization.NoEncryption(),
+            )
+        ),
+        cert_registry=SimpleCertificateStore(),
+        signature_mechanism=None,
+    )
+
+
+def _assert_signed(signed_pdf: bytes) -> None:
+    reader = PdfReader(io.BytesIO(signed_pdf))
+    fields = reader.get_fields() or {}
+    assert "Signature" in fields
+    assert fields["Signature"].get("/FT") == "/Sig"
+
+
+@pytest.mark.parametrize(
+    "mode",
+    [SigningExecutionMode.INLINE, SigningExecutionMode.THREAD],
+)
+async def test_executor_signs_document(mode: SigningExecutionMode) -> None:
+    """Inline and thread backends produce a signed PDF and count completions."""
+    executor = SigningExecutor(mode=mode, pool_size=2, max_queue=2)
+    try:
+        signed_pdf = await executor.run(
+            _minimal_pdf(), _self_signed_signer(), SignatureOptions()
+        )
+    finally:
+        executor.shutdown()
+
+    _assert_signed(signed_pdf)
+    stats = executor.stats()
+    assert stats.completed == 1
+    assert stats.in_flight == 0
+
+
+async def test_process_executor_signs_visible_document() -> None:
+    """Process workers rebuild the signer from the shipped key material."""
+    executor = SigningExecutor(
+        mode=SigningExecutionMode.PROCESS,
+        pool_size=1,
+        max_queue=4,
+        max_tasks_per_child=1,
+    )
+    signer = _self_signed_signer()
+    options = SignatureOptions(page_index=0, box=(10, 10, 110, 60), reason="Test")
+    try:
+        first, second = await asyncio.gather(
+            executor.run(_minimal_pdf(), signer, options),
+            executor.run(_minimal_pdf(), signer, options),
+        )
+    finally:
+        executor.shutdown()
+
+    _assert_signed(first)
+    _assert_signed(second)
+    stats = executor.stats()
+    assert stats.completed == 2
+    assert stats.max_tasks_per_child == 1
+
+
+@pytest.mark.parametrize(
+    "mode",
+    [SigningExecutionMode.THREAD, SigningExecutionMode.PROCESS],
+)
+async def test_executor_spools_signed_output(mode: SigningExecutionMode) -> None:
+    """With ``spool_output`` the signed PDF is written to disk, not returned."""
+    executor = SigningExecutor(mode=mode, pool_size=1, max_queue=2)
+    try:
+        signed = await executor.run(
+            _minimal_pdf(), _self_signed_signer(), SignatureOptions(), spool_output=True
+        )
+    finally:
+        executor.shutdown()
+
+    assert isinstance(signed, SpooledFile)
+    try:
+        with open(signed.path, "rb") as handle:
+            data = handle.read()
+        assert len(data) == signed.size
+        _assert_signed(data)
+    finally:
+        signed.unlink()
+    assert not os.path.exists(signed.path)
+
+
+async def test_executor_rejects_when_queue_is_full() -> None:
+    """Work beyond pool size plus queue depth is rejected immediately."""
+    executor = SigningExecutor(
+        mode=SigningExecutionMode.THREAD, pool_size=1, max_queue=0
+    )
+    signer = _self_signed_signer()
+    try:
+        results = await asyncio.gather(
+            executor.run(_minimal_pdf(), signer, SignatureOptions()),
+            executor.run(_minimal_pdf(), signer, SignatureOptions()),
+            return_exceptions=True,
+        )
+    finally:
+        executor.shutdown()
+
+    assert isinstance(results[0], bytes)
+    assert isinstance(results[1], SigningQueueFullError)
+    stats = executor.stats()
+    assert stats.rejected == 1
+    assert stats.completed == 1
+
+
+async def test_health_signing_reports_pool_stats() -> None:
+    """The signing health endpoint exposes pool configuration and load."""
+    async with AsyncClient(app=app, base_url="http://testserver") as client:
+        response = await client.get("/health/signing")
+
+    assert response.status_code == 200
+    signing = response.json()["signing"]
+    assert signing["mode"] in {mode.value for mode in SigningExecutionMode}
+    assert signing["pool_size"] >= 1
+    assert signing["in_flight"] == 0
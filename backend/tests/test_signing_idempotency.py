@@ -0,0 +1,152 @@
+"""Tests for idempotent signing and the stored signed-document cache."""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.audit_log import AuditLog
+from app.models.signed_document import SignedDocument
+from app.services.pdf_signing import PDFSigningService, SignatureVisibility
+from app.services.signing_idempotency import SignedResultStore, request_fingerprint
+from tests.test_pdf_signing import (  # noqa: F401 - shared fixtures
+    ca_service,
+    create_minimal_pdf,
+    db_session,
+    root_ca,
+    user_certificate,
+)
+
+
+async def _count_signature_audits(session: AsyncSession) -> int:
+    return await session.scalar(
+        select(func.count())
+        .select_from(AuditLog)
+        .where(AuditLog.event_type == "pdf.signature.applied")
+    )
+
+
+class TestIdempotentSigningAPI:
+    """Tests for replaying repeated /pdf/sign requests."""
+
+    @pytest.fixture(autouse=True)
+    def enable_idempotency(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            "app.api.endpoints.pdf_signing.settings.pdf_idempotency_enabled", True
+        )
+
+    async def test_retry_is_replayed_without_resigning(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """An identical upload returns the stored document and no new audit row."""
+        from app.core.security import create_access_token
+
+        cert_id, owner_id = user_certificate
+        token = create_access_token(subject=str(owner_id), role="admin")
+        pdf_data = create_minimal_pdf()
+
+        responses = [
+            await client.post(
+                "/api/v1/pdf/sign",
+                headers={"Authorization": f"Bearer {token}"},
+                files={"pdf_file": ("test.pdf", pdf_data, "application/pdf")},
+                data={"certificate_id": cert_id},
+            )
+            for _ in range(2)
+        ]
+
+        first, retry = responses
+        assert first.status_code == retry.status_code == 200
+        assert "idempotent-replayed" not in first.headers
+        assert retry.headers["idempotent-replayed"] == "true"
+        assert retry.headers["x-document-id"] == first.headers["x-document-id"]
+        assert retry.content == first.content
+        assert await _count_signature_audits(db_session) == 1
+
+    async def test_reused_key_with_different_document_is_rejected(
+        self,
+        client: AsyncClient,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """A client key only ever names one request."""
+        from app.core.security import create_access_token
+
+        cert_id, owner_id = user_certificate
+        headers = {
+            "Authorization": (
+                f"Bearer {create_access_token(subject=str(owner_id), role='admin')}"
+            ),
+            "Idempotency-Key": "invoice-42",
+        }
+
+        first = await client.post(
+            "/api/v1/pdf/sign",
+            headers=headers,
+            files={"pdf_file": ("a.pdf", create_minimal_pdf(), "application/pdf")},
+            data={"certificate_id": cert_id},
+        )
+        conflicting = await client.post(
+            "/api/v1/pdf/sign",
+            headers=headers,
+            files={"pdf_file": ("a.pdf", create_minimal_pdf(), "application/pdf")},
+            data={"certificate_id": cert_id, "reason": "Approved"},
+        )
+
+        assert first.status_code == 200
+        assert conflicting.status_code == 400
+
+
+async def test_store_evicts_oldest_documents_beyond_capacity(
+    db_session: AsyncSession,
+    user_certificate: tuple[str, int],
+) -> None:
+    """Only the newest ``max_entries`` signed documents are kept."""
+    cert_id, owner_id = user_certificate
+    service = PDFSigningService()
+    store = SignedResultStore(
+        ttl_seconds=60, max_entries=2, max_document_bytes=1024 * 1024
+    )
+
+    document_ids = []
+    for padding in range(3):
+        pdf_data = create_minimal_pdf() + b"\n" * padding
+
+        async def sign(pdf_data: bytes = pdf_data):
+            return await service.sign_pdf(
+                session=db_session,
+                pdf_data=pdf_data,
+                certificate_id=UUID(cert_id),
+                user_id=owner_id,
+            )
+
+        fingerprint = await request_fingerprint(
+            pdf_data,
+            certificate_id=UUID(cert_id),
+            seal_id=None,
+            visibility=SignatureVisibility.INVISIBLE,
+            coordinates=None,
+            metadata=None,
+            use_tsa=False,
+            embed_ltv=False,
+        )
+        result, replayed = await store.sign_once(
+            session=db_session,
+            owner_id=owner_id,
+            idempotency_key=None,
+            fingerprint=fingerprint,
+            sign=sign,
+        )
+        assert not replayed
+        document_ids.append(result.document_id)
+
+    stored = await db_session.scalars(select(SignedDocument.document_id))
+    assert set(stored) == set(document_ids[1:])
+    stats = store.stats()
+    assert (stats.stored, stats.evictions, stats.misses) == (3, 1, 3)
@@ -0,0 +1,356 @@
+"""Tests for asynchronous signing jobs."""
+
+from __future__ import annotations
+
+import io
+import json
+import zipfile
+from datetime import timedelta
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+from httpx import AsyncClient
+from pypdf import PdfReader
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import signing_job as signing_job_crud
+from app.models.audit_log import AuditLog
+from app.models.signing_job import SigningJobItemStatus, SigningJobStatus
+from app.services.signing_jobs import (
+    SigningJobLimitError,
+    SigningJobNotFoundError,
+    SigningJobService,
+    SigningJobWorker,
+    job_directory,
+)
+from app.services.spool import UploadSpool
+from tests.test_pdf_signing import (  # noqa: F401 - shared fixtures
+    ca_service,
+    create_minimal_pdf,
+    create_multipage_pdf,
+    db_session,
+    root_ca,
+    user_certificate,
+)
+
+
+@pytest.fixture(autouse=True)
+def job_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep job documents inside the test's temporary directory."""
+    monkeypatch.setattr("app.services.signing_jobs.settings.pdf_job_dir", tmp_path)
+    return tmp_path
+
+
+def make_worker() -> SigningJobWorker:
+    return SigningJobWorker(
+        concurrency=1,
+        poll_interval=0.01,
+        claim_timeout=timedelta(minutes=5),
+        retention=timedelta(hours=1),
+    )
+
+
+async def drain(worker: SigningJobWorker) -> int:
+    processed = 0
+    while await worker.run_once():
+        processed += 1
+    return processed
+
+
+class TestSigningJobService:
+    """Tests for job submission and background processing."""
+
+    async def test_job_signs_documents_and_reports_failures(
+        self,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """Workers sign every queued document and record per-item failures."""
+        cert_id, owner_id = user_certificate
+        spool = UploadSpool()
+        documents = [
+            ("a.pdf", await spool.add(io.BytesIO(create_minimal_pdf()))),
+            ("broken.pdf", await spool.add(io.BytesIO(b"%PDF-1.4\nnot really a pdf"))),
+            ("b.pdf", await spool.add(io.BytesIO(create_multipage_pdf(2)))),
+        ]
+
+        service = SigningJobService()
+        job = await service.submit_job(
+            session=db_session,
+            owner_id=owner_id,
+            documents=documents,
+            certificate_id=UUID(cert_id),
+        )
+        spool.detach()
+        assert job.status == SigningJobStatus.QUEUED.value
+        assert job.total_items == 3
+
+        assert await drain(make_worker()) == 3
+
+        job_id = job.id
+        db_session.expire_all()
+        job = await service.get_job(
+            session=db_session, job_id=job_id, owner_id=owner_id
+        )
+        assert job.status == SigningJobStatus.COMPLETED.value
+        assert job.succeeded_items == 2
+        assert job.failed_items == 1
+        assert job.started_at is not None
+        assert job.finished_at is not None
+
+        items = await signing_job_crud.list_job_items(session=db_session, job_id=job_id)
+        assert [item.status for item in items] == [
+            SigningJobItemStatus.SUCCEEDED.value,
+            SigningJobItemStatus.FAILED.value,
+            SigningJobItemStatus.SUCCEEDED.value,
+        ]
+        assert items[1].error
+        for item in items:
+            assert not Path(item.input_path).exists()
+        signed = Path(items[0].output_path).read_bytes()
+        assert len(signed) == items[0].file_size
+        assert PdfReader(io.BytesIO(signed)).get_fields()
+
+        audit_result = await db_session.execute(
+            select(AuditLog).where(AuditLog.event_type == "pdf.signature.job_applied")
+        )
+        audits = audit_result.scalars().all()
+        assert len(audits) == 2
+        assert {audit.meta["document_id"] for audit in audits} == {
+            items[0].document_id,
+            items[2].document_id,
+        }
+        for audit in audits:
+            assert audit.actor_id == owner_id
+            assert audit.meta["job_id"] == str(job_id)
+            assert audit.meta["certificate_id"] == cert_id
+
+    async def test_submit_rejects_oversized_job(
+        self,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Jobs above the configured document limit are rejected up front."""
+        cert_id, owner_id = user_certificate
+        monkeypatch.setattr(
+            "app.services.signing_jobs.settings.pdf_job_max_documents", 1
+        )
+        spool = UploadSpool()
+        documents = [
+            ("a.pdf", await spool.add(io.BytesIO(create_minimal_pdf()))),
+            ("b.pdf", await spool.add(io.BytesIO(create_minimal_pdf()))),
+        ]
+
+        with pytest.raises(SigningJobLimitError):
+            await SigningJobService().submit_job(
+                session=db_session,
+                owner_id=owner_id,
+                documents=documents,
+                certificate_id=UUID(cert_id),
+            )
+        spool.close()
+
+    async def test_delete_job_removes_documents(
+        self,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """Deleting a job drops its rows and its directory."""
+        cert_id, owner_id = user_certificate
+        spool = UploadSpool()
+        service = SigningJobService()
+        job = await service.submit_job(
+            session=db_session,
+            owner_id=owner_id,
+            documents=[("a.pdf", await spool.add(io.BytesIO(create_minimal_pdf())))],
+            certificate_id=UUID(cert_id),
+        )
+        spool.detach()
+        assert job_directory(job.id).exists()
+
+        await service.delete_job(session=db_session, job_id=job.id, owner_id=owner_id)
+
+        assert not job_directory(job.id).exists()
+        assert await make_worker().run_once() is False
+        with pytest.raises(SigningJobNotFoundError):
+            await service.get_job(session=db_session, job_id=job.id, owner_id=owner_id)
+
+    async def test_stale_claims_are_requeued(
+        self,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """Items claimed by a worker that went away return to the queue."""
+        cert_id, owner_id = user_certificate
+        spool = UploadSpool()
+        await SigningJobService().submit_job(
+            session=db_session,
+            owner_id=owner_id,
+            documents=[("a.pdf", await spool.add(io.BytesIO(create_minimal_pdf())))],
+            certificate_id=UUID(cert_id),
+        )
+        spool.detach()
+
+        claimed = await signing_job_crud.claim_next_item(session=db_session)
+        assert claimed is not None
+        assert await signing_job_crud.claim_next_item(session=db_session) is None
+
+        worker = SigningJobWorker(
+            concurrency=1,
+            poll_interval=0.01,
+            claim_timeout=timedelta(0),
+            retention=timedelta(hours=1),
+        )
+        await worker.run_maintenance()
+
+        assert await drain(make_worker()) == 1
+
+    async def test_items_failing_every_claim_are_not_requeued(
+        self,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """A document that keeps stalling its worker fails after the last attempt."""
+        cert_id, owner_id = user_certificate
+        spool = UploadSpool()
+        service = SigningJobService()
+        job = await service.submit_job(
+            session=db_session,
+            owner_id=owner_id,
+            documents=[("a.pdf", await spool.add(io.BytesIO(create_minimal_pdf())))],
+            certificate_id=UUID(cert_id),
+        )
+        spool.detach()
+        job_id = job.id
+        worker = SigningJobWorker(
+            concurrency=1,
+            poll_interval=0.01,
+            claim_timeout=timedelta(0),
+            retention=timedelta(hours=1),
+            max_attempts=2,
+        )
+
+        # Handing an item back unsigned does not use up an attempt.
+        claimed = await signing_job_crud.claim_next_item(session=db_session)
+        assert claimed is not None
+        await signing_job_crud.requeue_item(session=db_session, item_id=claimed.id)
+        for _ in range(2):
+            claimed = await signing_job_crud.claim_next_item(session=db_session)
+            assert claimed is not None
+            await worker.run_maintenance()
+
+        assert await signing_job_crud.claim_next_item(session=db_session) is None
+        db_session.expire_all()
+        finished = await service.get_job(
+            session=db_session, job_id=job_id, owner_id=owner_id
+        )
+        assert finished.status == SigningJobStatus.FAILED.value
+        assert finished.failed_items == 1
+        (item,) = await signing_job_crud.list_job_items(
+            session=db_session, job_id=job_id
+        )
+        assert item.status == SigningJobItemStatus.FAILED.value
+        assert item.attempts == 2
+        assert item.error == "Signing did not finish after 2 attempt(s)"
+        assert not Path(item.input_path).exists()
+
+
+class TestSigningJobEndpoints:
+    """Tests for the signing job API."""
+
+    async def test_submit_poll_and_download(
+        self,
+        client: AsyncClient,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """A job submitted over HTTP can be polled and downloaded once signed."""
+        from app.core.security import create_access_token
+
+        cert_id, owner_id = user_certificate
+        token = create_access_token(subject=str(owner_id), role="admin")
+        headers = {"Authorization": f"Bearer {token}"}
+        files = [
+            ("pdf_files", ("report.pdf", create_minimal_pdf(), "application/pdf")),
+            ("pdf_files", ("report.pdf", create_multipage_pdf(2), "application/pdf")),
+        ]
+
+        submitted = await client.post(
+            "/api/v1/pdf/jobs",
+            headers=headers,
+            files=files,
+            data={"certificate_id": cert_id},
+        )
+        assert submitted.status_code == 202
+        job = submitted.json()
+        assert job["status"] == "queued"
+        assert job["total"] == 2
+        assert job["pending"] == 2
+
+        await drain(make_worker())
+
+        polled = await client.get(f"/api/v1/pdf/jobs/{job['id']}", headers=headers)
+        assert polled.status_code == 200
+        payload = polled.json()
+        assert payload["status"] == "completed"
+        assert payload["successful"] == 2
+        assert payload["pending"] == 0
+        assert [item["position"] for item in payload["items"]] == [0, 1]
+
+        item = payload["items"][0]
+        download = await client.get(
+            f"/api/v1/pdf/jobs/{job['id']}/items/{item['id']}/download",
+            headers=headers,
+        )
+        assert download.status_code == 200
+        assert download.headers["content-type"] == "application/pdf"
+        assert download.headers["x-document-id"] == item["document_id"]
+        assert len(download.content) == item["file_size"]
+
+        archive_response = await client.get(
+            f"/api/v1/pdf/jobs/{job['id']}/archive", headers=headers
+        )
+        assert archive_response.status_code == 200
+        with zipfile.ZipFile(io.BytesIO(archive_response.content)) as archive:
+            assert set(archive.namelist()) == {
+                "report-signed.pdf",
+                "report-signed-2.pdf",
+                "manifest.json",
+            }
+            manifest = json.loads(archive.read("manifest.json"))
+            assert manifest["successful"] == 2
+
+        deleted = await client.delete(f"/api/v1/pdf/jobs/{job['id']}", headers=headers)
+        assert deleted.status_code == 204
+        missing = await client.get(f"/api/v1/pdf/jobs/{job['id']}", headers=headers)
+        assert missing.status_code == 404
+
+    async def test_download_before_signing_is_rejected(
+        self,
+        client: AsyncClient,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """Items that have not been signed yet cannot be downloaded."""
+        from app.core.security import create_access_token
+
+        cert_id, owner_id = user_certificate
+        token = create_access_token(subject=str(owner_id), role="admin")
+        headers = {"Authorization": f"Bearer {token}"}
+        submitted = await client.post(
+            "/api/v1/pdf/jobs",
+            headers=headers,
+            files=[("pdf_files", ("a.pdf", create_minimal_pdf(), "application/pdf"))],
+            data={"certificate_id": cert_id},
+        )
+        assert submitted.status_code == 202
+        job_id = submitted.json()["id"]
+
+        polled = await client.get(f"/api/v1/pdf/jobs/{job_id}", headers=headers)
+        item_id = polled.json()["items"][0]["id"]
+        response = await client.get(
+            f"/api/v1/pdf/jobs/{job_id}/items/{item_id}/download", headers=headers
+        )
+
+        assert response.status_code == 400
@@ -0,0 +1,115 @@
+"""Tests for per-stage signing latency and the Server-Timing header."""
+
+from __future__ import annotations
+
+from httpx import AsyncClient
+
+from app.services.signing_metrics import SigningMetrics, StageTimings
+from tests.test_pdf_signing import (  # noqa: F401 - shared fixtures
+    ca_service,
+    create_minimal_pdf,
+    db_session,
+    root_ca,
+    user_certificate,
+)
+
+
+def parse_server_timing(header: str) -> dict[str, float]:
+    stages: dict[str, float] = {}
+    for entry in header.split(", "):
+        name, duration = entry.split(";dur=")
+        stages[name] = float(duration)
+    return stages
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    """Samples count towards every bucket at or above their duration."""
+    metrics = SigningMetrics()
+    for elapsed_ms in (0.5, 7.0, 7.0, 20000.0):
+        metrics.observe("sign", elapsed_ms)
+
+    stats = metrics.stats()["sign"]
+
+    assert stats.count == 4
+    assert stats.max_ms == 20000.0
+    assert stats.buckets["1"] == 1
+    assert stats.buckets["5"] == 1
+    assert stats.buckets["10"] == 3
+    assert stats.buckets["10000"] == 3
+    assert stats.buckets["+Inf"] == 4
+
+
+def test_repeated_stages_are_summed() -> None:
+    """Per-document stages of a batch add up in the request's timings."""
+    metrics = SigningMetrics()
+    timings = StageTimings(metrics)
+    timings.record("sign", 2.0)
+    timings.record("sign", 3.0)
+    with timings.stage("audit"):
+        pass
+
+    stages = parse_server_timing(timings.server_timing())
+
+    assert list(stages) == ["sign", "audit", "total"]
+    assert stages["sign"] == 5.0
+    assert metrics.stats()["sign"].count == 2
+
+
+class TestServerTimingAPI:
+    """Tests for stage timings reported by the signing endpoints."""
+
+    async def test_sign_reports_stages_and_feeds_histograms(
+        self,
+        client: AsyncClient,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """Each signing stage appears in the header and in /health/signing."""
+        from app.core.security import create_access_token
+
+        cert_id, owner_id = user_certificate
+        token = create_access_token(subject=str(owner_id), role="admin")
+
+        response = await client.post(
+            "/api/v1/pdf/sign",
+            headers={"Authorization": f"Bearer {token}"},
+            files={"pdf_file": ("test.pdf", create_minimal_pdf(), "application/pdf")},
+            data={"certificate_id": cert_id},
+        )
+
+        assert response.status_code == 200
+        stages = parse_server_timing(response.headers["server-timing"])
+        for stage in ("upload", "validate", "certificate", "key", "sign", "audit"):
+            assert stage in stages
+        assert stages["total"] >= stages["sign"]
+
+        health = await client.get("/health/signing")
+        histograms = health.json()["signing_stages"]
+        assert histograms["sign"]["count"] >= 1
+        assert histograms["audit"]["buckets"]["+Inf"] >= 1
+
+    async def test_batch_reports_stages(
+        self,
+        client: AsyncClient,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """Batch responses carry the same header as single signing."""
+        from app.core.security import create_access_token
+
+        cert_id, owner_id = user_certificate
+        token = create_access_token(subject=str(owner_id), role="admin")
+        pdf_data = create_minimal_pdf()
+
+        response = await client.post(
+            "/api/v1/pdf/sign/batch",
+            headers={"Authorization": f"Bearer {token}"},
+            files=[
+                ("pdf_files", ("a.pdf", pdf_data, "application/pdf")),
+                ("pdf_files", ("b.pdf", pdf_data, "application/pdf")),
+            ],
+            data={"certificate_id": cert_id},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["successful"] == 2
+        stages = parse_server_timing(response.headers["server-timing"])
+        assert {"upload", "validate", "certificate", "sign", "audit"} <= set(stages)
@@ -0,0 +1,88 @@
+"""Tests for disk spooling of uploaded documents."""
+
+from __future__ import annotations
+
+import io
+import os
+from pathlib import Path
+
+import pytest
+
+from app.services.spool import (
+    SpooledFile,
+    SpoolLimitError,
+    UploadSpool,
+    iter_source_chunks,
+    open_source,
+    source_head,
+    source_size,
+    spool_stream,
+)
+
+
+def test_spool_stream_copies_payload_to_disk(tmp_path: Path) -> None:
+    """Spooled files keep the payload on disk and behave like in-memory sources."""
+    payload = b"%PDF-1.7\n" + os.urandom(3 * 1024 * 1024)
+
+    spooled = spool_stream(
+        io.BytesIO(payload), max_bytes=len(payload), directory=tmp_path
+    )
+
+    assert Path(spooled.path).parent == tmp_path
+    assert source_size(spooled) == len(payload)
+    assert source_head(spooled, 5) == b"%PDF-"
+    with open_source(spooled) as stream:
+        stream.seek(-16, io.SEEK_END)
+        assert stream.read() == payload[-16:]
+    with spooled.map() as view:
+        assert view[:] == payload
+
+    spooled.unlink()
+    spooled.unlink()
+    assert not os.path.exists(spooled.path)
+
+
+def test_spool_stream_enforces_limit_and_cleans_up(tmp_path: Path) -> None:
+    """Oversized uploads are rejected without leaving partial files behind."""
+    with pytest.raises(SpoolLimitError, match="exceeds"):
+        spool_stream(io.BytesIO(b"x" * 2048), max_bytes=1024, directory=tmp_path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_in_memory_sources_are_supported() -> None:
+    """Raw bytes remain a valid document source."""
+    assert source_size(b"%PDF-1.4") == 8
+    assert source_head(b"%PDF-1.4", 4) == b"%PDF"
+    with open_source(b"%PDF-1.4") as stream:
+        assert stream.read() == b"%PDF-1.4"
+
+
+async def test_upload_spool_removes_files_on_close() -> None:
+    """Files owned by a request spool are deleted unless detached."""
+    spool = UploadSpool(max_bytes=1024)
+    owned = await spool.add(io.BytesIO(b"%PDF-owned"))
+    detached_spool = UploadSpool(max_bytes=1024)
+    detached = await detached_spool.add(io.BytesIO(b"%PDF-detached"))
+
+    assert detached_spool.detach() == [detached]
+    spool.close()
+    detached_spool.close()
+
+    assert not os.path.exists(owned.path)
+    assert os.path.exists(detached.path)
+    SpooledFile(path=detached.path, size=detached.size).unlink()
+
+
+def test_iter_source_chunks_uses_fixed_size_chunks(tmp_path: Path) -> None:
+    """Both spooled and in-memory documents stream in fixed-size chunks."""
+    payload = os.urandom(10_000)
+    spooled = spool_stream(
+        io.BytesIO(payload), max_bytes=len(payload), directory=tmp_path
+    )
+
+    for source in (spooled, payload):
+        chunks = list(iter_source_chunks(source, chunk_size=4096))
+        assert [len(chunk) for chunk in chunks] == [4096, 4096, 1808]
+        assert b"".join(chunks) == payload
+    spooled.unlink()
@@ -0,0 +1,260 @@
+"""Tests for the built-in RFC 3161 timestamp authority."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+from typing import AsyncIterator, Iterator
+from uuid import UUID
+
+import pytest
+from asn1crypto import algos, tsp  # type: ignore[import-untyped]
+from cryptography import x509
+from cryptography.x509.oid import ExtendedKeyUsageOID
+from httpx import AsyncClient
+from pyhanko.pdf_utils.reader import PdfFileReader
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.endpoints.tsa import MAX_QUERY_BYTES
+from app.services.certificate_authority import (
+    CertificateAuthorityService,
+    LeafKeyAlgorithm,
+    TSACertificateResult,
+)
+from app.services.pdf_signing import PDFSigningService, SignatureError
+from app.services.pdf_verification import PDFVerificationService
+from app.services.timestamp_authority import (
+    LocalTimestampAuthority,
+    TimeStampResponse,
+    reset_local_timestamp_authority,
+)
+from app.services.tsa_client import TSAClient
+from tests.test_pdf_signing import (  # noqa: F401 - shared fixtures
+    ca_service,
+    create_minimal_pdf,
+    db_session,
+    root_ca,
+    user_certificate,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_authority() -> Iterator[None]:
+    """Each test database gets its own TSA key, so drop the cached responder."""
+    reset_local_timestamp_authority()
+    yield
+    reset_local_timestamp_authority()
+
+
+@pytest.fixture
+async def tsa_certificate(
+    ca_service: CertificateAuthorityService,
+    db_session: AsyncSession,
+    root_ca: None,
+) -> TSACertificateResult:
+    return await ca_service.issue_tsa_certificate(
+        session=db_session,
+        common_name="Test TSA",
+        organization="Test Org",
+        algorithm=LeafKeyAlgorithm.EC_P256,
+        actor_id=None,
+    )
+
+
+def make_request(
+    digest: bytes, algorithm: str = "sha256", *, nonce: int | None = 42
+) -> tsp.TimeStampReq:
+    request = {
+        "version": "v1",
+        "message_imprint": tsp.MessageImprint(
+            {
+                "hash_algorithm": algos.DigestAlgorithm({"algorithm": algorithm}),
+                "hashed_message": digest,
+            }
+        ),
+        "cert_req": True,
+    }
+    if nonce is not None:
+        request["nonce"] = nonce
+    return tsp.TimeStampReq(request)
+
+
+class TestLocalTimestampAuthority:
+    """Tests for the in-process RFC 3161 responder."""
+
+    async def test_tsa_certificate_is_timestamping_only(
+        self, tsa_certificate: TSACertificateResult
+    ) -> None:
+        """The certificate carries the critical time stamping EKU alone."""
+        usage = tsa_certificate.certificate.extensions.get_extension_for_class(
+            x509.ExtendedKeyUsage
+        )
+        assert usage.critical is True
+        assert list(usage.value) == [ExtendedKeyUsageOID.TIME_STAMPING]
+        assert tsa_certificate.artifact.artifact_type == "tsa-certificate"
+
+    async def test_grants_token_for_request(
+        self,
+        ca_service: CertificateAuthorityService,
+        db_session: AsyncSession,
+        tsa_certificate: TSACertificateResult,
+    ) -> None:
+        """Granted tokens echo the imprint and nonce under the configured policy."""
+        material = await ca_service.load_tsa_material(session=db_session)
+        authority = LocalTimestampAuthority.from_material(material)
+        digest = hashlib.sha256(b"document").digest()
+
+        response = await authority.respond(make_request(digest))
+
+        assert response["status"]["status"].native == "granted"
+        signed_data = response["time_stamp_token"]["content"]
+        tst_info = signed_data["encap_content_info"]["content"].parsed
+        assert tst_info["message_imprint"]["hashed_message"].native == digest
+        assert tst_info["nonce"].native == 42
+        assert tst_info["policy"].dotted == authority.policy
+        assert len(signed_data["certificates"]) == 2
+
+    async def test_rejects_weak_or_malformed_requests(
+        self,
+        ca_service: CertificateAuthorityService,
+        db_session: AsyncSession,
+        tsa_certificate: TSACertificateResult,
+    ) -> None:
+        """Rejections are reported in the RFC 3161 status, not as exceptions."""
+        material = await ca_service.load_tsa_material(session=db_session)
+        authority = LocalTimestampAuthority.from_material(material)
+
+        weak = await authority.respond(make_request(bytes(20), "sha1"))
+        truncated = await authority.respond(make_request(bytes(16)))
+        garbage = TimeStampResponse.load(await authority.respond_der(b"junk"))
+
+        for response, failure in (
+            (weak, "bad_alg"),
+            (truncated, "bad_data_format"),
+            (garbage, "bad_data_format"),
+        ):
+            assert response["status"]["status"].native == "rejection"
+            assert response["status"]["fail_info"].native == {failure}
+
+
+class TestLocalTimestampedSigning:
+    """Tests for signing with timestamps from the built-in authority."""
+
+    async def test_local_client_timestamps_without_http(
+        self,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+        tsa_certificate: TSACertificateResult,
+    ) -> None:
+        """A local TSA client needs no endpoint and yields a verifiable token."""
+        cert_id, owner_id = user_certificate
+        client = TSAClient(tsa_urls=[], local=True)
+        service = PDFSigningService(tsa_client=client)
+
+        result = await service.sign_pdf(
+            session=db_session,
+            pdf_data=create_minimal_pdf(),
+            certificate_id=UUID(cert_id),
+            user_id=owner_id,
+            use_tsa=True,
+        )
+
+        assert result.tsa_used is True
+        signature = PdfFileReader(io.BytesIO(result.signed_pdf)).embedded_signatures[0]
+        assert signature.signer_info["unsigned_attrs"][0]["type"].native == (
+            "signature_time_stamp_token"
+        )
+        report = await PDFVerificationService().verify_pdf(
+            session=db_session, pdf_data=result.signed_pdf
+        )
+        assert report.signatures[0].valid is True
+        assert report.signatures[0].timestamp_time is not None
+        stats = client.stats()
+        assert (stats.local, stats.requests, stats.failures) == (True, 1, 0)
+
+    async def test_missing_tsa_certificate_fails_signing(
+        self,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+    ) -> None:
+        """Without an issued TSA certificate the timestamp step is an error."""
+        cert_id, owner_id = user_certificate
+        service = PDFSigningService(tsa_client=TSAClient(tsa_urls=[], local=True))
+
+        with pytest.raises(SignatureError, match="Timestamping certificate"):
+            await service.sign_pdf(
+                session=db_session,
+                pdf_data=create_minimal_pdf(),
+                certificate_id=UUID(cert_id),
+                user_id=owner_id,
+                use_tsa=True,
+            )
+
+
+class TestTimestampAuthorityAPI:
+    """Tests for TSA certificate issuance and the /tsa endpoint."""
+
+    async def test_issue_certificate_and_timestamp_over_http(
+        self,
+        client: AsyncClient,
+        root_ca: None,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """An admin issues the TSA certificate; RFC 3161 clients then use /tsa."""
+        from app.core.security import create_access_token
+
+        monkeypatch.setattr("app.api.endpoints.tsa.settings.tsa_local_enabled", True)
+        token = create_access_token(subject="1", role="admin")
+        issued = await client.post(
+            "/api/v1/ca/tsa",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"common_name": "Built-in TSA"},
+        )
+        assert issued.status_code == 201
+        assert issued.json()["subject"] == "CN=Built-in TSA"
+
+        query = make_request(hashlib.sha256(b"payload").digest()).dump()
+        response = await client.post(
+            "/api/v1/tsa",
+            content=query,
+            headers={"Content-Type": "application/timestamp-query"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/timestamp-reply"
+        reply = TimeStampResponse.load(response.content)
+        assert reply["status"]["status"].native == "granted"
+
+        wrong_type = await client.post(
+            "/api/v1/tsa",
+            content=query,
+            headers={"Content-Type": "application/octet-stream"},
+        )
+        assert wrong_type.status_code == 400
+
+    async def test_rejects_oversized_queries(
+        self, client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Large bodies are refused with 413 whether declared or streamed."""
+        monkeypatch.setattr("app.api.endpoints.tsa.settings.tsa_local_enabled", True)
+        headers = {"Content-Type": "application/timestamp-query"}
+
+        declared = await client.post(
+            "/api/v1/tsa", content=b"\x00" * (MAX_QUERY_BYTES + 1), headers=headers
+        )
+        assert declared.status_code == 413
+
+        async def chunks() -> AsyncIterator[bytes]:
+            for _ in range(3):
+                yield b"\x00" * (MAX_QUERY_BYTES // 2)
+
+        streamed = await client.post("/api/v1/tsa", content=chunks(), headers=headers)
+        assert streamed.status_code == 413
+
+    async def test_endpoint_is_hidden_when_disabled(self, client: AsyncClient) -> None:
+        """The responder is opt-in."""
+        response = await client.post(
+            "/api/v1/tsa",
+            content=b"",
+            headers={"Content-Type": "application/timestamp-query"},
+        )
+        assert response.status_code == 404
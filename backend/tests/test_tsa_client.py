@@ -0,0 +1,302 @@
+"""Tests for the pooled TSA client and signature timestamping."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import UUID
+
+import httpx
+import pytest
+from asn1crypto import keys as asn1_keys  # type: ignore[import-untyped]
+from asn1crypto import tsp
+from asn1crypto import x509 as asn1_x509
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import ExtendedKeyUsageOID, NameOID
+from pyhanko.pdf_utils.reader import PdfFileReader
+from pyhanko.sign.timestamps import DummyTimeStamper
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.pdf_signing import PDFSigningService, SigningUnavailableError
+from app.services.pdf_verification import PDFVerificationService
+from app.services.spool import UploadSpool
+from app.services.tsa_client import (
+    CircuitState,
+    TSAClient,
+    TSAConnectionError,
+    TSAResponseError,
+)
+from tests.test_pdf_signing import (  # noqa: F401 - shared fixtures
+    ca_service,
+    create_minimal_pdf,
+    db_session,
+    root_ca,
+    user_certificate,
+)
+
+TSA_URL = "https://tsa.test/tsr"
+
+
+@pytest.fixture(scope="module")
+def dummy_tsa() -> DummyTimeStamper:
+    """A self-signed timestamp authority that answers requests in-process."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "Test TSA")])
+    now = datetime.now(timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=30))
+        .add_extension(
+            x509.ExtendedKeyUsage([ExtendedKeyUsageOID.TIME_STAMPING]), critical=True
+        )
+        .sign(key, hashes.SHA256())
+    )
+    return DummyTimeStamper(
+        tsa_cert=asn1_x509.Certificate.load(
+            certificate.public_bytes(serialization.Encoding.DER)
+        ),
+        tsa_key=asn1_keys.PrivateKeyInfo.load(
+            key.private_bytes(
+                serialization.Encoding.DER,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        ),
+    )
+
+
+def make_client(dummy_tsa: DummyTimeStamper, received: list[str]) -> TSAClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        received.append(request.headers["content-type"])
+        reply = dummy_tsa.request_tsa_response(tsp.TimeStampReq.load(request.content))
+        return httpx.Response(
+            200,
+            content=reply.dump(),
+            headers={"Content-Type": "application/timestamp-reply"},
+        )
+
+    return TSAClient(tsa_url=TSA_URL, transport=httpx.MockTransport(handler))
+
+
+def unreachable_client() -> TSAClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    return TSAClient(tsa_url=TSA_URL, transport=httpx.MockTransport(handler))
+
+
+class TestTSAClient:
+    """Tests for timestamp requests over the pooled HTTP client."""
+
+    async def test_timestamper_reuses_pooled_client(
+        self, dummy_tsa: DummyTimeStamper
+    ) -> None:
+        """Timestamps go through one HTTP client and feed the latency stats."""
+        received: list[str] = []
+        client = make_client(dummy_tsa, received)
+        timestamper = client.get_timestamper()
+        assert timestamper is client.get_timestamper()
+
+        for _ in range(3):
+            token = await timestamper.async_timestamp(bytes(32), "sha256")
+            assert token["content_type"].native == "signed_data"
+
+        stats = client.stats()
+        assert received == ["application/timestamp-query"] * 3
+        assert (stats.requests, stats.failures) == (3, 0)
+        assert stats.latency_p50_ms is not None
+        assert stats.latency_max_ms >= stats.latency_p50_ms
+        await client.aclose()
+
+    async def test_request_errors_are_classified(self) -> None:
+        """Unreachable and misbehaving TSAs raise distinct errors."""
+        failing = TSAClient(
+            tsa_url=TSA_URL,
+            transport=httpx.MockTransport(lambda request: httpx.Response(503)),
+        )
+        with pytest.raises(TSAResponseError):
+            await failing.get_timestamper().async_timestamp(bytes(32), "sha256")
+
+        unreachable = unreachable_client()
+        with pytest.raises(TSAConnectionError):
+            await unreachable.get_timestamper().async_timestamp(bytes(32), "sha256")
+
+        assert failing.stats().failures == 1
+        assert unreachable.stats().latency_p50_ms is None
+
+
+class TestTimestampedSigning:
+    """Tests for signatures that carry a TSA timestamp."""
+
+    @pytest.mark.parametrize("spool_output", [False, True])
+    async def test_use_tsa_embeds_signature_timestamp(
+        self,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+        dummy_tsa: DummyTimeStamper,
+        spool_output: bool,
+    ) -> None:
+        """The token is added after signing without breaking the signature."""
+        cert_id, owner_id = user_certificate
+        client = make_client(dummy_tsa, [])
+        service = PDFSigningService(tsa_client=client)
+        spool = UploadSpool() if spool_output else None
+
+        result = await service.sign_pdf(
+            session=db_session,
+            pdf_data=create_minimal_pdf(),
+            certificate_id=UUID(cert_id),
+            user_id=owner_id,
+            use_tsa=True,
+            output_spool=spool,
+        )
+
+        assert result.tsa_used is True
+        signature = PdfFileReader(io.BytesIO(result.signed_pdf)).embedded_signatures[0]
+        unsigned = signature.signer_info["unsigned_attrs"]
+        assert [attr["type"].native for attr in unsigned] == [
+            "signature_time_stamp_token"
+        ]
+
+        report = await PDFVerificationService().verify_pdf(
+            session=db_session, pdf_data=result.signed_pdf
+        )
+        assert report.signatures[0].valid is True
+        assert report.signatures[0].timestamp_time is not None
+        assert client.stats().requests == 1
+        if spool is not None:
+            spool.close()
+        await client.aclose()
+
+    async def test_unreachable_tsa_reports_unavailable(
+        self,
+        db_session: AsyncSession,
+        user_certificate: tuple[str, int],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A TSA outage is a retryable failure and leaves no output behind."""
+        cert_id, owner_id = user_certificate
+        monkeypatch.setattr(
+            "app.services.signing_executor.settings.pdf_spool_dir", tmp_path
+        )
+        service = PDFSigningService(tsa_client=unreachable_client())
+
+        with pytest.raises(SigningUnavailableError):
+            await service.sign_pdf(
+                session=db_session,
+                pdf_data=create_minimal_pdf(),
+                certificate_id=UUID(cert_id),
+                user_id=owner_id,
+                use_tsa=True,
+                output_spool=UploadSpool(),
+            )
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestTSAFailover:
+    """Tests for multi-endpoint failover, hedging and circuit breaking."""
+
+    def tsa_handler(self, dummy_tsa: DummyTimeStamper):  # type: ignore[no-untyped-def]
+        def reply(request: httpx.Request) -> httpx.Response:
+            response = dummy_tsa.request_tsa_response(
+                tsp.TimeStampReq.load(request.content)
+            )
+            return httpx.Response(200, content=response.dump())
+
+        return reply
+
+    async def test_failed_endpoint_fails_over(
+        self, dummy_tsa: DummyTimeStamper
+    ) -> None:
+        """A connection failure on the first endpoint moves on to the next."""
+        reply = self.tsa_handler(dummy_tsa)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "down.test":
+                raise httpx.ConnectError("connection refused", request=request)
+            return reply(request)
+
+        client = TSAClient(
+            tsa_urls=["https://down.test/tsr", "https://up.test/tsr"],
+            transport=httpx.MockTransport(handler),
+        )
+        await client.get_timestamper().async_timestamp(bytes(32), "sha256")
+
+        stats = client.stats()
+        assert (stats.requests, stats.failures, stats.hedged) == (1, 0, 0)
+        assert [(e.requests, e.failures) for e in stats.endpoints] == [(1, 1), (1, 0)]
+        await client.aclose()
+
+    async def test_slow_endpoint_is_hedged(
+        self, dummy_tsa: DummyTimeStamper, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A request slower than the hedge budget races a second endpoint."""
+        monkeypatch.setattr(
+            "app.services.tsa_client.settings.tsa_hedge_default_delay_ms", 20
+        )
+        reply = self.tsa_handler(dummy_tsa)
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "slow.test":
+                await asyncio.sleep(5)
+            return reply(request)
+
+        client = TSAClient(
+            tsa_urls=["https://slow.test/tsr", "https://fast.test/tsr"],
+            transport=httpx.MockTransport(handler),
+        )
+        started = time.perf_counter()
+        await client.get_timestamper().async_timestamp(bytes(32), "sha256")
+
+        assert time.perf_counter() - started < 2
+        stats = client.stats()
+        assert (stats.requests, stats.failures, stats.hedged) == (1, 0, 1)
+        slow, fast = stats.endpoints
+        assert (slow.failures, slow.latency_p50_ms is not None) == (0, True)
+        assert fast.requests == 1
+        await client.aclose()
+
+    async def test_failing_endpoint_trips_breaker(
+        self, dummy_tsa: DummyTimeStamper, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Repeated failures open the circuit until a trial request succeeds."""
+        monkeypatch.setattr(
+            "app.services.tsa_client.settings.tsa_breaker_cooldown_seconds", 0.05
+        )
+        reply = self.tsa_handler(dummy_tsa)
+        calls: list[str] = []
+        healthy = False
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(str(request.url))
+            return reply(request) if healthy else httpx.Response(502)
+
+        client = TSAClient(tsa_url=TSA_URL, transport=httpx.MockTransport(handler))
+        timestamper = client.get_timestamper()
+        for _ in range(5):
+            with pytest.raises(TSAResponseError):
+                await timestamper.async_timestamp(bytes(32), "sha256")
+        assert client.stats().endpoints[0].state is CircuitState.OPEN
+
+        with pytest.raises(TSAConnectionError, match="unavailable"):
+            await timestamper.async_timestamp(bytes(32), "sha256")
+        assert len(calls) == 5
+
+        await asyncio.sleep(0.06)
+        healthy = True
+        await timestamper.async_timestamp(bytes(32), "sha256")
+        endpoint = client.stats().endpoints[0]
+        assert (endpoint.state, endpoint.error_rate) == (CircuitState.CLOSED, 0.0)
+        await client.aclose()
@@ -209,6 +209,26 @@ export const IssueCertificateForm = ({ onIssued }: IssueCertificateFormProps) =>
               />
               ECDSA P-256
             </label>
+            <label style={{ display: "flex", alignItems: "center", gap: theme.spacing.xs }}>
+              <input
+                type="radio"
+                name="algorithm"
+                value="ec-p384"
+                checked={form.algorithm === "ec-p384"}
+                onChange={handleFieldChange("algorithm")}
+              />
+              ECDSA P-384
+            </label>
+            <label style={{ display: "flex", alignItems: "center", gap: theme.spacing.xs }}>
+              <input
+                type="radio"
+                name="algorithm"
+                value="ed25519"
+                checked={form.algorithm === "ed25519"}
+                onChange={handleFieldChange("algorithm")}
+              />
+              Ed25519
+            </label>
           </div>
           <span style={helperTextStyle}>Choose the asymmetric key algorithm for the issued certificate.</span>
         </div>
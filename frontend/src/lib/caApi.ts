@@ -53,16 +53,21 @@ type RawCrlMetadata = {
   artifact_id: string;
   name: string;
   created_at: string;
+  crl_number?: number | null;
+  base_crl_number?: number | null;
 };
 
 type CrlListResponse = {
   crls: RawCrlMetadata[];
+  delta_crls?: RawCrlMetadata[];
 };
 
 type RawCrlGenerateResponse = {
   artifact_id: string;
   name: string;
   created_at: string;
+  crl_number?: number | null;
+  base_crl_number?: number | null;
   revoked_serials: string[];
   crl_pem: string;
 };
@@ -107,12 +112,16 @@ const mapCrlMetadata = (payload: RawCrlMetadata): CrlMetadata => ({
   artifactId: payload.artifact_id,
   name: payload.name,
   createdAt: toDate(payload.created_at),
+  crlNumber: payload.crl_number ?? null,
+  baseCrlNumber: payload.base_crl_number ?? null,
 });
 
 const mapCrlGenerateResult = (payload: RawCrlGenerateResponse): CrlGenerateResult => ({
   artifactId: payload.artifact_id,
   name: payload.name,
   createdAt: toDate(payload.created_at),
+  crlNumber: payload.crl_number ?? null,
+  baseCrlNumber: payload.base_crl_number ?? null,
   revokedSerials: payload.revoked_serials,
   crlPem: payload.crl_pem,
 });
@@ -202,6 +211,11 @@ export const generateCrl = async (): Promise<CrlGenerateResult> => {
   return mapCrlGenerateResult(response.data);
 };
 
+export const generateDeltaCrl = async (): Promise<CrlGenerateResult> => {
+  const response = await httpClient.post<RawCrlGenerateResponse>("/api/v1/ca/crl/delta");
+  return mapCrlGenerateResult(response.data);
+};
+
 export const downloadCrl = async (
   artifactId: string
 ): Promise<{ blob: Blob; filename: string; contentType: string }> => {
@@ -12,7 +12,7 @@ export type CertificateSummary = {
 export type CertificateIssuePayload = {
   commonName: string;
   organization?: string | null;
-  algorithm: "rsa-2048" | "ec-p256";
+  algorithm: "rsa-2048" | "ec-p256" | "ec-p384" | "ed25519";
   validityDays: number;
   passphrase?: string | null;
 };
@@ -46,12 +46,16 @@ export type CrlMetadata = {
   artifactId: string;
   name: string;
   createdAt: Date;
+  crlNumber: number | null;
+  baseCrlNumber: number | null;
 };
 
 export type CrlGenerateResult = {
   artifactId: string;
   name: string;
   createdAt: Date;
+  crlNumber: number | null;
+  baseCrlNumber: number | null;
   revokedSerials: string[];
   crlPem: string;
 };